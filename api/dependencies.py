@@ -6,7 +6,7 @@ following Clean Architecture principles.
 """
 
 import logging
-from typing import Protocol
+from typing import Optional, Protocol
 import numpy as np
 
 from use_cases.mark_attendance import MarkAttendanceUseCase
@@ -15,15 +15,21 @@ from use_cases.get_analytics import GetAnalyticsUseCase
 from use_cases.generate_leaderboard import GenerateLeaderboardUseCase
 from use_cases.get_all_users import GetAllUsersUseCase
 from use_cases.register_user import RegisterUserUseCase
+from use_cases.bulk_register_users import BulkRegisterUsersUseCase
 from use_cases.get_user_info import GetUserInfoUseCase
 from use_cases.get_user_performance import GetUserPerformanceUseCase
 from use_cases.update_user_info import UpdateUserInfoUseCase
 from use_cases.get_attendance_records import GetAttendanceRecordsUseCase
 from use_cases.mark_class_attendance import MarkClassAttendanceUseCase
-from domain.services.recognition import FaceRecognitionService
+from use_cases.ingest_lecture_video import IngestLectureVideoUseCase
+from use_cases.backfill_class_attendance import BackfillClassAttendanceUseCase
+from use_cases.manage_rosters import RegisterRosterUseCase, GetRostersUseCase
+from use_cases.sync_cascade_gallery import SyncCascadeGalleryUseCase
+from use_cases.reembed_gallery import ReembedGalleryUseCase
+from domain.services.recognition import FaceRecognitionService, UserRegistrationService
 from domain.shared.constants import DEFAULT_CONFIDENCE_THRESHOLD
 from core.shared.constants import DEFAULT_EMBEDDING_MODEL
-from domain.services.liveness import LivenessService
+from domain.services.liveness import LivenessService, StreamingLivenessVerifier
 from domain.services.attendance import AttendanceService
 from domain.services.analytics import MetricsCalculator, TimelineAnalyzer
 from domain.services.gamification import (
@@ -35,10 +41,15 @@ from domain.services.gamification import (
 from repositories.attendance_repository import AttendanceRepository
 from repositories.face_repository import FaceRepository
 from repositories.user_repository import UserRepository
+from repositories.roster_repository import RosterRepository
+from repositories.session_repository import SessionRepository
 from infrastructure.storage.csv_handler import CSVHandler
 from infrastructure.storage.file_storage import FileStorage
-from core.recognition.detector import FaceDetector
+from infrastructure.config.settings import Settings
+from core.recognition.cascade import CascadePolicy
+from core.recognition.detector import FaceDetector, PooledFaceDetector
 from core.recognition.embedding_extractor import EmbeddingExtractor
+from core.recognition.inference_backend import BACKEND_ONNXRUNTIME, OnnxRuntimeBackend, embedding_model_id
 from core.recognition.recognizer import FaceRecognizer
 from core.recognition.quality_assessor import QualityAssessor
 from core.recognition.strategies import MediaPipeDetectionStrategy, YOLODetectionStrategy
@@ -47,524 +58,694 @@ from core.liveness.landmark_extractor import LandmarkExtractor
 from domain.services.liveness.liveness_verifier import LivenessVerifier
 from core.attendance.attendance_logger import AttendanceLogger
 from core.attendance.attendance_validator import AttendanceValidator
+from core.shared.inference_scheduler import InferenceScheduler
+from api.registry import ComponentRegistry
 
 logger = logging.getLogger(__name__)
 
-# Singleton instances (created once, reused)
-_file_storage: FileStorage | None = None
-_face_detector: FaceDetector | None = None
-_embedding_extractor: EmbeddingExtractor | None = None
-_face_recognizer: FaceRecognizer | None = None
-_quality_assessor: QualityAssessor | None = None
-_quality_assessor_class_attendance: QualityAssessor | None = None
-_blink_detector: BlinkDetector | None = None
-_landmark_extractor: LandmarkExtractor | None = None
-_liveness_verifier: LivenessVerifier | None = None
-_attendance_logger: AttendanceLogger | None = None
-_attendance_validator: AttendanceValidator | None = None
-_csv_handler: CSVHandler | None = None
-_attendance_repository: AttendanceRepository | None = None
-_face_repository: FaceRepository | None = None
-_user_repository: UserRepository | None = None
-_face_recognition_service: FaceRecognitionService | None = None
-_face_detector_mediapipe: FaceDetector | None = None
-_face_detector_yolo: FaceDetector | None = None
-_face_recognition_service_mediapipe: FaceRecognitionService | None = None
-_face_recognition_service_yolo: FaceRecognitionService | None = None
-_face_recognition_service_class_attendance: FaceRecognitionService | None = None
-_liveness_service: LivenessService | None = None
-_attendance_service: AttendanceService | None = None
-_recognize_face_use_case: RecognizeFaceUseCase | None = None
-_mark_attendance_use_case: MarkAttendanceUseCase | None = None
-_metrics_calculator: MetricsCalculator | None = None
-_timeline_analyzer: TimelineAnalyzer | None = None
-_badge_definitions: BadgeDefinitions | None = None
-_badge_calculator: BadgeCalculator | None = None
-_streak_calculator: StreakCalculator | None = None
-_leaderboard_generator: LeaderboardGenerator | None = None
-_get_analytics_use_case: GetAnalyticsUseCase | None = None
-_generate_leaderboard_use_case: GenerateLeaderboardUseCase | None = None
-_get_all_users_use_case: GetAllUsersUseCase | None = None
-_register_user_use_case: RegisterUserUseCase | None = None
-_get_user_info_use_case: GetUserInfoUseCase | None = None
-_get_user_performance_use_case: GetUserPerformanceUseCase | None = None
-_update_user_info_use_case: UpdateUserInfoUseCase | None = None
-_get_attendance_records_use_case: GetAttendanceRecordsUseCase | None = None
-_mark_class_attendance_use_case: MarkClassAttendanceUseCase | None = None
-
-
+# Shared components, created once on first use. Stateful components (blink
+# detector and the liveness objects wrapping it) are created per request instead.
+_registry = ComponentRegistry()
+
+
+@_registry.singleton
+def get_settings() -> Settings:
+    """Get or create application settings instance."""
+    settings = Settings()
+    logger.info("Settings initialized")
+    return settings
+
+
+@_registry.singleton
+def get_inference_scheduler() -> InferenceScheduler:
+    """Get or create the scheduler shared by interactive and bulk inference routes."""
+    settings = get_settings()
+    scheduler = InferenceScheduler.interactive_and_bulk(
+        max_workers=settings.inference_workers,
+        interactive_max_concurrency=settings.inference_interactive_concurrency,
+        bulk_max_concurrency=settings.inference_bulk_concurrency,
+        aging_seconds=settings.inference_aging_seconds,
+        # /recognize requests wait on an interactive worker for their batch to fill
+        interactive_batch_size=_recognition_batch_size()
+    )
+    logger.info(f"Inference scheduler initialized ({scheduler.max_workers} workers)")
+    return scheduler
+
+
+def _recognition_batch_size() -> int:
+    """
+    Get the micro-batch size of /recognize requests.
+
+    Only the aligned path (embedding_skip_detection or the ONNX Runtime
+    backend) embeds a batch with one model call; through DeepFace.represent
+    a batch would just run its faces one after another, so batching is off.
+    """
+    settings = get_settings()
+    if settings.embedding_skip_detection or settings.embedding_backend == BACKEND_ONNXRUNTIME:
+        return settings.recognition_batch_size
+    return 1
+
+
+def _embedding_model_id() -> str:
+    """
+    Get the ID of the configured embedding model, backend and weights.
+
+    Matches get_embedding_extractor().model_id without loading the model.
+    """
+    settings = get_settings()
+    weights_path = settings.onnx_model_path if settings.embedding_backend == BACKEND_ONNXRUNTIME else None
+    return embedding_model_id(DEFAULT_EMBEDDING_MODEL, settings.embedding_backend, weights_path)
+
+
+def _extractor_for_model(model_id: str) -> Optional[EmbeddingExtractor]:
+    """
+    Create an extractor for a gallery recorded with another model ID.
+
+    Serves recognition until a migration swaps the gallery. DeepFace model IDs
+    are bare model names (see embedding_model_id); other backends' weights
+    are not kept after a switch, so None is returned for them.
+    """
+    if "@" in model_id:
+        logger.warning(f"Gallery model {model_id} cannot be loaded; re-embed the gallery")
+        return None
+    try:
+        extractor = EmbeddingExtractor(model_name=model_id, skip_detection=get_settings().embedding_skip_detection)
+    except ImportError as e:
+        logger.warning(f"Gallery model {model_id} cannot be loaded: {e}")
+        return None
+    logger.info(f"Embedding extractor initialized with {model_id} model for the gallery being migrated")
+    return extractor
+
+
+@_registry.singleton
 def get_file_storage() -> FileStorage:
     """Get or create file storage instance."""
-    global _file_storage
-    if _file_storage is None:
-        _file_storage = FileStorage()
-        logger.info("File storage initialized")
-    return _file_storage
+    file_storage = FileStorage()
+    logger.info("File storage initialized")
+    return file_storage
 
 
+@_registry.singleton
 def get_csv_handler() -> CSVHandler:
     """Get or create CSV handler instance."""
-    global _csv_handler
-    if _csv_handler is None:
-        file_storage = get_file_storage()
-        _csv_handler = CSVHandler(file_storage=file_storage)
-        logger.info("CSV handler initialized")
-    return _csv_handler
+    file_storage = get_file_storage()
+    csv_handler = CSVHandler(file_storage=file_storage)
+    logger.info("CSV handler initialized")
+    return csv_handler
 
 
-def get_face_detector() -> FaceDetector:
-    """Get or create face detector instance."""
-    global _face_detector
-    if _face_detector is None:
-        _face_detector = FaceDetector()
-        logger.info("Face detector initialized")
-    return _face_detector
+@_registry.singleton
+def get_face_detector() -> PooledFaceDetector:
+    """Get or create face detector pool (OpenCV primary, MediaPipe fallback)."""
+    pool_size = get_settings().detector_pool_size
+    face_detector = PooledFaceDetector(FaceDetector, pool_size=pool_size)
+    logger.info(f"Face detector initialized (pool size {pool_size})")
+    return face_detector
 
 
+@_registry.singleton
 def get_embedding_extractor() -> EmbeddingExtractor:
     """Get or create embedding extractor instance."""
-    global _embedding_extractor
-    if _embedding_extractor is None:
-        _embedding_extractor = EmbeddingExtractor(model_name=DEFAULT_EMBEDDING_MODEL)
-        logger.info(f"Embedding extractor initialized with {DEFAULT_EMBEDDING_MODEL} model")
-    return _embedding_extractor
-
-
+    settings = get_settings()
+    skip_detection = settings.embedding_skip_detection
+    backend = None
+    if settings.embedding_backend == BACKEND_ONNXRUNTIME:
+        backend = OnnxRuntimeBackend(
+            model_path=settings.onnx_model_path,
+            int8_model_path=settings.onnx_int8_model_path or None,
+            use_int8=settings.onnx_use_int8,
+            intra_op_threads=settings.onnx_intra_op_threads,
+            input_mean=settings.onnx_input_mean,
+            input_std=settings.onnx_input_std
+        )
+    embedding_extractor = EmbeddingExtractor(
+        model_name=DEFAULT_EMBEDDING_MODEL,
+        skip_detection=skip_detection,
+        backend=backend
+    )
+    logger.info(f"Embedding extractor initialized with {DEFAULT_EMBEDDING_MODEL} model "
+                f"(backend={settings.embedding_backend}, skip_detection={embedding_extractor.skip_detection})")
+    return embedding_extractor
+
+
+@_registry.singleton
+def get_fast_embedding_extractor() -> Optional[EmbeddingExtractor]:
+    """Get or create the cascade's fast embedding extractor (None if the cascade is disabled)."""
+    settings = get_settings()
+    model_name = settings.recognition_cascade_model
+    if not model_name:
+        return None
+    fast_embedding_extractor = EmbeddingExtractor(
+        model_name=model_name,
+        skip_detection=settings.embedding_skip_detection
+    )
+    logger.info(f"Fast embedding extractor initialized with {model_name} model for cascade recognition")
+    return fast_embedding_extractor
+
+
+@_registry.singleton
 def get_face_recognizer() -> FaceRecognizer:
     """Get or create face recognizer instance."""
-    global _face_recognizer
-    if _face_recognizer is None:
-        _face_recognizer = FaceRecognizer()
-        logger.info("Face recognizer initialized")
-    return _face_recognizer
+    face_recognizer = FaceRecognizer()
+    logger.info("Face recognizer initialized")
+    return face_recognizer
 
 
+@_registry.singleton
 def get_quality_assessor() -> QualityAssessor:
     """Get or create quality assessor instance."""
-    global _quality_assessor
-    if _quality_assessor is None:
-        _quality_assessor = QualityAssessor()
-        logger.info("Quality assessor initialized")
-    return _quality_assessor
+    quality_assessor = QualityAssessor()
+    logger.info("Quality assessor initialized")
+    return quality_assessor
 
 
+@_registry.singleton
 def get_quality_assessor_class_attendance() -> QualityAssessor:
     """Get or create quality assessor instance for class attendance with lower threshold."""
-    global _quality_assessor_class_attendance
-    if _quality_assessor_class_attendance is None:
-        # Lower threshold (0.3) for class attendance to allow smaller/distant faces
-        _quality_assessor_class_attendance = QualityAssessor(min_quality_threshold=0.3)
-        logger.info("Quality assessor for class attendance initialized (threshold=0.3)")
-    return _quality_assessor_class_attendance
+    # Lower threshold (0.3) for class attendance to allow smaller/distant faces
+    quality_assessor_class_attendance = QualityAssessor(min_quality_threshold=0.3)
+    logger.info("Quality assessor for class attendance initialized (threshold=0.3)")
+    return quality_assessor_class_attendance
 
 
 def get_blink_detector() -> BlinkDetector:
-    """Get or create blink detector instance."""
-    global _blink_detector
-    if _blink_detector is None:
-        _blink_detector = BlinkDetector()
-        logger.info("Blink detector initialized")
-    return _blink_detector
+    """Create a blink detector instance (per request: it counts blinks across frames)."""
+    settings = get_settings()
+    return BlinkDetector(
+        ear_threshold=settings.liveness_threshold,
+        hysteresis=settings.liveness_ear_hysteresis
+    )
 
 
+@_registry.singleton
 def get_landmark_extractor() -> LandmarkExtractor:
     """Get or create landmark extractor instance."""
-    global _landmark_extractor
-    if _landmark_extractor is None:
-        _landmark_extractor = LandmarkExtractor()
-        logger.info("Landmark extractor initialized")
-    return _landmark_extractor
+    settings = get_settings()
+    landmark_extractor = LandmarkExtractor(
+        roi_input_size=settings.liveness_roi_input_size,
+        roi_margin=settings.liveness_roi_margin
+    )
+    logger.info("Landmark extractor initialized")
+    return landmark_extractor
 
 
 def get_liveness_verifier() -> LivenessVerifier:
-    """Get or create liveness verifier instance."""
-    global _liveness_verifier
-    if _liveness_verifier is None:
-        blink_detector = get_blink_detector()
-        _liveness_verifier = LivenessVerifier(blink_detector=blink_detector)
-        logger.info("Liveness verifier initialized")
-    return _liveness_verifier
+    """Create a liveness verifier instance with its own blink detector."""
+    return LivenessVerifier(blink_detector=get_blink_detector())
 
 
+@_registry.singleton
 def get_attendance_logger() -> AttendanceLogger:
     """Get or create attendance logger instance."""
-    global _attendance_logger
-    if _attendance_logger is None:
-        _attendance_logger = AttendanceLogger()
-        logger.info("Attendance logger initialized")
-    return _attendance_logger
+    attendance_logger = AttendanceLogger()
+    logger.info("Attendance logger initialized")
+    return attendance_logger
 
 
+@_registry.singleton
 def get_attendance_validator() -> AttendanceValidator:
     """Get or create attendance validator instance."""
-    global _attendance_validator
-    if _attendance_validator is None:
-        _attendance_validator = AttendanceValidator()
-        logger.info("Attendance validator initialized")
-    return _attendance_validator
+    attendance_validator = AttendanceValidator()
+    logger.info("Attendance validator initialized")
+    return attendance_validator
 
 
+@_registry.singleton
 def get_attendance_repository() -> AttendanceRepository:
     """Get or create attendance repository instance."""
-    global _attendance_repository
-    if _attendance_repository is None:
-        csv_handler = get_csv_handler()
-        _attendance_repository = AttendanceRepository(csv_handler=csv_handler)
-        logger.info("Attendance repository initialized")
-    return _attendance_repository
+    csv_handler = get_csv_handler()
+    attendance_repository = AttendanceRepository(csv_handler=csv_handler)
+    logger.info("Attendance repository initialized")
+    return attendance_repository
 
 
+@_registry.singleton
 def get_face_repository() -> FaceRepository:
     """Get or create face repository instance."""
-    global _face_repository
-    if _face_repository is None:
-        file_storage = get_file_storage()
-        _face_repository = FaceRepository(file_storage=file_storage)
-        logger.info("Face repository initialized")
-    return _face_repository
+    file_storage = get_file_storage()
+    face_repository = FaceRepository(file_storage=file_storage, embedding_model=_embedding_model_id())
+    logger.info("Face repository initialized")
+    return face_repository
 
 
+@_registry.singleton
 def get_user_repository() -> UserRepository:
     """Get or create user repository instance."""
-    global _user_repository
-    if _user_repository is None:
-        file_storage = get_file_storage()
-        _user_repository = UserRepository(storage_handler=file_storage)
-        logger.info("User repository initialized")
-    return _user_repository
-
-
+    file_storage = get_file_storage()
+    user_repository = UserRepository(storage_handler=file_storage)
+    logger.info("User repository initialized")
+    return user_repository
+
+
+@_registry.singleton
+def get_roster_repository() -> RosterRepository:
+    """Get or create roster repository instance."""
+    file_storage = get_file_storage()
+    roster_repository = RosterRepository(storage_handler=file_storage)
+    logger.info("Roster repository initialized")
+    return roster_repository
+
+
+@_registry.singleton
+def get_session_repository() -> SessionRepository:
+    """Get or create the in-memory recognition session repository."""
+    settings = get_settings()
+    session_repository = SessionRepository(
+        ttl_seconds=settings.recognition_session_ttl_seconds,
+        max_sessions=settings.recognition_session_max
+    )
+    logger.info(f"Session repository initialized (ttl {settings.recognition_session_ttl_seconds} s)")
+    return session_repository
+
+
+@_registry.singleton
 def get_face_recognition_service() -> FaceRecognitionService:
     """Get or create face recognition service instance."""
-    global _face_recognition_service
-    if _face_recognition_service is None:
-        _face_recognition_service = FaceRecognitionService(
-            face_detector=get_face_detector(),
-            embedding_extractor=get_embedding_extractor(),
-            face_recognizer=get_face_recognizer(),
-            quality_assessor=get_quality_assessor(),
-            confidence_threshold=DEFAULT_CONFIDENCE_THRESHOLD
+    settings = get_settings()
+    face_recognition_service = FaceRecognitionService(
+        face_detector=get_face_detector(),
+        embedding_extractor=get_embedding_extractor(),
+        face_recognizer=get_face_recognizer(),
+        quality_assessor=get_quality_assessor(),
+        confidence_threshold=DEFAULT_CONFIDENCE_THRESHOLD,
+        fast_embedding_extractor=get_fast_embedding_extractor(),
+        cascade_policy=CascadePolicy(
+            accept_score=settings.cascade_accept_score,
+            min_margin=settings.cascade_min_margin
         )
-        logger.info("Face recognition service initialized")
-    return _face_recognition_service
-
-
-def get_face_detector_mediapipe() -> FaceDetector:
-    """Get or create face detector instance with MediaPipe as primary strategy."""
-    global _face_detector_mediapipe
-    if _face_detector_mediapipe is None:
-        # Use very low confidence threshold and full-range model for better multi-face detection
-        # Lower threshold helps detect faces that are further away or partially occluded
-        mediapipe_strategy = MediaPipeDetectionStrategy(
-            min_detection_confidence=0.2,  # Lower threshold to catch all faces in group photos
-            model_selection=1  # Full-range (0-5m) for group photos
-        )
-        _face_detector_mediapipe = FaceDetector(detection_strategy=mediapipe_strategy)
-        logger.info("Face detector (MediaPipe primary) initialized with confidence=0.2, full-range model")
-    return _face_detector_mediapipe
-
-
-def get_face_detector_yolo() -> FaceDetector:
-    """Get or create face detector instance with YOLO as primary strategy."""
-    global _face_detector_yolo
-    if _face_detector_yolo is None:
-        try:
-            # Use default model path to trigger fallback logic (tries face models, then falls back to yolov8n.pt)
-            model_path = "yolov8n.pt"  # Ultralytics will download this automatically
-            conf_threshold = 0.25  # Lower threshold for better multi-face detection in group photos
-            yolo_strategy = YOLODetectionStrategy(
-                model_path=model_path,
-                conf_threshold=conf_threshold
-            )
-            _face_detector_yolo = FaceDetector(detection_strategy=yolo_strategy)
-            logger.info(f"Face detector (YOLO primary) initialized with model={model_path}, conf={conf_threshold}")
-        except ImportError as e:
-            logger.warning(f"YOLO is not available: {e}")
-            raise ImportError("YOLO is not available. Install it with: pip install ultralytics")
-    return _face_detector_yolo
-
-
+    )
+    logger.info("Face recognition service initialized")
+    return face_recognition_service
+
+
+def _create_face_detector_mediapipe() -> FaceDetector:
+    """Create a face detector with MediaPipe as primary strategy."""
+    # Use very low confidence threshold and full-range model for better multi-face detection
+    # Lower threshold helps detect faces that are further away or partially occluded
+    mediapipe_strategy = MediaPipeDetectionStrategy(
+        min_detection_confidence=0.2,  # Lower threshold to catch all faces in group photos
+        model_selection=1  # Full-range (0-5m) for group photos
+    )
+    return FaceDetector(detection_strategy=mediapipe_strategy)
+
+
+@_registry.singleton
+def get_face_detector_mediapipe() -> PooledFaceDetector:
+    """Get or create face detector pool with MediaPipe as primary strategy."""
+    pool_size = get_settings().detector_pool_size
+    face_detector_mediapipe = PooledFaceDetector(_create_face_detector_mediapipe, pool_size=pool_size)
+    logger.info(f"Face detector (MediaPipe primary) initialized with confidence=0.2, full-range model "
+                f"(pool size {pool_size})")
+    return face_detector_mediapipe
+
+
+def _create_face_detector_yolo() -> FaceDetector:
+    """Create a face detector with YOLO as primary strategy."""
+    # Use default model path to trigger fallback logic (tries face models, then falls back to yolov8n.pt)
+    model_path = "yolov8n.pt"  # Ultralytics will download this automatically
+    conf_threshold = 0.25  # Lower threshold for better multi-face detection in group photos
+    yolo_strategy = YOLODetectionStrategy(
+        model_path=model_path,
+        conf_threshold=conf_threshold
+    )
+    return FaceDetector(detection_strategy=yolo_strategy)
+
+
+@_registry.singleton
+def get_face_detector_yolo() -> PooledFaceDetector:
+    """Get or create face detector pool with YOLO as primary strategy."""
+    try:
+        pool_size = get_settings().detector_pool_size
+        face_detector_yolo = PooledFaceDetector(_create_face_detector_yolo, pool_size=pool_size)
+        logger.info(f"Face detector (YOLO primary) initialized with model=yolov8n.pt, conf=0.25 "
+                    f"(pool size {pool_size})")
+    except ImportError as e:
+        logger.warning(f"YOLO is not available: {e}")
+        raise ImportError("YOLO is not available. Install it with: pip install ultralytics")
+    return face_detector_yolo
+
+
+@_registry.singleton
 def get_face_recognition_service_mediapipe() -> FaceRecognitionService:
     """Get or create face recognition service instance with MediaPipe-based detector."""
-    global _face_recognition_service_mediapipe
-    if _face_recognition_service_mediapipe is None:
-        _face_recognition_service_mediapipe = FaceRecognitionService(
-            face_detector=get_face_detector_mediapipe(),
+    face_recognition_service_mediapipe = FaceRecognitionService(
+        face_detector=get_face_detector_mediapipe(),
+        embedding_extractor=get_embedding_extractor(),
+        face_recognizer=get_face_recognizer(),
+        quality_assessor=get_quality_assessor(),
+        confidence_threshold=DEFAULT_CONFIDENCE_THRESHOLD
+    )
+    logger.info("Face recognition service (MediaPipe primary) initialized")
+    return face_recognition_service_mediapipe
+
+
+@_registry.singleton
+def get_face_recognition_service_yolo() -> FaceRecognitionService:
+    """Get or create face recognition service instance with YOLO-based detector."""
+    try:
+        face_recognition_service_yolo = FaceRecognitionService(
+            face_detector=get_face_detector_yolo(),
             embedding_extractor=get_embedding_extractor(),
             face_recognizer=get_face_recognizer(),
             quality_assessor=get_quality_assessor(),
             confidence_threshold=DEFAULT_CONFIDENCE_THRESHOLD
         )
-        logger.info("Face recognition service (MediaPipe primary) initialized")
-    return _face_recognition_service_mediapipe
-
-
-def get_face_recognition_service_yolo() -> FaceRecognitionService:
-    """Get or create face recognition service instance with YOLO-based detector."""
-    global _face_recognition_service_yolo
-    if _face_recognition_service_yolo is None:
-        try:
-            _face_recognition_service_yolo = FaceRecognitionService(
-                face_detector=get_face_detector_yolo(),
-                embedding_extractor=get_embedding_extractor(),
-                face_recognizer=get_face_recognizer(),
-                quality_assessor=get_quality_assessor(),
-                confidence_threshold=DEFAULT_CONFIDENCE_THRESHOLD
-            )
-            logger.info("Face recognition service (YOLO primary) initialized")
-        except ImportError as e:
-            logger.error(f"Failed to initialize YOLO-based face recognition service: {e}")
-            raise
-    return _face_recognition_service_yolo
+        logger.info("Face recognition service (YOLO primary) initialized")
+    except ImportError as e:
+        logger.error(f"Failed to initialize YOLO-based face recognition service: {e}")
+        raise
+    return face_recognition_service_yolo
 
 
+@_registry.singleton
 def get_face_recognition_service_class_attendance() -> FaceRecognitionService:
     """Get or create face recognition service instance for class attendance with lower thresholds."""
-    global _face_recognition_service_class_attendance
-    if _face_recognition_service_class_attendance is None:
-        try:
-            # Lower thresholds for class attendance to handle smaller/distant faces:
-            # - Confidence threshold: 0.35 (instead of 0.45) for more lenient matching
-            # - Quality threshold: 0.3 (instead of 0.5) to allow smaller faces
-            _face_recognition_service_class_attendance = FaceRecognitionService(
-                face_detector=get_face_detector_yolo(),
-                embedding_extractor=get_embedding_extractor(),
-                face_recognizer=get_face_recognizer(),
-                quality_assessor=get_quality_assessor_class_attendance(),
-                confidence_threshold=0.35,  # Lower threshold for class photos
-                min_quality_threshold=0.3   # Lower quality threshold for distant faces
-            )
-            logger.info("Face recognition service for class attendance initialized (confidence=0.35, quality=0.3)")
-        except ImportError as e:
-            logger.error(f"Failed to initialize class attendance face recognition service: {e}")
-            raise
-    return _face_recognition_service_class_attendance
+    try:
+        # Lower thresholds for class attendance to handle smaller/distant faces:
+        # - Confidence threshold: 0.35 (instead of 0.45) for more lenient matching
+        # - Quality threshold: 0.3 (instead of 0.5) to allow smaller faces
+        face_recognition_service_class_attendance = FaceRecognitionService(
+            face_detector=get_face_detector_yolo(),
+            embedding_extractor=get_embedding_extractor(),
+            face_recognizer=get_face_recognizer(),
+            quality_assessor=get_quality_assessor_class_attendance(),
+            confidence_threshold=0.35,  # Lower threshold for class photos
+            min_quality_threshold=0.3   # Lower quality threshold for distant faces
+        )
+        logger.info("Face recognition service for class attendance initialized (confidence=0.35, quality=0.3)")
+    except ImportError as e:
+        logger.error(f"Failed to initialize class attendance face recognition service: {e}")
+        raise
+    return face_recognition_service_class_attendance
 
 
 def get_liveness_service() -> LivenessService:
-    """Get or create liveness service instance."""
-    global _liveness_service
-    if _liveness_service is None:
-        _liveness_service = LivenessService(
-            landmark_extractor=get_landmark_extractor(),
-            liveness_verifier=get_liveness_verifier()
+    """Create a liveness service instance (per request; shares the landmark extractor)."""
+    settings = get_settings()
+    streaming_verifier = None
+    if settings.liveness_streaming:
+        streaming_verifier = StreamingLivenessVerifier(
+            blink_detector=get_blink_detector(),
+            sparse_stride=settings.liveness_sparse_stride,
+            dip_margin=settings.liveness_dip_margin
         )
-        logger.info("Liveness service initialized")
-    return _liveness_service
+    return LivenessService(
+        landmark_extractor=get_landmark_extractor(),
+        liveness_verifier=get_liveness_verifier(),
+        streaming_verifier=streaming_verifier
+    )
 
 
+@_registry.singleton
 def get_attendance_service() -> AttendanceService:
     """Get or create attendance service instance."""
-    global _attendance_service
-    if _attendance_service is None:
-        _attendance_service = AttendanceService(
-            attendance_logger=get_attendance_logger(),
-            attendance_validator=get_attendance_validator()
-        )
-        logger.info("Attendance service initialized")
-    return _attendance_service
+    attendance_service = AttendanceService(
+        attendance_logger=get_attendance_logger(),
+        attendance_validator=get_attendance_validator()
+    )
+    logger.info("Attendance service initialized")
+    return attendance_service
 
 
+@_registry.singleton
 def get_metrics_calculator() -> MetricsCalculator:
     """Get or create metrics calculator instance."""
-    global _metrics_calculator
-    if _metrics_calculator is None:
-        _metrics_calculator = MetricsCalculator()
-        logger.info("Metrics calculator initialized")
-    return _metrics_calculator
+    metrics_calculator = MetricsCalculator()
+    logger.info("Metrics calculator initialized")
+    return metrics_calculator
 
 
+@_registry.singleton
 def get_timeline_analyzer() -> TimelineAnalyzer:
     """Get or create timeline analyzer instance."""
-    global _timeline_analyzer
-    if _timeline_analyzer is None:
-        _timeline_analyzer = TimelineAnalyzer()
-        logger.info("Timeline analyzer initialized")
-    return _timeline_analyzer
+    timeline_analyzer = TimelineAnalyzer()
+    logger.info("Timeline analyzer initialized")
+    return timeline_analyzer
 
 
+@_registry.singleton
 def get_badge_definitions() -> BadgeDefinitions:
     """Get or create badge definitions instance."""
-    global _badge_definitions
-    if _badge_definitions is None:
-        _badge_definitions = BadgeDefinitions.default()
-        logger.info("Badge definitions initialized")
-    return _badge_definitions
+    badge_definitions = BadgeDefinitions.default()
+    logger.info("Badge definitions initialized")
+    return badge_definitions
 
 
+@_registry.singleton
 def get_badge_calculator() -> BadgeCalculator:
     """Get or create badge calculator instance."""
-    global _badge_calculator
-    if _badge_calculator is None:
-        badge_definitions = get_badge_definitions()
-        _badge_calculator = BadgeCalculator(badge_definitions)
-        logger.info("Badge calculator initialized")
-    return _badge_calculator
+    badge_definitions = get_badge_definitions()
+    badge_calculator = BadgeCalculator(badge_definitions)
+    logger.info("Badge calculator initialized")
+    return badge_calculator
 
 
+@_registry.singleton
 def get_streak_calculator() -> StreakCalculator:
     """Get or create streak calculator instance."""
-    global _streak_calculator
-    if _streak_calculator is None:
-        _streak_calculator = StreakCalculator()
-        logger.info("Streak calculator initialized")
-    return _streak_calculator
+    streak_calculator = StreakCalculator()
+    logger.info("Streak calculator initialized")
+    return streak_calculator
 
 
+@_registry.singleton
 def get_leaderboard_generator() -> LeaderboardGenerator:
     """Get or create leaderboard generator instance."""
-    global _leaderboard_generator
-    if _leaderboard_generator is None:
-        _leaderboard_generator = LeaderboardGenerator()
-        logger.info("Leaderboard generator initialized")
-    return _leaderboard_generator
+    leaderboard_generator = LeaderboardGenerator()
+    logger.info("Leaderboard generator initialized")
+    return leaderboard_generator
 
 
+@_registry.singleton
 def get_recognize_face_use_case() -> RecognizeFaceUseCase:
     """Get or create recognize face use case instance."""
-    global _recognize_face_use_case
-    if _recognize_face_use_case is None:
-        _recognize_face_use_case = RecognizeFaceUseCase(
-            face_recognition_service=get_face_recognition_service(),
-            attendance_repository=get_attendance_repository(),
-            face_repository=get_face_repository(),
-            user_repository=get_user_repository()
-        )
-        logger.info("Recognize face use case initialized")
-    return _recognize_face_use_case
+    settings = get_settings()
+    batch_size = _recognition_batch_size()
+    recognize_face_use_case = RecognizeFaceUseCase(
+        face_recognition_service=get_face_recognition_service(),
+        attendance_repository=get_attendance_repository(),
+        face_repository=get_face_repository(),
+        user_repository=get_user_repository(),
+        batch_max_size=batch_size,
+        batch_max_wait_ms=settings.recognition_batch_wait_ms,
+        roster_repository=get_roster_repository(),
+        session_repository=get_session_repository(),
+        gallery_precision=settings.gallery_precision,
+        extractor_for_model=_extractor_for_model
+    )
+    logger.info(f"Recognize face use case initialized (batch size {batch_size}, "
+                f"max wait {settings.recognition_batch_wait_ms} ms, {settings.gallery_precision} gallery)")
+    return recognize_face_use_case
 
 
 def get_mark_attendance_use_case() -> MarkAttendanceUseCase:
-    """Get or create mark attendance use case instance."""
-    global _mark_attendance_use_case
-    if _mark_attendance_use_case is None:
-        _mark_attendance_use_case = MarkAttendanceUseCase(
-            liveness_service=get_liveness_service(),
-            attendance_service=get_attendance_service(),
-            attendance_repository=get_attendance_repository()
-        )
-        logger.info("Mark attendance use case initialized")
-    return _mark_attendance_use_case
+    """Create a mark attendance use case instance (per request, see get_liveness_service)."""
+    return MarkAttendanceUseCase(
+        liveness_service=get_liveness_service(),
+        attendance_service=get_attendance_service(),
+        attendance_repository=get_attendance_repository(),
+        session_repository=get_session_repository()
+    )
 
 
+@_registry.singleton
 def get_get_analytics_use_case() -> GetAnalyticsUseCase:
     """Get or create get analytics use case instance."""
-    global _get_analytics_use_case
-    if _get_analytics_use_case is None:
-        _get_analytics_use_case = GetAnalyticsUseCase(
-            metrics_calculator=get_metrics_calculator(),
-            timeline_analyzer=get_timeline_analyzer(),
-            attendance_repository=get_attendance_repository()
-        )
-        logger.info("Get analytics use case initialized")
-    return _get_analytics_use_case
+    get_analytics_use_case = GetAnalyticsUseCase(
+        metrics_calculator=get_metrics_calculator(),
+        timeline_analyzer=get_timeline_analyzer(),
+        attendance_repository=get_attendance_repository()
+    )
+    logger.info("Get analytics use case initialized")
+    return get_analytics_use_case
 
 
+@_registry.singleton
 def get_generate_leaderboard_use_case() -> GenerateLeaderboardUseCase:
     """Get or create generate leaderboard use case instance."""
-    global _generate_leaderboard_use_case
-    if _generate_leaderboard_use_case is None:
-        _generate_leaderboard_use_case = GenerateLeaderboardUseCase(
-            leaderboard_generator=get_leaderboard_generator(),
-            metrics_calculator=get_metrics_calculator(),
-            streak_calculator=get_streak_calculator(),
-            badge_calculator=get_badge_calculator(),
-            attendance_repository=get_attendance_repository(),
-            user_repository=get_user_repository()
-        )
-        logger.info("Generate leaderboard use case initialized")
-    return _generate_leaderboard_use_case
-
-
+    generate_leaderboard_use_case = GenerateLeaderboardUseCase(
+        leaderboard_generator=get_leaderboard_generator(),
+        metrics_calculator=get_metrics_calculator(),
+        streak_calculator=get_streak_calculator(),
+        badge_calculator=get_badge_calculator(),
+        attendance_repository=get_attendance_repository(),
+        user_repository=get_user_repository()
+    )
+    logger.info("Generate leaderboard use case initialized")
+    return generate_leaderboard_use_case
+
+
+@_registry.singleton
 def get_get_all_users_use_case() -> GetAllUsersUseCase:
     """Get or create get all users use case instance."""
-    global _get_all_users_use_case
-    if _get_all_users_use_case is None:
-        _get_all_users_use_case = GetAllUsersUseCase(
-            user_repository=get_user_repository()
-        )
-        logger.info("Get all users use case initialized")
-    return _get_all_users_use_case
-
-
+    get_all_users_use_case = GetAllUsersUseCase(
+        user_repository=get_user_repository()
+    )
+    logger.info("Get all users use case initialized")
+    return get_all_users_use_case
+
+
+@_registry.singleton
+def get_user_registration_service() -> UserRegistrationService:
+    """Get or create user registration service instance."""
+    user_registration_service = UserRegistrationService(
+        face_detector=get_face_detector(),
+        embedding_extractor=get_embedding_extractor(),
+        quality_assessor=get_quality_assessor()
+    )
+    logger.info("User registration service initialized")
+    return user_registration_service
+
+
+@_registry.singleton
 def get_register_user_use_case() -> RegisterUserUseCase:
     """Get or create register user use case instance."""
-    global _register_user_use_case
-    if _register_user_use_case is None:
-        from domain.services.recognition import UserRegistrationService
-        user_registration_service = UserRegistrationService(
-            face_detector=get_face_detector(),
-            embedding_extractor=get_embedding_extractor(),
-            quality_assessor=get_quality_assessor()
-        )
-        _register_user_use_case = RegisterUserUseCase(
-            registration_service=user_registration_service,
-            user_repository=get_user_repository(),
-            face_repository=get_face_repository()
-        )
-        logger.info("Register user use case initialized")
-    return _register_user_use_case
-
-
+    register_user_use_case = RegisterUserUseCase(
+        registration_service=get_user_registration_service(),
+        user_repository=get_user_repository(),
+        face_repository=get_face_repository(),
+        fast_embedding_extractor=get_fast_embedding_extractor()
+    )
+    logger.info("Register user use case initialized")
+    return register_user_use_case
+
+
+@_registry.singleton
+def get_bulk_register_users_use_case() -> BulkRegisterUsersUseCase:
+    """Get or create bulk register users use case instance."""
+    bulk_register_users_use_case = BulkRegisterUsersUseCase(
+        registration_service=get_user_registration_service(),
+        user_repository=get_user_repository(),
+        face_repository=get_face_repository(),
+        fast_embedding_extractor=get_fast_embedding_extractor()
+    )
+    logger.info("Bulk register users use case initialized")
+    return bulk_register_users_use_case
+
+
+@_registry.singleton
 def get_get_user_info_use_case() -> GetUserInfoUseCase:
     """Get or create get user info use case instance."""
-    global _get_user_info_use_case
-    if _get_user_info_use_case is None:
-        _get_user_info_use_case = GetUserInfoUseCase(
-            user_repository=get_user_repository(),
-            attendance_repository=get_attendance_repository(),
-            metrics_calculator=get_metrics_calculator()
-        )
-        logger.info("Get user info use case initialized")
-    return _get_user_info_use_case
+    get_user_info_use_case = GetUserInfoUseCase(
+        user_repository=get_user_repository(),
+        attendance_repository=get_attendance_repository(),
+        metrics_calculator=get_metrics_calculator()
+    )
+    logger.info("Get user info use case initialized")
+    return get_user_info_use_case
 
 
+@_registry.singleton
 def get_get_user_performance_use_case() -> GetUserPerformanceUseCase:
     """Get or create get user performance use case instance."""
-    global _get_user_performance_use_case
-    if _get_user_performance_use_case is None:
-        _get_user_performance_use_case = GetUserPerformanceUseCase(
-            metrics_calculator=get_metrics_calculator(),
-            streak_calculator=get_streak_calculator(),
-            attendance_repository=get_attendance_repository()
-        )
-        logger.info("Get user performance use case initialized")
-    return _get_user_performance_use_case
+    get_user_performance_use_case = GetUserPerformanceUseCase(
+        metrics_calculator=get_metrics_calculator(),
+        streak_calculator=get_streak_calculator(),
+        attendance_repository=get_attendance_repository()
+    )
+    logger.info("Get user performance use case initialized")
+    return get_user_performance_use_case
 
 
+@_registry.singleton
 def get_update_user_info_use_case() -> UpdateUserInfoUseCase:
     """Get or create update user info use case instance."""
-    global _update_user_info_use_case
-    if _update_user_info_use_case is None:
-        _update_user_info_use_case = UpdateUserInfoUseCase(
-            user_repository=get_user_repository()
-        )
-        logger.info("Update user info use case initialized")
-    return _update_user_info_use_case
+    update_user_info_use_case = UpdateUserInfoUseCase(
+        user_repository=get_user_repository()
+    )
+    logger.info("Update user info use case initialized")
+    return update_user_info_use_case
 
 
+@_registry.singleton
 def get_get_attendance_records_use_case() -> GetAttendanceRecordsUseCase:
     """Get or create get attendance records use case instance."""
-    global _get_attendance_records_use_case
-    if _get_attendance_records_use_case is None:
-        _get_attendance_records_use_case = GetAttendanceRecordsUseCase(
-            attendance_repository=get_attendance_repository()
-        )
-        logger.info("Get attendance records use case initialized")
-    return _get_attendance_records_use_case
+    get_attendance_records_use_case = GetAttendanceRecordsUseCase(
+        attendance_repository=get_attendance_repository()
+    )
+    logger.info("Get attendance records use case initialized")
+    return get_attendance_records_use_case
 
 
+@_registry.singleton
 def get_mark_class_attendance_use_case() -> MarkClassAttendanceUseCase:
     """Get or create mark class attendance use case instance."""
-    global _mark_class_attendance_use_case
-    if _mark_class_attendance_use_case is None:
-        _mark_class_attendance_use_case = MarkClassAttendanceUseCase(
-            face_recognition_service=get_face_recognition_service_class_attendance(),
-            attendance_service=get_attendance_service(),
-            attendance_repository=get_attendance_repository(),
-            face_repository=get_face_repository(),
-            user_repository=get_user_repository()
-        )
-        logger.info("Mark class attendance use case initialized with lower thresholds (confidence=0.35, quality=0.3)")
-    return _mark_class_attendance_use_case
-
+    mark_class_attendance_use_case = MarkClassAttendanceUseCase(
+        face_recognition_service=get_face_recognition_service_class_attendance(),
+        attendance_service=get_attendance_service(),
+        attendance_repository=get_attendance_repository(),
+        face_repository=get_face_repository(),
+        user_repository=get_user_repository(),
+        roster_repository=get_roster_repository()
+    )
+    logger.info("Mark class attendance use case initialized with lower thresholds (confidence=0.35, quality=0.3)")
+    return mark_class_attendance_use_case
+
+
+@_registry.singleton
+def get_ingest_lecture_video_use_case() -> IngestLectureVideoUseCase:
+    """Get or create ingest lecture video use case instance."""
+    ingest_lecture_video_use_case = IngestLectureVideoUseCase(
+        face_recognition_service=get_face_recognition_service_class_attendance(),
+        attendance_service=get_attendance_service(),
+        attendance_repository=get_attendance_repository(),
+        face_repository=get_face_repository(),
+        roster_repository=get_roster_repository()
+    )
+    logger.info("Ingest lecture video use case initialized")
+    return ingest_lecture_video_use_case
+
+
+@_registry.singleton
+def get_backfill_class_attendance_use_case() -> BackfillClassAttendanceUseCase:
+    """Get or create backfill class attendance use case instance."""
+    backfill_class_attendance_use_case = BackfillClassAttendanceUseCase(
+        face_recognition_service=get_face_recognition_service_class_attendance(),
+        attendance_service=get_attendance_service(),
+        attendance_repository=get_attendance_repository(),
+        face_repository=get_face_repository(),
+        roster_repository=get_roster_repository()
+    )
+    logger.info("Backfill class attendance use case initialized")
+    return backfill_class_attendance_use_case
+
+
+@_registry.singleton
+def get_register_roster_use_case() -> RegisterRosterUseCase:
+    """Get or create register roster use case instance."""
+    register_roster_use_case = RegisterRosterUseCase(roster_repository=get_roster_repository())
+    logger.info("Register roster use case initialized")
+    return register_roster_use_case
+
+
+@_registry.singleton
+def get_get_rosters_use_case() -> GetRostersUseCase:
+    """Get or create get rosters use case instance."""
+    get_rosters_use_case = GetRostersUseCase(roster_repository=get_roster_repository())
+    logger.info("Get rosters use case initialized")
+    return get_rosters_use_case
+
+
+@_registry.singleton
+def get_sync_cascade_gallery_use_case() -> Optional[SyncCascadeGalleryUseCase]:
+    """Get or create sync cascade gallery use case instance (None if the cascade is disabled)."""
+    fast_embedding_extractor = get_fast_embedding_extractor()
+    if fast_embedding_extractor is None:
+        return None
+    sync_cascade_gallery_use_case = SyncCascadeGalleryUseCase(
+        face_repository=get_face_repository(),
+        fast_embedding_extractor=fast_embedding_extractor
+    )
+    logger.info("Sync cascade gallery use case initialized")
+    return sync_cascade_gallery_use_case
+
+
+@_registry.singleton
+def get_reembed_gallery_use_case() -> ReembedGalleryUseCase:
+    """Get or create re-embed gallery use case instance."""
+    reembed_gallery_use_case = ReembedGalleryUseCase(
+        face_repository=get_face_repository(),
+        embedding_extractor=get_embedding_extractor()
+    )
+    logger.info("Re-embed gallery use case initialized")
+    return reembed_gallery_use_case
@@ -0,0 +1,112 @@
+"""
+Background gallery migration.
+
+Runs the re-embed gallery use case in a daemon thread, so the API keeps
+serving from the old gallery while the new one is built, and tracks its
+progress for the admin endpoint. The migration is started at startup when
+the gallery was not embedded with the current embedding model, or on
+demand through POST /api/admin/gallery/migration. Every uvicorn worker runs
+the startup check; the use case's job lock lets one process migrate and the
+others return an error.
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from api import dependencies
+from use_cases.reembed_gallery import ReembedGalleryProgress, ReembedGalleryRequest
+
+logger = logging.getLogger(__name__)
+
+
+class GalleryMigrationJob:
+    """Thread-safe state of the (at most one) running gallery migration."""
+
+    def __init__(self):
+        """Initialize an idle job."""
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._state: Dict[str, Any] = {"status": "idle"}
+
+    @property
+    def is_running(self) -> bool:
+        """Return True while a migration thread is running."""
+        with self._lock:
+            return self._thread is not None and self._thread.is_alive()
+
+    def start(self, request: ReembedGalleryRequest) -> bool:
+        """
+        Start a migration in a daemon thread.
+
+        Args:
+            request: Migration request (its progress_callback is replaced).
+
+        Returns:
+            False if a migration is already running.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._state = {
+                "status": "running",
+                "started_at": datetime.now().isoformat(),
+                "completed_at": None,
+                "error": None
+            }
+            request.progress_callback = self._record_progress
+            self._thread = threading.Thread(
+                target=self._run, args=(request,), name="gallery-migration", daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a JSON-serializable copy of the job state."""
+        with self._lock:
+            return dict(self._state)
+
+    def _record_progress(self, progress: ReembedGalleryProgress) -> None:
+        with self._lock:
+            self._state.update(
+                model_name=progress.model_name,
+                total_users=progress.total_users,
+                already_staged=progress.already_staged,
+                embedded=progress.embedded,
+                failed=progress.failed
+            )
+
+    def _run(self, request: ReembedGalleryRequest) -> None:
+        try:
+            response = dependencies.get_reembed_gallery_use_case().execute(request)
+            result = {
+                "status": "completed" if response.success else "failed",
+                "model_name": response.model_name,
+                "previous_model": response.previous_model,
+                "total_users": response.total_users,
+                "already_staged": response.already_staged,
+                "embedded": response.embedded,
+                "failed": len(response.failed_users),
+                "failed_users": response.failed_users,
+                "swapped": response.swapped,
+                "error": response.error
+            }
+        except Exception as e:
+            # e.g. the embedding model could not be loaded
+            logger.exception(f"Gallery migration failed: {e}")
+            result = {"status": "failed", "error": f"{type(e).__name__}: {e}"}
+        with self._lock:
+            self._state.update(result, completed_at=datetime.now().isoformat())
+
+
+migration_job = GalleryMigrationJob()
+
+
+def migrate_gallery_if_outdated() -> None:
+    """Start a migration if the gallery was not embedded with the current model."""
+    use_case = dependencies.get_reembed_gallery_use_case()
+    if use_case.is_current():
+        return
+    logger.info(f"Gallery was not embedded with {use_case.model_name}; starting re-embedding in the background")
+    migration_job.start(ReembedGalleryRequest())
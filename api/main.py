@@ -7,8 +7,9 @@ middleware, and error handlers.
 
 import logging
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
 
-from api.routes import attendance, analytics, leaderboard, users
+from api.routes import admin, attendance, analytics, leaderboard, rosters, users
 from api.middleware.cors import setup_cors
 from api.middleware.error_handler import (
     domain_exception_handler,
@@ -17,7 +18,9 @@ from api.middleware.error_handler import (
     general_exception_handler
 )
 from api.middleware.logging import LoggingMiddleware
+from api.startup import lifespan, readiness
 from domain.shared.exceptions import DomainException
+from core.shared.metrics import metrics_registry
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -35,7 +38,8 @@ app = FastAPI(
     description="REST API for EyeD AI Attendance System",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Setup CORS
@@ -75,6 +79,18 @@ app.include_router(
     tags=["users"]
 )
 
+app.include_router(
+    rosters.router,
+    prefix="/api/rosters",
+    tags=["rosters"]
+)
+
+app.include_router(
+    admin.router,
+    prefix="/api/admin",
+    tags=["admin"]
+)
+
 
 @app.get("/")
 async def root():
@@ -92,6 +108,23 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def ready():
+    """Readiness endpoint: 200 once models are warmed up, 503 until then."""
+    snapshot = readiness.snapshot()
+    status_code = 200 if snapshot["status"] == "ready" else 503
+    return JSONResponse(content=snapshot, status_code=status_code)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Metrics endpoint (Prometheus text exposition format)."""
+    return PlainTextResponse(
+        metrics_registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -7,8 +7,16 @@ import time
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from core.shared.metrics import metrics_registry
+
 logger = logging.getLogger(__name__)
 
+_REQUEST_SECONDS = metrics_registry.histogram(
+    "eyed_http_request_duration_seconds",
+    "HTTP request latency in seconds, by route template",
+    ("method", "route", "status_code")
+)
+
 
 class LoggingMiddleware(BaseHTTPMiddleware):
     """Middleware to log all HTTP requests and responses."""
@@ -33,6 +41,15 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         # Calculate duration
         duration = time.time() - start_time
         
+        # Record latency by route template (not raw path) to keep label cardinality bounded
+        route = request.scope.get("route")
+        _REQUEST_SECONDS.observe(
+            duration,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status_code=str(response.status_code)
+        )
+        
         # Log response
         logger.info(
             f"Response: {request.method} {request.url.path} - {response.status_code} ({duration:.3f}s)",
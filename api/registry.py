@@ -0,0 +1,110 @@
+"""
+Thread-safe component registry for dependency injection.
+
+The API builds its components (models, repositories, services, use cases)
+lazily on first use and shares them between requests. Requests run
+concurrently, so a plain check-then-set on a module global can construct
+the same component twice, e.g. load two TensorFlow models when the first
+two requests arrive together. The registry guards construction with one
+lock per component and double-checked reads, so each shared component is
+built exactly once while unrelated components can still be built in
+parallel (as the startup warm-up does).
+"""
+
+import functools
+import threading
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class ComponentRegistry:
+    """
+    Registry of lazily constructed, shared components.
+
+    This class is responsible ONLY for:
+    - Constructing each named component at most once, on first request
+    - Serializing concurrent construction of the same component
+    - Resetting components (e.g. between tests)
+
+    It does NOT decide which components are shared; stateful, per-request
+    components should be created without going through the registry.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._instances: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.RLock] = {}
+        self._locks_guard = threading.Lock()
+
+    def get_or_create(self, name: str, factory: Callable[[], T]) -> T:
+        """
+        Return the component registered under name, creating it if needed.
+
+        If the factory raises, nothing is registered and the next call
+        tries again.
+
+        Args:
+            name: Component name.
+            factory: Zero-argument callable creating the component. It may
+                request other components from the registry.
+
+        Returns:
+            The shared component instance.
+        """
+        instance = self._instances.get(name, _MISSING)
+        if instance is not _MISSING:
+            return instance
+
+        with self._lock_for(name):
+            instance = self._instances.get(name, _MISSING)
+            if instance is _MISSING:
+                instance = factory()
+                self._instances[name] = instance
+        return instance
+
+    def singleton(self, factory: Callable[[], T]) -> Callable[[], T]:
+        """
+        Decorate a factory function so it returns one shared instance.
+
+        The component is registered under the function name.
+
+        Args:
+            factory: Zero-argument function creating the component.
+
+        Returns:
+            Wrapped function returning the shared instance.
+        """
+        @functools.wraps(factory)
+        def get_instance() -> T:
+            return self.get_or_create(factory.__name__, factory)
+        return get_instance
+
+    def is_initialized(self, name: str) -> bool:
+        """Return True if the named component has been created."""
+        return name in self._instances
+
+    def reset(self, name: Optional[str] = None) -> None:
+        """
+        Forget created components so they are rebuilt on next use.
+
+        Args:
+            name: Component to forget, or None to forget all components.
+        """
+        with self._locks_guard:
+            if name is None:
+                self._instances.clear()
+            else:
+                self._instances.pop(name, None)
+
+    def _lock_for(self, name: str) -> threading.RLock:
+        """Return the construction lock of a component, creating it if needed."""
+        with self._locks_guard:
+            lock = self._locks.get(name)
+            if lock is None:
+                # Re-entrant so a factory can safely be re-entered by its own thread
+                lock = threading.RLock()
+                self._locks[name] = lock
+            return lock
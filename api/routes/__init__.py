@@ -1,11 +1,3 @@
-from . import attendance, analytics, leaderboard, users
-
-__all__ = ["attendance", "analytics", "leaderboard", "users"]
-
-
-
-
-
-
-
+from . import admin, attendance, analytics, leaderboard, rosters, users
 
+__all__ = ["admin", "attendance", "analytics", "leaderboard", "rosters", "users"]
@@ -0,0 +1,104 @@
+"""
+Admin API routes.
+
+This module provides REST API endpoints for maintenance jobs (gallery
+re-embedding). It acts as a thin adapter between HTTP requests and the
+background jobs.
+"""
+
+import logging
+from typing import Optional
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+
+from api.dependencies import get_reembed_gallery_use_case
+from api.gallery_migration import migration_job
+from use_cases.reembed_gallery import ReembedGalleryRequest, ReembedGalleryUseCase
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+# ==================== DTOs ====================
+
+class StartGalleryMigrationRequestDTO(BaseModel):
+    """Request DTO for starting a gallery migration."""
+    batchSize: int = 32
+    allowMissing: bool = False
+    restart: bool = False
+
+
+class GalleryMigrationStatusDTO(BaseModel):
+    """DTO for the gallery migration status."""
+    success: bool
+    status: str  # idle, running, completed or failed
+    modelName: Optional[str] = None
+    galleryModel: Optional[str] = None
+    totalUsers: Optional[int] = None
+    stagedUsers: Optional[int] = None
+    failedUsers: list[str] = []
+    swapped: bool = False
+    startedAt: Optional[str] = None
+    completedAt: Optional[str] = None
+    error: Optional[str] = None
+
+
+def _status(use_case: ReembedGalleryUseCase, error: Optional[str] = None) -> GalleryMigrationStatusDTO:
+    """Combine the job state with the gallery's recorded model and staging file."""
+    job = migration_job.snapshot()
+    return GalleryMigrationStatusDTO(
+        success=error is None,
+        status=job["status"],
+        modelName=use_case.model_name,
+        galleryModel=use_case.gallery_model(),
+        totalUsers=job.get("total_users"),
+        # Read from the staging file, so runs of reembed_gallery.py show up too
+        stagedUsers=use_case.staged_count(),
+        failedUsers=job.get("failed_users") or [],
+        swapped=bool(job.get("swapped")),
+        startedAt=job.get("started_at"),
+        completedAt=job.get("completed_at"),
+        error=error or job.get("error")
+    )
+
+
+# ==================== Endpoints ====================
+
+@router.get("/gallery/migration", response_model=GalleryMigrationStatusDTO)
+async def get_gallery_migration(
+    use_case: ReembedGalleryUseCase = Depends(get_reembed_gallery_use_case)
+):
+    """
+    Gallery migration progress endpoint.
+
+    NO business logic here - all in use case.
+    """
+    try:
+        return _status(use_case)
+    except Exception as e:
+        logger.exception(f"Unexpected error in get_gallery_migration: {str(e)}")
+        return GalleryMigrationStatusDTO(success=False, status="unknown", error=f"Internal server error: {str(e)}")
+
+
+@router.post("/gallery/migration", response_model=GalleryMigrationStatusDTO)
+async def start_gallery_migration(
+    request: StartGalleryMigrationRequestDTO,
+    use_case: ReembedGalleryUseCase = Depends(get_reembed_gallery_use_case)
+):
+    """
+    Start re-embedding the gallery with the current model in the background.
+
+    Users staged by an earlier run are skipped unless restart is set.
+    NO business logic here - all in use case.
+    """
+    try:
+        started = migration_job.start(ReembedGalleryRequest(
+            embedding_batch_size=request.batchSize,
+            allow_missing=request.allowMissing,
+            restart=request.restart
+        ))
+        return _status(use_case, error=None if started else "A gallery migration is already running")
+    except Exception as e:
+        logger.exception(f"Unexpected error in start_gallery_migration: {str(e)}")
+        return GalleryMigrationStatusDTO(success=False, status="unknown", error=f"Internal server error: {str(e)}")
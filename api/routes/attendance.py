@@ -7,7 +7,8 @@ It acts as a thin adapter between HTTP requests and use cases.
 
 import base64
 import logging
-from typing import List, Optional
+from collections.abc import Sequence
+from typing import Dict, List, Optional
 from datetime import date, time, datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
@@ -25,8 +26,10 @@ from api.dependencies import (
     get_recognize_face_use_case,
     get_get_attendance_records_use_case,
     get_get_all_users_use_case,
-    get_mark_class_attendance_use_case
+    get_mark_class_attendance_use_case,
+    get_inference_scheduler
 )
+from core.shared.inference_scheduler import InferenceScheduler, PRIORITY_BULK, PRIORITY_INTERACTIVE
 from core.recognition.quality_assessor import QualityAssessor
 from domain.shared.exceptions import (
     DailyLimitExceededError,
@@ -41,6 +44,7 @@ router = APIRouter()
 class RecognizeFaceRequestDTO(BaseModel):
     """Request DTO for recognizing a face."""
     frame: str  # Base64 encoded single frame
+    location: Optional[str] = None  # Kiosk location; its roster is searched first
 
 
 class RecognizeFaceResponseDTO(BaseModel):
@@ -51,16 +55,18 @@ class RecognizeFaceResponseDTO(BaseModel):
     confidence: Optional[float] = None
     message: str
     dailyLimitReached: bool = False
+    sessionId: Optional[str] = None  # Pass to /mark along with userId, userName, faceImage and confidence
 
 
 class MarkAttendanceRequestDTO(BaseModel):
     """Request DTO for marking attendance."""
     frames: List[str]  # Base64 encoded frames for blink detection
     landmarks: Optional[List[List[List[float]]]] = None  # Optional landmarks from frontend: [[[x, y], ...], ...]
-    userId: str  # REQUIRED - from Phase 1
-    userName: str  # REQUIRED - from Phase 1
-    faceImage: str  # REQUIRED - Base64 encoded single frame from Phase 1
-    confidence: float  # REQUIRED - Recognition confidence from Phase 1
+    sessionId: Optional[str] = None  # Session from Phase 1; the four fields below are used if another worker holds it
+    userId: Optional[str] = None  # REQUIRED without sessionId - from Phase 1
+    userName: Optional[str] = None  # REQUIRED without sessionId - from Phase 1
+    faceImage: Optional[str] = None  # REQUIRED without sessionId - Base64 encoded single frame from Phase 1
+    confidence: Optional[float] = None  # REQUIRED without sessionId - Recognition confidence from Phase 1
     faceQualityScore: Optional[float] = None  # Optional - Quality score from Phase 1, will be recalculated if not provided
     location: Optional[str] = None
     blinkCount: Optional[int] = None  # Optional - Blink count from frontend (trusted if >= 3)
@@ -156,6 +162,25 @@ def _base64_to_numpy(base64_string: str) -> np.ndarray:
     Returns:
         Numpy array representing the image (RGB format)
     """
+    return _image_to_numpy(_open_base64_image(base64_string))
+
+
+def _open_base64_image(base64_string: str) -> Image.Image:
+    """
+    Open a base64 encoded image without decoding its pixels.
+    
+    Pillow only reads the header here, so format errors are reported
+    immediately while pixel decoding is deferred to _image_to_numpy.
+    
+    Args:
+        base64_string: Base64 encoded image string (with or without data URL prefix)
+    
+    Returns:
+        Opened PIL image
+    
+    Raises:
+        HTTPException: 400 if the string is not a valid image
+    """
     try:
         # Remove data URL prefix if present (e.g., "data:image/jpeg;base64,...")
         if ',' in base64_string:
@@ -165,8 +190,23 @@ def _base64_to_numpy(base64_string: str) -> np.ndarray:
         image_bytes = base64.b64decode(base64_string)
         
         # Convert to PIL Image
-        image = Image.open(io.BytesIO(image_bytes))
-        
+        return Image.open(io.BytesIO(image_bytes))
+    except Exception as e:
+        logger.error(f"Error converting base64 to numpy: {str(e)}")
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid image format: {str(e)}"
+        )
+
+
+def _image_to_numpy(image: Image.Image) -> np.ndarray:
+    """
+    Decode an opened PIL image into an RGB numpy array.
+    
+    Raises:
+        HTTPException: 400 if the pixel data cannot be decoded
+    """
+    try:
         # Convert to RGB if necessary
         if image.mode != 'RGB':
             image = image.convert('RGB')
@@ -181,24 +221,92 @@ def _base64_to_numpy(base64_string: str) -> np.ndarray:
         )
 
 
+class _LazyFrames(Sequence):
+    """
+    Liveness frames whose pixels are decoded on first access.
+    
+    Streaming liveness verification stops early and samples frames, so
+    frames it never looks at are never decoded. Headers are still parsed
+    up front so malformed images are rejected with a 400 as before. Pixel
+    errors surface inside the use case; they are recorded in decode_error
+    so the route can still answer with a 400.
+    """
+    
+    def __init__(self, encoded_frames: List[str]):
+        self._images = [_open_base64_image(frame) for frame in encoded_frames]
+        self._decoded: Dict[int, np.ndarray] = {}
+        self.decode_error: Optional[HTTPException] = None
+    
+    def __len__(self) -> int:
+        return len(self._images)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(len(self._images))[index]
+        frame = self._decoded.get(index)
+        if frame is None:
+            try:
+                frame = _image_to_numpy(self._images[index])
+            except HTTPException as e:
+                self.decode_error = e
+                raise
+            self._decoded[index] = frame
+        return frame
+    
+    @property
+    def decoded_count(self) -> int:
+        """Return the number of frames decoded so far."""
+        return len(self._decoded)
+
+
 def _convert_to_use_case_request(dto: MarkAttendanceRequestDTO) -> MarkAttendanceRequest:
     """
     Convert DTO to use case request.
     
-    Extracts user info from Phase 1 (userId, userName, faceImage, confidence)
-    and converts base64 images to numpy arrays for use case processing.
+    With a sessionId, Phase 1 results (face crop, quality score, user and
+    confidence) are taken from the server-side session by the use case and
+    only the frames are decoded; the Phase 1 fields sent along are decoded
+    only if the session is held by another worker. Otherwise extracts user
+    info from Phase 1 (userId, userName, faceImage, confidence) and converts
+    base64 images to numpy arrays for use case processing.
     
     Args:
-        dto: Request DTO from frontend with user info from Phase 1
+        dto: Request DTO from frontend with a session ID or user info from Phase 1
     
     Returns:
         Use case request with numpy arrays, landmarks, and user info from Phase 1
     """
-    # Convert base64 frames to numpy arrays
-    frames_sequence = [_base64_to_numpy(frame) for frame in dto.frames]
+    # Convert base64 frames to numpy arrays as liveness verification reads them
+    frames_sequence = _LazyFrames(dto.frames)
     
-    # Convert faceImage from Phase 1 to numpy array
-    face_image = _base64_to_numpy(dto.faceImage)
+    if dto.sessionId:
+        return MarkAttendanceRequest(
+            frames_sequence=frames_sequence,
+            device_info="web",
+            location=dto.location or "unknown",
+            frontend_blink_count=dto.blinkCount,
+            session_id=dto.sessionId,
+            fallback_request=(
+                (lambda: _convert_phase1_fields(dto, frames_sequence)) if dto.faceImage else None
+            )
+        )
+    return _convert_phase1_fields(dto, frames_sequence)
+
+
+def _convert_phase1_fields(dto: MarkAttendanceRequestDTO, frames_sequence: Sequence[np.ndarray]) -> MarkAttendanceRequest:
+    """
+    Build a use case request from the Phase 1 fields sent by the client.
+    
+    Args:
+        dto: Request DTO with userId, userName, faceImage and confidence
+        frames_sequence: Already wrapped liveness frames
+    
+    Returns:
+        Use case request with the decoded face image and its quality score
+    """
+    # Convert faceImage from Phase 1 to numpy array (the use case rejects a missing one)
+    face_image = _base64_to_numpy(dto.faceImage) if dto.faceImage else None
     
     # Note: Landmarks are extracted server-side by LivenessService.verify_liveness()
     # Frontend landmarks are not used to avoid inconsistencies and ensure server-side validation
@@ -209,7 +317,7 @@ def _convert_to_use_case_request(dto: MarkAttendanceRequestDTO) -> MarkAttendanc
     
     # Calculate face quality score if not provided from Phase 1
     face_quality_score = dto.faceQualityScore
-    if face_quality_score is None:
+    if face_quality_score is None and face_image is not None:
         logger.info("Face quality score not provided from Phase 1, recalculating from faceImage")
         quality_assessor = QualityAssessor()
         quality_result = quality_assessor.assess(face_image)
@@ -223,11 +331,11 @@ def _convert_to_use_case_request(dto: MarkAttendanceRequestDTO) -> MarkAttendanc
     
     return MarkAttendanceRequest(
         frames_sequence=frames_sequence,
-        user_id=dto.userId,
-        user_name=dto.userName,
+        user_id=dto.userId or "",
+        user_name=dto.userName or "",
         face_image=face_image,
-        face_quality_score=face_quality_score,
-        confidence=dto.confidence,
+        face_quality_score=face_quality_score or 0.0,
+        confidence=dto.confidence or 0.0,
         device_info=device_info,
         location=location,
         frontend_blink_count=dto.blinkCount
@@ -267,10 +375,10 @@ def _convert_record_to_dto(
         error_message = response.error or "Failed to mark attendance"
         return MarkAttendanceResponseDTO(
             success=False,
-            userId=request.userId if request else "",
-            userName=request.userName if request else "",
+            userId=(request.userId or "") if request else "",
+            userName=(request.userName or "") if request else "",
             timestamp="",
-            confidence=request.confidence if request else 0.0,
+            confidence=(request.confidence or 0.0) if request else 0.0,
             message=error_message
         )
 
@@ -278,7 +386,8 @@ def _convert_record_to_dto(
 @router.post("/recognize", response_model=RecognizeFaceResponseDTO)
 async def recognize_face(
     request: RecognizeFaceRequestDTO,
-    use_case: RecognizeFaceUseCase = Depends(get_recognize_face_use_case)
+    use_case: RecognizeFaceUseCase = Depends(get_recognize_face_use_case),
+    scheduler: InferenceScheduler = Depends(get_inference_scheduler)
 ):
     """
     Recognize face endpoint for Phase 1.
@@ -297,10 +406,11 @@ async def recognize_face(
         frame_array = _base64_to_numpy(request.frame)
         
         # Create use case request
-        use_case_request = RecognizeFaceRequest(frame=frame_array)
+        use_case_request = RecognizeFaceRequest(frame=frame_array, location=request.location)
         
-        # Call use case (business logic is here)
-        response = use_case.execute(use_case_request)
+        # Call use case (business logic is here). Run it on an interactive worker so
+        # concurrent requests can be micro-batched and are served ahead of bulk jobs
+        response = await scheduler.run(PRIORITY_INTERACTIVE, use_case.execute, use_case_request)
         
         # Convert to DTO
         if response.success:
@@ -310,7 +420,8 @@ async def recognize_face(
                 userName=response.user_name,
                 confidence=response.confidence,
                 message=f"Face recognized: {response.user_name}",
-                dailyLimitReached=response.daily_limit_reached
+                dailyLimitReached=response.daily_limit_reached,
+                sessionId=response.session_id
             )
         else:
             # Error case - use case already handled exceptions internally
@@ -335,7 +446,8 @@ async def recognize_face(
 @router.post("/mark", response_model=MarkAttendanceResponseDTO)
 async def mark_attendance(
     request: MarkAttendanceRequestDTO,
-    use_case: MarkAttendanceUseCase = Depends(get_mark_attendance_use_case)
+    use_case: MarkAttendanceUseCase = Depends(get_mark_attendance_use_case),
+    scheduler: InferenceScheduler = Depends(get_inference_scheduler)
 ):
     """
     Mark attendance endpoint for Phase 2 (liveness verification).
@@ -353,25 +465,37 @@ async def mark_attendance(
     NO business logic here - all in use case.
     The use case handles liveness verification and returns the exact error message
     "Unable to verify Liveness and we detected less than 3 blinks" if verification fails.
+    
+    Clients should send the sessionId returned by /recognize; the face crop
+    and quality score are then reused from the server-side session. Sessions
+    are per worker, so clients send faceImage and the other Phase 1 fields
+    too; they are decoded only when the session is held by another worker.
     """
     try:
         # Convert DTO to use case request
         use_case_request = _convert_to_use_case_request(request)
         
-        # Call use case (business logic is here)
-        response = use_case.execute(use_case_request)
+        # Call use case (business logic is here) on an interactive worker
+        response = await scheduler.run(PRIORITY_INTERACTIVE, use_case.execute, use_case_request)
+        
+        # A frame that failed to decode is a client error, not a liveness failure
+        if use_case_request.frames_sequence.decode_error is not None:
+            raise use_case_request.frames_sequence.decode_error
         
         # Convert to DTO (uses error message from use case response)
         return _convert_record_to_dto(response, request)
         
+    except HTTPException:
+        raise
+    
     except DailyLimitExceededError as e:
         logger.warning(f"Daily limit exceeded: {e.message}")
         return MarkAttendanceResponseDTO(
             success=False,
-            userId=request.userId,
-            userName=request.userName,
+            userId=request.userId or "",
+            userName=request.userName or "",
             timestamp="",
-            confidence=request.confidence,
+            confidence=request.confidence or 0.0,
             message="Daily attendance limit exceeded. You have already marked attendance today."
         )
     
@@ -379,10 +503,10 @@ async def mark_attendance(
         logger.error(f"Invalid attendance record: {e.message}")
         return MarkAttendanceResponseDTO(
             success=False,
-            userId=request.userId,
-            userName=request.userName,
+            userId=request.userId or "",
+            userName=request.userName or "",
             timestamp="",
-            confidence=request.confidence,
+            confidence=request.confidence or 0.0,
             message=f"Failed to create attendance record: {e.message}"
         )
     
@@ -390,10 +514,10 @@ async def mark_attendance(
         logger.exception(f"Unexpected error in mark_attendance: {str(e)}")
         return MarkAttendanceResponseDTO(
             success=False,
-            userId=request.userId if hasattr(request, 'userId') else "",
-            userName=request.userName if hasattr(request, 'userName') else "",
+            userId=request.userId or "",
+            userName=request.userName or "",
             timestamp="",
-            confidence=request.confidence if hasattr(request, 'confidence') else 0.0,
+            confidence=request.confidence or 0.0,
             message="An unexpected error occurred. Please try again."
         )
 
@@ -655,7 +779,8 @@ async def get_attendance_stats(
 @router.post("/mark-class", response_model=MarkClassAttendanceResponseDTO)
 async def mark_class_attendance(
     request: MarkClassAttendanceRequestDTO,
-    use_case: MarkClassAttendanceUseCase = Depends(get_mark_class_attendance_use_case)
+    use_case: MarkClassAttendanceUseCase = Depends(get_mark_class_attendance_use_case),
+    scheduler: InferenceScheduler = Depends(get_inference_scheduler)
 ):
     """
     Mark class attendance endpoint.
@@ -684,8 +809,9 @@ async def mark_class_attendance(
             location=request.location or "unknown"
         )
         
-        # Call use case (business logic is here)
-        response = use_case.execute(use_case_request)
+        # Call use case (business logic is here) as bulk work, so a large class
+        # photo does not hold up interactive kiosk requests
+        response = await scheduler.run(PRIORITY_BULK, use_case.execute, use_case_request)
         
         # Convert response to DTOs
         current_timestamp = datetime.now().isoformat()
@@ -0,0 +1,118 @@
+"""
+Roster API routes.
+
+This module provides REST API endpoints for class roster operations.
+It acts as a thin adapter between HTTP requests and use cases.
+"""
+
+import logging
+from typing import Optional
+from fastapi import APIRouter, Depends, Path
+from pydantic import BaseModel
+
+from use_cases.manage_rosters import (
+    GetRostersRequest,
+    GetRostersUseCase,
+    RegisterRosterRequest,
+    RegisterRosterUseCase
+)
+from api.dependencies import get_get_rosters_use_case, get_register_roster_use_case
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+# ==================== DTOs ====================
+
+class RegisterRosterRequestDTO(BaseModel):
+    """Request DTO for registering a roster."""
+    userIds: list[str]
+
+
+class RosterDTO(BaseModel):
+    """DTO for a roster."""
+    location: str
+    userIds: list[str]
+
+
+class RegisterRosterResponseDTO(BaseModel):
+    """Response DTO for roster registration."""
+    success: bool
+    roster: Optional[RosterDTO] = None
+    error: Optional[str] = None
+
+
+class GetRostersResponseDTO(BaseModel):
+    """Response DTO for getting all rosters."""
+    success: bool
+    rosters: list[RosterDTO]
+    error: Optional[str] = None
+
+
+# ==================== Endpoints ====================
+
+@router.get("", response_model=GetRostersResponseDTO)
+async def get_rosters(
+    use_case: GetRostersUseCase = Depends(get_get_rosters_use_case)
+):
+    """
+    Get all rosters endpoint.
+
+    NO business logic here - all in use case.
+    """
+    try:
+        response = use_case.execute(GetRostersRequest())
+
+        if not response.success:
+            return GetRostersResponseDTO(success=False, rosters=[], error=response.error)
+
+        return GetRostersResponseDTO(
+            success=True,
+            rosters=[
+                RosterDTO(location=location, userIds=user_ids)
+                for location, user_ids in sorted(response.rosters.items())
+            ]
+        )
+
+    except Exception as e:
+        logger.exception(f"Unexpected error in get_rosters: {str(e)}")
+        return GetRostersResponseDTO(
+            success=False,
+            rosters=[],
+            error="An unexpected error occurred. Please try again."
+        )
+
+
+@router.put("/{location}", response_model=RegisterRosterResponseDTO)
+async def register_roster(
+    request: RegisterRosterRequestDTO,
+    location: str = Path(..., description="Location or session the roster belongs to"),
+    use_case: RegisterRosterUseCase = Depends(get_register_roster_use_case)
+):
+    """
+    Register (or replace) a roster endpoint.
+
+    Recognition at this location (/api/attendance/recognize with a location,
+    /api/attendance/mark-class) searches the roster's users first and the
+    full gallery only for faces that do not match any of them.
+
+    NO business logic here - all in use case.
+    """
+    try:
+        response = use_case.execute(RegisterRosterRequest(location=location, user_ids=request.userIds))
+
+        if not response.success:
+            return RegisterRosterResponseDTO(success=False, error=response.error)
+
+        return RegisterRosterResponseDTO(
+            success=True,
+            roster=RosterDTO(location=response.location, userIds=response.user_ids)
+        )
+
+    except Exception as e:
+        logger.exception(f"Unexpected error in register_roster: {str(e)}")
+        return RegisterRosterResponseDTO(
+            success=False,
+            error="An unexpected error occurred. Please try again."
+        )
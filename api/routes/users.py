@@ -5,7 +5,6 @@ This module provides REST API endpoints for user operations.
 It acts as a thin adapter between HTTP requests and use cases.
 """
 
-import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Optional
@@ -22,8 +21,10 @@ from api.dependencies import (
     get_register_user_use_case,
     get_get_user_info_use_case,
     get_get_user_performance_use_case,
-    get_update_user_info_use_case
+    get_update_user_info_use_case,
+    get_inference_scheduler
 )
+from core.shared.inference_scheduler import InferenceScheduler, PRIORITY_BULK
 from domain.entities.user import User
 from infrastructure.utils.image_converter import ImageConverter
 
@@ -202,7 +203,8 @@ async def get_all_users(
 @router.post("/register", response_model=RegisterUserResponseDTO)
 async def register_user(
     request: RegisterUserRequestDTO,
-    use_case: RegisterUserUseCase = Depends(get_register_user_use_case)
+    use_case: RegisterUserUseCase = Depends(get_register_user_use_case),
+    scheduler: InferenceScheduler = Depends(get_inference_scheduler)
 ):
     """
     Register user endpoint.
@@ -243,11 +245,10 @@ async def register_user(
             last_name=request.lastName
         )
         
-        # Run CPU-bound face recognition operations in thread pool to avoid blocking
-        # This allows the async endpoint to handle other requests while processing
-        loop = asyncio.get_event_loop()
-        response: RegisterUserResponse = await loop.run_in_executor(
-            None,  # Use default ThreadPoolExecutor
+        # Run CPU-bound face recognition operations on a bulk inference worker so
+        # the event loop stays free and interactive recognition is served first
+        response: RegisterUserResponse = await scheduler.run(
+            PRIORITY_BULK,
             use_case.execute,
             use_case_request
         )
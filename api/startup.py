@@ -0,0 +1,260 @@
+"""
+Application startup: model warm-up and readiness tracking.
+
+Loading the ML models (ArcFace via DeepFace/TensorFlow, MediaPipe graphs,
+YOLO weights) and running their first inference takes seconds. Without a
+warm-up, that cost lands on the first user request. This module warms the
+models up in parallel in a background thread when the API starts and tracks
+readiness separately from liveness:
+
+- /health: the process is up (always healthy once serving)
+- /ready: models are loaded and the recognition path can serve requests
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+from fastapi import FastAPI
+
+from api import dependencies
+from api.gallery_migration import migrate_gallery_if_outdated
+from core.shared.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+_WARMUP_SECONDS = metrics_registry.histogram(
+    "eyed_warmup_seconds",
+    "Model warm-up duration in seconds, by component",
+    ("component",),
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+)
+
+# Components without which recognition requests cannot be served
+REQUIRED_COMPONENTS = ("embedding_extractor", "face_detector")
+
+
+def _dummy_frame() -> np.ndarray:
+    """Return a blank camera-sized frame for warm-up inference."""
+    return np.full((480, 640, 3), 127, dtype=np.uint8)
+
+
+def _dummy_face() -> np.ndarray:
+    """Return a blank face crop for warm-up inference."""
+    return np.full((112, 112, 3), 127, dtype=np.uint8)
+
+
+def _warm_up_embedding_extractor() -> None:
+    dependencies.get_embedding_extractor().extract(_dummy_face())
+
+
+def _warm_up_fast_embedding_extractor() -> None:
+    # No-op unless cascade recognition is enabled (EYED_RECOGNITION_CASCADE_MODEL)
+    extractor = dependencies.get_fast_embedding_extractor()
+    if extractor is not None:
+        extractor.extract(_dummy_face())
+
+
+def _warm_up_face_detector() -> None:
+    dependencies.get_face_detector().detect(_dummy_frame())
+
+
+def _warm_up_face_detector_mediapipe() -> None:
+    dependencies.get_face_detector_mediapipe().detect(_dummy_frame())
+
+
+def _warm_up_face_detector_yolo() -> None:
+    dependencies.get_face_detector_yolo().detect(_dummy_frame())
+
+
+def _warm_up_landmark_extractor() -> None:
+    dependencies.get_landmark_extractor().extract(_dummy_frame())
+
+
+# Each task builds one leaf component through its dependency getter and runs a
+# dummy inference. Tasks touch disjoint getters so they can run concurrently.
+WARMUP_TASKS: Dict[str, Callable[[], None]] = {
+    "embedding_extractor": _warm_up_embedding_extractor,
+    "fast_embedding_extractor": _warm_up_fast_embedding_extractor,
+    "face_detector": _warm_up_face_detector,
+    "face_detector_mediapipe": _warm_up_face_detector_mediapipe,
+    "face_detector_yolo": _warm_up_face_detector_yolo,
+    "landmark_extractor": _warm_up_landmark_extractor,
+}
+
+
+class ReadinessState:
+    """
+    Thread-safe readiness state of the application.
+
+    Status moves from "starting" to "warming_up" to "ready" (all required
+    components warmed up) or "not_ready" (a required component failed).
+    Optional components that are unavailable (missing dependency) or failed
+    are reported but do not block readiness.
+    """
+
+    def __init__(self):
+        """Initialize readiness state."""
+        self._lock = threading.Lock()
+        self._status = "starting"
+        self._components: Dict[str, Dict[str, Any]] = {}
+        self._started_at: Optional[str] = None
+        self._completed_at: Optional[str] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True if the application is ready to serve recognition requests."""
+        with self._lock:
+            return self._status == "ready"
+
+    def mark_warming_up(self) -> None:
+        """Mark the start of model warm-up."""
+        with self._lock:
+            self._status = "warming_up"
+            self._started_at = datetime.now().isoformat()
+
+    def record_component(
+        self,
+        name: str,
+        status: str,
+        duration_ms: float,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Record the warm-up outcome of a component.
+
+        Args:
+            name: Component name.
+            status: "ready", "unavailable" (missing dependency) or "failed".
+            duration_ms: Warm-up duration in milliseconds.
+            error: Error message if the component is not ready.
+        """
+        with self._lock:
+            self._components[name] = {
+                "status": status,
+                "duration_ms": round(duration_ms, 1),
+                "error": error
+            }
+
+    def mark_complete(self) -> None:
+        """Mark warm-up as finished and compute the overall status."""
+        with self._lock:
+            required_ok = all(
+                self._components.get(name, {}).get("status", "ready") == "ready"
+                for name in REQUIRED_COMPONENTS
+            )
+            self._status = "ready" if required_ok else "not_ready"
+            self._completed_at = datetime.now().isoformat()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a JSON-serializable copy of the current state."""
+        with self._lock:
+            return {
+                "status": self._status,
+                "started_at": self._started_at,
+                "completed_at": self._completed_at,
+                "components": {name: dict(info) for name, info in self._components.items()}
+            }
+
+
+readiness = ReadinessState()
+
+
+def _run_task(name: str, task: Callable[[], None], state: ReadinessState) -> None:
+    """Run one warm-up task and record its outcome."""
+    start = time.perf_counter()
+    try:
+        task()
+        status, error = "ready", None
+    except ImportError as e:
+        status, error = "unavailable", str(e)
+    except Exception as e:
+        status, error = "failed", f"{type(e).__name__}: {e}"
+    duration = time.perf_counter() - start
+
+    _WARMUP_SECONDS.observe(duration, component=name)
+    state.record_component(name, status, duration * 1000, error)
+    if status == "ready":
+        logger.info(f"Warm-up of {name} completed in {duration:.2f}s")
+    else:
+        logger.warning(f"Warm-up of {name} {status} after {duration:.2f}s: {error}")
+
+
+def warm_up_models(
+    max_workers: int = 4,
+    state: ReadinessState = readiness,
+    tasks: Optional[Dict[str, Callable[[], None]]] = None
+) -> Dict[str, Any]:
+    """
+    Warm up all models in parallel and update readiness state.
+
+    Args:
+        max_workers: Number of warm-up threads.
+        state: Readiness state to update.
+        tasks: Warm-up tasks by component name (defaults to WARMUP_TASKS).
+
+    Returns:
+        Snapshot of the readiness state after warm-up.
+    """
+    tasks = WARMUP_TASKS if tasks is None else tasks
+    state.mark_warming_up()
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="warmup") as executor:
+        for name, task in tasks.items():
+            executor.submit(_run_task, name, task, state)
+
+    state.mark_complete()
+    snapshot = state.snapshot()
+    logger.info(f"Model warm-up finished in {time.perf_counter() - start:.2f}s: {snapshot['status']}")
+    return snapshot
+
+
+def sync_cascade_gallery() -> None:
+    """
+    Embed users missing from the cascade's fast-model gallery.
+
+    No-op if the cascade is disabled; of several uvicorn workers, only the
+    one that claims the sync job runs it.
+    """
+    use_case = dependencies.get_sync_cascade_gallery_use_case()
+    if use_case is None:
+        return
+    from use_cases.sync_cascade_gallery import SyncCascadeGalleryRequest
+    use_case.execute(SyncCascadeGalleryRequest())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    FastAPI lifespan handler that starts model warm-up in the background.
+
+    Warm-up runs in a daemon thread so the server starts accepting requests
+    (and answering /health) immediately; /ready reports 503 until it finishes.
+    Set EYED_WARMUP_ON_STARTUP=false to skip warm-up and load models lazily.
+    A gallery not embedded with the current model is re-embedded in the
+    background (by one of several uvicorn workers) unless
+    EYED_GALLERY_MIGRATION_ON_STARTUP=false.
+    """
+    settings = dependencies.get_settings()
+    if settings.warmup_on_startup:
+        thread = threading.Thread(
+            target=warm_up_models,
+            kwargs={"max_workers": settings.warmup_workers},
+            name="model-warmup",
+            daemon=True
+        )
+        thread.start()
+    else:
+        logger.info("Model warm-up disabled; models will load on first use")
+        readiness.mark_complete()
+    if settings.recognition_cascade_model:
+        threading.Thread(target=sync_cascade_gallery, name="cascade-gallery-sync", daemon=True).start()
+    if settings.gallery_migration_on_startup:
+        threading.Thread(target=migrate_gallery_if_outdated, name="gallery-migration-check", daemon=True).start()
+    yield
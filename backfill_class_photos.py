@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Backfill class attendance from a folder of class photos.
+
+Photos are decoded and their faces detected in a pool of worker processes.
+The parent process embeds the crops of several photos per batch against a
+gallery loaded once and saves each chunk with one bulk insert. Completed
+photos are recorded in a checkpoint file, so an interrupted run continues
+where it stopped when started again with the same arguments.
+
+Usage:
+    python backfill_class_photos.py archive/2024-fall --location "Room 101"
+    python backfill_class_photos.py archive/2024-03-04 --location "Room 101" --date 2024-03-04 --time 09:00
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+CHECKPOINT_NAME = ".eyed_backfill_checkpoint"
+
+# Per-process detector and quality assessor (set by _init_worker)
+_face_detector = None
+_quality_assessor = None
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Mark class attendance from a folder of class photos")
+    parser.add_argument("directory", help="Folder with class photos (searched recursively)")
+    parser.add_argument("--location", required=True, help="Location recorded with attendance (selects the roster)")
+    parser.add_argument("--date", type=date.fromisoformat, default=None,
+                        help="Attendance date YYYY-MM-DD (default: each photo's modification date)")
+    parser.add_argument("--time", type=lambda value: datetime.strptime(value, "%H:%M").time(), default=None,
+                        help="Attendance time HH:MM (default: each photo's modification time)")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) - 1),
+                        help="Detection processes (default: CPU count - 1)")
+    parser.add_argument("--batch-size", type=int, default=64, help="Face crops embedded per batch (default: 64)")
+    parser.add_argument("--checkpoint", default=None,
+                        help=f"Checkpoint file (default: {CHECKPOINT_NAME} in the photo folder)")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and process every photo")
+    return parser.parse_args()
+
+
+def _find_photos(directory: str) -> List[str]:
+    """Return the photo paths under directory, relative to it and sorted."""
+    photos = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                photos.append(os.path.relpath(os.path.join(root, name), directory))
+    return sorted(photos)
+
+
+def _init_worker() -> None:
+    """Load the detector and quality assessor once per worker process."""
+    global _face_detector, _quality_assessor
+    from api import dependencies
+
+    _face_detector = dependencies.get_face_detector_yolo()
+    _quality_assessor = dependencies.get_quality_assessor_class_attendance()
+
+
+def _detect(task: Tuple[str, str, datetime]):
+    """Decode one photo and detect its faces (runs in a worker process)."""
+    import cv2
+    from use_cases.backfill_class_attendance import detect_class_photo
+
+    photo_id, path, recorded_at = task
+    return detect_class_photo(photo_id, cv2.imread(path), recorded_at, _face_detector, _quality_assessor)
+
+
+def _recorded_at(path: str, day: Optional[date], time_of_day) -> datetime:
+    """Return the attendance date/time of a photo (flags override its modification time)."""
+    modified = datetime.fromtimestamp(os.path.getmtime(path))
+    return datetime.combine(day or modified.date(), time_of_day or modified.time())
+
+
+def main() -> None:
+    args = _parse_args()
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    from api import dependencies
+    from infrastructure.storage import CheckpointFile
+    from infrastructure.utils import map_in_processes
+    from use_cases.backfill_class_attendance import BackfillClassAttendanceRequest
+
+    checkpoint = CheckpointFile(args.checkpoint or os.path.join(args.directory, CHECKPOINT_NAME))
+    if args.restart:
+        checkpoint.clear()
+    done = checkpoint.load()
+
+    photos = _find_photos(args.directory)
+    todo = [photo for photo in photos if photo not in done]
+    print(f"{len(photos)} photos, {len(photos) - len(todo)} already done, {len(todo)} to process")
+    if not todo:
+        return
+
+    tasks = [
+        (photo, os.path.join(args.directory, photo),
+         _recorded_at(os.path.join(args.directory, photo), args.date, args.time))
+        for photo in todo
+    ]
+    started = time.time()
+
+    def report(progress) -> None:
+        checkpoint.add(progress.committed_photo_ids)
+        elapsed = time.time() - started
+        rate = progress.photos_processed / elapsed if elapsed > 0 else 0.0
+        remaining = (len(todo) - progress.photos_processed) / rate if rate > 0 else 0.0
+        print(f"\r{progress.photos_processed}/{len(todo)} photos ({rate:.1f}/s, ~{remaining:.0f}s left), "
+              f"{progress.faces_detected} faces, {progress.faces_recognized} recognized, "
+              f"{progress.total_marked} marked, {progress.photos_failed} failed", end="", flush=True)
+
+    # Load the embedding model before the workers start competing for CPU
+    use_case = dependencies.get_backfill_class_attendance_use_case()
+    response = use_case.execute(BackfillClassAttendanceRequest(
+        photos=map_in_processes(_detect, tasks, args.workers, initializer=_init_worker),
+        location=args.location,
+        embedding_batch_size=args.batch_size,
+        progress_callback=report
+    ))
+    print()
+
+    if not response.success:
+        sys.exit(f"Backfill failed: {response.error}")
+    print(f"Done in {time.time() - started:.0f}s: {response.photos_processed} photos, "
+          f"{response.faces_detected} faces, {response.faces_recognized} recognized, "
+          f"{response.total_marked} marked")
+    for photo_id, error in sorted(response.failed_photos.items()):
+        print(f"  failed: {photo_id} - {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""
+Performance benchmarks for EyeD AI Attendance System.
+
+This package contains a repeatable benchmark suite for the hot paths of the
+system (embedding matching, attendance persistence, analytics, export and
+face detection) driven by synthetic data generators. Results are written as
+JSON and can be compared against a stored baseline to catch regressions.
+
+Run with:
+    python -m benchmarks.run --profile quick
+"""
@@ -0,0 +1,125 @@
+"""
+Analytics, leaderboard and export benchmarks.
+
+Times GenerateLeaderboardUseCase.execute end-to-end against repositories
+backed by synthetic files, plus MetricsCalculator and ExportFormatter on
+in-memory record lists.
+"""
+
+import tempfile
+from pathlib import Path
+from typing import List
+
+from benchmarks.harness import BenchmarkResult, run_benchmark
+from benchmarks.synthetic import (
+    make_attendance_frame,
+    make_attendance_records,
+    make_gallery,
+    write_attendance_csv,
+    write_faces_json
+)
+from domain.services.analytics import MetricsCalculator
+from domain.services.gamification import (
+    BadgeCalculator,
+    BadgeDefinitions,
+    LeaderboardGenerator,
+    StreakCalculator
+)
+from infrastructure.storage.csv_handler import CSVHandler
+from infrastructure.storage.export_formatter import ExportFormatter
+from infrastructure.storage.file_storage import FileStorage
+from repositories.attendance_repository import AttendanceRepository
+from repositories.user_repository import UserRepository
+from use_cases.generate_leaderboard import GenerateLeaderboardRequest, GenerateLeaderboardUseCase
+
+# (attendance rows, users) for the end-to-end leaderboard benchmark
+LEADERBOARD_CASES = {
+    "quick": [(10_000, 50)],
+    "default": [(10_000, 50), (100_000, 200)],
+    "full": [(10_000, 50), (100_000, 200), (1_000_000, 500)],
+}
+
+RECORD_COUNTS = {
+    "quick": [10_000],
+    "default": [10_000, 100_000],
+    "full": [10_000, 100_000, 1_000_000],
+}
+
+
+def _run_leaderboard(profile: str) -> List[BenchmarkResult]:
+    """Benchmark GenerateLeaderboardUseCase.execute with file-backed repositories."""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="eyed_bench_") as temp_dir:
+        for rows, users in LEADERBOARD_CASES[profile]:
+            attendance_file = str(Path(temp_dir) / f"attendance_{rows}.csv")
+            faces_file = str(Path(temp_dir) / f"faces_{users}.json")
+            write_attendance_csv(attendance_file, make_attendance_frame(rows, users=users, days=30))
+            write_faces_json(faces_file, make_gallery(users))
+
+            file_storage = FileStorage()
+            use_case = GenerateLeaderboardUseCase(
+                leaderboard_generator=LeaderboardGenerator(),
+                metrics_calculator=MetricsCalculator(),
+                streak_calculator=StreakCalculator(),
+                badge_calculator=BadgeCalculator(BadgeDefinitions.default()),
+                attendance_repository=AttendanceRepository(
+                    CSVHandler(file_storage), data_file=attendance_file
+                ),
+                user_repository=UserRepository(file_storage, data_file=faces_file)
+            )
+            request = GenerateLeaderboardRequest(metric="attendance_rate", limit=10, period_days=30)
+
+            results.append(run_benchmark(
+                "generate_leaderboard",
+                lambda: use_case.execute(request),
+                params={"rows": rows, "users": users},
+                repeats=3 if rows <= 10_000 else 1,
+                warmup=0
+            ))
+    return results
+
+
+def _run_in_memory(profile: str) -> List[BenchmarkResult]:
+    """Benchmark MetricsCalculator and ExportFormatter on record lists."""
+    results = []
+    calculator = MetricsCalculator()
+    formatter = ExportFormatter()
+
+    for count in RECORD_COUNTS[profile]:
+        records = make_attendance_records(count)
+        repeats = 5 if count <= 10_000 else 2
+
+        results.append(run_benchmark(
+            "metrics_attendance_summary",
+            lambda: calculator.calculate_attendance_summary(records),
+            params={"records": count},
+            repeats=repeats
+        ))
+        results.append(run_benchmark(
+            "metrics_daily_statistics",
+            lambda: calculator.calculate_daily_statistics(records),
+            params={"records": count},
+            repeats=repeats
+        ))
+        for format_type in ("csv", "json"):
+            results.append(run_benchmark(
+                "export_format",
+                lambda: formatter.format(records, format_type),
+                params={"records": count, "format": format_type},
+                repeats=repeats
+            ))
+
+    return results
+
+
+def run(profile: str = "default") -> List[BenchmarkResult]:
+    """
+    Run analytics, leaderboard and export benchmarks.
+
+    Args:
+        profile: Size profile ("quick", "default" or "full").
+
+    Returns:
+        List of benchmark results.
+    """
+    return _run_leaderboard(profile) + _run_in_memory(profile)
@@ -0,0 +1,95 @@
+"""
+Attendance persistence benchmarks.
+
+Times AttendanceRepository.get_attendance_history, count_for_day (the daily
+limit check) and add_attendance against synthetic attendance CSV files of
+increasing size.
+"""
+
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+from typing import List
+
+from benchmarks.harness import BenchmarkResult, run_benchmark
+from benchmarks.synthetic import make_attendance_frame, write_attendance_csv
+from domain.entities.attendance_record import AttendanceRecord
+from infrastructure.storage.csv_handler import CSVHandler
+from infrastructure.storage.file_storage import FileStorage
+from repositories.attendance_repository import AttendanceRepository
+
+HISTORY_ROWS = {
+    "quick": [10_000, 100_000],
+    "default": [10_000, 100_000, 1_000_000],
+    "full": [10_000, 100_000, 1_000_000, 10_000_000],
+}
+
+
+def _new_record(index: int) -> AttendanceRecord:
+    """Create a record to append during the add_attendance benchmark."""
+    now = datetime.now()
+    return AttendanceRecord(
+        record_id=f"bench_{index}_{now.timestamp()}",
+        user_id="user_000001",
+        user_name="Name user_000001",
+        date=now.date(),
+        time=now.time().replace(microsecond=0),
+        confidence=0.9,
+        liveness_verified=True,
+        face_quality_score=0.9,
+        processing_time_ms=120.0,
+        verification_stage="Liveness Verified",
+        session_id=f"bench_{index}",
+        device_info="Benchmark",
+        location="Room 1",
+        status="Present"
+    )
+
+
+def run(profile: str = "default") -> List[BenchmarkResult]:
+    """
+    Run attendance repository benchmarks.
+
+    Args:
+        profile: Size profile ("quick", "default" or "full").
+
+    Returns:
+        List of benchmark results.
+    """
+    results = []
+    today = date.today()
+
+    with tempfile.TemporaryDirectory(prefix="eyed_bench_") as temp_dir:
+        for rows in HISTORY_ROWS[profile]:
+            data_file = str(Path(temp_dir) / f"attendance_{rows}.csv")
+            write_attendance_csv(data_file, make_attendance_frame(rows))
+            repository = AttendanceRepository(CSVHandler(FileStorage()), data_file=data_file)
+            repeats = 3 if rows <= 100_000 else 1
+
+            results.append(run_benchmark(
+                "get_attendance_history",
+                lambda: repository.get_attendance_history(
+                    user_id="user_000001", start_date=today, end_date=today
+                ),
+                params={"rows": rows, "filter": "user_today"},
+                repeats=repeats,
+                warmup=0
+            ))
+
+            results.append(run_benchmark(
+                "count_for_day",
+                lambda: repository.count_for_day("user_000001", today),
+                params={"rows": rows},
+                repeats=100
+            ))
+
+            counter = iter(range(1_000_000))
+            results.append(run_benchmark(
+                "add_attendance",
+                lambda: repository.add_attendance(_new_record(next(counter))),
+                params={"rows": rows},
+                repeats=repeats,
+                warmup=0
+            ))
+
+    return results
@@ -0,0 +1,90 @@
+"""
+Micro-batching benchmarks.
+
+Simulates a burst of concurrent /recognize requests (one thread per
+request) matching a probe against the gallery, once with a per-request
+FaceRecognizer.find_best_match call and once through a MicroBatcher that
+matches coalesced probes with one EmbeddingGallery matrix multiply.
+Each case times the whole burst.
+"""
+
+import threading
+from typing import Callable, List
+
+import numpy as np
+
+from benchmarks.harness import BenchmarkResult, run_benchmark
+from benchmarks.synthetic import make_gallery, make_probe
+from core.recognition.gallery import EmbeddingGallery
+from core.recognition.recognizer import FaceRecognizer
+from core.shared.constants import DEFAULT_CONFIDENCE_THRESHOLD
+from core.shared.micro_batcher import MicroBatcher
+
+GALLERY_SIZE = 1_000
+
+BURST_SIZES = {
+    "quick": [16, 64],
+    "default": [16, 64, 256],
+    "full": [16, 64, 256, 1024],
+}
+
+
+def _burst(requests: int, handle: Callable[[np.ndarray], object], probes: List[np.ndarray]) -> None:
+    """Run one request per thread, all released at the same moment."""
+    start = threading.Barrier(requests)
+
+    def request(i: int) -> None:
+        start.wait()
+        handle(probes[i % len(probes)])
+
+    threads = [threading.Thread(target=request, args=(i,)) for i in range(requests)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run(profile: str = "default") -> List[BenchmarkResult]:
+    """
+    Run micro-batching benchmarks.
+
+    Args:
+        profile: Size profile ("quick", "default" or "full").
+
+    Returns:
+        List of benchmark results (durations are per burst).
+    """
+    gallery_embeddings = make_gallery(GALLERY_SIZE, dimension=512)
+    user_ids = list(gallery_embeddings)
+    probes = [make_probe(gallery_embeddings, user_id=user_ids[i]) for i in range(32)]
+
+    recognizer = FaceRecognizer()
+    gallery = EmbeddingGallery.from_known_embeddings(gallery_embeddings)
+    batcher = MicroBatcher(
+        lambda batch: gallery.match(np.stack(batch), DEFAULT_CONFIDENCE_THRESHOLD),
+        max_batch_size=64,
+        max_wait_ms=2.0,
+        name="benchmark"
+    )
+
+    results = []
+    try:
+        for requests in BURST_SIZES[profile]:
+            results.append(run_benchmark(
+                "recognize_burst",
+                lambda: _burst(requests, lambda probe: recognizer.find_best_match(
+                    probe, gallery_embeddings, DEFAULT_CONFIDENCE_THRESHOLD
+                ), probes),
+                params={"requests": requests, "gallery_size": GALLERY_SIZE, "mode": "per_request"},
+                repeats=3
+            ))
+            results.append(run_benchmark(
+                "recognize_burst",
+                lambda: _burst(requests, batcher.process, probes),
+                params={"requests": requests, "gallery_size": GALLERY_SIZE, "mode": "micro_batched"},
+                repeats=3
+            ))
+    finally:
+        batcher.close()
+
+    return results
@@ -0,0 +1,188 @@
+"""
+Cascade recognition benchmarks.
+
+Replays single-face recognitions (the kiosk path) through
+FaceRecognitionService twice: full model only, and as a cascade with a
+cheap model in front. Embeddings are synthetic but correlated: each
+identity has a 512-d full-model embedding and a noisier 128-d fast-model
+projection of it, and probes vary in noise from clean to hard, plus a
+share of unenrolled visitors. Model inference is a sleep of typical CPU
+cost per model. Each case reports the per-face latency distribution; the
+escalation rate and both accuracies are printed alongside. With DeepFace
+installed, the real per-face cost of both models is timed as well.
+"""
+
+import statistics
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from benchmarks.harness import BenchmarkResult, run_benchmark
+from benchmarks.synthetic import make_images
+from core.recognition.cascade import CascadePolicy
+from core.recognition.embedding_extractor import DEEPFACE_AVAILABLE, EmbeddingExtractor
+from core.recognition.recognizer import FaceRecognizer
+from core.recognition.value_objects import EmbeddingResult
+from core.shared.constants import DEFAULT_EMBEDDING_MODEL
+from domain.services.recognition import FaceRecognitionService
+
+FULL_DIM = 512
+FAST_DIM = 128
+FAST_MODEL = "SFace"
+# Typical single-face CPU inference cost of ArcFace and SFace
+FULL_MODEL_SECONDS = 0.040
+FAST_MODEL_SECONDS = 0.004
+IMPOSTOR_SHARE = 0.1
+# Probe noise relative to the identity embedding, clean to hard
+NOISE_LEVELS = (0.3, 0.5, 0.8, 1.1)
+FAST_EXTRA_NOISE = 0.3
+
+SCENARIOS = {
+    "quick": {"gallery_size": 200, "probes": 50},
+    "default": {"gallery_size": 1000, "probes": 200},
+    "full": {"gallery_size": 10000, "probes": 500},
+}
+
+
+class _SimulatedExtractor:
+    """Extractor stand-in returning precomputed embeddings after a fixed model cost."""
+
+    def __init__(self, model_name: str, embeddings: np.ndarray, seconds: float):
+        self.model_name = model_name
+        self.embeddings = embeddings
+        self.seconds = seconds
+
+    def extract_batch(self, face_images: List[np.ndarray]) -> List[EmbeddingResult]:
+        """Return the embeddings of the probe indices encoded in the images."""
+        time.sleep(self.seconds * len(face_images))
+        return [
+            EmbeddingResult(
+                embedding=self.embeddings[int(image.flat[0])],
+                dimension=self.embeddings.shape[1],
+                extraction_time_ms=self.seconds * 1000.0
+            )
+            for image in face_images
+        ]
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
+def _make_data(gallery_size: int, probes: int, seed: int = 0) -> Tuple[dict, dict, np.ndarray, np.ndarray, list]:
+    """
+    Build correlated full/fast galleries and probes.
+
+    Returns:
+        Tuple of (full gallery, fast gallery, full probes, fast probes,
+        true user_id per probe or None for unenrolled visitors).
+    """
+    rng = np.random.default_rng(seed)
+    projection = rng.standard_normal((FULL_DIM, FAST_DIM)) / np.sqrt(FULL_DIM)
+    identities = _normalize(rng.standard_normal((gallery_size, FULL_DIM)))
+    user_ids = [f"user_{i:06d}" for i in range(gallery_size)]
+    full_gallery = dict(zip(user_ids, identities.astype(np.float32)))
+    fast_gallery = dict(zip(user_ids, _normalize(identities @ projection).astype(np.float32)))
+
+    truth: List = []
+    full_probes, fast_probes = [], []
+    for _ in range(probes):
+        if rng.random() < IMPOSTOR_SHARE:
+            identity = _normalize(rng.standard_normal(FULL_DIM))
+            truth.append(None)
+        else:
+            index = int(rng.integers(gallery_size))
+            identity = identities[index]
+            truth.append(user_ids[index])
+        noise = rng.choice(NOISE_LEVELS)
+        full_probe = identity + noise * rng.standard_normal(FULL_DIM) / np.sqrt(FULL_DIM)
+        fast_probe = full_probe @ projection
+        fast_probe = fast_probe + FAST_EXTRA_NOISE * rng.standard_normal(FAST_DIM) / np.sqrt(FAST_DIM)
+        full_probes.append(full_probe)
+        fast_probes.append(fast_probe)
+
+    return (
+        full_gallery,
+        fast_gallery,
+        _normalize(np.stack(full_probes)).astype(np.float32),
+        _normalize(np.stack(fast_probes)).astype(np.float32),
+        truth
+    )
+
+
+def _latency_result(name: str, params: dict, latencies_ms: List[float]) -> BenchmarkResult:
+    """Summarize per-face latencies as a BenchmarkResult."""
+    result = BenchmarkResult(
+        name=name,
+        params=params,
+        repeats=len(latencies_ms),
+        mean_ms=statistics.fmean(latencies_ms),
+        median_ms=statistics.median(latencies_ms),
+        p95_ms=float(np.percentile(latencies_ms, 95)),
+        min_ms=min(latencies_ms),
+        max_ms=max(latencies_ms)
+    )
+    print(f"[Benchmark] {result.key}: median {result.median_ms:.3f} ms "
+          f"(mean {result.mean_ms:.3f}, p95 {result.p95_ms:.3f}, n={result.repeats})")
+    return result
+
+
+def run(profile: str = "default") -> List[BenchmarkResult]:
+    """
+    Run cascade benchmarks.
+
+    Args:
+        profile: Size profile ("quick", "default" or "full").
+
+    Returns:
+        List of benchmark results (durations are per-face recognition latencies).
+    """
+    scenario = SCENARIOS[profile]
+    full_gallery, fast_gallery, full_probes, fast_probes, truth = _make_data(**scenario)
+    policy = CascadePolicy()
+    service = FaceRecognitionService(
+        face_detector=None,
+        embedding_extractor=_SimulatedExtractor(DEFAULT_EMBEDDING_MODEL, full_probes, FULL_MODEL_SECONDS),
+        face_recognizer=FaceRecognizer(),
+        quality_assessor=None,
+        fast_embedding_extractor=_SimulatedExtractor(FAST_MODEL, fast_probes, FAST_MODEL_SECONDS),
+        cascade_policy=policy
+    )
+    faces = [np.full((1, 1, 1), i, dtype=np.int64) for i in range(len(truth))]
+    params = {"gallery_size": scenario["gallery_size"], "probes": scenario["probes"]}
+    results = []
+
+    for mode in ("full_only", "cascade"):
+        latencies_ms, correct = [], 0
+        for face, expected in zip(faces, truth):
+            start = time.perf_counter()
+            if mode == "cascade":
+                result = service.recognize_faces_cascade([face], full_gallery, fast_gallery, {})[0]
+            else:
+                result = service.recognize_faces([face], full_gallery, {})[0]
+            latencies_ms.append((time.perf_counter() - start) * 1000.0)
+            correct += (result.user_id if result else None) == expected
+        results.append(_latency_result("recognize_face", {**params, "mode": mode}, latencies_ms))
+        print(f"[Benchmark]   {mode} accuracy: {correct / len(truth):.1%}")
+
+    fast_matrix = np.stack(list(fast_gallery.values()))
+    _, _, accepted = policy.decide(fast_probes @ fast_matrix.T)
+    escalated = int((~accepted).sum())
+    print(f"[Benchmark]   cascade escalation rate: {escalated / len(truth):.1%} "
+          f"(accept_score={policy.accept_score}, min_margin={policy.min_margin})")
+
+    if DEEPFACE_AVAILABLE:
+        crop = make_images(1)[0][160:320, 240:400]
+        for model_name in (FAST_MODEL, DEFAULT_EMBEDDING_MODEL):
+            extractor = EmbeddingExtractor(model_name=model_name, skip_detection=True)
+            results.append(run_benchmark(
+                "model_extract",
+                lambda: extractor.extract(crop),
+                params={"model": model_name},
+                repeats=10
+            ))
+    else:
+        print("[Benchmark] DeepFace not installed; skipping real model timings")
+
+    return results
@@ -0,0 +1,78 @@
+"""
+Face detection benchmarks.
+
+Times each available detection strategy (OpenCV Haar cascade, MediaPipe,
+YOLO) on sample images. Strategies whose dependencies are not installed are
+skipped. Without --images-dir, synthetic images are used; they exercise the
+full code path but contain no faces.
+"""
+
+from typing import List, Optional
+
+from benchmarks.harness import BenchmarkResult, run_benchmark
+from benchmarks.synthetic import load_images, make_images
+from core.recognition.strategies import (
+    MEDIAPIPE_AVAILABLE,
+    OPENCV_AVAILABLE,
+    YOLO_AVAILABLE,
+    MediaPipeDetectionStrategy,
+    OpenCVDetectionStrategy,
+    YOLODetectionStrategy
+)
+
+IMAGE_COUNTS = {
+    "quick": 5,
+    "default": 20,
+    "full": 50,
+}
+
+
+def _available_strategies():
+    """Yield (name, factory) for strategies whose dependencies are installed."""
+    if OPENCV_AVAILABLE:
+        yield "opencv", OpenCVDetectionStrategy
+    if MEDIAPIPE_AVAILABLE:
+        yield "mediapipe", lambda: MediaPipeDetectionStrategy(min_detection_confidence=0.2, model_selection=1)
+    if YOLO_AVAILABLE:
+        yield "yolo", lambda: YOLODetectionStrategy("yolov8n.pt", conf_threshold=0.25)
+
+
+def run(profile: str = "default", images_dir: Optional[str] = None) -> List[BenchmarkResult]:
+    """
+    Run detection benchmarks.
+
+    Args:
+        profile: Size profile ("quick", "default" or "full").
+        images_dir: Optional directory of sample photos to use instead of synthetic images.
+
+    Returns:
+        List of benchmark results (one per strategy, timing a pass over all images).
+    """
+    count = IMAGE_COUNTS[profile]
+    images = load_images(images_dir, limit=count) if images_dir else make_images(count)
+    source = "images_dir" if images_dir else "synthetic"
+    if not images:
+        print(f"[Benchmark] No images found in {images_dir}, skipping detection benchmarks")
+        return []
+
+    results = []
+    for name, factory in _available_strategies():
+        try:
+            strategy = factory()
+        except Exception as e:
+            print(f"[Benchmark] Skipping {name} detection: {e}")
+            continue
+
+        def detect_all(strategy=strategy):
+            for image in images:
+                strategy.detect(image)
+
+        result = run_benchmark(
+            "detect",
+            detect_all,
+            params={"strategy": name, "images": len(images), "source": source},
+            repeats=3
+        )
+        results.append(result)
+
+    return results
@@ -0,0 +1,98 @@
+"""
+Liveness (blink counting) benchmarks.
+
+Times blink counting over synthetic landmark sequences: the per-frame path
+(LivenessVerifier.verify calling BlinkDetector.detect on 468-tuple lists)
+against the vectorized BlinkDetector.detect_sequence on (T, 468, 2) and
+(T, 12, 2) arrays, and StreamingLivenessVerifier, which stops at the
+third blink and samples open-eye stretches sparsely. Landmark extraction
+itself needs MediaPipe and is not timed here; the streaming cases print
+how many frames it would have run on, since that dominates real requests.
+"""
+
+from typing import List
+
+import numpy as np
+
+from benchmarks.harness import BenchmarkResult, run_benchmark
+from core.liveness.blink_detector import BlinkDetector
+from domain.services.liveness.liveness_verifier import LivenessVerifier
+from domain.services.liveness.streaming_verifier import StreamingLivenessVerifier
+
+# Frames per sequence (a 3-blink capture at 30 fps is ~90-150 frames)
+FRAME_COUNTS = {
+    "quick": [150],
+    "default": [150, 1000],
+    "full": [150, 1000, 10000],
+}
+
+BLINK_PERIOD = 30
+BLINK_FRAMES = 4
+OPEN_EAR = 0.3
+CLOSED_EAR = 0.05
+
+
+def _make_landmarks(frames: int, seed: int = 0) -> np.ndarray:
+    """Build (frames, 468, 2) landmarks with a blink every BLINK_PERIOD frames."""
+    rng = np.random.default_rng(seed)
+    landmarks = rng.random((frames, 468, 2))
+    closed = (np.arange(frames) % BLINK_PERIOD) < BLINK_FRAMES
+    half_height = np.where(closed, CLOSED_EAR, OPEN_EAR)[:, None] / 2
+    # Eye points ordered [outer, top_outer, top_inner, inner, bottom_inner, bottom_outer]
+    # with unit width, so EAR equals the eye height
+    eye = np.zeros((frames, 6, 2))
+    eye[:, :, 0] = (0.0, 0.3, 0.6, 1.0, 0.6, 0.3)
+    eye[:, 1:3, 1] = -half_height
+    eye[:, 4:6, 1] = half_height
+    for indices in (BlinkDetector.LEFT_EYE_INDICES, BlinkDetector.RIGHT_EYE_INDICES):
+        landmarks[:, indices] = 0.2 * eye + 0.4
+    return landmarks
+
+
+def run(profile: str = "default") -> List[BenchmarkResult]:
+    """
+    Run liveness benchmarks.
+
+    Args:
+        profile: Size profile ("quick", "default" or "full").
+
+    Returns:
+        List of benchmark results.
+    """
+    results = []
+    for frames in FRAME_COUNTS[profile]:
+        landmarks = _make_landmarks(frames)
+        landmark_lists = [[tuple(point) for point in frame] for frame in landmarks.tolist()]
+        eye_points = landmarks[:, BlinkDetector.EYE_INDICES]
+        verifier = LivenessVerifier(BlinkDetector(), min_blinks=3)
+        detector = BlinkDetector()
+        params = {"frames": frames}
+
+        results.append(run_benchmark(
+            "blink_count", lambda: verifier.verify([None] * frames, landmark_lists),
+            params={**params, "mode": "per_frame"}
+        ))
+        results.append(run_benchmark(
+            "blink_count", lambda: detector.detect_sequence(landmarks),
+            params={**params, "mode": "sequence_468"}
+        ))
+        results.append(run_benchmark(
+            "blink_count", lambda: detector.detect_sequence(eye_points),
+            params={**params, "mode": "sequence_eyes"}
+        ))
+
+        expected = verifier.blink_detector.get_blink_count()
+        print(f"[Benchmark]   blinks per_frame={expected} "
+              f"sequence={detector.detect_sequence(eye_points).blink_count}")
+
+        for stride in (1, 2):
+            streaming = StreamingLivenessVerifier(BlinkDetector(), min_blinks=3, sparse_stride=stride)
+            frames = list(eye_points)
+            results.append(run_benchmark(
+                "blink_count", lambda: streaming.verify(frames, lambda frame: frame),
+                params={**params, "mode": f"streaming_stride{stride}"}
+            ))
+            report = streaming.verify(frames, lambda frame: frame)
+            print(f"[Benchmark]   streaming stride {stride}: verified={report.is_verified}, "
+                  f"landmarks extracted for {report.frames_processed}/{report.frames_received} frames")
+    return results
@@ -0,0 +1,135 @@
+"""
+Embedding matching benchmarks.
+
+Times FaceRecognizer.find_best_match against synthetic galleries of
+unit-norm 512-d embeddings, and matching all faces of a class photo face by
+face versus with one EmbeddingGallery.match_unique call over the whole
+gallery or over a class roster. Compact (float16 / int8) galleries are
+timed against float32, and their memory and accuracy deltas against
+float32 are printed.
+"""
+
+from typing import List
+
+import numpy as np
+
+from benchmarks.harness import BenchmarkResult, run_benchmark
+from benchmarks.synthetic import make_gallery, make_probe
+from core.recognition.compact_gallery import (
+    COMPACT_PRECISIONS,
+    CompactEmbeddingGallery,
+    compare_to_float32
+)
+from core.recognition.gallery import EmbeddingGallery
+from core.recognition.recognizer import FaceRecognizer
+from core.shared.constants import DEFAULT_CONFIDENCE_THRESHOLD
+
+GALLERY_SIZES = {
+    "quick": [1_000, 10_000],
+    "default": [1_000, 10_000, 50_000, 200_000],
+    "full": [1_000, 10_000, 50_000, 200_000],
+}
+
+CLASS_PHOTO_FACES = 60
+# Probe noise levels for the compact-gallery accuracy report; the hardest
+# ones score close to the match threshold
+ACCURACY_NOISE_LEVELS = (0.5, 1.0, 1.5, 2.0)
+
+
+def run(profile: str = "default") -> List[BenchmarkResult]:
+    """
+    Run matching benchmarks.
+
+    Args:
+        profile: Size profile ("quick", "default" or "full").
+
+    Returns:
+        List of benchmark results.
+    """
+    recognizer = FaceRecognizer()
+    results = []
+
+    for size in GALLERY_SIZES[profile]:
+        gallery = make_gallery(size, dimension=512)
+        probe = make_probe(gallery, user_id=next(iter(gallery)))
+        repeats = 5 if size <= 10_000 else 2
+
+        results.append(run_benchmark(
+            "find_best_match",
+            lambda: recognizer.find_best_match(probe, gallery, DEFAULT_CONFIDENCE_THRESHOLD),
+            params={"gallery_size": size, "dimension": 512},
+            repeats=repeats
+        ))
+
+        user_ids = list(gallery)
+        probes = [make_probe(gallery, user_id=user_ids[i]) for i in range(CLASS_PHOTO_FACES)]
+        probe_matrix = np.stack(probes)
+        roster = user_ids[:CLASS_PHOTO_FACES]
+        if size <= 1_000:
+            results.append(run_benchmark(
+                "match_class_photo",
+                lambda: [recognizer.find_best_match(p, gallery, DEFAULT_CONFIDENCE_THRESHOLD) for p in probes],
+                params={"gallery_size": size, "faces": CLASS_PHOTO_FACES, "mode": "per_face"},
+                repeats=3
+            ))
+        # Galleries are built once up front (the service keeps them cached), so
+        # only matching is timed
+        full_gallery = EmbeddingGallery.from_known_embeddings(gallery)
+        results.append(run_benchmark(
+            "match_class_photo",
+            lambda: full_gallery.match_unique(probe_matrix, DEFAULT_CONFIDENCE_THRESHOLD),
+            params={"gallery_size": size, "faces": CLASS_PHOTO_FACES, "mode": "one_to_one"},
+            repeats=3
+        ))
+        # What FaceRecognitionService does for a class whose faces all match its roster
+        roster_gallery = EmbeddingGallery.from_known_embeddings({user_id: gallery[user_id] for user_id in roster})
+        results.append(run_benchmark(
+            "match_class_photo",
+            lambda: roster_gallery.match_unique(probe_matrix, DEFAULT_CONFIDENCE_THRESHOLD),
+            params={"gallery_size": size, "faces": CLASS_PHOTO_FACES, "mode": "roster"},
+            repeats=3
+        ))
+
+        results.extend(_run_precision_cases(gallery, probe, size, repeats))
+
+    return results
+
+
+def _run_precision_cases(
+    gallery: dict,
+    probe: np.ndarray,
+    size: int,
+    repeats: int
+) -> List[BenchmarkResult]:
+    """Time gallery.match per precision and print compact-vs-float32 reports."""
+    baseline = EmbeddingGallery.from_known_embeddings(gallery)
+    results = [run_benchmark(
+        "gallery_match",
+        lambda: baseline.match(probe, DEFAULT_CONFIDENCE_THRESHOLD),
+        params={"gallery_size": size, "precision": "float32"},
+        repeats=repeats
+    )]
+
+    user_ids = list(gallery)
+    accuracy_probes = np.stack([
+        make_probe(gallery, user_id=user_ids[i % size], noise=noise, seed=i)
+        for i in range(CLASS_PHOTO_FACES)
+        for noise in ACCURACY_NOISE_LEVELS
+    ])
+    for precision in COMPACT_PRECISIONS:
+        compact = CompactEmbeddingGallery.from_known_embeddings(gallery, precision=precision)
+        results.append(run_benchmark(
+            "gallery_match",
+            lambda: compact.match(probe, DEFAULT_CONFIDENCE_THRESHOLD),
+            params={"gallery_size": size, "precision": precision},
+            repeats=repeats
+        ))
+        report = compare_to_float32(baseline, compact, accuracy_probes, DEFAULT_CONFIDENCE_THRESHOLD)
+        compact.rerank_k = 0
+        unranked = compare_to_float32(baseline, compact, accuracy_probes, DEFAULT_CONFIDENCE_THRESHOLD)
+        print(f"[Benchmark]   {precision}: compact rows {compact.compact_bytes / 2**20:.1f} MiB "
+              f"vs float32 {report.float32_memory_bytes / 2**20:.1f} MiB; "
+              f"top-1 agreement {report.top1_agreement:.2%} (no re-rank {unranked.top1_agreement:.2%}), "
+              f"decisions {report.decision_agreement:.2%}, "
+              f"max score delta {report.max_abs_score_delta:.2e} (no re-rank {unranked.max_abs_score_delta:.2e})")
+    return results
@@ -0,0 +1,102 @@
+"""
+Inference scheduling benchmarks.
+
+Replays a class-photo burst (bulk tasks) with kiosk requests (interactive
+tasks) arriving during it, once on a FIFO thread pool and once on the
+InferenceScheduler. Tasks sleep instead of computing, standing in for model
+inference that releases the GIL. Each case reports the latency
+distribution of the interactive requests rather than a repeated timing.
+"""
+
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+import numpy as np
+
+from benchmarks.harness import BenchmarkResult
+from core.shared.inference_scheduler import InferenceScheduler, PRIORITY_BULK, PRIORITY_INTERACTIVE
+
+WORKERS = 2
+BULK_TASK_SECONDS = 0.05
+INTERACTIVE_TASK_SECONDS = 0.005
+INTERACTIVE_INTERVAL_SECONDS = 0.01
+
+SCENARIOS = {
+    "quick": {"bulk_tasks": 16, "interactive_requests": 10},
+    "default": {"bulk_tasks": 40, "interactive_requests": 30},
+    "full": {"bulk_tasks": 120, "interactive_requests": 100},
+}
+
+
+def _latency_result(name: str, params: dict, latencies_ms: List[float]) -> BenchmarkResult:
+    """Summarize per-request latencies as a BenchmarkResult."""
+    result = BenchmarkResult(
+        name=name,
+        params=params,
+        repeats=len(latencies_ms),
+        mean_ms=statistics.fmean(latencies_ms),
+        median_ms=statistics.median(latencies_ms),
+        p95_ms=float(np.percentile(latencies_ms, 95)),
+        min_ms=min(latencies_ms),
+        max_ms=max(latencies_ms)
+    )
+    print(f"[Benchmark] {result.key}: median {result.median_ms:.3f} ms "
+          f"(p95 {result.p95_ms:.3f}, p99 {np.percentile(latencies_ms, 99):.3f}, n={result.repeats})")
+    return result
+
+
+def _replay(
+    submit_bulk: Callable[[], object],
+    submit_interactive: Callable[[], object],
+    bulk_tasks: int,
+    interactive_requests: int
+) -> List[float]:
+    """Queue the bulk burst, then issue interactive requests and return their latencies in ms."""
+    bulk_futures = [submit_bulk() for _ in range(bulk_tasks)]
+    latencies_ms = []
+    for _ in range(interactive_requests):
+        start = time.perf_counter()
+        submit_interactive().result()
+        latencies_ms.append((time.perf_counter() - start) * 1000.0)
+        time.sleep(INTERACTIVE_INTERVAL_SECONDS)
+    for future in bulk_futures:
+        future.result()
+    return latencies_ms
+
+
+def run(profile: str = "default") -> List[BenchmarkResult]:
+    """
+    Run scheduling benchmarks.
+
+    Args:
+        profile: Size profile ("quick", "default" or "full").
+
+    Returns:
+        List of benchmark results (durations are interactive request latencies).
+    """
+    scenario = SCENARIOS[profile]
+    params = {"workers": WORKERS, **scenario}
+    results = []
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        latencies = _replay(
+            lambda: pool.submit(time.sleep, BULK_TASK_SECONDS),
+            lambda: pool.submit(time.sleep, INTERACTIVE_TASK_SECONDS),
+            **scenario
+        )
+    results.append(_latency_result("interactive_latency", {**params, "mode": "fifo_pool"}, latencies))
+
+    scheduler = InferenceScheduler.interactive_and_bulk(max_workers=WORKERS)
+    try:
+        latencies = _replay(
+            lambda: scheduler.submit(PRIORITY_BULK, time.sleep, BULK_TASK_SECONDS),
+            lambda: scheduler.submit(PRIORITY_INTERACTIVE, time.sleep, INTERACTIVE_TASK_SECONDS),
+            **scenario
+        )
+    finally:
+        scheduler.close()
+    results.append(_latency_result("interactive_latency", {**params, "mode": "priority_scheduler"}, latencies))
+
+    return results
@@ -0,0 +1,105 @@
+"""
+API startup benchmarks.
+
+Times `import api.main` in a fresh interpreter and checks that no heavy ML
+library (TensorFlow, DeepFace, MediaPipe, Ultralytics/PyTorch) is imported
+along the way; those must load only when a strategy or extractor is first
+constructed. Each repetition runs in its own subprocess so module caching
+does not hide the cost.
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+from benchmarks.harness import BenchmarkResult
+
+# Import time budget for the API module, excluding interpreter startup
+MAX_IMPORT_SECONDS = 1.0
+
+HEAVY_MODULES = ("tensorflow", "tf_keras", "keras", "deepface", "mediapipe", "ultralytics", "torch", "onnxruntime")
+
+REPEATS = {
+    "quick": 3,
+    "default": 5,
+    "full": 10,
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted(name for name in {heavy!r} if name in sys.modules)
+print(json.dumps({{"seconds": elapsed, "heavy_modules": heavy}}))
+"""
+
+
+def measure_import(module: str = "api.main") -> Dict[str, Any]:
+    """
+    Import a module in a fresh interpreter and report its import time.
+
+    Args:
+        module: Dotted module name to import.
+
+    Returns:
+        Dictionary with "seconds" (import duration) and "heavy_modules"
+        (heavy ML modules present in sys.modules after the import).
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    project_root = Path(__file__).resolve().parent.parent
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=str(project_root),
+        capture_output=True,
+        text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run(profile: str = "default") -> List[BenchmarkResult]:
+    """
+    Run startup benchmarks.
+
+    Args:
+        profile: Size profile ("quick", "default" or "full"); sets the number of repetitions.
+
+    Returns:
+        List with one result for `import api.main`.
+
+    Raises:
+        AssertionError: If a heavy ML module is imported at startup or the
+            median import time exceeds MAX_IMPORT_SECONDS.
+    """
+    measurements = [measure_import("api.main") for _ in range(REPEATS[profile])]
+    durations_ms = [m["seconds"] * 1000.0 for m in measurements]
+    heavy = sorted({name for m in measurements for name in m["heavy_modules"]})
+
+    result = BenchmarkResult(
+        name="import",
+        params={"module": "api.main"},
+        repeats=len(durations_ms),
+        mean_ms=statistics.fmean(durations_ms),
+        median_ms=statistics.median(durations_ms),
+        p95_ms=float(np.percentile(durations_ms, 95)),
+        min_ms=min(durations_ms),
+        max_ms=max(durations_ms)
+    )
+    print(f"[Benchmark] {result.key}: median {result.median_ms:.3f} ms "
+          f"(min {result.min_ms:.3f}, p95 {result.p95_ms:.3f}, n={result.repeats})")
+
+    assert not heavy, f"Heavy ML modules imported at API startup: {', '.join(heavy)}"
+    assert result.median_ms < MAX_IMPORT_SECONDS * 1000.0, (
+        f"import api.main took {result.median_ms:.0f} ms "
+        f"(budget {MAX_IMPORT_SECONDS * 1000.0:.0f} ms)"
+    )
+    return [result]
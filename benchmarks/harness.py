@@ -0,0 +1,196 @@
+"""
+Benchmark harness.
+
+Provides timing of individual benchmark cases, JSON result files and
+comparison of a run against a stored baseline.
+"""
+
+import json
+import platform
+import statistics
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Timing result of a single benchmark case.
+
+    Attributes:
+        name: Benchmark name (e.g. "find_best_match").
+        params: Parameters of the case (e.g. {"gallery_size": 1000}).
+        repeats: Number of timed repetitions.
+        mean_ms: Mean duration in milliseconds.
+        median_ms: Median duration in milliseconds (used for baseline comparison).
+        p95_ms: 95th percentile duration in milliseconds.
+        min_ms: Fastest duration in milliseconds.
+        max_ms: Slowest duration in milliseconds.
+    """
+    name: str
+    params: Dict[str, Any]
+    repeats: int
+    mean_ms: float
+    median_ms: float
+    p95_ms: float
+    min_ms: float
+    max_ms: float
+
+    @property
+    def key(self) -> str:
+        """Unique key of the case, e.g. "find_best_match[gallery_size=1000]"."""
+        if not self.params:
+            return self.name
+        params = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.name}[{params}]"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["key"] = self.key
+        return data
+
+
+@dataclass
+class Comparison:
+    """
+    Comparison of a benchmark case against its baseline.
+
+    Attributes:
+        key: Benchmark case key.
+        baseline_ms: Baseline median duration in milliseconds.
+        current_ms: Current median duration in milliseconds.
+        ratio: current_ms / baseline_ms.
+        regressed: True if ratio exceeds 1 + tolerance.
+    """
+    key: str
+    baseline_ms: float
+    current_ms: float
+    ratio: float
+    regressed: bool
+
+
+def run_benchmark(
+    name: str,
+    func: Callable[[], Any],
+    params: Optional[Dict[str, Any]] = None,
+    repeats: int = 5,
+    warmup: int = 1
+) -> BenchmarkResult:
+    """
+    Time a zero-argument callable.
+
+    Args:
+        name: Benchmark name.
+        func: Callable to time; setup must be done outside of it.
+        params: Parameters of the case, recorded in the result.
+        repeats: Number of timed repetitions.
+        warmup: Number of untimed warm-up calls.
+
+    Returns:
+        BenchmarkResult with timing statistics.
+    """
+    for _ in range(warmup):
+        func()
+
+    durations_ms: List[float] = []
+    for _ in range(max(1, repeats)):
+        start = time.perf_counter()
+        func()
+        durations_ms.append((time.perf_counter() - start) * 1000.0)
+
+    result = BenchmarkResult(
+        name=name,
+        params=dict(params or {}),
+        repeats=len(durations_ms),
+        mean_ms=statistics.fmean(durations_ms),
+        median_ms=statistics.median(durations_ms),
+        p95_ms=float(np.percentile(durations_ms, 95)),
+        min_ms=min(durations_ms),
+        max_ms=max(durations_ms)
+    )
+    print(f"[Benchmark] {result.key}: median {result.median_ms:.3f} ms "
+          f"(min {result.min_ms:.3f}, p95 {result.p95_ms:.3f}, n={result.repeats})")
+    return result
+
+
+def save_results(
+    path: str,
+    results: List[BenchmarkResult],
+    metadata: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Write results to a JSON file.
+
+    Args:
+        path: Output file path (parent directories are created).
+        results: Benchmark results to write.
+        metadata: Extra metadata (e.g. profile name) merged into the header.
+    """
+    document = {
+        "metadata": {
+            "created_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            **(metadata or {})
+        },
+        "results": [result.to_dict() for result in results]
+    }
+    output_path = Path(path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load a results file.
+
+    Args:
+        path: Path to a JSON file written by save_results.
+
+    Returns:
+        Dictionary mapping case key to its result dictionary.
+    """
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {entry["key"]: entry for entry in document.get("results", [])}
+
+
+def compare_to_baseline(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float = 0.5
+) -> List[Comparison]:
+    """
+    Compare results against a baseline by median duration.
+
+    Cases missing from the baseline are skipped.
+
+    Args:
+        results: Current benchmark results.
+        baseline: Baseline as returned by load_results.
+        tolerance: Allowed relative slowdown before a case counts as regressed.
+
+    Returns:
+        List of Comparison objects, one per case present in both.
+    """
+    comparisons = []
+    for result in results:
+        entry = baseline.get(result.key)
+        if entry is None or entry.get("median_ms", 0) <= 0:
+            continue
+        ratio = result.median_ms / entry["median_ms"]
+        comparisons.append(Comparison(
+            key=result.key,
+            baseline_ms=entry["median_ms"],
+            current_ms=result.median_ms,
+            ratio=ratio,
+            regressed=ratio > 1.0 + tolerance
+        ))
+    return comparisons
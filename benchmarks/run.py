@@ -0,0 +1,124 @@
+"""
+Benchmark runner.
+
+Runs the benchmark suites, writes a JSON results file and compares the run
+against a stored baseline. Exits with status 1 if any case is slower than
+the baseline by more than the tolerance.
+
+Usage:
+    python -m benchmarks.run --profile quick
+    python -m benchmarks.run --suites matching attendance --output results.json
+    python -m benchmarks.run --profile quick --save-baseline
+    python -m benchmarks.run --images-dir path/to/photos --suites detection
+
+Baselines are machine-specific; regenerate with --save-baseline on the
+reference machine after intentional performance changes.
+"""
+
+import argparse
+import logging
+import shutil
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from benchmarks import (
+    bench_analytics,
+    bench_attendance,
+    bench_batching,
+    bench_cascade,
+    bench_detection,
+    bench_embedding,
+    bench_liveness,
+    bench_matching,
+    bench_scheduling,
+    bench_startup,
+    bench_video
+)
+from benchmarks.harness import BenchmarkResult, compare_to_baseline, load_results, save_results
+
+DEFAULT_OUTPUT = "benchmarks/results/latest.json"
+DEFAULT_BASELINE = "benchmarks/baseline.json"
+
+
+def _suites(images_dir: str = None) -> Dict[str, Callable[[str], List[BenchmarkResult]]]:
+    """Return the available suites keyed by name."""
+    return {
+        "matching": bench_matching.run,
+        "attendance": bench_attendance.run,
+        "analytics": bench_analytics.run,
+        "detection": lambda profile: bench_detection.run(profile, images_dir=images_dir),
+        "embedding": bench_embedding.run,
+        "batching": bench_batching.run,
+        "scheduling": bench_scheduling.run,
+        "cascade": bench_cascade.run,
+        "liveness": bench_liveness.run,
+        "startup": bench_startup.run,
+        "video": bench_video.run,
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Run benchmarks from the command line.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        Process exit code (0 on success, 1 on regression).
+    """
+    suites = _suites()
+    parser = argparse.ArgumentParser(description="Run EyeD performance benchmarks")
+    parser.add_argument("--profile", choices=["quick", "default", "full"], default="default",
+                        help="Data size profile (full includes 10M-row attendance histories)")
+    parser.add_argument("--suites", nargs="+", choices=sorted(suites), default=sorted(suites),
+                        help="Suites to run (default: all)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Results JSON path")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON path")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="Allowed relative slowdown vs. baseline median (default: 0.5)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store this run as the new baseline instead of comparing")
+    parser.add_argument("--images-dir", default=None,
+                        help="Directory with sample photos for detection benchmarks")
+    args = parser.parse_args(argv)
+
+    # Keep per-call INFO logging of the measured code out of the output
+    logging.basicConfig(level=logging.WARNING)
+    logging.disable(logging.WARNING)
+
+    suites = _suites(images_dir=args.images_dir)
+    results: List[BenchmarkResult] = []
+    for name in args.suites:
+        print(f"[Benchmark] Running suite: {name} (profile: {args.profile})")
+        results.extend(suites[name](args.profile))
+
+    save_results(args.output, results, metadata={"profile": args.profile, "suites": args.suites})
+    print(f"[Benchmark] Wrote {len(results)} results to {args.output}")
+
+    if args.save_baseline:
+        Path(args.baseline).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(args.output, args.baseline)
+        print(f"[Benchmark] Saved baseline to {args.baseline}")
+        return 0
+
+    if not Path(args.baseline).exists():
+        print(f"[Benchmark] No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    comparisons = compare_to_baseline(results, load_results(args.baseline), args.tolerance)
+    regressions = [c for c in comparisons if c.regressed]
+    for comparison in comparisons:
+        status = "REGRESSED" if comparison.regressed else "ok"
+        print(f"[Benchmark] {comparison.key}: {comparison.current_ms:.3f} ms vs "
+              f"{comparison.baseline_ms:.3f} ms baseline (x{comparison.ratio:.2f}) {status}")
+
+    if regressions:
+        print(f"[Benchmark] {len(regressions)} case(s) regressed beyond {args.tolerance:.0%} tolerance")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -51,7 +51,8 @@ class AttendanceLogger:
         location: str,
         verification_stage: Optional[str] = None,
         session_id: Optional[str] = None,
-        start_time: Optional[float] = None
+        start_time: Optional[float] = None,
+        recorded_at: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """
         Create an attendance record from provided data.
@@ -71,6 +72,8 @@ class AttendanceLogger:
             session_id: Optional session ID. If not provided, a new one is generated.
             start_time: Optional start time for processing time calculation.
                        If not provided, processing time is set to 0.0.
+            recorded_at: Optional date and time of the attendance (e.g. when a
+                        backfilled photo was taken). Defaults to now.
         
         Returns:
             A dictionary containing attendance record data. The domain layer
@@ -85,8 +88,8 @@ class AttendanceLogger:
         # Generate record ID
         record_id = self.generate_record_id()
         
-        # Get current date and time
-        current_datetime = datetime.now()
+        # Get current date and time (unless the attendance happened earlier)
+        current_datetime = recorded_at if recorded_at is not None else datetime.now()
         record_date = current_datetime.date()
         record_time = current_datetime.time()
         
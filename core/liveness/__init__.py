@@ -6,11 +6,12 @@ This module provides pure liveness detection logic with no infrastructure depend
 
 from .blink_detector import BlinkDetector
 from .landmark_extractor import LandmarkExtractor
-from .value_objects import BlinkResult
+from .value_objects import BlinkResult, BlinkSequenceResult
 
 __all__ = [
     'BlinkDetector',
     'LandmarkExtractor',
     'BlinkResult',
+    'BlinkSequenceResult',
 ]
 
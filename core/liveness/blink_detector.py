@@ -5,9 +5,11 @@ This module provides pure blink detection logic using Eye Aspect Ratio (EAR) cal
 It has no infrastructure dependencies and follows Single Responsibility Principle.
 """
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from .value_objects import BlinkResult
+import numpy as np
+
+from .value_objects import BlinkResult, BlinkSequenceResult
 
 
 class BlinkDetector:
@@ -19,6 +21,7 @@ class BlinkDetector:
     - Detecting when eyes are closed (EAR < threshold)
     - Counting blinks (incrementing counter when blink detected)
     - Resetting the blink counter
+    - Computing EARs and blinks for whole landmark sequences at once
     
     It does NOT handle:
     - Motion analysis
@@ -34,15 +37,23 @@ class BlinkDetector:
     RIGHT_EYE_INDICES = [33, 160, 158, 133, 153, 144]
     """Right eye landmark indices: [outer_corner, top_outer, top_inner, inner_corner, bottom_inner, bottom_outer]"""
     
-    def __init__(self, ear_threshold: float = 0.2) -> None:
+    EYE_INDICES = LEFT_EYE_INDICES + RIGHT_EYE_INDICES
+    """The 12 landmark indices used for EAR: left eye points, then right eye points."""
+    
+    def __init__(self, ear_threshold: float = 0.2, hysteresis: float = 0.0) -> None:
         """
         Initialize the blink detector.
         
         Args:
             ear_threshold: Threshold below which eyes are considered closed.
                           Default is 0.2 (standard EAR threshold for blink detection).
+            hysteresis: Margin above ear_threshold that EAR must reach before
+                       closed eyes count as open again. Default 0.0 (a single
+                       threshold); a small margin (e.g. 0.02) stops EAR jitter
+                       around the threshold from counting as several blinks.
         """
         self.ear_threshold = ear_threshold
+        self.hysteresis = max(0.0, hysteresis)
         self._blink_count = 0
         self._previous_eyes_closed = False
         """Track previous frame state to detect blink transitions"""
@@ -80,12 +91,74 @@ class BlinkDetector:
         # Calculate EAR for both eyes
         left_ear = self._calculate_ear(landmarks, self.LEFT_EYE_INDICES)
         right_ear = self._calculate_ear(landmarks, self.RIGHT_EYE_INDICES)
+        return self._update(left_ear, right_ear)
+    
+    def detect_eye_points(self, eye_points: np.ndarray) -> BlinkResult:
+        """
+        Detect blink from the 12 EAR eye points of one frame.
+        
+        Same as detect() for landmarks already reduced to EYE_INDICES (see
+        LandmarkExtractor.extract_eye_points); shares the blink counter.
+        
+        Args:
+            eye_points: Array of shape (12, 2) ordered as EYE_INDICES.
+        
+        Returns:
+            BlinkResult for this frame.
+        
+        Raises:
+            ValueError: If eye_points does not have shape (12, 2).
+        """
+        left_ear, right_ear = self.eye_aspect_ratios(eye_points)
+        return self._update(left_ear, right_ear)
+    
+    @classmethod
+    def eye_aspect_ratios(cls, eye_points: np.ndarray) -> Tuple[float, float]:
+        """
+        Calculate (left EAR, right EAR) from the 12 eye points of one frame.
+        
+        Args:
+            eye_points: Array of shape (12, 2) ordered as EYE_INDICES.
+        
+        Returns:
+            Tuple of (left_ear, right_ear).
         
+        Raises:
+            ValueError: If eye_points does not have shape (12, 2).
+        """
+        points = np.asarray(eye_points, dtype=np.float64)
+        if points.shape != (len(cls.EYE_INDICES), 2):
+            raise ValueError(f"Invalid eye points: expected shape (12, 2), got {points.shape}")
+        # Per eye: vertical pairs (1, 5), (2, 4) and horizontal pair (0, 3)
+        deltas = points[_EAR_PAIRS_FROM] - points[_EAR_PAIRS_TO]
+        distances = np.hypot(deltas[:, 0], deltas[:, 1]).tolist()
+        return _ear_from_distances(*distances[:3]), _ear_from_distances(*distances[3:])
+    
+    @property
+    def is_closed(self) -> bool:
+        """Return whether the eyes counted as closed in the last processed frame."""
+        return self._previous_eyes_closed
+    
+    def _update(self, left_ear: float, right_ear: float) -> BlinkResult:
+        """
+        Advance the open/closed state and blink counter by one frame.
+        
+        Args:
+            left_ear: EAR of the left eye.
+            right_ear: EAR of the right eye.
+        
+        Returns:
+            BlinkResult for this frame.
+        """
         # Average EAR for both eyes
         ear_value = (left_ear + right_ear) / 2.0
         
-        # Determine if eyes are currently closed
-        is_blinking = ear_value < self.ear_threshold
+        # Determine if eyes are currently closed (closed eyes stay closed
+        # until EAR clears the hysteresis margin)
+        if self._previous_eyes_closed:
+            is_blinking = ear_value < self.ear_threshold + self.hysteresis
+        else:
+            is_blinking = ear_value < self.ear_threshold
         
         # Detect blink transition: open -> closed -> open
         # A blink is detected when eyes transition from open to closed
@@ -107,6 +180,88 @@ class BlinkDetector:
             blink_count=self._blink_count
         )
     
+    def detect_sequence(
+        self,
+        landmarks: np.ndarray,
+        valid: Optional[np.ndarray] = None
+    ) -> BlinkSequenceResult:
+        """
+        Compute EARs and detect blinks for a whole landmark sequence.
+        
+        Equivalent to calling detect() on every frame from a reset state, but
+        EAR is computed for all frames in one vectorized expression and the
+        open/closed state, including hysteresis, is resolved without a Python
+        loop. Does not touch the per-frame blink counter.
+        
+        Args:
+            landmarks: Array of shape (T, 468+, 2) with full MediaPipe
+                      landmarks, or (T, 12, 2) with only the EYE_INDICES points
+                      (see LandmarkExtractor.extract_eye_points).
+            valid: Optional boolean mask of length T. Invalid frames (no face
+                  found) keep the previous open/closed state, like frames
+                  skipped by LivenessVerifier.verify.
+        
+        Returns:
+            BlinkSequenceResult with per-frame EARs, closed states and the
+            indices of frames at which a blink ended (eyes reopened).
+        
+        Raises:
+            ValueError: If landmarks do not have shape (T, 12, 2) or (T, 468+, 2).
+        """
+        eye_points = self.gather_eye_points(landmarks)
+        left_ears = _ear(eye_points[:, :6])
+        right_ears = _ear(eye_points[:, 6:])
+        ear_values = (left_ears + right_ears) / 2.0
+        
+        frames = len(ear_values)
+        valid = np.ones(frames, dtype=bool) if valid is None else np.asarray(valid, dtype=bool)
+        if valid.shape != (frames,):
+            raise ValueError(f"valid mask must have length {frames}, got shape {valid.shape}")
+        
+        # A frame decides the state when EAR is below the close threshold or at
+        # or above the reopen threshold; frames in between (and invalid
+        # frames) carry the last decided state forward
+        below = valid & (ear_values < self.ear_threshold)
+        above = valid & (ear_values >= self.ear_threshold + self.hysteresis)
+        decisive = below | above
+        last_decisive = np.maximum.accumulate(np.where(decisive, np.arange(frames), -1))
+        closed = (last_decisive >= 0) & below[np.maximum(last_decisive, 0)]
+        
+        # A blink ends at each closed -> open transition
+        blink_frames = np.flatnonzero(closed[:-1] & ~closed[1:]) + 1
+        
+        return BlinkSequenceResult(
+            ear_values=ear_values,
+            left_ears=left_ears,
+            right_ears=right_ears,
+            closed=closed,
+            blink_frames=blink_frames
+        )
+    
+    @classmethod
+    def gather_eye_points(cls, landmarks: np.ndarray) -> np.ndarray:
+        """
+        Reduce a landmark sequence to the 12 EAR points per frame.
+        
+        Args:
+            landmarks: Array of shape (T, 468+, 2) or (T, 12, 2).
+        
+        Returns:
+            float64 array of shape (T, 12, 2) ordered as EYE_INDICES.
+        
+        Raises:
+            ValueError: If the shape is neither of the above.
+        """
+        landmarks = np.asarray(landmarks, dtype=np.float64)
+        points = landmarks.shape[1] if landmarks.ndim == 3 else 0
+        if landmarks.ndim != 3 or landmarks.shape[2] != 2 or (points != len(cls.EYE_INDICES) and points < 468):
+            raise ValueError(
+                f"Invalid landmarks: expected shape (T, 468, 2) or (T, 12, 2), got {landmarks.shape}"
+            )
+        if points == len(cls.EYE_INDICES):
+            return landmarks
+        return landmarks[:, cls.EYE_INDICES]
+    
     def reset_counter(self) -> None:
         """
         Reset the blink counter to zero.
@@ -190,6 +345,24 @@ class BlinkDetector:
             return 0.0
 
 
+_EAR_PAIRS_FROM = [1, 2, 0, 7, 8, 6]
+_EAR_PAIRS_TO = [5, 4, 3, 11, 10, 9]
+
 
+def _ear_from_distances(vertical_a: float, vertical_b: float, horizontal: float) -> float:
+    """EAR from an eye's two vertical and one horizontal distance (0.0 for zero width)."""
+    return (vertical_a + vertical_b) / (2.0 * horizontal) if horizontal > 0 else 0.0
 
 
+def _ear(eye_points: np.ndarray) -> np.ndarray:
+    """
+    Vectorized EAR for eye points of shape (T, 6, 2), ordered as an eye's indices.
+    
+    Frames with zero horizontal eye width get EAR 0.0, like _calculate_ear.
+    """
+    vertical_a = np.linalg.norm(eye_points[:, 1] - eye_points[:, 5], axis=-1)
+    vertical_b = np.linalg.norm(eye_points[:, 2] - eye_points[:, 4], axis=-1)
+    horizontal = np.linalg.norm(eye_points[:, 0] - eye_points[:, 3], axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ear = (vertical_a + vertical_b) / (2.0 * horizontal)
+    return np.where(horizontal > 0, ear, 0.0)
@@ -5,17 +5,26 @@ This module provides pure landmark extraction logic using MediaPipe FaceMesh.
 It has no infrastructure dependencies and follows Single Responsibility Principle.
 """
 
+import threading
 from typing import List, Optional, Tuple
 
 import numpy as np
 
-try:
-    import mediapipe as mp
-    _ = mp.solutions.face_mesh
-    MEDIAPIPE_AVAILABLE = True
-except (ImportError, AttributeError):
-    MEDIAPIPE_AVAILABLE = False
-    mp = None
+from core.shared.optional_imports import module_available
+
+from .blink_detector import BlinkDetector
+
+# MediaPipe is slow to import; it is loaded when the first extractor is created.
+MEDIAPIPE_AVAILABLE = module_available("mediapipe")
+
+FACE_MESH_INPUT_SIZE = 192
+"""Input side length of the FaceMesh landmark model; larger face ROIs are downscaled to it."""
+
+DEFAULT_ROI_MARGIN = 0.25
+"""Fraction of the face ROI size added on each side before cropping."""
+
+FaceRoi = Tuple[int, int, int, int]
+"""Face region of interest as (x, y, width, height) in pixels."""
 
 
 class LandmarkExtractor:
@@ -25,7 +34,10 @@ class LandmarkExtractor:
     This class is responsible ONLY for:
     - Extracting facial landmarks from face images
     - Returning landmarks as list of (x, y) tuples
-    - Handling MediaPipe initialization
+    - Returning only the 12 EAR eye points as a NumPy array, optionally from
+      a downscaled crop around a known face ROI
+    - Handling MediaPipe initialization (one FaceMesh graph per thread,
+      reused across calls)
     
     It does NOT handle:
     - Blink detection
@@ -34,13 +46,21 @@ class LandmarkExtractor:
     - Face detection (assumes face image is already provided)
     """
     
-    def __init__(self, min_detection_confidence: float = 0.3) -> None:
+    def __init__(
+        self,
+        min_detection_confidence: float = 0.3,
+        roi_input_size: int = FACE_MESH_INPUT_SIZE,
+        roi_margin: float = DEFAULT_ROI_MARGIN
+    ) -> None:
         """
         Initialize the landmark extractor.
         
         Args:
             min_detection_confidence: Minimum confidence threshold for face detection.
                                      Default is 0.3 (standard MediaPipe threshold).
+            roi_input_size: Longest side, in pixels, that face ROI crops are
+                           downscaled to (default: the FaceMesh model input).
+            roi_margin: Fraction of the ROI size added on each side of the crop.
         
         Raises:
             ImportError: If MediaPipe is not available.
@@ -50,8 +70,20 @@ class LandmarkExtractor:
                 "MediaPipe is not available. Install it with: pip install mediapipe"
             )
         
+        try:
+            import mediapipe as mp
+            self._mp_face_mesh = mp.solutions.face_mesh
+        except (ImportError, AttributeError) as e:
+            raise ImportError(
+                "MediaPipe is not available. Install it with: pip install mediapipe"
+            ) from e
+        
         self.min_detection_confidence = min_detection_confidence
-        self._mp_face_mesh = mp.solutions.face_mesh
+        self.roi_input_size = max(32, int(roi_input_size))
+        self.roi_margin = max(0.0, roi_margin)
+        # The extractor is a shared singleton and a FaceMesh graph must not be
+        # used by two threads at once, so each thread builds its own
+        self._thread_state = threading.local()
     
     def extract(
         self, face_image: np.ndarray
@@ -76,6 +108,158 @@ class LandmarkExtractor:
             Returns None if no face is detected in the image.
             MediaPipe FaceMesh standard is 468 landmarks.
         
+        Raises:
+            ValueError: If face_image is invalid or empty.
+        """
+        face_landmarks = self._face_landmarks(face_image)
+        if face_landmarks is None:
+            return None
+        # Convert MediaPipe landmarks to list of (x, y) tuples
+        return [(landmark.x, landmark.y) for landmark in face_landmarks]
+    
+    def extract_eye_points(
+        self,
+        face_image: np.ndarray,
+        roi: Optional[FaceRoi] = None,
+        full_frame_fallback: bool = True
+    ) -> Optional[np.ndarray]:
+        """
+        Extract only the 12 landmarks used for EAR from a face image.
+        
+        Gathers BlinkDetector.EYE_INDICES straight from the MediaPipe output
+        instead of converting all 468 landmarks, so a sequence of frames can
+        be stacked into a (T, 12, 2) array for BlinkDetector.detect_sequence.
+        
+        With a face ROI (from Phase 1 detection or face_roi_from_eye_points on
+        the previous frame), FaceMesh runs on a crop around it downscaled to
+        roi_input_size instead of the full frame. Coordinates are mapped back
+        to the full frame either way. If the crop shows no face, the full
+        frame is tried unless full_frame_fallback is False (callers tracking
+        a face across frames can retry the full frame on the next frame
+        instead of running FaceMesh twice on this one).
+        
+        Args:
+            face_image: Face image as numpy array (BGR format expected).
+            roi: Optional face region (x, y, width, height) in pixels.
+            full_frame_fallback: Search the full frame if the ROI crop shows
+                                no face.
+        
+        Returns:
+            float64 array of shape (12, 2) with (x, y) per eye point, normalized
+            to the full frame and ordered as BlinkDetector.EYE_INDICES.
+            Returns None if no face is detected.
+        
+        Raises:
+            ValueError: If face_image is invalid or empty.
+        """
+        if roi is not None and face_image is not None and face_image.ndim == 3:
+            bounds = self.crop_bounds(face_image.shape, roi, self.roi_margin)
+            if bounds is not None:
+                x0, y0, x1, y1 = bounds
+                crop = self._downscale(face_image[y0:y1, x0:x1])
+                eye_points = self._eye_points(self._face_landmarks(crop))
+                if eye_points is not None:
+                    height, width = face_image.shape[:2]
+                    eye_points[:, 0] = (x0 + eye_points[:, 0] * (x1 - x0)) / width
+                    eye_points[:, 1] = (y0 + eye_points[:, 1] * (y1 - y0)) / height
+                    return eye_points
+                if not full_frame_fallback:
+                    return None
+        
+        return self._eye_points(self._face_landmarks(face_image))
+    
+    @staticmethod
+    def crop_bounds(
+        image_shape: Tuple[int, ...],
+        roi: FaceRoi,
+        margin: float = DEFAULT_ROI_MARGIN
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Return the (x0, y0, x1, y1) crop around a face ROI, clipped to the image.
+        
+        Args:
+            image_shape: Shape of the full image (height, width, ...).
+            roi: Face region (x, y, width, height) in pixels.
+            margin: Fraction of the ROI size added on each side.
+        
+        Returns:
+            Crop bounds, or None if the ROI lies outside the image.
+        """
+        height, width = image_shape[:2]
+        x, y, roi_width, roi_height = roi
+        pad_x, pad_y = roi_width * margin, roi_height * margin
+        x0 = max(0, int(x - pad_x))
+        y0 = max(0, int(y - pad_y))
+        x1 = min(width, int(np.ceil(x + roi_width + pad_x)))
+        y1 = min(height, int(np.ceil(y + roi_height + pad_y)))
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            return None
+        return x0, y0, x1, y1
+    
+    @staticmethod
+    def face_roi_from_eye_points(
+        eye_points: np.ndarray,
+        image_shape: Tuple[int, ...]
+    ) -> FaceRoi:
+        """
+        Estimate the face ROI of the next frame from this frame's eye points.
+        
+        Uses face proportions relative to the outer eye corners: the face is
+        about twice as wide as the corner-to-corner span, and extends about
+        0.8 spans above and 1.6 spans below the eye line.
+        
+        Args:
+            eye_points: (12, 2) eye points normalized to the full frame.
+            image_shape: Shape of the full image (height, width, ...).
+        
+        Returns:
+            Face region (x, y, width, height) in pixels.
+        """
+        height, width = image_shape[:2]
+        xs = eye_points[:, 0] * width
+        ys = eye_points[:, 1] * height
+        span = max(float(xs.max() - xs.min()), 1.0)
+        center_x = float(xs.mean())
+        center_y = float(ys.mean())
+        return (
+            int(center_x - span),
+            int(center_y - 0.8 * span),
+            int(2.0 * span),
+            int(2.4 * span)
+        )
+    
+    def _downscale(self, image: np.ndarray) -> np.ndarray:
+        """Downscale an image so its longest side is at most roi_input_size."""
+        longest = max(image.shape[:2])
+        if longest <= self.roi_input_size:
+            return image
+        # OpenCV is installed with MediaPipe
+        import cv2
+        scale = self.roi_input_size / longest
+        size = (max(1, round(image.shape[1] * scale)), max(1, round(image.shape[0] * scale)))
+        return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    
+    @staticmethod
+    def _eye_points(face_landmarks) -> Optional[np.ndarray]:
+        """Gather the EYE_INDICES points of MediaPipe landmarks into a (12, 2) array."""
+        if face_landmarks is None:
+            return None
+        return np.array(
+            [(face_landmarks[idx].x, face_landmarks[idx].y) for idx in BlinkDetector.EYE_INDICES],
+            dtype=np.float64
+        )
+    
+    def _face_landmarks(self, face_image: np.ndarray):
+        """
+        Run MediaPipe FaceMesh on a face image.
+        
+        Args:
+            face_image: Face image as numpy array (BGR format expected).
+        
+        Returns:
+            MediaPipe landmark sequence of the first face, or None if no face
+            is detected or processing fails.
+        
         Raises:
             ValueError: If face_image is invalid or empty.
         """
@@ -92,31 +276,39 @@ class LandmarkExtractor:
             # Assumes BGR input (common from OpenCV)
             rgb_image = self._convert_to_rgb(face_image)
             
-            # Create MediaPipe FaceMesh instance
-            # Using context manager ensures proper cleanup
-            with self._mp_face_mesh.FaceMesh(
-                min_detection_confidence=self.min_detection_confidence,
-                min_tracking_confidence=self.min_detection_confidence,
-                max_num_faces=1,
-                refine_landmarks=True
-            ) as face_mesh:
-                # Process image with MediaPipe
-                results = face_mesh.process(rgb_image)
-                
-                # Extract landmarks if face detected
-                if results.multi_face_landmarks:
-                    landmarks = results.multi_face_landmarks[0].landmark
-                    # Convert MediaPipe landmarks to list of (x, y) tuples
-                    return [
-                        (landmark.x, landmark.y) for landmark in landmarks
-                    ]
-                else:
-                    return None
+            # Process image with this thread's MediaPipe FaceMesh
+            results = self._face_mesh().process(rgb_image)
+            
+            # Extract landmarks if face detected
+            if results.multi_face_landmarks:
+                return results.multi_face_landmarks[0].landmark
+            else:
+                return None
                     
         except Exception as e:
             # Return None on any error (allows caller to handle gracefully)
             return None
     
+    def _face_mesh(self):
+        """
+        Return the calling thread's FaceMesh, creating it on first use.
+        
+        Building the graph costs far more than running it on a small crop,
+        so it is kept for the life of the thread. static_image_mode makes
+        every call independent: crops of successive frames are not treated
+        as a video stream.
+        """
+        face_mesh = getattr(self._thread_state, "face_mesh", None)
+        if face_mesh is None:
+            face_mesh = self._mp_face_mesh.FaceMesh(
+                static_image_mode=True,
+                min_detection_confidence=self.min_detection_confidence,
+                max_num_faces=1,
+                refine_landmarks=True
+            )
+            self._thread_state.face_mesh = face_mesh
+        return face_mesh
+    
     def _convert_to_rgb(self, image: np.ndarray) -> np.ndarray:
         """
         Convert image to RGB format using numpy.
@@ -7,6 +7,8 @@ These are pure data structures with no business logic or infrastructure dependen
 
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass
 class BlinkResult:
@@ -46,6 +48,26 @@ class BlinkResult:
             )
 
 
-
-
+@dataclass
+class BlinkSequenceResult:
+    """
+    Represents blink detection over a whole sequence of frames.
+    
+    Attributes:
+        ear_values: Average EAR of both eyes per frame, shape (T,).
+        left_ears: Left eye EAR per frame, shape (T,).
+        right_ears: Right eye EAR per frame, shape (T,).
+        closed: Whether the eyes count as closed in each frame, shape (T,).
+        blink_frames: Indices of the frames at which a blink ended (eyes reopened).
+    """
+    ear_values: np.ndarray
+    left_ears: np.ndarray
+    right_ears: np.ndarray
+    closed: np.ndarray
+    blink_frames: np.ndarray
+    
+    @property
+    def blink_count(self) -> int:
+        """Return the number of blinks in the sequence."""
+        return int(len(self.blink_frames))
 
@@ -4,8 +4,10 @@ Core face detection and recognition module for EyeD AI Attendance System.
 This module provides pure face detection and embedding extraction logic with no infrastructure dependencies.
 """
 
-from .detector import FaceDetector
+from .detector import FaceDetector, PooledFaceDetector
 from .embedding_extractor import EmbeddingExtractor
+from .face_aligner import FaceAligner
+from .image_context import ImageContext
 from .recognizer import FaceRecognizer
 from .quality_assessor import QualityAssessor
 from .value_objects import (
@@ -18,7 +20,10 @@ from .value_objects import (
 
 __all__ = [
     'FaceDetector',
+    'PooledFaceDetector',
     'EmbeddingExtractor',
+    'FaceAligner',
+    'ImageContext',
     'FaceRecognizer',
     'QualityAssessor',
     'FaceLocation',
@@ -0,0 +1,119 @@
+"""
+One-to-one assignment of probe faces to known users.
+
+In a class photo every face belongs to a different student, so matching
+faces independently can give two faces the same user. This module turns a
+faces x users similarity matrix into a thresholded one-to-one assignment.
+No file I/O, no database access.
+"""
+
+import logging
+from typing import List, Optional
+
+import numpy as np
+
+from core.shared.optional_imports import module_available
+
+logger = logging.getLogger(__name__)
+
+SCIPY_AVAILABLE = module_available("scipy")
+
+ASSIGNMENT_GREEDY = "greedy"
+ASSIGNMENT_HUNGARIAN = "hungarian"
+ASSIGNMENT_AUTO = "auto"
+
+
+def assign_greedy(scores: np.ndarray, threshold: float) -> List[Optional[int]]:
+    """
+    Assign probes to users by repeatedly taking the best remaining pair.
+
+    Args:
+        scores: Similarity matrix of shape (probes, users).
+        threshold: Minimum similarity for an assignment.
+
+    Returns:
+        One entry per probe: assigned user column, or None.
+    """
+    assignment: List[Optional[int]] = [None] * scores.shape[0]
+    probe_rows, user_cols = np.nonzero(scores >= threshold)
+    if len(probe_rows) == 0:
+        return assignment
+
+    order = np.argsort(-scores[probe_rows, user_cols], kind="stable")
+    used_users = set()
+    for index in order:
+        probe, user = int(probe_rows[index]), int(user_cols[index])
+        if assignment[probe] is None and user not in used_users:
+            assignment[probe] = user
+            used_users.add(user)
+    return assignment
+
+
+def assign_hungarian(scores: np.ndarray, threshold: float) -> List[Optional[int]]:
+    """
+    Assign probes to users maximizing the number of matches (requires scipy).
+
+    Pairs below the threshold are excluded. Every eligible pair is worth its
+    score plus 1, so the assignment first maximizes how many probes are
+    matched and only then their total similarity: a probe may get a weaker
+    user than its best one if that lets another probe be matched too.
+
+    Args:
+        scores: Similarity matrix of shape (probes, users).
+        threshold: Minimum similarity for an assignment.
+
+    Returns:
+        One entry per probe: assigned user column, or None.
+    """
+    from scipy.optimize import linear_sum_assignment
+
+    assignment: List[Optional[int]] = [None] * scores.shape[0]
+    eligible = scores >= threshold
+    if not eligible.any():
+        return assignment
+
+    # Ineligible pairs score 0; an eligible pair is always worth more than none
+    weights = np.where(eligible, scores + 1.0, 0.0)
+    probe_rows, user_cols = linear_sum_assignment(weights, maximize=True)
+    for probe, user in zip(probe_rows, user_cols):
+        if eligible[probe, user]:
+            assignment[int(probe)] = int(user)
+    return assignment
+
+
+def assign_one_to_one(
+    scores: np.ndarray,
+    threshold: float,
+    method: str = ASSIGNMENT_AUTO
+) -> List[Optional[int]]:
+    """
+    Assign each probe to at most one user and each user to at most one probe.
+
+    Args:
+        scores: Similarity matrix of shape (probes, users).
+        threshold: Minimum similarity for an assignment.
+        method: "greedy", "hungarian" or "auto" (Hungarian when scipy is
+                installed, as listed in requirements.txt; greedy otherwise).
+
+    Returns:
+        One entry per probe: assigned user column, or None.
+
+    Raises:
+        ValueError: If method is unknown or scipy is required but missing.
+    """
+    scores = np.asarray(scores, dtype=np.float32)
+    if scores.ndim != 2 or scores.size == 0:
+        return [None] * (scores.shape[0] if scores.ndim == 2 else 0)
+
+    if method == ASSIGNMENT_AUTO:
+        method = ASSIGNMENT_HUNGARIAN if SCIPY_AVAILABLE else ASSIGNMENT_GREEDY
+    if method == ASSIGNMENT_GREEDY:
+        return assign_greedy(scores, threshold)
+    if method == ASSIGNMENT_HUNGARIAN:
+        if not SCIPY_AVAILABLE:
+            raise ValueError("Hungarian assignment requires scipy. Install with: pip install scipy")
+        return assign_hungarian(scores, threshold)
+    raise ValueError(
+        f"Unknown assignment method '{method}', expected one of "
+        f"{[ASSIGNMENT_AUTO, ASSIGNMENT_GREEDY, ASSIGNMENT_HUNGARIAN]}"
+    )
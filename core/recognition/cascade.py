@@ -0,0 +1,63 @@
+"""
+Two-stage cascade decisions for face recognition.
+
+A cheap model (e.g. SFace, 128-d) is matched first against a gallery of
+embeddings from the same model. Probes whose best match is both strong and
+well separated from the runner-up are accepted right away; all others are
+escalated to the full model (ArcFace). No file I/O, no database access.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+DEFAULT_CASCADE_ACCEPT_SCORE = 0.6
+"""Minimum fast-model similarity for accepting a match without escalation."""
+
+DEFAULT_CASCADE_MIN_MARGIN = 0.15
+"""Minimum gap between the best and second best user for accepting without escalation."""
+
+
+@dataclass(frozen=True)
+class CascadePolicy:
+    """
+    Accept-or-escalate rule for the fast stage of the cascade.
+
+    Attributes:
+        accept_score: Minimum top-1 fast-model similarity to accept.
+        min_margin: Minimum top-1 minus top-2 similarity to accept.
+    """
+    accept_score: float = DEFAULT_CASCADE_ACCEPT_SCORE
+    min_margin: float = DEFAULT_CASCADE_MIN_MARGIN
+
+    def decide(self, user_scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Decide which probes the fast stage can answer.
+
+        Args:
+            user_scores: Fast-model similarities of shape (probes, users), e.g.
+                        from EmbeddingGallery.user_scores.
+
+        Returns:
+            Tuple of (best user column, best score, accepted mask), each of
+            length probes. Probes are never accepted against an empty gallery.
+        """
+        user_scores = np.atleast_2d(np.asarray(user_scores, dtype=np.float32))
+        probes, users = user_scores.shape
+        if users == 0:
+            return (
+                np.zeros(probes, dtype=np.intp),
+                np.zeros(probes, dtype=np.float32),
+                np.zeros(probes, dtype=bool)
+            )
+
+        best = user_scores.argmax(axis=1)
+        best_scores = user_scores[np.arange(probes), best]
+        if users > 1:
+            runner_up = np.partition(user_scores, users - 2, axis=1)[:, users - 2]
+        else:
+            runner_up = np.zeros(probes, dtype=np.float32)
+
+        accepted = (best_scores >= self.accept_score) & (best_scores - runner_up >= self.min_margin)
+        return best, best_scores, accepted
@@ -0,0 +1,373 @@
+"""
+Compact (float16 / int8) embedding gallery for face matching.
+
+A 200k x 512 float32 gallery takes 400 MB per worker. CompactEmbeddingGallery
+stores the rows as float16 (2 bytes per value) or as int8 codes with one
+float32 scale per row (1 byte per value), scores probes in that compact
+form and re-ranks each probe's top candidates with exact float32
+similarities. The float32 rows used for re-ranking can live in a
+memory-mapped file (see save/load), so only the few rows that are re-ranked
+are ever read. No database access.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AbstractSet, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.recognition.gallery import EmbeddingGallery, EmbeddingInput
+
+logger = logging.getLogger(__name__)
+
+PRECISION_FLOAT32 = "float32"
+PRECISION_FLOAT16 = "float16"
+PRECISION_INT8 = "int8"
+COMPACT_PRECISIONS = (PRECISION_FLOAT16, PRECISION_INT8)
+
+DEFAULT_RERANK_K = 8
+"""Candidates per probe re-scored with float32 embeddings."""
+
+# Rows dequantized per step (2 MB of float32 at 512-d): keeps the working
+# buffer in cache instead of materializing a float32 copy of the gallery
+_CHUNK_ROWS = 1024
+
+
+def quantize_embeddings(matrix: np.ndarray, precision: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Convert a float32 embedding matrix to a compact representation.
+
+    Args:
+        matrix: Array of shape (N, D).
+        precision: "float16" or "int8".
+
+    Returns:
+        Tuple of (codes, scales). For int8, row i is approximately
+        codes[i] * scales[i] (symmetric, per-row scale); for float16 scales
+        is None.
+
+    Raises:
+        ValueError: If precision is not a compact precision.
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if precision == PRECISION_FLOAT16:
+        return matrix.astype(np.float16), None
+    if precision == PRECISION_INT8:
+        scales = np.abs(matrix).max(axis=1) / 127.0 if matrix.size else np.zeros(len(matrix), dtype=np.float32)
+        scales = np.where(scales > 0, scales, 1.0).astype(np.float32)
+        codes = np.clip(np.rint(matrix / scales[:, None]), -127, 127).astype(np.int8)
+        return codes, scales
+    raise ValueError(f"Unsupported gallery precision '{precision}', expected one of {COMPACT_PRECISIONS}")
+
+
+class CompactEmbeddingGallery(EmbeddingGallery):
+    """
+    Embedding gallery stored as float16 or per-row scaled int8.
+
+    This class is responsible ONLY for:
+    - Holding known embeddings in a compact representation
+    - Scoring probes against the compact rows, chunk by chunk
+    - Re-ranking each probe's top candidates with float32 rows
+    - Saving and loading the gallery (float32 rows memory-mapped)
+
+    Matching, per-user reduction and one-to-one assignment are inherited
+    from EmbeddingGallery and work on the re-ranked scores: the best
+    candidates carry exact float32 similarities, the others approximate ones.
+    """
+
+    def __init__(
+        self,
+        matrix: np.ndarray,
+        row_user_ids: Sequence[str],
+        user_names: Optional[Dict[str, str]] = None,
+        precision: str = PRECISION_INT8,
+        rerank_k: int = DEFAULT_RERANK_K,
+        keep_float32: bool = True
+    ):
+        """
+        Initialize the gallery from a float32 embedding matrix.
+
+        Args:
+            matrix: Array of shape (N, D); rows are normalized here.
+            row_user_ids: User ID of each row (length N).
+            user_names: Optional mapping of user_id to user_name.
+            precision: "float16" or "int8".
+            rerank_k: Candidates per probe re-scored in float32 (0 disables).
+            keep_float32: Whether to keep the float32 rows in memory for
+                         re-ranking. Galleries opened with load() keep them
+                         memory-mapped instead.
+
+        Raises:
+            ValueError: If matrix and row_user_ids do not match, or the
+                        precision is not supported.
+        """
+        super().__init__(matrix, row_user_ids, user_names)
+        self.precision = precision
+        self.rerank_k = max(0, int(rerank_k))
+        self._codes, self._scales = quantize_embeddings(self.matrix, precision)
+        self._shape = self.matrix.shape
+        self._rerank_rows: Optional[np.ndarray] = self.matrix if keep_float32 and self.rerank_k else None
+        self.matrix = None
+
+    @classmethod
+    def from_known_embeddings(
+        cls,
+        known_embeddings: Dict[str, EmbeddingInput],
+        user_names: Optional[Dict[str, str]] = None,
+        precision: str = PRECISION_INT8,
+        rerank_k: int = DEFAULT_RERANK_K,
+        keep_float32: bool = True
+    ) -> "CompactEmbeddingGallery":
+        """
+        Build a compact gallery from the user_id -> embedding(s) mapping.
+
+        See EmbeddingGallery.from_known_embeddings for accepted values.
+        """
+        gallery = EmbeddingGallery.from_known_embeddings(known_embeddings, user_names)
+        return cls(
+            gallery.matrix,
+            list(gallery.row_user_ids),
+            user_names,
+            precision=precision,
+            rerank_k=rerank_k,
+            keep_float32=keep_float32
+        )
+
+    def subset(self, user_ids: AbstractSet[str]) -> "CompactEmbeddingGallery":
+        """
+        Return a compact gallery of the rows of the given users.
+
+        Slices the compact rows, their scales and the float32 re-rank rows
+        (memory-mapped rows of the kept users are read into memory).
+
+        Args:
+            user_ids: Users to keep (unknown IDs are ignored).
+
+        Returns:
+            CompactEmbeddingGallery sharing this gallery's user names.
+        """
+        gallery = CompactEmbeddingGallery.__new__(CompactEmbeddingGallery)
+        rows = np.sort(self._rows_of(self._user_positions(user_ids)))
+        gallery.user_names = self.user_names
+        gallery._set_row_user_ids(self.row_user_ids[rows])
+        gallery.precision = self.precision
+        gallery.rerank_k = self.rerank_k
+        gallery._codes = self._codes[rows]
+        gallery._scales = self._scales[rows] if self._scales is not None else None
+        gallery._rerank_rows = (
+            np.asarray(self._rerank_rows[rows], dtype=np.float32) if self._rerank_rows is not None else None
+        )
+        gallery._shape = (len(rows), self._shape[1])
+        gallery.matrix = None
+        return gallery
+
+    @property
+    def size(self) -> int:
+        """Return the number of embeddings in the gallery."""
+        return self._shape[0]
+
+    @property
+    def dimension(self) -> int:
+        """Return the embedding dimension (0 for an empty gallery)."""
+        return self._shape[1]
+
+    @property
+    def compact_bytes(self) -> int:
+        """Return bytes of the compact rows and their scales."""
+        return self._codes.nbytes + (self._scales.nbytes if self._scales is not None else 0)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Return bytes held in memory by the embeddings (memory-mapped rows excluded)."""
+        total = self.compact_bytes
+        if self._rerank_rows is not None and not isinstance(self._rerank_rows, np.memmap):
+            total += self._rerank_rows.nbytes
+        return total
+
+    def compact_scores(self, probes: np.ndarray) -> np.ndarray:
+        """
+        Compute approximate cosine similarities from the compact rows only.
+
+        Args:
+            probes: Array of shape (B, D) or (D,).
+
+        Returns:
+            Array of shape (B, N) with similarities clamped to [0, 1].
+        """
+        probes = self._normalize_probes(probes)
+        scores = np.empty((len(probes), self.size), dtype=np.float32)
+        buffer = np.empty((min(_CHUNK_ROWS, self.size), self.dimension), dtype=np.float32)
+        for start in range(0, self.size, _CHUNK_ROWS):
+            codes = self._codes[start:start + _CHUNK_ROWS]
+            rows = buffer[:len(codes)]
+            rows[...] = codes
+            np.matmul(probes, rows.T, out=scores[:, start:start + len(codes)])
+        if self._scales is not None:
+            scores *= self._scales
+        return np.clip(scores, 0.0, 1.0, out=scores)
+
+    def scores(self, probes: np.ndarray) -> np.ndarray:
+        """
+        Compute similarities, exact in float32 for each probe's top candidates.
+
+        Args:
+            probes: Array of shape (B, D) or (D,).
+
+        Returns:
+            Array of shape (B, N) with similarities clamped to [0, 1].
+        """
+        probes = self._normalize_probes(probes)
+        scores = self.compact_scores(probes)
+        k = min(self.rerank_k, self.size)
+        if self._rerank_rows is None or k == 0:
+            return scores
+
+        candidates = np.argpartition(scores, self.size - k, axis=1)[:, self.size - k:]
+        # Sorted row order keeps reads of memory-mapped rows sequential
+        rows, inverse = np.unique(candidates, return_inverse=True)
+        exact = probes @ np.asarray(self._rerank_rows[rows], dtype=np.float32).T
+        probe_index = np.arange(len(probes))[:, None]
+        scores[probe_index, candidates] = np.clip(
+            exact[probe_index, inverse.reshape(candidates.shape)], 0.0, 1.0
+        )
+        return scores
+
+    def save(self, directory: str) -> None:
+        """
+        Save the gallery to a directory (compact rows, scales, float32 rows, user IDs).
+
+        Args:
+            directory: Target directory (created if missing).
+
+        Raises:
+            ValueError: If the float32 rows were not kept.
+        """
+        if self._rerank_rows is None:
+            raise ValueError("Cannot save a compact gallery without its float32 rows")
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / "codes.npy", self._codes)
+        if self._scales is not None:
+            np.save(path / "scales.npy", self._scales)
+        np.save(path / "float32.npy", np.asarray(self._rerank_rows, dtype=np.float32))
+        (path / "gallery.json").write_text(json.dumps({
+            "precision": self.precision,
+            "rerank_k": self.rerank_k,
+            "row_user_ids": [str(user_id) for user_id in self.row_user_ids],
+            "user_names": self.user_names
+        }), encoding="utf-8")
+
+    @classmethod
+    def load(cls, directory: str, rerank_k: Optional[int] = None) -> "CompactEmbeddingGallery":
+        """
+        Load a gallery written by save(), memory-mapping the float32 rows.
+
+        Only the compact rows are read into memory; float32 rows are paged
+        in by the OS when a probe re-ranks them.
+
+        Args:
+            directory: Directory written by save().
+            rerank_k: Optional override of the saved re-rank depth.
+
+        Returns:
+            CompactEmbeddingGallery.
+        """
+        path = Path(directory)
+        meta = json.loads((path / "gallery.json").read_text(encoding="utf-8"))
+        rows = np.load(path / "float32.npy", mmap_mode="r")
+        gallery = cls.__new__(cls)
+        gallery.user_names = dict(meta["user_names"])
+        gallery._set_row_user_ids(meta["row_user_ids"])
+        gallery.precision = meta["precision"]
+        gallery.rerank_k = max(0, int(meta["rerank_k"] if rerank_k is None else rerank_k))
+        gallery._codes = np.load(path / "codes.npy")
+        scales_path = path / "scales.npy"
+        gallery._scales = np.load(scales_path) if scales_path.exists() else None
+        gallery._shape = rows.shape
+        gallery._rerank_rows = rows
+        gallery.matrix = None
+        return gallery
+
+    @staticmethod
+    def _normalize_probes(probes: np.ndarray) -> np.ndarray:
+        """Return probes as a unit-norm (B, D) float32 array."""
+        probes = np.atleast_2d(np.asarray(probes, dtype=np.float32))
+        norms = np.linalg.norm(probes, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return probes / norms
+
+
+@dataclass
+class CompactGalleryReport:
+    """
+    Accuracy and memory of a compact gallery relative to float32.
+
+    Attributes:
+        precision: Compact precision ("float16" or "int8").
+        rerank_k: Re-rank depth used.
+        probes: Number of probes compared.
+        top1_agreement: Share of probes whose best row is the same.
+        decision_agreement: Share of probes with the same match/no-match
+                            decision and user at the threshold.
+        max_abs_score_delta: Largest best-score difference.
+        mean_abs_score_delta: Mean best-score difference.
+        memory_bytes: In-memory bytes of the compact gallery.
+        float32_memory_bytes: Bytes of the float32 gallery.
+    """
+    precision: str
+    rerank_k: int
+    probes: int
+    top1_agreement: float
+    decision_agreement: float
+    max_abs_score_delta: float
+    mean_abs_score_delta: float
+    memory_bytes: int
+    float32_memory_bytes: int
+
+
+def compare_to_float32(
+    baseline: EmbeddingGallery,
+    compact: CompactEmbeddingGallery,
+    probes: np.ndarray,
+    threshold: float
+) -> CompactGalleryReport:
+    """
+    Report how closely a compact gallery reproduces float32 matching.
+
+    Args:
+        baseline: float32 gallery of the same embeddings.
+        compact: Compact gallery to evaluate.
+        probes: Array of shape (B, D).
+        threshold: Match threshold used for the decision comparison.
+
+    Returns:
+        CompactGalleryReport.
+    """
+    probes = np.atleast_2d(np.asarray(probes, dtype=np.float32))
+    baseline_scores = baseline.scores(probes)
+    compact_scores = compact.scores(probes)
+    index = np.arange(len(probes))
+    baseline_best = baseline_scores.argmax(axis=1)
+    compact_best = compact_scores.argmax(axis=1)
+    deltas = np.abs(baseline_scores[index, baseline_best] - compact_scores[index, compact_best])
+
+    baseline_matches = baseline.match(probes, threshold)
+    compact_matches = compact.match(probes, threshold)
+    same_decision = [
+        (a[0] if a else None) == (b[0] if b else None)
+        for a, b in zip(baseline_matches, compact_matches)
+    ]
+
+    return CompactGalleryReport(
+        precision=compact.precision,
+        rerank_k=compact.rerank_k,
+        probes=len(probes),
+        top1_agreement=float(np.mean(baseline_best == compact_best)) if len(probes) else 1.0,
+        decision_agreement=float(np.mean(same_decision)) if len(probes) else 1.0,
+        max_abs_score_delta=float(deltas.max()) if len(probes) else 0.0,
+        mean_abs_score_delta=float(deltas.mean()) if len(probes) else 0.0,
+        memory_bytes=compact.memory_bytes,
+        float32_memory_bytes=baseline.matrix.nbytes
+    )
@@ -6,9 +6,12 @@ detecting faces in images. It supports multiple detection strategies through
 dependency injection (MediaPipe, OpenCV).
 """
 
-from typing import List, Optional, Protocol
+import queue
+import threading
+from typing import Callable, List, Optional, Protocol, Union
 import numpy as np
 
+from .image_context import ImageContext
 from .value_objects import FaceLocation, DetectionResult
 from .strategies import (
     MediaPipeDetectionStrategy,
@@ -18,17 +21,29 @@ from .strategies import (
     OPENCV_AVAILABLE,
     YOLO_AVAILABLE
 )
+from core.shared.metrics import metrics_registry
+
+_DETECTIONS_TOTAL = metrics_registry.counter(
+    "eyed_face_detections_total",
+    "Number of faces detected, by detection strategy",
+    ("strategy",)
+)
+_FALLBACKS_TOTAL = metrics_registry.counter(
+    "eyed_detection_fallbacks_total",
+    "Number of times the OpenCV primary detector fell back to MediaPipe",
+    ("reason",)
+)
 
 
 class DetectionStrategy(Protocol):
     """Protocol for face detection strategies."""
     
-    def detect(self, image: np.ndarray) -> List[tuple[FaceLocation, float]]:
+    def detect(self, image: Union[np.ndarray, ImageContext]) -> List[tuple[FaceLocation, float]]:
         """
         Detect faces in an image.
         
         Args:
-            image: Input image as numpy array
+            image: Input image as numpy array or its ImageContext
             
         Returns:
             List of tuples containing (FaceLocation, confidence_score)
@@ -96,18 +111,29 @@ class FaceDetector:
             self.primary_strategy = None
             self.fallback_strategy = None
     
-    def detect(self, image: np.ndarray) -> DetectionResult:
+    def detect(self, image: Union[np.ndarray, ImageContext]) -> DetectionResult:
         """
         Detect faces in an image.
         
+        Given an ImageContext, the strategies share its colour conversions and
+        repeated calls for the same context return the first result.
+        
         Args:
-            image: Input image as numpy array
+            image: Input image as numpy array or its ImageContext
         
         Returns:
             DetectionResult containing face detection information
         """
+        context = ImageContext.of(image)
+        return context.memoize(self, lambda: self._detect(context))
+    
+    def _detect(self, context: ImageContext) -> DetectionResult:
+        """Run the detection strategies on an image context (see detect)."""
         # Preprocess image
-        processed_image = self._preprocess_image(image)
+        processed_image = self._preprocess_image(context.image)
+        if processed_image is not context.image:
+            # Converted to uint8: derived forms must come from the converted image
+            context = ImageContext(processed_image)
         
         # Debug: Log detection attempt
         strategy_name = type(self.detection_strategy).__name__
@@ -122,7 +148,7 @@ class FaceDetector:
         # Try OpenCV first (primary strategy, matches old system)
         if self.primary_strategy is not None:
             try:
-                detections = self.primary_strategy.detect(processed_image)
+                detections = self.primary_strategy.detect(context)
                 strategy_used = "OpenCVDetectionStrategy"
                 print(f"[FaceDetector] OpenCV returned {len(detections)} detections")
                 
@@ -133,8 +159,9 @@ class FaceDetector:
                     # OpenCV found no faces, try MediaPipe fallback
                     print(f"[FaceDetector] OpenCV found no faces, trying MediaPipe fallback...")
                     if self.fallback_strategy is not None:
+                        _FALLBACKS_TOTAL.inc(reason="no_faces")
                         try:
-                            fallback_detections = self.fallback_strategy.detect(processed_image)
+                            fallback_detections = self.fallback_strategy.detect(context)
                             if len(fallback_detections) > 0:
                                 detections = fallback_detections
                                 strategy_used = "MediaPipeDetectionStrategy (fallback)"
@@ -149,8 +176,9 @@ class FaceDetector:
                 # Try MediaPipe fallback if OpenCV fails
                 if self.fallback_strategy is not None:
                     print(f"[FaceDetector] Falling back to MediaPipe detection...")
+                    _FALLBACKS_TOTAL.inc(reason="error")
                     try:
-                        detections = self.fallback_strategy.detect(processed_image)
+                        detections = self.fallback_strategy.detect(context)
                         strategy_used = "MediaPipeDetectionStrategy (fallback)"
                         print(f"[FaceDetector] MediaPipe fallback returned {len(detections)} detections")
                     except Exception as fallback_error:
@@ -165,7 +193,7 @@ class FaceDetector:
         elif self.fallback_strategy is not None:
             # Only MediaPipe available, use it directly
             try:
-                detections = self.fallback_strategy.detect(processed_image)
+                detections = self.fallback_strategy.detect(context)
                 strategy_used = "MediaPipeDetectionStrategy"
                 print(f"[FaceDetector] MediaPipe returned {len(detections)} detections")
             except Exception as e:
@@ -176,7 +204,7 @@ class FaceDetector:
         elif self.detection_strategy is not None and self.primary_strategy is None and self.fallback_strategy is None:
             # Strategy passed directly (e.g., MediaPipe as primary for class attendance)
             try:
-                detections = self.detection_strategy.detect(processed_image)
+                detections = self.detection_strategy.detect(context)
                 strategy_used = type(self.detection_strategy).__name__
                 print(f"[FaceDetector] {strategy_used} returned {len(detections)} detections")
             except Exception as e:
@@ -197,6 +225,7 @@ class FaceDetector:
         # Extract faces and confidence scores
         faces = [face_location for face_location, _ in detections]
         confidence_scores = [confidence for _, confidence in detections]
+        _DETECTIONS_TOTAL.inc(len(faces), strategy=strategy_used.replace(" (fallback)", ""))
         
         print(f"[FaceDetector] Successfully detected {len(faces)} face(s)")
         return DetectionResult(
@@ -206,7 +235,7 @@ class FaceDetector:
             confidence_scores=confidence_scores
         )
     
-    def detect_multiple(self, image: np.ndarray) -> List[DetectionResult]:
+    def detect_multiple(self, image: Union[np.ndarray, ImageContext]) -> List[DetectionResult]:
         """
         Detect faces in an image, returning a list of DetectionResult objects.
         
@@ -260,3 +289,107 @@ class FaceDetector:
         
         return image
 
+
+class PooledFaceDetector:
+    """
+    Thread-safe face detector backed by a pool of FaceDetector instances.
+    
+    Detection strategies hold state that must not be shared between threads
+    (MediaPipe graphs, YOLO predictors), so each FaceDetector is used by one
+    caller at a time. This class is responsible ONLY for:
+    - Lending a detector from the pool for the duration of one detect() call
+    - Creating detectors lazily, up to pool_size, when all are busy
+    - Blocking callers when pool_size detectors are already in use
+    
+    It does NOT change detection behavior; results are those of the
+    underlying FaceDetector.
+    """
+    
+    def __init__(self, factory: Callable[[], FaceDetector], pool_size: int = 2):
+        """
+        Initialize the pool and create its first detector.
+        
+        The first detector is created eagerly so that missing dependencies
+        raise ImportError here, as they would for a plain FaceDetector.
+        
+        Args:
+            factory: Zero-argument callable creating a FaceDetector.
+            pool_size: Maximum number of detectors (and concurrent detections).
+        
+        Raises:
+            ValueError: If pool_size is less than 1.
+        """
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1, got {pool_size}")
+        
+        self._factory = factory
+        self.pool_size = pool_size
+        self._lock = threading.Lock()
+        # LIFO keeps recently used (warm) detectors in circulation
+        self._idle: "queue.LifoQueue[FaceDetector]" = queue.LifoQueue()
+        self._idle.put(factory())
+        self._created = 1
+    
+    @property
+    def created(self) -> int:
+        """Return the number of detectors created so far."""
+        with self._lock:
+            return self._created
+    
+    def detect(self, image: Union[np.ndarray, ImageContext]) -> DetectionResult:
+        """
+        Detect faces in an image using a detector from the pool.
+        
+        Repeated calls for the same ImageContext return the first result
+        without borrowing a detector.
+        
+        Args:
+            image: Input image as numpy array or its ImageContext
+        
+        Returns:
+            DetectionResult containing face detection information
+        """
+        context = ImageContext.of(image)
+        return context.memoize(self, lambda: self._detect(context))
+    
+    def _detect(self, context: ImageContext) -> DetectionResult:
+        """Detect faces with a borrowed detector."""
+        detector = self._acquire()
+        try:
+            return detector.detect(context)
+        finally:
+            self._idle.put(detector)
+    
+    def detect_multiple(self, image: Union[np.ndarray, ImageContext]) -> List[DetectionResult]:
+        """
+        Detect faces in an image, returning a list of DetectionResult objects.
+        
+        Args:
+            image: Input image as numpy array
+            
+        Returns:
+            List of DetectionResult objects (currently contains one result)
+        """
+        return [self.detect(image)]
+    
+    def _acquire(self) -> FaceDetector:
+        """Take an idle detector, create a new one, or wait for one to be released."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_create = self._created < self.pool_size
+            if can_create:
+                self._created += 1
+        
+        if not can_create:
+            return self._idle.get()
+        
+        try:
+            return self._factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
@@ -6,26 +6,46 @@ This module provides pure embedding extraction logic with no infrastructure depe
 
 import time
 import logging
-from typing import Optional, List
+from typing import Optional, List, Sequence, Tuple
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
-# Import DeepFace - environment should be properly configured via requirements.txt
-try:
-    from deepface import DeepFace
-    DEEPFACE_AVAILABLE = True
-    logger.info("DeepFace imported successfully")
-except ImportError as e:
-    logger.error(f"Failed to import DeepFace: {e}", exc_info=True)
-    DEEPFACE_AVAILABLE = False
-    DeepFace = None
-except Exception as e:
-    logger.warning(f"Error importing DeepFace: {e}", exc_info=True)
-    DEEPFACE_AVAILABLE = False
-    DeepFace = None
+from core.shared.optional_imports import module_available
 
-from .value_objects import EmbeddingResult
+# DeepFace pulls in TensorFlow, which takes seconds to import. Only its presence
+# is checked here; the module is imported when the first extractor is created.
+DEEPFACE_AVAILABLE = module_available("deepface")
+DeepFace = None
+
+
+def _load_deepface():
+    """
+    Import DeepFace on first use and cache it at module level.
+    
+    Returns:
+        The DeepFace module.
+    
+    Raises:
+        ImportError: If DeepFace (or TensorFlow) fails to import.
+    """
+    global DeepFace
+    if DeepFace is None:
+        try:
+            from deepface import DeepFace as deepface_module
+        except ImportError:
+            logger.error("Failed to import DeepFace", exc_info=True)
+            raise
+        except Exception as e:
+            logger.warning(f"Error importing DeepFace: {e}", exc_info=True)
+            raise ImportError(f"Error importing DeepFace: {e}") from e
+        DeepFace = deepface_module
+        logger.info("DeepFace imported successfully")
+    return DeepFace
+
+from .face_aligner import FaceAligner
+from .inference_backend import DeepFaceBackend, InferenceBackend, embedding_model_id
+from .value_objects import EmbeddingResult, FaceLocation
 
 # Embedding dimensions for known models (no need to run inference to determine)
 EMBEDDING_DIMENSIONS = {
@@ -50,11 +70,31 @@ class EmbeddingExtractor:
     Uses ArcFace model by default for improved recognition accuracy, especially
     for smaller/distant faces in group photos.
     
+    Two extraction paths are available:
+    - DeepFace.represent (default): DeepFace runs its own detector and
+      alignment on the face crop before the recognition model.
+    - Aligned (extract_aligned, or extract with skip_detection=True): the
+      face is aligned from our FaceLocation/landmarks and the recognition
+      model is run directly, skipping the second detection pass.
+    Embeddings from the two paths are not interchangeable; use the same
+    path for registration and recognition.
+    
+    The recognition model runs on an inference backend (DeepFace on
+    TensorFlow by default). With another backend, e.g. OnnxRuntimeBackend,
+    DeepFace is not needed and only the aligned path is available.
+    
     Single Responsibility: Extract face embeddings ONLY.
     No file I/O, no database access, no matching logic.
     """
     
-    def __init__(self, model_name: str = "ArcFace", enforce_detection: bool = False, align: bool = True):
+    def __init__(
+        self,
+        model_name: str = "ArcFace",
+        enforce_detection: bool = False,
+        align: bool = True,
+        skip_detection: bool = False,
+        backend: Optional[InferenceBackend] = None
+    ):
         """
         Initialize the embedding extractor.
         
@@ -62,7 +102,24 @@ class EmbeddingExtractor:
             model_name: DeepFace model name (default: "ArcFace")
             enforce_detection: Whether to enforce face detection (default: False)
             align: Whether to align faces (default: True)
+            skip_detection: If True, extract() treats its input as an already
+                           located face crop and uses the aligned path instead
+                           of DeepFace's detector backend (default: False)
+            backend: Inference backend running the recognition model. If
+                    given, extraction always uses the aligned path
+                    (default: DeepFace backend for model_name)
         """
+        self.model_name = model_name
+        self.enforce_detection = enforce_detection
+        self.align = align
+        self._embedding_dimension = None
+        self._aligner: Optional[FaceAligner] = None
+        
+        if backend is not None:
+            self.skip_detection = True
+            self._backend = backend
+            return
+        
         if not DEEPFACE_AVAILABLE:
             error_msg = (
                 "DeepFace is not available. Please install dependencies:\n"
@@ -72,10 +129,8 @@ class EmbeddingExtractor:
             logger.error(error_msg)
             raise ImportError(error_msg)
         
-        self.model_name = model_name
-        self.enforce_detection = enforce_detection
-        self.align = align
-        self._embedding_dimension = None
+        self.skip_detection = skip_detection
+        self._backend = DeepFaceBackend(model_name, _load_deepface())
     
     def _normalize_embedding(self, embedding: np.ndarray) -> np.ndarray:
         """
@@ -105,6 +160,10 @@ class EmbeddingExtractor:
         if face_image is None or face_image.size == 0:
             return None
         
+        if self.skip_detection:
+            height, width = face_image.shape[:2]
+            return self.extract_aligned(face_image, FaceLocation(x=0, y=0, width=width, height=height))
+        
         start_time = time.time()
         
         try:
@@ -146,16 +205,146 @@ class EmbeddingExtractor:
             )
             raise RuntimeError(error_msg) from e
     
+    def extract_aligned(
+        self,
+        image: np.ndarray,
+        face_location: FaceLocation,
+        landmarks: Optional[Sequence[Tuple[float, float]]] = None
+    ) -> Optional[EmbeddingResult]:
+        """
+        Extract a face embedding from an already located face.
+        
+        The face is aligned to the model input size (112x112 for ArcFace)
+        from its location and optional landmarks, and fed straight to the
+        recognition model; DeepFace's detector backend is skipped.
+        
+        Args:
+            image: Full image containing the face (same channel order as extract()).
+            face_location: Location of the face in the image.
+            landmarks: Optional landmarks in image pixel coordinates, 5 points
+                      (eyes, nose tip, mouth corners) or 2 points (eyes).
+            
+        Returns:
+            EmbeddingResult, or None if the image is empty
+        
+        Raises:
+            RuntimeError: If the model fails.
+        """
+        results = self.extract_aligned_batch(
+            image,
+            [face_location],
+            [landmarks] if landmarks is not None else None
+        )
+        return results[0] if results else None
+    
+    def extract_aligned_batch(
+        self,
+        image: np.ndarray,
+        face_locations: List[FaceLocation],
+        landmarks: Optional[List[Optional[Sequence[Tuple[float, float]]]]] = None
+    ) -> List[Optional[EmbeddingResult]]:
+        """
+        Extract embeddings for several located faces with one model call.
+        
+        Args:
+            image: Full image containing the faces.
+            face_locations: Locations of the faces in the image.
+            landmarks: Optional per-face landmarks (entries may be None).
+            
+        Returns:
+            List of EmbeddingResult objects in face_locations order (empty if
+            the image is empty or no faces are given)
+        
+        Raises:
+            RuntimeError: If the model fails.
+        """
+        if image is None or image.size == 0 or not face_locations:
+            return []
+        
+        return self._extract_aligned_faces([
+            (image, location, landmarks[i] if landmarks else None)
+            for i, location in enumerate(face_locations)
+        ])
+    
+    def _extract_aligned_faces(
+        self,
+        faces: List[Tuple[np.ndarray, FaceLocation, Optional[Sequence[Tuple[float, float]]]]]
+    ) -> List[EmbeddingResult]:
+        """
+        Align (image, location, landmarks) faces and embed them with one model call.
+        
+        Raises:
+            RuntimeError: If the model fails.
+        """
+        start_time = time.time()
+        
+        try:
+            aligner = self._get_aligner()
+            aligned = np.stack([
+                aligner.align(image, location, face_landmarks)
+                for image, location, face_landmarks in faces
+            ])
+            embeddings = self._backend.forward(aligned)
+        except Exception as e:
+            error_msg = (
+                f"Aligned embedding extraction failed with {self.model_name} model: "
+                f"{type(e).__name__}: {str(e)}"
+            )
+            raise RuntimeError(error_msg) from e
+        
+        extraction_time_ms = (time.time() - start_time) * 1000 / len(faces)
+        self._embedding_dimension = embeddings.shape[1]
+        return [
+            EmbeddingResult(
+                embedding=self._normalize_embedding(embedding),
+                dimension=len(embedding),
+                extraction_time_ms=extraction_time_ms
+            )
+            for embedding in embeddings
+        ]
+    
+    @property
+    def backend(self) -> InferenceBackend:
+        """Return the inference backend running the recognition model."""
+        return self._backend
+    
+    @property
+    def model_id(self) -> str:
+        """Return the identifier of the embedding space (model, backend and weights)."""
+        return embedding_model_id(self.model_name, self._backend.name, self._backend.weights_path)
+    
+    def _get_aligner(self) -> FaceAligner:
+        """Return a face aligner producing crops of the model input size."""
+        if self._aligner is None:
+            self._aligner = FaceAligner(output_size=int(self._backend.input_size))
+        return self._aligner
+    
     def extract_batch(self, face_images: List[np.ndarray]) -> List[Optional[EmbeddingResult]]:
         """
         Extract face embeddings from multiple face images.
         
+        With skip_detection, all crops are embedded with a single batched
+        model call; otherwise each crop goes through DeepFace.represent.
+        
         Args:
             face_images: List of face images as numpy arrays
             
         Returns:
             List of EmbeddingResult objects (None for failed extractions)
         """
+        if self.skip_detection:
+            valid = [i for i, face in enumerate(face_images) if face is not None and face.size > 0]
+            results: List[Optional[EmbeddingResult]] = [None] * len(face_images)
+            if valid:
+                embedded = self._extract_aligned_faces([
+                    (face_images[i], FaceLocation(x=0, y=0, width=face_images[i].shape[1],
+                                                  height=face_images[i].shape[0]), None)
+                    for i in valid
+                ])
+                for i, result in zip(valid, embedded):
+                    results[i] = result
+            return results
+        
         results = []
         for face_image in face_images:
             result = self.extract(face_image)
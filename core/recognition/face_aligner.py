@@ -0,0 +1,159 @@
+"""
+Face alignment for embedding extraction.
+
+This module provides pure alignment logic that turns a detected face
+(FaceLocation plus optional landmarks) into the fixed-size, aligned crop
+expected by ArcFace-style recognition models, so the embedding model can be
+run without a second detection pass.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from .value_objects import FaceLocation
+
+# Reference positions of (left eye, right eye, nose tip, left mouth corner,
+# right mouth corner) in a 112x112 ArcFace input, in image left-to-right order
+ARCFACE_TEMPLATE_112 = np.array([
+    [38.2946, 51.6963],
+    [73.5318, 51.5014],
+    [56.0252, 71.7366],
+    [41.5493, 92.3655],
+    [70.7299, 92.2041],
+], dtype=np.float64)
+
+__all__ = ['FaceAligner', 'ARCFACE_TEMPLATE_112', 'estimate_similarity_transform']
+
+
+def estimate_similarity_transform(source: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """
+    Estimate the similarity transform (rotation, uniform scale, translation)
+    that best maps source points onto target points in the least-squares sense.
+
+    Uses the closed-form Umeyama method.
+
+    Args:
+        source: Array of shape (N, 2) with source points (N >= 2).
+        target: Array of shape (N, 2) with corresponding target points.
+
+    Returns:
+        2x3 affine matrix suitable for cv2.warpAffine.
+    """
+    source = np.asarray(source, dtype=np.float64)
+    target = np.asarray(target, dtype=np.float64)
+
+    source_mean = source.mean(axis=0)
+    target_mean = target.mean(axis=0)
+    source_centered = source - source_mean
+    target_centered = target - target_mean
+
+    covariance = target_centered.T @ source_centered / len(source)
+    u, singular_values, vt = np.linalg.svd(covariance)
+
+    # Avoid reflections
+    sign = np.ones(2)
+    if np.linalg.det(u) * np.linalg.det(vt) < 0:
+        sign[-1] = -1.0
+
+    rotation = u @ np.diag(sign) @ vt
+    source_variance = source_centered.var(axis=0).sum()
+    scale = (singular_values * sign).sum() / source_variance if source_variance > 0 else 1.0
+    translation = target_mean - scale * rotation @ source_mean
+
+    return np.hstack([scale * rotation, translation[:, None]])
+
+
+class FaceAligner:
+    """
+    Produces aligned, fixed-size face crops for embedding models.
+
+    This class is responsible ONLY for:
+    - Warping a face onto the ArcFace 5-point template when landmarks are known
+    - Aligning on the eyes when only the two eye landmarks are known
+    - Cropping a square region around the face box when no landmarks are known
+
+    It does NOT detect faces or landmarks, and does not run any model.
+    """
+
+    def __init__(self, output_size: int = 112):
+        """
+        Initialize the face aligner.
+
+        Args:
+            output_size: Side length of the square output crop in pixels.
+                        The ArcFace template is scaled to this size.
+        """
+        self.output_size = output_size
+        self.template = ARCFACE_TEMPLATE_112 * (output_size / 112.0)
+
+    def align(
+        self,
+        image: np.ndarray,
+        face_location: FaceLocation,
+        landmarks: Optional[Sequence[Tuple[float, float]]] = None
+    ) -> np.ndarray:
+        """
+        Produce an aligned face crop.
+
+        Args:
+            image: Full image containing the face, shape (H, W, 3).
+            face_location: Location of the face in the image.
+            landmarks: Optional facial landmarks in image pixel coordinates:
+                      5 points (eyes, nose tip, mouth corners, template order)
+                      or 2 points (left eye, right eye).
+
+        Returns:
+            Aligned crop of shape (output_size, output_size, 3), same dtype
+            and channel order as the input image.
+
+        Raises:
+            ValueError: If landmarks are given with an unsupported point count.
+        """
+        if landmarks is None:
+            return self._crop_box(image, face_location)
+
+        points = np.asarray(landmarks, dtype=np.float64).reshape(-1, 2)
+        if len(points) == 5:
+            template = self.template
+        elif len(points) == 2:
+            template = self.template[:2]
+        else:
+            raise ValueError(f"Expected 5 or 2 landmarks, got {len(points)}")
+
+        matrix = estimate_similarity_transform(points, template)
+        return cv2.warpAffine(
+            image,
+            matrix,
+            (self.output_size, self.output_size),
+            flags=cv2.INTER_LINEAR,
+            borderMode=cv2.BORDER_REPLICATE
+        )
+
+    def _crop_box(self, image: np.ndarray, face_location: FaceLocation) -> np.ndarray:
+        """
+        Crop a square around the face box and resize it to the output size.
+
+        The square is centered on the box and has the side of its longer edge,
+        so the face keeps its aspect ratio; regions outside the image are
+        filled by replicating the border.
+        """
+        side = max(face_location.width, face_location.height, 1)
+        center_x = face_location.x + face_location.width / 2.0
+        center_y = face_location.y + face_location.height / 2.0
+        scale = self.output_size / side
+
+        # Map the square onto the output with a pure scale + translation
+        matrix = np.array([
+            [scale, 0.0, self.output_size / 2.0 - scale * center_x],
+            [0.0, scale, self.output_size / 2.0 - scale * center_y],
+        ])
+        interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+        return cv2.warpAffine(
+            image,
+            matrix,
+            (self.output_size, self.output_size),
+            flags=interpolation,
+            borderMode=cv2.BORDER_REPLICATE
+        )
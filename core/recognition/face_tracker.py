@@ -0,0 +1,278 @@
+"""
+Face tracking across video frames and per-track identity voting.
+
+Faces detected in consecutive (sampled) frames are linked into tracks by
+box overlap, and each track keeps only its few best-quality crops. Video
+ingestion then embeds those crops instead of every detection and decides a
+track's identity by voting over their recognition results. No file I/O, no
+database access.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from core.recognition.value_objects import FaceLocation, RecognitionResult
+
+DEFAULT_TRACK_IOU_THRESHOLD = 0.3
+"""Minimum box overlap (IoU) for linking a detection to a track."""
+
+DEFAULT_TRACK_MAX_MISSED = 3
+"""Consecutive frames a track may go undetected before it ends."""
+
+DEFAULT_TRACK_KEEP_BEST = 3
+"""Best-quality crops kept per track (the crops that get embedded)."""
+
+
+@dataclass(frozen=True)
+class TrackedFace:
+    """
+    One detection of a tracked face.
+
+    Attributes:
+        frame_index: Index of the frame the face was detected in.
+        quality_score: Quality score of the crop.
+        face_image: Cropped face image.
+    """
+    frame_index: int
+    quality_score: float
+    face_image: np.ndarray
+
+
+@dataclass
+class FaceTrack:
+    """
+    A face followed across frames.
+
+    Attributes:
+        track_id: Track number (1 for the first track).
+        location: Box of the latest detection.
+        first_frame: Frame index of the first detection.
+        last_frame: Frame index of the latest detection.
+        hits: Number of detections linked to the track.
+        missed: Frames since the latest detection.
+        best_faces: Best-quality detections, best first.
+    """
+    track_id: int
+    location: FaceLocation
+    first_frame: int
+    last_frame: int
+    hits: int = 0
+    missed: int = 0
+    best_faces: List[TrackedFace] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class TrackIdentity:
+    """
+    Identity voted for a track.
+
+    Attributes:
+        user_id: Winning user.
+        user_name: Winning user's name.
+        confidence: Mean confidence of the winning votes.
+        votes: Crops recognized as the winning user.
+        samples: Crops that were recognized (including unmatched ones).
+    """
+    user_id: str
+    user_name: str
+    confidence: float
+    votes: int
+    samples: int
+
+
+class FaceTracker:
+    """
+    Greedy IoU tracker for faces in a frame sequence.
+
+    This class is responsible ONLY for:
+    - Linking each frame's detections to existing tracks by box overlap
+    - Starting tracks for unmatched detections and ending stale ones
+    - Keeping the best-quality crops of each track
+
+    It does NOT handle:
+    - Face detection, quality assessment or recognition
+    - Frame decoding
+
+    Frames should be fed in order; with sampled frames, max_missed counts
+    sampled frames, not source frames.
+    """
+
+    def __init__(
+        self,
+        iou_threshold: float = DEFAULT_TRACK_IOU_THRESHOLD,
+        max_missed: int = DEFAULT_TRACK_MAX_MISSED,
+        keep_best: int = DEFAULT_TRACK_KEEP_BEST
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            iou_threshold: Minimum IoU for linking a detection to a track.
+            max_missed: Frames a track may go undetected before it ends.
+            keep_best: Best-quality crops kept per track.
+        """
+        self.iou_threshold = iou_threshold
+        self.max_missed = max(0, int(max_missed))
+        self.keep_best = max(1, int(keep_best))
+        self._active: List[FaceTrack] = []
+        self._finished: List[FaceTrack] = []
+        self._next_id = 1
+
+    @property
+    def active_tracks(self) -> List[FaceTrack]:
+        """Return the tracks still being followed."""
+        return list(self._active)
+
+    def update(
+        self,
+        frame_index: int,
+        locations: Sequence[FaceLocation],
+        face_images: Sequence[np.ndarray],
+        quality_scores: Sequence[float]
+    ) -> List[FaceTrack]:
+        """
+        Link one frame's detections to tracks.
+
+        Pairs are matched greedily in descending IoU order, so each track and
+        each detection is used at most once.
+
+        Args:
+            frame_index: Index of the frame (increasing).
+            locations: Detected face boxes.
+            face_images: Crop of each detection.
+            quality_scores: Quality score of each crop.
+
+        Returns:
+            Track of each detection, in detection order.
+        """
+        assigned: List[Optional[FaceTrack]] = [None] * len(locations)
+
+        if self._active and len(locations):
+            overlaps = _iou_matrix(
+                np.array([_box(track.location) for track in self._active], dtype=np.float64),
+                np.array([_box(location) for location in locations], dtype=np.float64)
+            )
+            order = np.argsort(overlaps, axis=None)[::-1]
+            used_tracks, used_detections = set(), set()
+            for flat in order:
+                track_index, detection = divmod(int(flat), len(locations))
+                if overlaps[track_index, detection] < self.iou_threshold:
+                    break
+                if track_index in used_tracks or detection in used_detections:
+                    continue
+                used_tracks.add(track_index)
+                used_detections.add(detection)
+                assigned[detection] = self._active[track_index]
+
+        for detection, location in enumerate(locations):
+            track = assigned[detection]
+            if track is None:
+                track = FaceTrack(
+                    track_id=self._next_id,
+                    location=location,
+                    first_frame=frame_index,
+                    last_frame=frame_index
+                )
+                self._next_id += 1
+                self._active.append(track)
+                assigned[detection] = track
+            track.location = location
+            track.last_frame = frame_index
+            track.hits += 1
+            track.missed = 0
+            self._offer(track, frame_index, float(quality_scores[detection]), face_images[detection])
+
+        self._expire(frame_index)
+        return assigned
+
+    def finish(self) -> List[FaceTrack]:
+        """
+        End all tracks and return every track seen, in start order.
+
+        Returns:
+            All tracks (ended and still active).
+        """
+        self._finished.extend(self._active)
+        self._active = []
+        return sorted(self._finished, key=lambda track: track.track_id)
+
+    def _offer(self, track: FaceTrack, frame_index: int, quality_score: float, face_image: np.ndarray) -> None:
+        """Keep a detection if it is among the track's best crops."""
+        best = track.best_faces
+        if len(best) >= self.keep_best and quality_score <= best[-1].quality_score:
+            return
+        # Copy: the crop is usually a view into a frame that is about to be discarded
+        best.append(TrackedFace(frame_index, quality_score, np.array(face_image)))
+        best.sort(key=lambda kept: kept.quality_score, reverse=True)
+        del best[self.keep_best:]
+
+    def _expire(self, frame_index: int) -> None:
+        """End tracks that have not been detected for more than max_missed frames."""
+        still_active = []
+        for track in self._active:
+            if track.last_frame != frame_index:
+                # Counted per update() call, so sampled frame indices work too
+                track.missed += 1
+            if track.missed > self.max_missed:
+                self._finished.append(track)
+            else:
+                still_active.append(track)
+        self._active = still_active
+
+
+def vote_identity(
+    results: Sequence[Optional[RecognitionResult]],
+    min_vote_share: float = 0.5
+) -> Optional[TrackIdentity]:
+    """
+    Decide a track's identity from the recognition results of its crops.
+
+    The user with the most votes wins if it has strictly more votes than
+    any other user and at least min_vote_share of all crops, unmatched
+    crops included.
+
+    Args:
+        results: Recognition result per embedded crop (None: no match).
+        min_vote_share: Share of crops the winner needs.
+
+    Returns:
+        TrackIdentity, or None if no user wins the vote.
+    """
+    votes: Dict[str, List[RecognitionResult]] = {}
+    for result in results:
+        if result is not None:
+            votes.setdefault(result.user_id, []).append(result)
+    if not votes:
+        return None
+
+    ranked = sorted(votes.items(), key=lambda item: len(item[1]), reverse=True)
+    user_id, winning = ranked[0]
+    if len(ranked) > 1 and len(ranked[1][1]) == len(winning):
+        return None
+    if len(winning) < min_vote_share * len(results):
+        return None
+    return TrackIdentity(
+        user_id=user_id,
+        user_name=winning[0].user_name,
+        confidence=float(np.mean([float(r.confidence) for r in winning])),
+        votes=len(winning),
+        samples=len(results)
+    )
+
+
+def _box(location: FaceLocation) -> tuple:
+    """Return a face location as (x1, y1, x2, y2)."""
+    return (location.x, location.y, location.x + location.width, location.y + location.height)
+
+
+def _iou_matrix(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """Return the IoU of every box in boxes_a (N, 4) with every box in boxes_b (M, 4)."""
+    top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bottom_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    area_a = np.prod(boxes_a[:, 2:] - boxes_a[:, :2], axis=1)
+    area_b = np.prod(boxes_b[:, 2:] - boxes_b[:, :2], axis=1)
+    union = area_a[:, None] + area_b[None, :] - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
@@ -0,0 +1,279 @@
+"""
+Vectorized embedding gallery for face matching.
+
+This module provides pure matching logic over a matrix of known embeddings.
+Matching one or many probes costs a single matrix multiplication instead of
+a Python loop over users. No file I/O, no database access.
+"""
+
+import logging
+from collections import Counter
+from typing import AbstractSet, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from core.recognition.assignment import ASSIGNMENT_AUTO, assign_one_to_one
+
+logger = logging.getLogger(__name__)
+
+EmbeddingInput = Union[np.ndarray, Sequence[np.ndarray]]
+
+
+class EmbeddingGallery:
+    """
+    Immutable matrix of known face embeddings.
+
+    This class is responsible ONLY for:
+    - Stacking known embeddings into a normalized (N, D) float32 matrix
+    - Scoring probes against all known embeddings with one matrix multiply
+    - Reducing scores to the best matching user per probe
+    - Assigning a batch of probes to distinct users (one-to-one)
+
+    Users may have several embeddings; a user's score is the best score of
+    any of their embeddings. Scores are cosine similarities clamped to
+    [0, 1], as in FaceRecognizer.
+    """
+
+    def __init__(
+        self,
+        matrix: np.ndarray,
+        row_user_ids: Sequence[str],
+        user_names: Optional[Dict[str, str]] = None
+    ):
+        """
+        Initialize the gallery from an embedding matrix.
+
+        Args:
+            matrix: Array of shape (N, D); rows are normalized here.
+            row_user_ids: User ID of each row (length N).
+            user_names: Optional mapping of user_id to user_name.
+
+        Raises:
+            ValueError: If matrix and row_user_ids do not match.
+        """
+        matrix = np.asarray(matrix, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[0] != len(row_user_ids):
+            raise ValueError(
+                f"matrix shape {matrix.shape} does not match {len(row_user_ids)} row user IDs"
+            )
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.matrix = matrix / norms
+        self.user_names = dict(user_names or {})
+        self._set_row_user_ids(row_user_ids)
+
+    def _set_row_user_ids(self, row_user_ids: Sequence[str]) -> None:
+        """Store the user ID of each row and index rows by distinct user."""
+        self.row_user_ids = np.asarray(row_user_ids, dtype=object)
+        self.user_ids, self._row_user_index = (
+            np.unique(self.row_user_ids.astype(str), return_inverse=True)
+            if len(row_user_ids) else (np.zeros(0, dtype=str), np.zeros(0, dtype=np.intp))
+        )
+        # Rows grouped by user: user u owns rows _user_rows[_user_row_starts[u]:_user_row_starts[u + 1]]
+        self._user_rows = np.argsort(self._row_user_index, kind="stable")
+        self._user_row_starts = np.searchsorted(
+            self._row_user_index[self._user_rows], np.arange(len(self.user_ids) + 1)
+        )
+
+    @classmethod
+    def from_known_embeddings(
+        cls,
+        known_embeddings: Dict[str, EmbeddingInput],
+        user_names: Optional[Dict[str, str]] = None
+    ) -> "EmbeddingGallery":
+        """
+        Build a gallery from the user_id -> embedding(s) mapping used by FaceRecognizer.
+
+        Values may be a single embedding, a list/tuple of embeddings or a 2-D
+        array with one embedding per row. Embeddings whose dimension differs
+        from the most common one are skipped (FaceRecognizer scores them 0).
+
+        Args:
+            known_embeddings: Mapping of user_id to embedding(s).
+            user_names: Optional mapping of user_id to user_name.
+
+        Returns:
+            EmbeddingGallery (possibly empty).
+        """
+        rows: List[np.ndarray] = []
+        row_user_ids: List[str] = []
+        for user_id, value in known_embeddings.items():
+            if isinstance(value, (list, tuple)):
+                vectors = [np.asarray(v, dtype=np.float32).ravel() for v in value]
+            else:
+                array = np.asarray(value, dtype=np.float32)
+                vectors = list(array) if array.ndim == 2 else [array.ravel()]
+            for vector in vectors:
+                rows.append(vector)
+                row_user_ids.append(user_id)
+
+        if not rows:
+            return cls(np.zeros((0, 0), dtype=np.float32), [], user_names)
+
+        dimension, _ = Counter(len(row) for row in rows).most_common(1)[0]
+        keep = [i for i, row in enumerate(rows) if len(row) == dimension]
+        if len(keep) < len(rows):
+            logger.warning(f"Skipping {len(rows) - len(keep)} gallery embedding(s) with dimension != {dimension}")
+
+        return cls(
+            np.stack([rows[i] for i in keep]),
+            [row_user_ids[i] for i in keep],
+            user_names
+        )
+
+    def subset(self, user_ids: AbstractSet[str]) -> "EmbeddingGallery":
+        """
+        Return a gallery of the rows of the given users.
+
+        Rows are looked up per user and taken from the already normalized
+        matrix, so the cost depends on the number of users kept, not on the
+        gallery size.
+
+        Args:
+            user_ids: Users to keep (unknown IDs are ignored).
+
+        Returns:
+            EmbeddingGallery sharing this gallery's user names.
+        """
+        gallery = EmbeddingGallery.__new__(EmbeddingGallery)
+        rows = np.sort(self._rows_of(self._user_positions(user_ids)))
+        gallery.matrix = self.matrix[rows]
+        gallery.user_names = self.user_names
+        gallery._set_row_user_ids(self.row_user_ids[rows])
+        return gallery
+
+    def _user_positions(self, user_ids: Optional[AbstractSet[str]]) -> np.ndarray:
+        """Return the positions in self.user_ids of the known users among user_ids."""
+        if not user_ids or not len(self.user_ids):
+            return np.zeros(0, dtype=np.intp)
+        wanted = np.asarray(sorted(str(user_id) for user_id in user_ids))
+        positions = np.minimum(np.searchsorted(self.user_ids, wanted), len(self.user_ids) - 1)
+        return positions[self.user_ids[positions] == wanted]
+
+    def _rows_of(self, positions: np.ndarray) -> np.ndarray:
+        """Return the row indices of the users at the given positions."""
+        if not len(positions):
+            return np.zeros(0, dtype=np.intp)
+        return np.concatenate([
+            self._user_rows[self._user_row_starts[position]:self._user_row_starts[position + 1]]
+            for position in positions
+        ])
+
+    @property
+    def size(self) -> int:
+        """Return the number of embeddings in the gallery."""
+        return self.matrix.shape[0]
+
+    @property
+    def dimension(self) -> int:
+        """Return the embedding dimension (0 for an empty gallery)."""
+        return self.matrix.shape[1]
+
+    def scores(self, probes: np.ndarray) -> np.ndarray:
+        """
+        Compute cosine similarities of probes against every gallery row.
+
+        Args:
+            probes: Array of shape (B, D) or (D,).
+
+        Returns:
+            Array of shape (B, N) with similarities clamped to [0, 1].
+        """
+        probes = np.atleast_2d(np.asarray(probes, dtype=np.float32))
+        norms = np.linalg.norm(probes, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return np.clip((probes / norms) @ self.matrix.T, 0.0, 1.0)
+
+    def match(
+        self,
+        probes: np.ndarray,
+        threshold: float,
+        exclude: Optional[AbstractSet[str]] = None
+    ) -> List[Optional[Tuple[str, float]]]:
+        """
+        Find the best matching user for each probe.
+
+        Args:
+            probes: Array of shape (B, D) or (D,).
+            threshold: Minimum similarity for a match.
+            exclude: Optional users that must not be matched (e.g. a roster
+                    searched before); their scores are masked, the matrix is
+                    not copied.
+
+        Returns:
+            One entry per probe: (user_id, similarity) if the best score is at
+            least threshold, None otherwise (also for dimension mismatches).
+        """
+        probes = np.atleast_2d(np.asarray(probes, dtype=np.float32))
+        if self.size == 0 or probes.shape[1] != self.dimension:
+            if self.size:
+                logger.error(f"Probe dimension {probes.shape[1]} does not match gallery dimension {self.dimension}")
+            return [None] * len(probes)
+
+        scores = self.scores(probes)
+        if exclude:
+            scores[:, self._rows_of(self._user_positions(exclude))] = 0.0
+        best_rows = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(probes)), best_rows]
+
+        return [
+            (self.row_user_ids[row], float(score)) if score >= threshold and score > 0 else None
+            for row, score in zip(best_rows, best_scores)
+        ]
+
+    def user_scores(self, probes: np.ndarray) -> np.ndarray:
+        """
+        Compute each probe's best similarity to every user.
+
+        Args:
+            probes: Array of shape (B, D) or (D,).
+
+        Returns:
+            Array of shape (B, U) aligned with self.user_ids; a user's score is
+            the best score of any of their embeddings.
+        """
+        row_scores = self.scores(probes)
+        user_scores = np.zeros((row_scores.shape[0], len(self.user_ids)), dtype=np.float32)
+        np.maximum.at(user_scores.T, self._row_user_index, row_scores.T)
+        return user_scores
+
+    def match_unique(
+        self,
+        probes: np.ndarray,
+        threshold: float,
+        method: str = ASSIGNMENT_AUTO,
+        exclude: Optional[AbstractSet[str]] = None
+    ) -> List[Optional[Tuple[str, float]]]:
+        """
+        Match a batch of probes to distinct users.
+
+        Used for group photos, where no two faces can be the same person.
+        Scores are computed with one matrix multiply and then solved as a
+        thresholded one-to-one assignment (see assign_one_to_one).
+
+        Args:
+            probes: Array of shape (B, D) or (D,).
+            threshold: Minimum similarity for a match.
+            method: Assignment method ("auto", "greedy" or "hungarian").
+            exclude: Optional users that must not be matched (see match).
+
+        Returns:
+            One entry per probe: (user_id, similarity) or None. No user_id
+            appears more than once.
+        """
+        probes = np.atleast_2d(np.asarray(probes, dtype=np.float32))
+        if self.size == 0 or probes.shape[1] != self.dimension:
+            if self.size:
+                logger.error(f"Probe dimension {probes.shape[1]} does not match gallery dimension {self.dimension}")
+            return [None] * len(probes)
+
+        user_scores = self.user_scores(probes)
+        if exclude:
+            user_scores[:, self._user_positions(exclude)] = 0.0
+        # Mirror match(): a zero score is never a match, even with threshold 0
+        assignment = assign_one_to_one(np.where(user_scores > 0, user_scores, -1.0), threshold, method)
+        return [
+            (str(self.user_ids[user]), float(user_scores[probe, user])) if user is not None else None
+            for probe, user in enumerate(assignment)
+        ]
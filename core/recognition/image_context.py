@@ -0,0 +1,121 @@
+"""
+Per-request image context for the face pipeline.
+
+One request's image goes through several stages (detection strategies,
+quality assessment, cropping), each of which used to convert it on its own.
+An ImageContext carries the image through those stages and computes each
+derived form at most once.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+import numpy as np
+import cv2
+
+from .value_objects import FaceLocation
+
+
+class ImageContext:
+    """
+    An image with lazily computed, memoized derived forms.
+
+    This class is responsible ONLY for:
+    - Converting the (BGR) image to RGB and grayscale once, on first use
+    - Handing out face crops as views, sharing the parent's conversions
+    - Memoizing per-stage results (e.g. a detector's detections) for the request
+
+    It does NOT validate or normalize the image (see FaceDetector), and it
+    is not thread-safe: create one per request and drop it afterwards.
+
+    Derived arrays are shared between stages and must not be modified.
+    """
+
+    def __init__(self, image: np.ndarray, parent: Optional["ImageContext"] = None,
+                 region: Optional[Tuple[int, int, int, int]] = None):
+        """
+        Initialize the context.
+
+        Args:
+            image: Image as numpy array (BGR, or single-channel grayscale).
+            parent: Context this one is a crop of (set by crop()).
+            region: (y, y_end, x, x_end) of the crop in the parent.
+        """
+        self.image = image
+        self._parent = parent
+        self._region = region
+        self._rgb: Optional[np.ndarray] = None
+        self._gray: Optional[np.ndarray] = None
+        self._crops: Dict[Tuple[int, int, int, int], "ImageContext"] = {}
+        self._memo: Dict[Hashable, Any] = {}
+
+    @classmethod
+    def of(cls, image: Union[np.ndarray, "ImageContext"]) -> "ImageContext":
+        """Return image if it already is a context, else a new context wrapping it."""
+        return image if isinstance(image, ImageContext) else cls(image)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of the image."""
+        return self.image.shape
+
+    @property
+    def rgb(self) -> np.ndarray:
+        """The image in RGB order (the image itself if it is single-channel)."""
+        if self._rgb is None:
+            self._rgb = self._derived("_rgb", lambda image: cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+        return self._rgb
+
+    @property
+    def gray(self) -> np.ndarray:
+        """The image in grayscale (the image itself if it is single-channel)."""
+        if self._gray is None:
+            self._gray = self._derived("_gray", lambda image: cv2.cvtColor(image, cv2.COLOR_BGR2GRAY))
+        return self._gray
+
+    def crop(self, face_location: FaceLocation) -> "ImageContext":
+        """
+        Return the context of a face region, clipped to the image bounds.
+
+        The crop is a view, not a copy. Crops of the same region are the same
+        context, so their conversions and memoized results are shared too.
+
+        Args:
+            face_location: Location of the face in this image.
+
+        Returns:
+            ImageContext of the face region.
+        """
+        height, width = self.image.shape[:2]
+        x = max(0, face_location.x)
+        y = max(0, face_location.y)
+        region = (y, min(height, y + face_location.height), x, min(width, x + face_location.width))
+        crop = self._crops.get(region)
+        if crop is None:
+            crop = ImageContext(self.image[region[0]:region[1], region[2]:region[3]], parent=self, region=region)
+            self._crops[region] = crop
+        return crop
+
+    def memoize(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the result stored under key, computing and storing it on first use.
+
+        Args:
+            key: Result key, e.g. the stage object that computes it.
+            compute: Zero-argument callable computing the result.
+
+        Returns:
+            The memoized result.
+        """
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def _derived(self, attribute: str, convert: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+        """Return a converted image, slicing it from the parent's if that one is already converted."""
+        if self.image.ndim != 3:
+            return self.image
+        if self._parent is not None:
+            parent_converted = getattr(self._parent, attribute)
+            if parent_converted is not None:
+                y, y_end, x, x_end = self._region
+                return parent_converted[y:y_end, x:x_end]
+        return convert(self.image)
@@ -0,0 +1,269 @@
+"""
+Inference backends for face embedding models.
+
+An inference backend runs a recognition model on aligned face crops and
+returns raw embeddings. EmbeddingExtractor handles alignment and
+normalization and delegates the model call to a backend:
+- DeepFaceBackend: DeepFace's Keras model on TensorFlow (default).
+- OnnxRuntimeBackend: an exported model (e.g. ArcFace) from a local .onnx
+  file on ONNX Runtime's CPU provider, optionally its int8-quantized variant.
+
+No file I/O beyond loading the model, no database access.
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import List, Optional, Protocol
+
+import numpy as np
+
+from core.shared.optional_imports import module_available
+
+logger = logging.getLogger(__name__)
+
+ONNXRUNTIME_AVAILABLE = module_available("onnxruntime")
+
+BACKEND_DEEPFACE = "deepface"
+BACKEND_ONNXRUNTIME = "onnxruntime"
+
+__all__ = [
+    'InferenceBackend',
+    'DeepFaceBackend',
+    'OnnxRuntimeBackend',
+    'quantize_onnx_model',
+    'ONNXRUNTIME_AVAILABLE',
+    'BACKEND_DEEPFACE',
+    'BACKEND_ONNXRUNTIME',
+    'embedding_model_id',
+]
+
+
+class InferenceBackend(Protocol):
+    """Protocol for recognition model backends."""
+
+    name: str
+    """Backend name (BACKEND_DEEPFACE or BACKEND_ONNXRUNTIME)."""
+
+    weights_path: Optional[str]
+    """Model file the weights are loaded from (None for DeepFace's own weights)."""
+
+    input_size: int
+    """Side length in pixels of the square face crops the model expects."""
+
+    def forward(self, faces: np.ndarray) -> np.ndarray:
+        """
+        Embed aligned uint8 faces of shape (N, input_size, input_size, 3).
+
+        Returns:
+            Array of shape (N, dimension) with raw (unnormalized) embeddings.
+        """
+        ...
+
+
+class DeepFaceBackend:
+    """
+    DeepFace (TensorFlow) recognition model backend.
+
+    The model is built on first use, so creating the backend is cheap.
+    """
+
+    name = BACKEND_DEEPFACE
+    weights_path = None
+
+    def __init__(self, model_name: str, deepface_module):
+        """
+        Initialize the DeepFace backend.
+
+        Args:
+            model_name: DeepFace model name (e.g. "ArcFace").
+            deepface_module: The imported DeepFace module.
+        """
+        self.model_name = model_name
+        self._deepface = deepface_module
+        self._model = None
+        self._model_lock = threading.Lock()
+
+    @property
+    def model(self):
+        """Build the DeepFace recognition model once (thread-safe) and return it."""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._model = self._deepface.build_model(model_name=self.model_name)
+        return self._model
+
+    @property
+    def input_size(self) -> int:
+        """Return the model input size (112 for ArcFace)."""
+        input_shape = getattr(self.model, "input_shape", (112, 112))
+        return int(input_shape[0])
+
+    def forward(self, faces: np.ndarray) -> np.ndarray:
+        """
+        Run the model on aligned uint8 faces.
+
+        Applies the same input scaling DeepFace uses for ArcFace ([0, 1] floats).
+        """
+        batch = faces.astype(np.float32)
+        if batch.max() > 1:
+            batch /= 255.0
+        output = self.model.forward(batch)
+        return np.asarray(output, dtype=np.float32).reshape(len(faces), -1)
+
+
+class OnnxRuntimeBackend:
+    """
+    ONNX Runtime CPU recognition model backend.
+
+    Loads an exported model from a local .onnx file. Inputs may be NHWC or
+    NCHW (detected from the model's input shape); a fixed batch size of 1
+    is handled by running faces one at a time, otherwise a whole batch is
+    one session call. Pixels are scaled as (pixel - input_mean) / input_std;
+    the defaults give DeepFace's [0, 1] scaling, exports from InsightFace
+    typically expect input_mean=127.5, input_std=127.5.
+    """
+
+    name = BACKEND_ONNXRUNTIME
+
+    def __init__(
+        self,
+        model_path: str,
+        int8_model_path: Optional[str] = None,
+        use_int8: bool = False,
+        intra_op_threads: int = 0,
+        input_mean: float = 0.0,
+        input_std: float = 255.0
+    ):
+        """
+        Initialize the ONNX Runtime backend and create its session.
+
+        Args:
+            model_path: Path to the float32 .onnx model.
+            int8_model_path: Path to the int8-quantized model (see
+                            quantize_onnx_model). Defaults to model_path with
+                            an ".int8.onnx" suffix.
+            use_int8: Whether to load the int8-quantized model.
+            intra_op_threads: Threads per operator (0 lets ONNX Runtime decide).
+            input_mean: Value subtracted from uint8 pixels.
+            input_std: Value pixels are divided by after subtracting the mean.
+
+        Raises:
+            ImportError: If onnxruntime is not installed.
+            FileNotFoundError: If the selected model file does not exist.
+        """
+        if not ONNXRUNTIME_AVAILABLE:
+            error_msg = (
+                "onnxruntime is not available. Please install it:\n"
+                "pip install onnxruntime"
+            )
+            logger.error(error_msg)
+            raise ImportError(error_msg)
+        import onnxruntime
+
+        # The int8 variant quantizes the same weights, so it keeps their identity
+        self.weights_path = model_path
+        if use_int8:
+            model_path = int8_model_path or _int8_path(model_path)
+        if not Path(model_path).is_file():
+            raise FileNotFoundError(f"ONNX model not found: {model_path}")
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = max(0, int(intra_op_threads))
+        # Concurrency comes from the inference scheduler's threads; keep one
+        # inter-op thread per call
+        options.inter_op_num_threads = 1
+        self._session = onnxruntime.InferenceSession(
+            model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+
+        model_input = self._session.get_inputs()[0]
+        self._input_name = model_input.name
+        shape = list(model_input.shape)
+        self._channels_first = len(shape) == 4 and shape[1] == 3
+        spatial = shape[2] if self._channels_first else shape[1]
+        self.input_size = int(spatial) if isinstance(spatial, int) else 112
+        self._fixed_batch = shape[0] if isinstance(shape[0], int) else None
+        self.model_path = model_path
+        self.input_mean = float(input_mean)
+        self.input_std = float(input_std) or 1.0
+
+        logger.info(f"ONNX Runtime backend loaded {model_path} (input {shape}, "
+                    f"intra_op_threads={options.intra_op_num_threads or 'auto'})")
+
+    def forward(self, faces: np.ndarray) -> np.ndarray:
+        """Run the model on aligned uint8 faces of shape (N, H, W, 3)."""
+        batch = (faces.astype(np.float32) - self.input_mean) / self.input_std
+        if self._channels_first:
+            batch = np.ascontiguousarray(batch.transpose(0, 3, 1, 2))
+
+        if self._fixed_batch == 1 and len(batch) > 1:
+            outputs: List[np.ndarray] = [
+                self._session.run(None, {self._input_name: batch[i:i + 1]})[0]
+                for i in range(len(batch))
+            ]
+            output = np.concatenate(outputs)
+        else:
+            output = self._session.run(None, {self._input_name: batch})[0]
+        return np.asarray(output, dtype=np.float32).reshape(len(faces), -1)
+
+
+def embedding_model_id(
+    model_name: str,
+    backend_name: str = BACKEND_DEEPFACE,
+    weights_path: Optional[str] = None
+) -> str:
+    """
+    Return the identifier of the embedding space a model and backend produce.
+
+    Galleries record it (see FaceRepository.get_gallery_model), so a gallery
+    is re-embedded when the model, the backend or the exported weights
+    change. DeepFace models keep their bare name, the identifier galleries
+    recorded before backends were; other backends append their name and the
+    weights file's stem, e.g. "ArcFace@onnxruntime-arcface".
+
+    Args:
+        model_name: Recognition model name (e.g. "ArcFace").
+        backend_name: Inference backend name.
+        weights_path: Model file of backends loading exported weights.
+
+    Returns:
+        Model identifier, usable in file names.
+    """
+    if backend_name == BACKEND_DEEPFACE:
+        return model_name
+    model_id = f"{model_name}@{backend_name}"
+    if weights_path:
+        model_id += f"-{Path(weights_path).stem}"
+    return model_id
+
+
+def _int8_path(model_path: str) -> str:
+    """Return the default int8 model path for a float32 model path."""
+    if model_path.endswith(".onnx"):
+        return model_path[:-len(".onnx")] + ".int8.onnx"
+    return model_path + ".int8.onnx"
+
+
+def quantize_onnx_model(model_path: str, int8_model_path: Optional[str] = None) -> str:
+    """
+    Write an int8 dynamically quantized copy of an ONNX model.
+
+    Weights of MatMul/Gemm/Conv layers are stored as int8 and activations are
+    quantized at run time, which needs no calibration data. Requires the
+    onnx package next to onnxruntime.
+
+    Args:
+        model_path: Path to the float32 .onnx model.
+        int8_model_path: Output path (default: model_path with ".int8.onnx").
+
+    Returns:
+        Path of the quantized model.
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    int8_model_path = int8_model_path or _int8_path(model_path)
+    quantize_dynamic(model_path, int8_model_path, weight_type=QuantType.QInt8)
+    logger.info(f"Wrote int8-quantized model to {int8_model_path}")
+    return int8_model_path
@@ -6,11 +6,12 @@ It analyzes face images for resolution, brightness, contrast, and sharpness to d
 overall quality and suitability for recognition.
 """
 
-from typing import List
+from typing import List, Union
 import numpy as np
 import cv2
 
 from core.shared.constants import MIN_FACE_QUALITY_SCORE
+from .image_context import ImageContext
 from .value_objects import QualityResult
 
 
@@ -56,12 +57,16 @@ class QualityAssessor:
         self.contrast_weight = 0.25
         self.sharpness_weight = 0.2
     
-    def assess(self, face_image: np.ndarray) -> QualityResult:
+    def assess(self, face_image: Union[np.ndarray, ImageContext]) -> QualityResult:
         """
         Assess the quality of a single face image.
         
+        Given an ImageContext (e.g. a crop from ImageContext.crop), its
+        grayscale form is shared with the other stages and repeated calls for
+        the same context return the first result.
+        
         Args:
-            face_image: Face image to assess (cropped face, numpy array).
+            face_image: Face image to assess (cropped face, numpy array or ImageContext).
         
         Returns:
             QualityResult containing all quality metrics and suitability determination.
@@ -69,6 +74,12 @@ class QualityAssessor:
         Raises:
             ValueError: If face_image is None or empty.
         """
+        context = ImageContext.of(face_image)
+        return context.memoize(self, lambda: self._assess(context))
+    
+    def _assess(self, context: ImageContext) -> QualityResult:
+        """Assess the face image of a context (see assess)."""
+        face_image = context.image
         if face_image is None or face_image.size == 0:
             return QualityResult(
                 overall_score=0.0,
@@ -80,8 +91,8 @@ class QualityAssessor:
                 reason="Face image is None or empty"
             )
         
-        # Convert to grayscale for analysis
-        gray = self._to_grayscale(face_image)
+        # Grayscale for analysis (converted once per image context)
+        gray = context.gray
         
         # Calculate individual quality scores
         resolution_score = self._calculate_resolution_score(gray)
@@ -135,20 +146,6 @@ class QualityAssessor:
         """
         return [self.assess(face_image) for face_image in face_images]
     
-    def _to_grayscale(self, image: np.ndarray) -> np.ndarray:
-        """
-        Convert image to grayscale if needed.
-        
-        Args:
-            image: Input image (BGR, RGB, or grayscale).
-        
-        Returns:
-            Grayscale image.
-        """
-        if len(image.shape) == 3:
-            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        return image
-    
     def _calculate_resolution_score(self, image: np.ndarray) -> float:
         """
         Calculate resolution quality score.
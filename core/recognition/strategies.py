@@ -4,21 +4,17 @@ Face detection strategies for different detection algorithms.
 This module provides implementations of detection strategies for MediaPipe, OpenCV, and YOLO.
 """
 
-from typing import List
+from typing import List, Union
 import logging
 import numpy as np
 
+from .image_context import ImageContext
 from .value_objects import FaceLocation
+from core.shared.optional_imports import module_available
 
-# Try to import MediaPipe for enhanced detection
-try:
-    import mediapipe as mp
-    mp_face_detection = mp.solutions.face_detection
-    MEDIAPIPE_AVAILABLE = True
-except (ImportError, AttributeError):
-    MEDIAPIPE_AVAILABLE = False
-    mp = None
-    mp_face_detection = None
+# MediaPipe and Ultralytics (PyTorch) are slow to import, so only their presence
+# is checked here; they are imported when a strategy is first constructed.
+MEDIAPIPE_AVAILABLE = module_available("mediapipe")
 
 # Try to import OpenCV
 try:
@@ -28,13 +24,7 @@ except ImportError:
     OPENCV_AVAILABLE = False
     cv2 = None
 
-# Try to import Ultralytics YOLO
-try:
-    from ultralytics import YOLO
-    YOLO_AVAILABLE = True
-except ImportError:
-    YOLO_AVAILABLE = False
-    YOLO = None
+YOLO_AVAILABLE = module_available("ultralytics")
 
 __all__ = [
     'MediaPipeDetectionStrategy',
@@ -46,6 +36,34 @@ __all__ = [
 ]
 
 
+def _load_mediapipe_face_detection():
+    """
+    Import MediaPipe and return its face detection solution.
+    
+    Raises:
+        ImportError: If MediaPipe (or its legacy solutions API) is not available.
+    """
+    try:
+        import mediapipe as mp
+        return mp.solutions.face_detection
+    except (ImportError, AttributeError) as e:
+        raise ImportError("MediaPipe is not available. Install it with: pip install mediapipe") from e
+
+
+def _load_yolo_class():
+    """
+    Import Ultralytics and return the YOLO model class.
+    
+    Raises:
+        ImportError: If Ultralytics is not available.
+    """
+    try:
+        from ultralytics import YOLO
+        return YOLO
+    except ImportError as e:
+        raise ImportError("YOLO is not available. Install it with: pip install ultralytics") from e
+
+
 class MediaPipeDetectionStrategy:
     """MediaPipe-based face detection strategy."""
     
@@ -60,17 +78,18 @@ class MediaPipeDetectionStrategy:
         if not MEDIAPIPE_AVAILABLE:
             raise ImportError("MediaPipe is not available. Install it with: pip install mediapipe")
         
+        mp_face_detection = _load_mediapipe_face_detection()
         self.detector = mp_face_detection.FaceDetection(
             model_selection=model_selection,
             min_detection_confidence=min_detection_confidence
         )
     
-    def detect(self, image: np.ndarray) -> List[tuple[FaceLocation, float]]:
+    def detect(self, image: Union[np.ndarray, ImageContext]) -> List[tuple[FaceLocation, float]]:
         """
         Detect faces using MediaPipe.
         
         Args:
-            image: Input image as numpy array (BGR format)
+            image: Input image as numpy array (BGR format) or its ImageContext
             
         Returns:
             List of tuples containing (FaceLocation, confidence_score)
@@ -79,13 +98,11 @@ class MediaPipeDetectionStrategy:
             return []
         
         try:
-            # Convert BGR to RGB for MediaPipe
-            if len(image.shape) == 3:
-                rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                print(f"[MediaPipe] Converted BGR to RGB, image shape: {rgb_image.shape}")
-            else:
-                rgb_image = image
-                print(f"[MediaPipe] Image is not 3-channel, using as-is")
+            # MediaPipe expects RGB (converted once per image context)
+            context = ImageContext.of(image)
+            image = context.image
+            rgb_image = context.rgb
+            print(f"[MediaPipe] Using RGB image, shape: {rgb_image.shape}")
             
             # Detect faces
             print(f"[MediaPipe] Processing image for face detection...")
@@ -162,12 +179,12 @@ class OpenCVDetectionStrategy:
         self.min_size = min_size
         self.default_confidence = 0.8  # OpenCV doesn't provide confidence scores
     
-    def detect(self, image: np.ndarray) -> List[tuple[FaceLocation, float]]:
+    def detect(self, image: Union[np.ndarray, ImageContext]) -> List[tuple[FaceLocation, float]]:
         """
         Detect faces using OpenCV cascade classifier.
         
         Args:
-            image: Input image as numpy array
+            image: Input image as numpy array or its ImageContext
             
         Returns:
             List of tuples containing (FaceLocation, confidence_score)
@@ -176,13 +193,9 @@ class OpenCVDetectionStrategy:
             return []
         
         try:
-            # Convert to grayscale for cascade detection
-            if len(image.shape) == 3:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-                print(f"[OpenCV] Converted to grayscale, shape: {gray.shape}")
-            else:
-                gray = image
-                print(f"[OpenCV] Image is already grayscale")
+            # Cascade detection runs on grayscale (converted once per image context)
+            gray = ImageContext.of(image).gray
+            print(f"[OpenCV] Using grayscale image, shape: {gray.shape}")
             
             # Detect faces
             print(f"[OpenCV] Processing image for face detection...")
@@ -227,6 +240,7 @@ class YOLODetectionStrategy:
         if not YOLO_AVAILABLE:
             raise ImportError("YOLO is not available. Install it with: pip install ultralytics")
         
+        YOLO = _load_yolo_class()
         self.conf_threshold = conf_threshold
         self.logger = logging.getLogger(__name__)
         
@@ -256,12 +270,12 @@ class YOLODetectionStrategy:
                 self.logger.error(f"Failed to load YOLO model from {model_path}: {e}")
                 raise ValueError(f"Failed to load YOLO model from {model_path}: {e}")
     
-    def detect(self, image: np.ndarray) -> List[tuple[FaceLocation, float]]:
+    def detect(self, image: Union[np.ndarray, ImageContext]) -> List[tuple[FaceLocation, float]]:
         """
         Detect faces using YOLO.
         
         Args:
-            image: Input image as numpy array (BGR or RGB format)
+            image: Input image as numpy array (BGR format) or its ImageContext
             
         Returns:
             List of tuples containing (FaceLocation, confidence_score)
@@ -270,6 +284,9 @@ class YOLODetectionStrategy:
             return []
         
         try:
+            context = ImageContext.of(image)
+            image = context.image
+            
             # Validate image input
             if not isinstance(image, np.ndarray):
                 self.logger.warning("Invalid image: not a numpy array")
@@ -289,18 +306,8 @@ class YOLODetectionStrategy:
                 self.logger.warning(f"Invalid image: invalid dimensions (h={h}, w={w})")
                 return []
             
-            # Convert BGR to RGB if needed (YOLO expects RGB)
-            if len(image.shape) == 3:
-                # Check if image is BGR (OpenCV format) or RGB
-                # YOLO can handle both, but RGB is preferred
-                rgb_image = image.copy()
-                # If image came from OpenCV, it's likely BGR
-                if cv2 is not None:
-                    rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                    self.logger.debug("Converted BGR to RGB for YOLO")
-            else:
-                rgb_image = image
-                self.logger.debug("Image is not 3-channel, using as-is")
+            # YOLO expects RGB (converted once per image context, no copy of the BGR image)
+            rgb_image = context.rgb
             
             # Run YOLO prediction
             self.logger.debug("Processing image for face detection with YOLO...")
@@ -0,0 +1,299 @@
+"""
+Priority-aware scheduling of CPU-bound inference work.
+
+Interactive requests (a student at a kiosk) and bulk jobs (class photos,
+registration, imports) share the same CPU. An InferenceScheduler runs both
+on one pool of worker threads, but always prefers interactive work, caps how
+many workers each priority class may occupy, and ages waiting work so bulk
+jobs are never starved. Queue depth, running tasks and queue wait time are
+reported per class.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from core.shared.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BULK = "bulk"
+
+_QUEUE_DEPTH = metrics_registry.gauge(
+    "eyed_inference_queue_depth",
+    "Number of inference tasks waiting for a worker, by priority class",
+    ("priority",)
+)
+_RUNNING = metrics_registry.gauge(
+    "eyed_inference_running",
+    "Number of inference tasks currently running, by priority class",
+    ("priority",)
+)
+_QUEUE_WAIT_SECONDS = metrics_registry.histogram(
+    "eyed_inference_queue_wait_seconds",
+    "Time inference tasks wait for a worker, by priority class",
+    ("priority",)
+)
+
+
+@dataclass(frozen=True)
+class PriorityClass:
+    """
+    Scheduling parameters of one priority class.
+
+    Attributes:
+        name: Class name (e.g. "interactive").
+        rank: Base rank; lower ranks are scheduled first.
+        max_concurrency: Maximum number of workers the class may occupy.
+    """
+    name: str
+    rank: int
+    max_concurrency: int
+
+
+_Task = Tuple[Callable[..., Any], tuple, dict, Future, float]
+
+
+class InferenceScheduler:
+    """
+    Runs callables on a shared worker pool in priority order.
+
+    This class is responsible ONLY for:
+    - Queueing tasks per priority class (FIFO within a class)
+    - Picking the next task by rank, aged by time spent waiting
+    - Enforcing per-class concurrency limits
+    - Reporting queue depth, running tasks and wait time per class
+
+    A task's effective rank is its class rank minus seconds waited divided
+    by aging_seconds, so a bulk task that has waited aging_seconds ranks
+    like a freshly queued interactive task.
+    """
+
+    def __init__(
+        self,
+        classes: List[PriorityClass],
+        max_workers: int = 4,
+        aging_seconds: float = 2.0,
+        name: str = "inference"
+    ):
+        """
+        Initialize the scheduler. Worker threads start on first submit.
+
+        Args:
+            classes: Priority classes served by this scheduler.
+            max_workers: Number of worker threads.
+            aging_seconds: Waiting time worth one rank (0 disables aging).
+            name: Name used for worker threads.
+
+        Raises:
+            ValueError: If no classes are given or a limit is not positive.
+        """
+        if not classes:
+            raise ValueError("At least one priority class is required")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        for priority_class in classes:
+            if priority_class.max_concurrency < 1:
+                raise ValueError(
+                    f"max_concurrency of '{priority_class.name}' must be at least 1, "
+                    f"got {priority_class.max_concurrency}"
+                )
+
+        self.classes: Dict[str, PriorityClass] = {c.name: c for c in classes}
+        self.max_workers = max_workers
+        self.aging_seconds = aging_seconds
+        self.name = name
+        self._queues: Dict[str, Deque[_Task]] = {c.name: deque() for c in classes}
+        self._running: Dict[str, int] = {c.name: 0 for c in classes}
+        self._condition = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._closed = False
+
+    @classmethod
+    def interactive_and_bulk(
+        cls,
+        max_workers: int = 4,
+        interactive_max_concurrency: Optional[int] = None,
+        bulk_max_concurrency: Optional[int] = None,
+        aging_seconds: float = 2.0,
+        interactive_batch_size: int = 1
+    ) -> "InferenceScheduler":
+        """
+        Create a scheduler with the standard interactive and bulk classes.
+
+        Args:
+            max_workers: Number of worker threads.
+            interactive_max_concurrency: Worker limit for interactive tasks
+                                         (default: all workers).
+            bulk_max_concurrency: Worker limit for bulk tasks (default: all
+                                  workers but one, keeping one free for
+                                  interactive requests).
+            aging_seconds: Waiting time worth one rank.
+            interactive_batch_size: Size of the micro-batches interactive
+                                    tasks wait in (see MicroBatcher). Each
+                                    waiting task holds a worker, so the
+                                    interactive limit and the worker count
+                                    are raised to at least this size; the
+                                    extra workers mostly wait, and bulk
+                                    limits still follow max_workers.
+
+        Returns:
+            InferenceScheduler
+        """
+        interactive_limit = max(interactive_max_concurrency or max_workers, interactive_batch_size)
+        return cls(
+            [
+                PriorityClass(PRIORITY_INTERACTIVE, 0, interactive_limit),
+                PriorityClass(
+                    PRIORITY_BULK, 1,
+                    bulk_max_concurrency or max(1, max_workers - 1)
+                ),
+            ],
+            max_workers=max(max_workers, interactive_limit),
+            aging_seconds=aging_seconds
+        )
+
+    def submit(self, priority: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Queue a callable.
+
+        Args:
+            priority: Priority class name.
+            fn: Callable to run on a worker thread.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            Future resolving to fn's result.
+
+        Raises:
+            ValueError: If the priority class is unknown.
+            RuntimeError: If the scheduler has been closed.
+        """
+        if priority not in self.classes:
+            raise ValueError(f"Unknown priority class '{priority}', expected one of {sorted(self.classes)}")
+
+        future: Future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(f"InferenceScheduler '{self.name}' is closed")
+            self._start_workers()
+            self._queues[priority].append((fn, args, kwargs, future, time.perf_counter()))
+            _QUEUE_DEPTH.inc(priority=priority)
+            self._condition.notify()
+        return future
+
+    async def run(self, priority: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Queue a callable and await its result from async code (e.g. a route).
+
+        Args:
+            priority: Priority class name.
+            fn: Callable to run on a worker thread.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            fn's result.
+        """
+        return await asyncio.wrap_future(self.submit(priority, fn, *args, **kwargs))
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return queued and running task counts per priority class.
+
+        Returns:
+            Mapping of class name to {"queued": int, "running": int, "max_concurrency": int}
+        """
+        with self._condition:
+            return {
+                name: {
+                    "queued": len(self._queues[name]),
+                    "running": self._running[name],
+                    "max_concurrency": priority_class.max_concurrency,
+                }
+                for name, priority_class in self.classes.items()
+            }
+
+    def close(self) -> None:
+        """Stop accepting tasks and stop the workers after queued tasks are processed."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            workers = list(self._workers)
+            self._condition.notify_all()
+        for worker in workers:
+            worker.join()
+
+    def _start_workers(self) -> None:
+        """Start the worker threads (caller holds the condition)."""
+        if self._workers:
+            return
+        for index in range(self.max_workers):
+            worker = threading.Thread(
+                target=self._run,
+                name=f"{self.name}-worker-{index}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _next_task(self) -> Optional[Tuple[str, _Task]]:
+        """Pop the best eligible task, if any (caller holds the condition)."""
+        now = time.perf_counter()
+        best_name = None
+        best_rank = 0.0
+        for name, tasks in self._queues.items():
+            priority_class = self.classes[name]
+            if not tasks or self._running[name] >= priority_class.max_concurrency:
+                continue
+            rank = float(priority_class.rank)
+            if self.aging_seconds > 0:
+                rank -= (now - tasks[0][4]) / self.aging_seconds
+            if best_name is None or rank < best_rank:
+                best_name, best_rank = name, rank
+
+        if best_name is None:
+            return None
+        return best_name, self._queues[best_name].popleft()
+
+    def _has_queued_tasks(self) -> bool:
+        """Return whether any task is queued (caller holds the condition)."""
+        return any(self._queues.values())
+
+    def _run(self) -> None:
+        """Worker loop: run the best eligible task, repeat until closed and drained."""
+        while True:
+            with self._condition:
+                selected = self._next_task()
+                while selected is None:
+                    if self._closed and not self._has_queued_tasks():
+                        return
+                    self._condition.wait()
+                    selected = self._next_task()
+                priority, task = selected
+                self._running[priority] += 1
+
+            fn, args, kwargs, future, submitted = task
+            _QUEUE_DEPTH.dec(priority=priority)
+            _QUEUE_WAIT_SECONDS.observe(time.perf_counter() - submitted, priority=priority)
+            _RUNNING.inc(priority=priority)
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args, **kwargs))
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                _RUNNING.dec(priority=priority)
+                with self._condition:
+                    self._running[priority] -= 1
+                    # A finished task may unblock a class that was at its limit
+                    self._condition.notify_all()
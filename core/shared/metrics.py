@@ -0,0 +1,329 @@
+"""
+In-process metrics for EyeD AI Attendance System.
+
+This module provides minimal counter and histogram primitives and a registry
+that renders them in the Prometheus text exposition format. It is used to
+instrument individual pipeline stages (detection, quality assessment,
+embedding extraction, matching, persistence) so slow requests can be
+attributed to a specific stage.
+
+Pure Python with no external dependencies; all operations are thread-safe.
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+"""Default histogram buckets (seconds), covering sub-millisecond matching up to slow model loads."""
+
+__all__ = [
+    'Counter',
+    'Gauge',
+    'Histogram',
+    'MetricsRegistry',
+    'metrics_registry',
+    'DEFAULT_LATENCY_BUCKETS',
+]
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+    """Format label pairs as {name="value",...} (empty string if no labels)."""
+    if not label_names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"'
+        for name, value in zip(label_names, label_values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value (integers without trailing .0, infinities as +Inf)."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class holding the name, help text and label schema of a metric."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()):
+        """
+        Initialize metric.
+
+        Args:
+            name: Metric name (e.g. "eyed_recognition_stage_seconds").
+            description: Help text rendered in the exposition output.
+            label_names: Names of the labels every sample must provide.
+        """
+        self.name = name
+        self.description = description
+        self.label_names: Tuple[str, ...] = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _label_key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        """
+        Convert keyword labels to an ordered key.
+
+        Raises:
+            ValueError: If the labels do not match the metric's label names.
+        """
+        if set(labels) != set(self.label_names):
+            raise ValueError(
+                f"Metric {self.name} expects labels {list(self.label_names)}, got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def collect(self) -> List[str]:
+        """Return exposition lines for this metric."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()):
+        super().__init__(name, description, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """
+        Increment the counter.
+
+        Args:
+            amount: Non-negative amount to add (default: 1).
+            **labels: Label values for this sample.
+        """
+        if amount < 0:
+            raise ValueError("Counter can only be incremented by non-negative amounts")
+        key = self._label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        """Return the current value for the given labels (0 if never incremented)."""
+        key = self._label_key(labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, such as a queue depth."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()):
+        super().__init__(name, description, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge to value."""
+        key = self._label_key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Add amount (may be negative) to the gauge."""
+        key = self._label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Subtract amount from the gauge."""
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: str) -> float:
+        """Return the current value for the given labels (0 if never set)."""
+        key = self._label_key(labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """Histogram with fixed cumulative buckets, typically used for latencies in seconds."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ):
+        super().__init__(name, description, label_names)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        # Per label key: (bucket counts, sum, count)
+        self._series: Dict[Tuple[str, ...], List] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value: Observed value (seconds for latency histograms).
+            **labels: Label values for this sample.
+        """
+        key = self._label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = [[0] * len(self.buckets), 0.0, 0]
+                self._series[key] = series
+            bucket_counts = series[0]
+            for index, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    bucket_counts[index] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """
+        Time a block (or, used as a decorator, a function call) and record its duration.
+
+        Examples:
+            >>> with STAGE_SECONDS.time(stage="detection"):
+            ...     detector.detect(image)
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def get_count(self, **labels: str) -> int:
+        """Return the number of observations for the given labels."""
+        key = self._label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            return series[2] if series else 0
+
+    def get_sum(self, **labels: str) -> float:
+        """Return the sum of observations for the given labels."""
+        key = self._label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            return series[1] if series else 0.0
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = sorted(
+                (key, (list(series[0]), series[1], series[2]))
+                for key, series in self._series.items()
+            )
+
+        lines = []
+        bucket_label_names = self.label_names + ("le",)
+        for key, (bucket_counts, total, count) in items:
+            cumulative = 0
+            for upper_bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                labels = _format_labels(bucket_label_names, key + (_format_value(upper_bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(bucket_label_names, key + ("+Inf",))
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            plain_labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{plain_labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{plain_labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Registry of named metrics.
+
+    Metrics are created on first use and shared by name, so several modules
+    can record into the same metric (e.g. all repositories into
+    eyed_repository_operation_seconds with different labels).
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, metric_class, name: str, description: str, label_names, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_class(name, description, label_names, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, metric_class) or metric.label_names != tuple(label_names):
+                raise ValueError(
+                    f"Metric {name} is already registered as {metric.metric_type} "
+                    f"with labels {list(metric.label_names)}"
+                )
+            return metric
+
+    def counter(self, name: str, description: str, label_names: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, description, label_names)
+
+    def gauge(self, name: str, description: str, label_names: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, description, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(Histogram, name, description, label_names, buckets=buckets)
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format (version 0.0.4).
+
+        Returns:
+            Exposition text, terminated by a newline.
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+"""Process-wide default registry exposed at /metrics."""
@@ -0,0 +1,191 @@
+"""
+Dynamic micro-batching of concurrent calls.
+
+Model inference and gallery matching cost much less per item when run on a
+batch. A MicroBatcher sits in front of such a batch function: callers
+submit single items from their own threads, a worker thread collects items
+for up to max_wait_ms (or until max_batch_size items are queued), runs the
+batch function once and hands each caller its own result.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Generic, List, Optional, Tuple, TypeVar
+
+from core.shared.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_BATCH_SIZE = metrics_registry.histogram(
+    "eyed_batch_size",
+    "Number of items processed per micro-batch, by batcher",
+    ("batcher",),
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
+_QUEUE_WAIT_SECONDS = metrics_registry.histogram(
+    "eyed_batch_queue_wait_seconds",
+    "Time items wait in a micro-batcher queue before processing, by batcher",
+    ("batcher",)
+)
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Coalesces concurrent single-item calls into batch calls.
+
+    This class is responsible ONLY for:
+    - Queueing submitted items and returning a Future per item
+    - Forming batches of up to max_batch_size items within max_wait_ms
+    - Running the batch function on a single worker thread
+    - Delivering per-item results or exceptions to the Futures
+
+    The batch function receives a list of items and must return a list of
+    the same length. An entry that is an exception instance is raised to
+    that item's caller only; an exception raised by the batch function
+    itself is delivered to every item of the batch.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[T]], List[R]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        name: str = "default"
+    ):
+        """
+        Initialize the batcher. The worker thread starts on first submit.
+
+        Args:
+            process_batch: Function processing a list of items.
+            max_batch_size: Maximum number of items per batch.
+            max_wait_ms: Maximum time to wait for more items after the first
+                        item of a batch arrives, in milliseconds.
+            name: Batcher name used in metrics and the worker thread name.
+
+        Raises:
+            ValueError: If max_batch_size is less than 1 or max_wait_ms is negative.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        if max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must not be negative, got {max_wait_ms}")
+
+        self._process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000.0
+        self.name = name
+        self._queue: "queue.Queue[Optional[Tuple[T, Future, float]]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, item: T) -> Future:
+        """
+        Submit an item for batched processing.
+
+        Args:
+            item: Item to process.
+
+        Returns:
+            Future resolving to the item's result.
+
+        Raises:
+            RuntimeError: If the batcher has been closed.
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"MicroBatcher '{self.name}' is closed")
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name=f"batcher-{self.name}",
+                    daemon=True
+                )
+                self._worker.start()
+            self._queue.put((item, future, time.perf_counter()))
+        return future
+
+    def process(self, item: T, timeout: Optional[float] = None) -> R:
+        """
+        Submit an item and wait for its result.
+
+        Args:
+            item: Item to process.
+            timeout: Maximum time to wait in seconds (None waits indefinitely).
+
+        Returns:
+            The item's result.
+
+        Raises:
+            Exception: The item's exception, if processing failed.
+        """
+        return self.submit(item).result(timeout=timeout)
+
+    def close(self) -> None:
+        """Stop accepting items and stop the worker after queued items are processed."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+        if worker is not None:
+            self._queue.put(None)
+            worker.join()
+
+    def _run(self) -> None:
+        """Worker loop: collect a batch, process it, repeat until closed."""
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.perf_counter() + self.max_wait_seconds
+            stop = False
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    entry = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stop = True
+                    break
+                batch.append(entry)
+
+            self._execute(batch)
+            if stop:
+                return
+
+    def _execute(self, batch: List[Tuple[T, Future, float]]) -> None:
+        """Run the batch function and resolve the batch's Futures."""
+        started = time.perf_counter()
+        for _, _, submitted in batch:
+            _QUEUE_WAIT_SECONDS.observe(started - submitted, batcher=self.name)
+        _BATCH_SIZE.observe(len(batch), batcher=self.name)
+
+        futures = [future for _, future, _ in batch]
+        try:
+            results = self._process_batch([item for item, _, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch function returned {len(results)} results for {len(batch)} items"
+                )
+        except Exception as e:
+            logger.error(f"MicroBatcher '{self.name}' batch of {len(batch)} failed: {e}", exc_info=True)
+            for future in futures:
+                future.set_exception(e)
+            return
+
+        for future, result in zip(futures, results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,26 @@
+"""
+Helpers for optional, heavy dependencies.
+
+MediaPipe, Ultralytics (PyTorch) and DeepFace (TensorFlow) take seconds to
+import. Modules that depend on them check availability at import time with
+module_available(), which only locates the package without importing it,
+and import the package itself when a component is first constructed.
+"""
+
+import importlib.util
+
+
+def module_available(module_name: str) -> bool:
+    """
+    Check whether a module can be imported, without importing it.
+
+    Args:
+        module_name: Top-level module name (e.g. "mediapipe").
+
+    Returns:
+        True if the module is installed, False otherwise.
+    """
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
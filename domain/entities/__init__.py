@@ -10,6 +10,7 @@ from .attendance_record import AttendanceRecord
 from .face_embedding import FaceEmbedding
 from .badge import Badge, BadgeCategory
 from .attendance_session import AttendanceSession
+from .recognition_session import RecognitionSession
 
 __all__ = [
     'User',
@@ -18,6 +19,7 @@ __all__ = [
     'Badge',
     'BadgeCategory',
     'AttendanceSession',
+    'RecognitionSession',
 ]
 
 
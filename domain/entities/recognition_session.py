@@ -0,0 +1,44 @@
+"""
+Recognition session domain entity.
+
+Represents the server-side state kept between Phase 1 (recognition) and
+Phase 2 (liveness verification and attendance marking) of the attendance
+workflow. This is a pure domain entity with no infrastructure dependencies.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from domain.entities.attendance_session import AttendanceSession
+
+
+@dataclass(frozen=True)
+class RecognitionSession:
+    """
+    Immutable Phase 1 result referenced by Phase 2.
+    
+    Holds what Phase 2 would otherwise have to receive again from the client
+    and recompute: the decoded face crop, its quality score and the
+    recognition result.
+    
+    Attributes:
+        session: Attendance session (ID, recognized user, confidence, start time).
+        face_image: Decoded face crop from Phase 1.
+        face_quality_score: Quality score of the face crop (0-1).
+        location: Optional location given in Phase 1.
+        face_roi: Optional face box (x, y, width, height) in the Phase 1
+                 frame, used to crop Phase 2 frames for landmark extraction.
+    """
+    
+    session: AttendanceSession
+    face_image: np.ndarray
+    face_quality_score: float
+    location: Optional[str] = None
+    face_roi: Optional[Tuple[int, int, int, int]] = None
+    
+    @property
+    def session_id(self) -> str:
+        """Return the session ID."""
+        return self.session.session_id
@@ -5,6 +5,7 @@ This service groups related attendance operations (logging and validation)
 to reduce coupling in use cases.
 """
 
+from datetime import datetime
 from typing import Optional
 import numpy as np
 
@@ -49,7 +50,8 @@ class AttendanceService:
         location: str,
         verification_stage: Optional[str] = None,
         session_id: Optional[str] = None,
-        start_time: Optional[float] = None
+        start_time: Optional[float] = None,
+        recorded_at: Optional[datetime] = None
     ) -> AttendanceRecord:
         """
         Create and validate an attendance record.
@@ -72,6 +74,7 @@ class AttendanceService:
             verification_stage: Optional stage of verification process.
             session_id: Optional session ID. If not provided, a new one is generated.
             start_time: Optional start time for processing time calculation.
+            recorded_at: Optional date and time of the attendance. Defaults to now.
         
         Returns:
             Created and validated AttendanceRecord.
@@ -103,7 +106,8 @@ class AttendanceService:
             location=location,
             verification_stage=verification_stage,
             session_id=session_id,
-            start_time=start_time
+            start_time=start_time,
+            recorded_at=recorded_at
         )
         
         # Step 2: Validate attendance record data
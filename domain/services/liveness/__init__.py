@@ -7,6 +7,8 @@ No business logic - just package exports.
 
 from .liveness_service import LivenessService
 from .liveness_verifier import LivenessVerifier
+from .streaming_verifier import StreamingLivenessVerifier
+from .value_objects import LivenessReport
 
-__all__ = ["LivenessService", "LivenessVerifier"]
+__all__ = ["LivenessService", "LivenessVerifier", "StreamingLivenessVerifier", "LivenessReport"]
 
@@ -8,13 +8,32 @@ It orchestrates the complete liveness verification workflow by:
 3. Raising appropriate exceptions on failure
 """
 
-from typing import List, Optional, Tuple
+import logging
+from typing import Optional, Sequence, Tuple
 
 import numpy as np
 
-from core.liveness.landmark_extractor import LandmarkExtractor
+from core.liveness.blink_detector import BlinkDetector
+from core.liveness.landmark_extractor import FaceRoi, LandmarkExtractor
 from domain.services.liveness.liveness_verifier import LivenessVerifier
+from domain.services.liveness.streaming_verifier import StreamingLivenessVerifier
+from domain.services.liveness.value_objects import LivenessReport
 from domain.shared.exceptions import LivenessVerificationFailedError
+from core.shared.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+_STAGE_SECONDS = metrics_registry.histogram(
+    "eyed_liveness_stage_seconds",
+    "Latency of liveness verification stages in seconds",
+    ("stage",)
+)
+
+_FRAMES_TOTAL = metrics_registry.counter(
+    "eyed_liveness_frames_total",
+    "Liveness frames received in requests and frames whose landmarks were extracted",
+    ("kind",)
+)
 
 
 class LivenessService:
@@ -22,8 +41,9 @@ class LivenessService:
     Coordinates liveness verification workflow.
     
     This service is responsible ONLY for:
-    - Extracting landmarks from frames using LandmarkExtractor
-    - Calling LivenessVerifier.verify() with frames and landmarks
+    - Extracting eye landmarks from frames using LandmarkExtractor
+    - Calling LivenessVerifier.verify_sequence() with the stacked eye landmarks,
+      or StreamingLivenessVerifier when configured
     - Returning boolean result
     - Raising LivenessVerificationFailedError if verification fails
     
@@ -37,7 +57,8 @@ class LivenessService:
     def __init__(
         self,
         landmark_extractor: LandmarkExtractor,
-        liveness_verifier: LivenessVerifier
+        liveness_verifier: LivenessVerifier,
+        streaming_verifier: Optional[StreamingLivenessVerifier] = None
     ) -> None:
         """
         Initialize the liveness service.
@@ -45,6 +66,9 @@ class LivenessService:
         Args:
             landmark_extractor: LandmarkExtractor instance for extracting landmarks from frames.
             liveness_verifier: LivenessVerifier instance for verifying liveness.
+            streaming_verifier: Optional StreamingLivenessVerifier. When set,
+                               frames are processed lazily with early exit and
+                               adaptive sampling instead of all up front.
         
         Raises:
             ValueError: If any dependency is None.
@@ -57,11 +81,15 @@ class LivenessService:
         
         self.landmark_extractor = landmark_extractor
         self.liveness_verifier = liveness_verifier
+        self.streaming_verifier = streaming_verifier
+        self.last_report: Optional[LivenessReport] = None
+        """Report of the last verification (frames processed vs received)."""
     
     def verify_liveness(
         self, 
-        frames: List[np.ndarray], 
-        frontend_blink_count: Optional[int] = None
+        frames: Sequence[np.ndarray], 
+        frontend_blink_count: Optional[int] = None,
+        face_roi: Optional[FaceRoi] = None
     ) -> bool:
         """
         Verify liveness by extracting landmarks and checking blink count.
@@ -77,6 +105,9 @@ class LivenessService:
             frames: List of frame images (numpy arrays) to verify liveness for.
             frontend_blink_count: Optional blink count from frontend. If >= 3, 
                                 trust it and skip strict re-counting.
+            face_roi: Optional face box (x, y, width, height) from Phase 1.
+                     Landmarks are extracted from a downscaled crop around
+                     it, then around the face found in the previous frame.
         
         Returns:
             True if liveness verification passes (blink_count >= 3), False otherwise.
@@ -88,21 +119,16 @@ class LivenessService:
         if not frames:
             raise ValueError("frames cannot be empty or None")
         
+        if self.streaming_verifier is not None:
+            return self._verify_streaming(frames, frontend_blink_count, face_roi)
+        
         # If frontend reports 3+ blinks, trust it and do basic validation
         if frontend_blink_count is not None and frontend_blink_count >= 3:
             # Extract landmarks to verify they exist (basic validation)
-            landmarks_sequence: List[List[Tuple[float, float]]] = []
-            
-            for frame in frames:
-                landmarks = self.landmark_extractor.extract(frame)
-                if landmarks is None:
-                    landmarks_sequence.append([])
-                else:
-                    landmarks_sequence.append(landmarks)
+            _, valid = self._extract_eye_points(frames, face_roi)
             
             # Verify at least some frames have valid landmarks
-            valid_landmarks_count = sum(1 for lm in landmarks_sequence if len(lm) > 0)
-            if valid_landmarks_count < 1:
+            if not valid.any():
                 raise LivenessVerificationFailedError(
                     message="Liveness verification failed. Unable to verify liveness and we detected less than 3 blinks."
                 )
@@ -111,22 +137,11 @@ class LivenessService:
             return True
         
         # Otherwise, do full server-side verification (re-count blinks)
-        # Extract landmarks from each frame
-        landmarks_sequence: List[List[Tuple[float, float]]] = []
-        
-        for frame in frames:
-            landmarks = self.landmark_extractor.extract(frame)
-            
-            # If landmarks extraction fails for a frame, skip it
-            # (LivenessVerifier will handle empty landmarks gracefully)
-            if landmarks is None:
-                # Use empty list as placeholder to maintain frame-landmark alignment
-                landmarks_sequence.append([])
-            else:
-                landmarks_sequence.append(landmarks)
+        eye_points, valid = self._extract_eye_points(frames, face_roi)
         
         # Verify liveness using extracted landmarks
-        is_verified = self.liveness_verifier.verify(frames, landmarks_sequence)
+        with _STAGE_SECONDS.time(stage="blink_verification"):
+            is_verified = self.liveness_verifier.verify_sequence(eye_points, valid)
         
         # Raise exception if verification fails
         if not is_verified:
@@ -135,4 +150,103 @@ class LivenessService:
             )
         
         return is_verified
+    
+    def _extract_eye_points(
+        self,
+        frames: Sequence[np.ndarray],
+        face_roi: Optional[FaceRoi]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Extract the EAR eye points of every frame into one array.
+        
+        Args:
+            frames: List of frame images.
+            face_roi: Optional face box of the first frame.
+        
+        Returns:
+            Tuple of (eye points of shape (T, 12, 2), boolean mask of frames
+            where a face was found). Frames without a face hold zeros and are
+            masked out, keeping frames and landmarks aligned.
+        """
+        eye_points = np.zeros((len(frames), len(BlinkDetector.EYE_INDICES), 2), dtype=np.float64)
+        valid = np.zeros(len(frames), dtype=bool)
+        extract = self._eye_point_tracker(face_roi)
+        
+        for i, frame in enumerate(frames):
+            points = extract(frame)
+            if points is not None:
+                eye_points[i] = points
+                valid[i] = True
+        
+        return eye_points, valid
+    
+    def _verify_streaming(
+        self,
+        frames: Sequence[np.ndarray],
+        frontend_blink_count: Optional[int],
+        face_roi: Optional[FaceRoi]
+    ) -> bool:
+        """
+        Verify liveness with the streaming verifier.
+        
+        Args:
+            frames: Frame sequence (may decode frames lazily on indexing).
+            frontend_blink_count: Optional blink count from frontend.
+            face_roi: Optional face box of the first frame.
+        
+        Returns:
+            True if liveness verification passes.
+        
+        Raises:
+            LivenessVerificationFailedError: If liveness verification fails.
+        """
+        extract = self._eye_point_tracker(face_roi)
+        
+        if frontend_blink_count is not None and frontend_blink_count >= 3:
+            # Trust the frontend count; the first frame with a face is enough
+            report = self.streaming_verifier.find_face(frames, extract)
+        else:
+            report = self.streaming_verifier.verify(frames, extract)
+        
+        self.last_report = report
+        _FRAMES_TOTAL.inc(report.frames_received, kind="received")
+        _FRAMES_TOTAL.inc(report.frames_processed, kind="processed")
+        logger.info(f"Liveness processed {report.frames_processed}/{report.frames_received} frames "
+                    f"({report.blink_count} blinks, verified={report.is_verified}, "
+                    f"early_exit={report.early_exit})")
+        
+        if not report.is_verified:
+            raise LivenessVerificationFailedError(
+                message="Liveness verification failed. Unable to verify liveness and we detected less than 3 blinks."
+            )
+        return True
+    
+    def _eye_point_tracker(self, face_roi: Optional[FaceRoi]):
+        """
+        Return an eye point extractor that follows the face across frames.
+        
+        Each frame is cropped around the face found in the previously
+        processed frame (initially face_roi). FaceMesh runs once per frame:
+        if the crop shows no face, the frame counts as faceless and the next
+        frame is searched in full.
+        
+        Args:
+            face_roi: Optional face box of the first frame.
+        
+        Returns:
+            Callable mapping a frame to its (12, 2) eye points or None.
+        """
+        tracked_roi = [face_roi]
+        
+        def extract(frame: np.ndarray) -> Optional[np.ndarray]:
+            with _STAGE_SECONDS.time(stage="landmarks"):
+                points = self.landmark_extractor.extract_eye_points(
+                    frame, roi=tracked_roi[0], full_frame_fallback=False
+                )
+            tracked_roi[0] = (
+                LandmarkExtractor.face_roi_from_eye_points(points, frame.shape) if points is not None else None
+            )
+            return points
+        
+        return extract
 
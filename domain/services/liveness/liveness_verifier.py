@@ -5,7 +5,7 @@ This service verifies liveness by checking if the blink count meets the minimum
 It uses BlinkDetector to count blinks across a sequence of frames and landmarks.
 """
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 
@@ -18,7 +18,8 @@ class LivenessVerifier:
     
     This service is responsible ONLY for:
     - Processing frames and landmarks sequences
-    - Using BlinkDetector to count blinks
+    - Using BlinkDetector to count blinks (per frame or over a whole
+      landmark array)
     - Verifying if blink count meets minimum threshold (default: 3)
     
     It does NOT handle:
@@ -98,8 +99,29 @@ class LivenessVerifier:
         # Check if blink count meets minimum threshold
         blink_count = self.blink_detector.get_blink_count()
         return blink_count >= self.min_blinks
-
-
-
-
+    
+    def verify_sequence(
+        self,
+        eye_points: np.ndarray,
+        valid: Optional[np.ndarray] = None
+    ) -> bool:
+        """
+        Verify liveness from a landmark array in one vectorized pass.
+        
+        Same decision as verify(), computed with BlinkDetector.detect_sequence.
+        
+        Args:
+            eye_points: Array of shape (T, 12, 2) from
+                       LandmarkExtractor.extract_eye_points, or (T, 468, 2).
+            valid: Optional boolean mask of frames that had a face; other
+                  frames are skipped.
+        
+        Returns:
+            True if blink_count >= min_blinks, False otherwise.
+        """
+        if len(eye_points) == 0:
+            return False
+        
+        result = self.blink_detector.detect_sequence(eye_points, valid)
+        return result.blink_count >= self.min_blinks
 
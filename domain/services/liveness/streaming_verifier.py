@@ -0,0 +1,179 @@
+"""
+Streaming Liveness Verifier - Domain Service for early-exit liveness verification.
+
+Processes a frame sequence lazily, one frame at a time, instead of extracting
+landmarks for every frame up front. Verification stops as soon as the outcome
+is decided (enough blinks counted, or too few frames left to reach them), and
+frames are sampled adaptively: every sparse_stride-th frame while the eyes are
+clearly open, every frame (including the skipped ones just before) once EAR
+dips towards the blink threshold.
+"""
+
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from core.liveness.blink_detector import BlinkDetector
+from domain.services.liveness.value_objects import LivenessReport
+
+EyePointExtractor = Callable[[np.ndarray], Optional[np.ndarray]]
+"""Returns the (12, 2) EAR eye points of a frame, or None if no face is found."""
+
+
+class StreamingLivenessVerifier:
+    """
+    Verifies liveness frame by frame with early exit and adaptive sampling.
+    
+    This service is responsible ONLY for:
+    - Choosing which frames to process and in which order
+    - Feeding eye points to BlinkDetector one frame at a time
+    - Stopping once the blink count decides the outcome
+    - Reporting frames processed vs received
+    
+    It does NOT handle:
+    - Landmark extraction (an extractor callable must be provided)
+    - Frame decoding (frames are only indexed, so a lazy sequence is decoded
+      only for processed frames)
+    """
+    
+    def __init__(
+        self,
+        blink_detector: BlinkDetector,
+        min_blinks: int = 3,
+        sparse_stride: int = 1,
+        dip_margin: float = 0.05
+    ) -> None:
+        """
+        Initialize the streaming liveness verifier.
+        
+        Args:
+            blink_detector: BlinkDetector instance for counting blinks.
+            min_blinks: Minimum number of blinks required. Default is 3.
+            sparse_stride: Frame step while the eyes are clearly open. 1
+                          (default) processes every frame; 2 only sees
+                          blinks that keep the eyes closed for 2+ frames.
+            dip_margin: EAR margin above the reopen threshold below which
+                       an EAR dip switches to processing every frame.
+        
+        Raises:
+            ValueError: If min_blinks or sparse_stride is less than 1.
+        """
+        if min_blinks < 1:
+            raise ValueError(f"min_blinks must be at least 1, got {min_blinks}")
+        if sparse_stride < 1:
+            raise ValueError(f"sparse_stride must be at least 1, got {sparse_stride}")
+        
+        self.blink_detector = blink_detector
+        self.min_blinks = min_blinks
+        self.sparse_stride = sparse_stride
+        self.dip_margin = max(0.0, dip_margin)
+    
+    def verify(self, frames: Sequence[np.ndarray], extract: EyePointExtractor) -> LivenessReport:
+        """
+        Count blinks until min_blinks is reached or can no longer be reached.
+        
+        Args:
+            frames: Frame sequence; only the processed frames are indexed.
+            extract: Callable returning a frame's (12, 2) eye points or None.
+        
+        Returns:
+            LivenessReport with the outcome and frames processed vs received.
+        """
+        detector = self.blink_detector
+        detector.reset_counter()
+        dip_ear = detector.ear_threshold + detector.hysteresis + self.dip_margin
+        total = len(frames)
+        processed = 0
+        last_fed = -1
+        index = 0
+        
+        while index < total:
+            eye_points = extract(frames[index])
+            processed += 1
+            
+            if eye_points is not None:
+                left_ear, right_ear = detector.eye_aspect_ratios(eye_points)
+                dipping = (left_ear + right_ear) / 2.0 < dip_ear
+                if dipping and index - last_fed > 1:
+                    # The dip may have started in the skipped frames: feed them
+                    # first so the blink state machine sees frames in order
+                    for skipped in range(last_fed + 1, index):
+                        skipped_points = extract(frames[skipped])
+                        processed += 1
+                        if skipped_points is not None:
+                            detector.detect_eye_points(skipped_points)
+                detector.detect_eye_points(eye_points)
+            else:
+                dipping = False
+            last_fed = index
+            
+            decided = self._decided(total - index - 1)
+            if decided is not None:
+                return LivenessReport(
+                    is_verified=decided,
+                    blink_count=detector.get_blink_count(),
+                    frames_received=total,
+                    frames_processed=processed,
+                    early_exit=index < total - 1
+                )
+            
+            dense = dipping or detector.is_closed
+            index += 1 if dense else self.sparse_stride
+        
+        blink_count = detector.get_blink_count()
+        return LivenessReport(
+            is_verified=blink_count >= self.min_blinks,
+            blink_count=blink_count,
+            frames_received=total,
+            frames_processed=processed
+        )
+    
+    def find_face(self, frames: Sequence[np.ndarray], extract: EyePointExtractor) -> LivenessReport:
+        """
+        Confirm that at least one frame has a face, stopping at the first one.
+        
+        Used when the frontend's blink count is trusted and the server only
+        checks that the frames show a face.
+        
+        Args:
+            frames: Frame sequence; only the processed frames are indexed.
+            extract: Callable returning a frame's (12, 2) eye points or None.
+        
+        Returns:
+            LivenessReport verified if any frame has a face.
+        """
+        total = len(frames)
+        for index in range(total):
+            if extract(frames[index]) is not None:
+                return LivenessReport(
+                    is_verified=True,
+                    blink_count=0,
+                    frames_received=total,
+                    frames_processed=index + 1,
+                    early_exit=index < total - 1
+                )
+        return LivenessReport(
+            is_verified=False,
+            blink_count=0,
+            frames_received=total,
+            frames_processed=total
+        )
+    
+    def _decided(self, remaining: int) -> Optional[bool]:
+        """
+        Return the outcome if the blink count already decides it, else None.
+        
+        A blink needs a closed frame followed by an open one, so `remaining`
+        frames add at most (remaining + 1) // 2 blinks if the eyes are
+        closed now and remaining // 2 otherwise.
+        
+        Args:
+            remaining: Number of frames after the current one.
+        """
+        blink_count = self.blink_detector.get_blink_count()
+        if blink_count >= self.min_blinks:
+            return True
+        reachable = (remaining + 1) // 2 if self.blink_detector.is_closed else remaining // 2
+        if blink_count + reachable < self.min_blinks:
+            return False
+        return None
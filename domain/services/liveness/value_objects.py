@@ -0,0 +1,41 @@
+"""
+Value objects for liveness domain services.
+
+Contains immutable value objects describing liveness verification outcomes.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LivenessReport:
+    """
+    Immutable value object describing one liveness verification.
+    
+    Attributes:
+        is_verified: Whether liveness was verified.
+        blink_count: Blinks counted in the processed frames (0 when the
+                    frontend count was trusted).
+        frames_received: Number of frames in the request.
+        frames_processed: Number of frames whose landmarks were extracted.
+        early_exit: Whether verification stopped before the last frame
+                   because the outcome was already decided.
+    """
+    
+    is_verified: bool
+    blink_count: int
+    frames_received: int
+    frames_processed: int
+    early_exit: bool = False
+    
+    def __post_init__(self):
+        """Validate the value object after initialization."""
+        if self.blink_count < 0:
+            raise ValueError("blink_count must be non-negative")
+        if not 0 <= self.frames_processed <= self.frames_received:
+            raise ValueError("frames_processed must be between 0 and frames_received")
+    
+    @property
+    def frames_skipped(self) -> int:
+        """Return the number of frames that were never processed."""
+        return self.frames_received - self.frames_processed
@@ -12,12 +12,15 @@ The service supports single-frame recognition, which is used in Phase 1 to
 identify the user before proceeding to liveness verification.
 """
 
-from typing import Optional, Tuple, Dict, Any, List
+from typing import AbstractSet, Optional, Tuple, Dict, Any, List, Union
 import numpy as np
 import logging
 
+from core.recognition.cascade import CascadePolicy
 from core.recognition.detector import FaceDetector
 from core.recognition.embedding_extractor import EmbeddingExtractor
+from core.recognition.gallery import EmbeddingGallery
+from core.recognition.image_context import ImageContext
 from core.recognition.recognizer import FaceRecognizer
 from core.recognition.quality_assessor import QualityAssessor
 from core.recognition.value_objects import (
@@ -33,6 +36,27 @@ from domain.shared.exceptions import (
     FaceNotRecognizedError
 )
 from domain.shared.constants import DEFAULT_CONFIDENCE_THRESHOLD
+from core.shared.metrics import metrics_registry
+
+_STAGE_SECONDS = metrics_registry.histogram(
+    "eyed_recognition_stage_seconds",
+    "Latency of face recognition pipeline stages in seconds",
+    ("stage",)
+)
+_CASCADE_DECISIONS_TOTAL = metrics_registry.counter(
+    "eyed_cascade_decisions_total",
+    "Faces answered by the cascade's fast model (accepted) or sent to the full model (escalated)",
+    ("decision",)
+)
+_ROSTER_MATCHES_TOTAL = metrics_registry.counter(
+    "eyed_roster_matches_total",
+    "Roster-scoped recognitions, by where the face matched (roster, global or unmatched)",
+    ("result",)
+)
+
+# Known embeddings as a user_id -> embedding mapping, or an already built
+# gallery (callers matching repeatedly against the same embeddings keep one)
+KnownEmbeddings = Union[Dict[str, np.ndarray], EmbeddingGallery]
 
 
 class FaceRecognitionService:
@@ -53,7 +77,9 @@ class FaceRecognitionService:
         face_recognizer: FaceRecognizer,
         quality_assessor: QualityAssessor,
         confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
-        min_quality_threshold: float = 0.5
+        min_quality_threshold: float = 0.5,
+        fast_embedding_extractor: Optional[EmbeddingExtractor] = None,
+        cascade_policy: Optional[CascadePolicy] = None
     ):
         """
         Initialize face recognition service.
@@ -65,6 +91,9 @@ class FaceRecognitionService:
             quality_assessor: Face quality assessment service.
             confidence_threshold: Minimum confidence threshold for recognition.
             min_quality_threshold: Minimum quality threshold for face images.
+            fast_embedding_extractor: Optional cheaper extractor enabling cascade
+                                      recognition (see recognize_faces_cascade).
+            cascade_policy: Accept-or-escalate rule for the fast stage.
         """
         self.face_detector = face_detector
         self.embedding_extractor = embedding_extractor
@@ -72,6 +101,13 @@ class FaceRecognitionService:
         self.quality_assessor = quality_assessor
         self.confidence_threshold = confidence_threshold
         self.min_quality_threshold = min_quality_threshold
+        self.fast_embedding_extractor = fast_embedding_extractor
+        self.cascade_policy = cascade_policy or CascadePolicy()
+    
+    @property
+    def cascade_enabled(self) -> bool:
+        """Return whether a fast model is configured for cascade recognition."""
+        return self.fast_embedding_extractor is not None
     
     def detect_and_assess_face(
         self,
@@ -94,30 +130,57 @@ class FaceRecognitionService:
             FaceDetectionFailedError: If no face detected.
             InsufficientQualityError: If quality below threshold.
         """
+        face_image, quality_result, _ = self.detect_and_assess_face_with_location(image)
+        return face_image, quality_result
+    
+    def detect_and_assess_face_with_location(
+        self,
+        image: Union[np.ndarray, ImageContext]
+    ) -> Tuple[np.ndarray, QualityResult, FaceLocation]:
+        """
+        Same as detect_and_assess_face, also returning the face's location.
+        
+        The location lets Phase 2 crop its frames to the face for landmark
+        extraction.
+        
+        Returns:
+            Tuple of (face_image, quality_result, face_location).
+        
+        Raises:
+            FaceDetectionFailedError: If no face detected.
+            InsufficientQualityError: If quality below threshold.
+        """
+        # Detection and quality share one image context (one grayscale conversion)
+        context = ImageContext.of(image)
+        
         # Step 1: Detect face
-        detection_result = self.face_detector.detect(image)
+        with _STAGE_SECONDS.time(stage="detection"):
+            detection_result = self.face_detector.detect(context)
         if not detection_result.faces_detected or detection_result.face_count == 0:
             raise FaceDetectionFailedError()
         
         # Get the first detected face (assumes single face)
         face_location = detection_result.faces[0]
-        face_image = self._extract_face_region(image, face_location)
+        face = context.crop(face_location)
+        face_image = face.image
         
         # Step 2: Assess quality
-        quality_result = self.quality_assessor.assess(face_image)
+        with _STAGE_SECONDS.time(stage="quality"):
+            quality_result = self.quality_assessor.assess(face)
         if not quality_result.is_suitable:
             raise InsufficientQualityError(
                 quality_score=quality_result.overall_score,
                 threshold=self.min_quality_threshold
             )
         
-        return face_image, quality_result
+        return face_image, quality_result, face_location
     
     def recognize_face(
         self,
         face_image: np.ndarray,
-        known_embeddings: Dict[str, np.ndarray],
-        user_names: Dict[str, str]
+        known_embeddings: KnownEmbeddings,
+        user_names: Dict[str, str],
+        roster: Optional[AbstractSet[str]] = None
     ) -> RecognitionResult:
         """
         Extract embedding and recognize face from known embeddings.
@@ -131,8 +194,11 @@ class FaceRecognitionService:
         
         Args:
             face_image: Cropped face image (single frame from Phase 1).
-            known_embeddings: Dictionary mapping user_id to embedding arrays.
+            known_embeddings: Dictionary mapping user_id to embedding arrays,
+                             or an EmbeddingGallery of them.
             user_names: Dictionary mapping user_id to user names.
+            roster: Optional user IDs expected at the location; they are
+                   searched first and the full gallery only if none matches.
         
         Returns:
             RecognitionResult with user_id, user_name, and confidence.
@@ -141,7 +207,8 @@ class FaceRecognitionService:
             FaceNotRecognizedError: If recognition fails.
         """
         # Step 1: Extract embedding
-        embedding_result = self.embedding_extractor.extract(face_image)
+        with _STAGE_SECONDS.time(stage="embedding"):
+            embedding_result = self.embedding_extractor.extract(face_image)
         if embedding_result is None:
             raise FaceNotRecognizedError(message="Failed to extract face embedding")
         
@@ -149,27 +216,204 @@ class FaceRecognitionService:
         logger = logging.getLogger(__name__)
         logger.info(f"Extracted embedding: shape={embedding_result.embedding.shape}, dtype={embedding_result.embedding.dtype}, norm={np.linalg.norm(embedding_result.embedding):.6f}")
         
-        # Step 2: Recognize face
-        recognition_result = self.face_recognizer.recognize(
-            face_embedding=embedding_result.embedding,
-            known_embeddings=known_embeddings,
-            threshold=self.confidence_threshold,
-            user_names=user_names
-        )
+        # Step 2: Recognize face, within the roster first if one is given
+        with _STAGE_SECONDS.time(stage="matching"):
+            match = self._match_probes(
+                embedding_result.embedding[np.newaxis],
+                known_embeddings,
+                user_names,
+                roster,
+                unique=False
+            )[0]
         
-        if recognition_result is None:
+        if match is None:
             raise FaceNotRecognizedError(
                 confidence=0.0,
                 threshold=self.confidence_threshold
             )
         
-        return recognition_result
+        user_id, score = match
+        return RecognitionResult(
+            user_id=user_id,
+            user_name=user_names.get(user_id, user_id),
+            confidence=score,
+            match_score=score
+        )
+    
+    def recognize_faces(
+        self,
+        face_images: List[np.ndarray],
+        known_embeddings: KnownEmbeddings,
+        user_names: Dict[str, str],
+        rosters: Optional[List[Optional[AbstractSet[str]]]] = None,
+        embedding_extractor: Optional[EmbeddingExtractor] = None
+    ) -> List[Optional[RecognitionResult]]:
+        """
+        Extract embeddings and recognize several face crops in one batch.
+        
+        Embeddings are extracted with one extract_batch call and all probes
+        are matched with a single matrix multiply against the known
+        embeddings (one per distinct roster). Used by the micro-batched
+        recognition path, where the crops come from concurrent requests.
+        
+        Args:
+            face_images: Cropped face images.
+            known_embeddings: Dictionary mapping user_id to embedding arrays,
+                             or an EmbeddingGallery of them.
+            user_names: Dictionary mapping user_id to user names.
+            rosters: Optional roster per face image (None entries search the
+                    full gallery only).
+            embedding_extractor: Extractor of the model the known embeddings
+                                were produced with (default: the service's).
+        
+        Returns:
+            One entry per face image: RecognitionResult, or None if embedding
+            extraction failed or no known face matched above the threshold.
+        """
+        logger = logging.getLogger(__name__)
+        if not face_images:
+            return []
+        
+        with _STAGE_SECONDS.time(stage="embedding"):
+            embedding_results = self._extract_batch(embedding_extractor or self.embedding_extractor, face_images)
+        
+        extracted = [i for i, result in enumerate(embedding_results) if result is not None]
+        results: List[Optional[RecognitionResult]] = [None] * len(face_images)
+        if not extracted:
+            return results
+        
+        with _STAGE_SECONDS.time(stage="matching"):
+            gallery = self._as_gallery(known_embeddings, user_names)
+            # Faces sharing a roster are matched together
+            groups: Dict[Optional[frozenset], List[int]] = {}
+            for i in extracted:
+                roster = rosters[i] if rosters else None
+                groups.setdefault(frozenset(roster) if roster else None, []).append(i)
+            matches_by_face = {}
+            for roster, indices in groups.items():
+                probes = np.stack([embedding_results[i].embedding for i in indices])
+                matches = self._match_probes(probes, gallery, user_names, roster, unique=False)
+                matches_by_face.update(zip(indices, matches))
+            matches = [matches_by_face[i] for i in extracted]
+        
+        for i, match in zip(extracted, matches):
+            if match is not None:
+                user_id, score = match
+                results[i] = RecognitionResult(
+                    user_id=user_id,
+                    user_name=user_names.get(user_id, user_id),
+                    confidence=score,
+                    match_score=score
+                )
+        
+        logger.info(f"Batch recognition: {len(face_images)} face(s), "
+                    f"{sum(r is not None for r in results)} recognized")
+        return results
+    
+    def recognize_faces_cascade(
+        self,
+        face_images: List[np.ndarray],
+        known_embeddings: KnownEmbeddings,
+        fast_known_embeddings: KnownEmbeddings,
+        user_names: Dict[str, str],
+        rosters: Optional[List[Optional[AbstractSet[str]]]] = None,
+        embedding_extractor: Optional[EmbeddingExtractor] = None
+    ) -> List[Optional[RecognitionResult]]:
+        """
+        Recognize face crops with the fast model first, escalating ambiguous ones.
+        
+        Each face is matched against the fast-model gallery (the roster's
+        users if it has a roster). Faces whose best match passes the cascade
+        policy (high score, clear margin over the runner-up) are answered by
+        the fast model; the rest go through recognize_faces with the full
+        model. Faces are always escalated when some candidate user has no
+        fast-model embedding yet, so an incomplete fast gallery never
+        produces a wrong accept.
+        
+        Args:
+            face_images: Cropped face images.
+            known_embeddings: Dictionary mapping user_id to full-model embeddings
+                             (or an EmbeddingGallery of them).
+            fast_known_embeddings: Dictionary mapping user_id to fast-model embeddings
+                                  (or an EmbeddingGallery of them).
+            user_names: Dictionary mapping user_id to user names.
+            rosters: Optional roster per face image.
+            embedding_extractor: Extractor of the model the full-model
+                                embeddings were produced with (default: the
+                                service's).
+        
+        Returns:
+            One entry per face image: RecognitionResult, or None if not recognized.
+            Accepted results carry the fast model's similarity as confidence.
+        """
+        if not self.cascade_enabled:
+            return self.recognize_faces(face_images, known_embeddings, user_names, rosters, embedding_extractor)
+        if not face_images:
+            return []
+        
+        with _STAGE_SECONDS.time(stage="embedding_fast"):
+            fast_results = self._extract_batch(self.fast_embedding_extractor, face_images)
+        
+        full_gallery = self._as_gallery(known_embeddings, user_names)
+        fast_gallery = self._as_gallery(fast_known_embeddings, user_names)
+        results: List[Optional[RecognitionResult]] = [None] * len(face_images)
+        escalate = [i for i, result in enumerate(fast_results) if result is None]
+        
+        with _STAGE_SECONDS.time(stage="matching_fast"):
+            groups: Dict[Optional[frozenset], List[int]] = {}
+            for i, result in enumerate(fast_results):
+                if result is not None:
+                    roster = rosters[i] if rosters else None
+                    groups.setdefault(frozenset(roster) if roster else None, []).append(i)
+            
+            for roster, indices in groups.items():
+                candidates = full_gallery.subset(roster).user_ids if roster else full_gallery.user_ids
+                if not len(candidates) or not np.isin(candidates, fast_gallery.user_ids).all():
+                    escalate.extend(indices)
+                    continue
+                
+                gallery = (
+                    fast_gallery if len(candidates) == len(fast_gallery.user_ids)
+                    else fast_gallery.subset(set(candidates))
+                )
+                user_scores = gallery.user_scores(np.stack([fast_results[i].embedding for i in indices]))
+                best, best_scores, accepted = self.cascade_policy.decide(user_scores)
+                for row, i in enumerate(indices):
+                    if not accepted[row]:
+                        escalate.append(i)
+                        continue
+                    user_id = str(gallery.user_ids[best[row]])
+                    score = float(best_scores[row])
+                    results[i] = RecognitionResult(
+                        user_id=user_id,
+                        user_name=user_names.get(user_id, user_id),
+                        confidence=score,
+                        match_score=score
+                    )
+        
+        _CASCADE_DECISIONS_TOTAL.inc(len(face_images) - len(escalate), decision="accepted")
+        _CASCADE_DECISIONS_TOTAL.inc(len(escalate), decision="escalated")
+        
+        if escalate:
+            escalate.sort()
+            escalated_results = self.recognize_faces(
+                [face_images[i] for i in escalate],
+                full_gallery,
+                user_names,
+                [rosters[i] for i in escalate] if rosters else None,
+                embedding_extractor
+            )
+            for i, result in zip(escalate, escalated_results):
+                results[i] = result
+        
+        return results
     
     def recognize_multiple_faces(
         self,
-        image: np.ndarray,
+        image: Union[np.ndarray, ImageContext],
         known_embeddings: Dict[str, np.ndarray],
-        user_names: Dict[str, str]
+        user_names: Dict[str, str],
+        roster: Optional[AbstractSet[str]] = None
     ) -> List[Optional[RecognitionResult]]:
         """
         Detect and recognize all faces in an image.
@@ -183,10 +427,21 @@ class FaceRecognitionService:
         beneficial for class attendance photos where students may be at varying
         distances from the camera.
         
+        The faces that pass the quality check are embedded with one
+        extract_batch call. All embeddings are matched together: one faces x
+        gallery similarity matrix is computed and solved as a one-to-one
+        assignment, so the gallery is scanned once per photo and no student
+        is assigned to two faces. With a roster, faces are matched within the
+        roster first and only the remaining faces against the rest of the
+        gallery.
+        
         Args:
-            image: Full image containing multiple faces.
+            image: Full image containing multiple faces, or its ImageContext
+                   (its detections, crops and quality results are then
+                   reusable by the caller).
             known_embeddings: Dictionary mapping user_id to embedding arrays.
             user_names: Dictionary mapping user_id to user names.
+            roster: Optional user IDs expected in the photo (e.g. the class roster).
         
         Returns:
             List of RecognitionResult objects (one per detected face).
@@ -194,80 +449,232 @@ class FaceRecognitionService:
         """
         logger = logging.getLogger(__name__)
         results: List[Optional[RecognitionResult]] = []
+        context = ImageContext.of(image)
         
         # Step 1: Detect all faces
-        detection_result = self.face_detector.detect(image)
+        with _STAGE_SECONDS.time(stage="detection"):
+            detection_result = self.face_detector.detect(context)
         if not detection_result.faces_detected or detection_result.face_count == 0:
             logger.info("No faces detected in image")
             return results
         
         logger.info(f"Detected {detection_result.face_count} face(s) in image")
         
-        # Step 2: Process each detected face
-        for face_location in detection_result.faces:
+        # Step 2: Quality-check each detected face
+        crops: List[np.ndarray] = []
+        crop_faces: List[int] = []
+        for index, face_location in enumerate(detection_result.faces):
             try:
-                # Extract face region
-                face_image = self._extract_face_region(image, face_location)
+                # Extract face region (a view sharing the photo's conversions)
+                face = context.crop(face_location)
                 
                 # Assess quality
-                quality_result = self.quality_assessor.assess(face_image)
+                with _STAGE_SECONDS.time(stage="quality"):
+                    quality_result = self.quality_assessor.assess(face)
                 if quality_result.overall_score < self.min_quality_threshold:
                     logger.debug(f"Face quality insufficient: {quality_result.overall_score:.3f} < {self.min_quality_threshold}")
-                    results.append(None)
                     continue
                 
-                # Extract embedding
-                embedding_result = self.embedding_extractor.extract(face_image)
+                crops.append(face.image)
+                crop_faces.append(index)
+                
+            except Exception as e:
+                logger.warning(f"Error processing face: {str(e)}")
+        
+        # Step 3: Extract the embeddings of all suitable faces in one batch
+        embeddings: List[Optional[np.ndarray]] = [None] * detection_result.face_count
+        if crops:
+            with _STAGE_SECONDS.time(stage="embedding"):
+                embedding_results = self._extract_batch(self.embedding_extractor, crops)
+            for index, embedding_result in zip(crop_faces, embedding_results):
                 if embedding_result is None:
                     logger.debug("Failed to extract embedding for face")
-                    results.append(None)
                     continue
-                
-                # Recognize face
-                recognition_result = self.face_recognizer.recognize(
-                    face_embedding=embedding_result.embedding,
-                    known_embeddings=known_embeddings,
-                    threshold=self.confidence_threshold,
-                    user_names=user_names
+                embeddings[index] = embedding_result.embedding
+        
+        # Step 4: Match all faces at once with a one-to-one assignment
+        results = [None] * len(embeddings)
+        extracted = [i for i, embedding in enumerate(embeddings) if embedding is not None]
+        if not extracted:
+            return results
+        
+        with _STAGE_SECONDS.time(stage="matching"):
+            matches = self._match_probes(
+                np.stack([embeddings[i] for i in extracted]),
+                known_embeddings,
+                user_names,
+                roster,
+                unique=True
+            )
+        
+        for i, match in zip(extracted, matches):
+            if match is not None:
+                user_id, score = match
+                results[i] = RecognitionResult(
+                    user_id=user_id,
+                    user_name=user_names.get(user_id, user_id),
+                    confidence=score,
+                    match_score=score
                 )
-                
-                results.append(recognition_result)
-                
-            except Exception as e:
-                logger.warning(f"Error processing face: {str(e)}")
-                results.append(None)
         
         return results
     
-    def _extract_face_region(
+    def recognize_face_groups(
+        self,
+        face_groups: List[List[np.ndarray]],
+        known_embeddings: Dict[str, np.ndarray],
+        user_names: Dict[str, str],
+        roster: Optional[AbstractSet[str]] = None
+    ) -> List[List[Optional[RecognitionResult]]]:
+        """
+        Recognize the face crops of several photos with one embedding batch.
+        
+        Crops of all photos are embedded with one extract_batch call and the
+        gallery is built once; within each photo, faces are matched one-to-one
+        as in recognize_multiple_faces. Used by bulk class photo processing,
+        where detection and quality checks already ran elsewhere.
+        
+        Args:
+            face_groups: Cropped face images per photo.
+            known_embeddings: Dictionary mapping user_id to embedding arrays.
+            user_names: Dictionary mapping user_id to user names.
+            roster: Optional user IDs expected in the photos (e.g. the class roster).
+        
+        Returns:
+            Per photo, one entry per face crop: RecognitionResult, or None if
+            embedding extraction failed or no known face matched.
+        """
+        crops = [face_image for group in face_groups for face_image in group]
+        results: List[Optional[RecognitionResult]] = [None] * len(crops)
+        if crops:
+            with _STAGE_SECONDS.time(stage="embedding"):
+                embedding_results = self._extract_batch(self.embedding_extractor, crops)
+            extracted = [i for i, result in enumerate(embedding_results) if result is not None]
+            
+            if extracted:
+                # Probe groups index the stacked probes, not the crops
+                position = {crop_index: probe for probe, crop_index in enumerate(extracted)}
+                groups, start = [], 0
+                for group in face_groups:
+                    groups.append([position[i] for i in range(start, start + len(group)) if i in position])
+                    start += len(group)
+                with _STAGE_SECONDS.time(stage="matching"):
+                    matches = self._match_probes(
+                        np.stack([embedding_results[i].embedding for i in extracted]),
+                        known_embeddings,
+                        user_names,
+                        roster,
+                        unique=True,
+                        groups=groups
+                    )
+                for i, match in zip(extracted, matches):
+                    if match is not None:
+                        user_id, score = match
+                        results[i] = RecognitionResult(
+                            user_id=user_id,
+                            user_name=user_names.get(user_id, user_id),
+                            confidence=score,
+                            match_score=score
+                        )
+        
+        grouped, start = [], 0
+        for group in face_groups:
+            grouped.append(results[start:start + len(group)])
+            start += len(group)
+        return grouped
+    
+    def _match_probes(
         self,
-        image: np.ndarray,
-        face_location: FaceLocation
-    ) -> np.ndarray:
+        probes: np.ndarray,
+        known_embeddings: KnownEmbeddings,
+        user_names: Dict[str, str],
+        roster: Optional[AbstractSet[str]],
+        unique: bool,
+        groups: Optional[List[List[int]]] = None
+    ) -> List[Optional[Tuple[str, float]]]:
         """
-        Extract face region from image using face location.
+        Match probes within a roster first, then unmatched probes globally.
         
         Args:
-            image: Full image containing the face.
-            face_location: Location of the face in the image.
+            probes: Embeddings of shape (B, D).
+            known_embeddings: Dictionary mapping user_id to embedding arrays,
+                             or an EmbeddingGallery of them.
+            user_names: Dictionary mapping user_id to user names.
+            roster: Optional user IDs to search first.
+            unique: Whether to assign each user to at most one probe.
+            groups: Optional probe indices per photo; with unique, each user is
+                   assigned at most once per group. Defaults to one group.
         
         Returns:
-            Cropped face image as numpy array.
+            One entry per probe: (user_id, similarity) or None.
         """
-        # Ensure coordinates are within image bounds
-        height, width = image.shape[:2]
-        x = max(0, face_location.x)
-        y = max(0, face_location.y)
-        x_end = min(width, x + face_location.width)
-        y_end = min(height, y + face_location.height)
+        def match(gallery: EmbeddingGallery, indices: List[int], exclude: Optional[AbstractSet[str]]) -> None:
+            if not unique:
+                matches = gallery.match(probes[indices], self.confidence_threshold, exclude=exclude)
+                for i, result in zip(indices, matches):
+                    results[i] = result
+                return
+            pending_indices = set(indices)
+            for group in (groups if groups is not None else [indices]):
+                members = [i for i in group if i in pending_indices]
+                if members:
+                    matches = gallery.match_unique(probes[members], self.confidence_threshold, exclude=exclude)
+                    for i, result in zip(members, matches):
+                        results[i] = result
         
-        # Extract face region
-        face_image = image[y:y_end, x:x_end]
+        gallery = self._as_gallery(known_embeddings, user_names)
+        results: List[Optional[Tuple[str, float]]] = [None] * len(probes)
+        pending = list(range(len(probes)))
+        if roster:
+            match(gallery.subset(roster), pending, None)
+            pending = [i for i in pending if results[i] is None]
+            _ROSTER_MATCHES_TOTAL.inc(len(probes) - len(pending), result="roster")
+            if not pending:
+                return results
         
-        return face_image
-
-
-
-
-
-
+        # Roster users were already searched (and, for unique matching, may be
+        # taken); their scores are masked instead of copying the gallery
+        match(gallery, pending, roster)
+        if roster:
+            matched = sum(results[i] is not None for i in pending)
+            _ROSTER_MATCHES_TOTAL.inc(matched, result="global")
+            _ROSTER_MATCHES_TOTAL.inc(len(pending) - matched, result="unmatched")
+        return results
+    
+    @staticmethod
+    def _as_gallery(known_embeddings: KnownEmbeddings, user_names: Dict[str, str]) -> EmbeddingGallery:
+        """Return known_embeddings as an EmbeddingGallery, building one from a mapping."""
+        if isinstance(known_embeddings, EmbeddingGallery):
+            return known_embeddings
+        return EmbeddingGallery.from_known_embeddings(known_embeddings, user_names)
+    
+    @staticmethod
+    def _extract_batch(
+        extractor: EmbeddingExtractor,
+        face_images: List[np.ndarray]
+    ) -> List[Optional[EmbeddingResult]]:
+        """
+        Extract embeddings for a batch, falling back to one face at a time on error.
+        
+        Args:
+            extractor: Embedding extractor to use.
+            face_images: Cropped face images.
+        
+        Returns:
+            One EmbeddingResult (or None on failure) per face image.
+        """
+        logger = logging.getLogger(__name__)
+        try:
+            return extractor.extract_batch(face_images)
+        except Exception as e:
+            # One bad crop must not fail the whole batch: retry face by face
+            logger.warning(f"Batched embedding extraction failed, retrying per face: {e}")
+        
+        embedding_results = []
+        for face_image in face_images:
+            try:
+                embedding_results.append(extractor.extract(face_image))
+            except Exception as face_error:
+                logger.warning(f"Embedding extraction failed for face: {face_error}")
+                embedding_results.append(None)
+        return embedding_results
@@ -74,22 +74,8 @@ class UserRegistrationService:
             InsufficientQualityError: If quality below threshold.
             EmbeddingExtractionFailedError: If embedding extraction fails.
         """
-        # Step 1: Detect face
-        detection_result = self.face_detector.detect(image)
-        if not detection_result.faces_detected or detection_result.face_count == 0:
-            raise FaceDetectionFailedError()
-        
-        # Get the first detected face (assumes single face registration)
-        face_location = detection_result.faces[0]
-        face_image = self._extract_face_region(image, face_location)
-        
-        # Step 2: Assess quality
-        quality_result = self.quality_assessor.assess(face_image)
-        if not quality_result.is_suitable:
-            raise InsufficientQualityError(
-                quality_score=quality_result.overall_score,
-                threshold=self.min_quality_threshold
-            )
+        # Steps 1-2: Detect face and assess quality
+        face_image, quality_result, _ = self.detect_registration_face(image)
         
         # Step 3: Extract embedding
         try:
@@ -117,6 +103,43 @@ class UserRegistrationService:
         
         return face_image, quality_result, embedding_result
     
+    def detect_registration_face(
+        self,
+        image: np.ndarray
+    ) -> Tuple[np.ndarray, QualityResult, FaceLocation]:
+        """
+        Detect the face to register and assess its quality (no embedding).
+        
+        Used on its own by bulk enrollment, where embeddings are extracted
+        in batches after detection ran in worker processes.
+        
+        Args:
+            image: Full image containing the face.
+        
+        Returns:
+            Tuple of (face_image, quality_result, face_location).
+        
+        Raises:
+            FaceDetectionFailedError: If no face detected.
+            InsufficientQualityError: If quality below threshold.
+        """
+        detection_result = self.face_detector.detect(image)
+        if not detection_result.faces_detected or detection_result.face_count == 0:
+            raise FaceDetectionFailedError()
+        
+        # Get the first detected face (assumes single face registration)
+        face_location = detection_result.faces[0]
+        face_image = self._extract_face_region(image, face_location)
+        
+        quality_result = self.quality_assessor.assess(face_image)
+        if not quality_result.is_suitable:
+            raise InsufficientQualityError(
+                quality_score=quality_result.overall_score,
+                threshold=self.min_quality_threshold
+            )
+        
+        return face_image, quality_result, face_location
+    
     def _extract_face_region(
         self,
         image: np.ndarray,
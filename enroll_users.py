@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Enroll many users from a CSV manifest and a folder of face photos.
+
+The manifest has one row per user with the columns user_id, user_name and
+image (a path relative to --images-dir), and optionally first_name,
+last_name and email. Images are decoded and their faces detected and
+quality-checked in worker processes. Embeddings are extracted in batches,
+and all users are then written to faces.json at once. Either the whole
+intake is registered or, if that write fails, none of it is. Rows that
+cannot be enrolled are listed with the reason.
+
+Usage:
+    python enroll_users.py intake.csv --images-dir photos/
+    python enroll_users.py intake.csv --images-dir photos/ --report failures.csv
+"""
+
+import argparse
+import csv
+import logging
+import os
+import sys
+import time
+from typing import Iterator, Tuple
+
+REQUIRED_COLUMNS = ("user_id", "user_name", "image")
+
+# Per-process registration service without embedding model (set by _init_worker)
+_registration_service = None
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Enroll users from a CSV manifest")
+    parser.add_argument("manifest", help="CSV with user_id, user_name, image [, first_name, last_name, email]")
+    parser.add_argument("--images-dir", default=None, help="Folder the image paths are relative to "
+                                                           "(default: the manifest's folder)")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) - 1),
+                        help="Detection processes (default: CPU count - 1)")
+    parser.add_argument("--batch-size", type=int, default=32, help="Faces embedded per batch (default: 32)")
+    parser.add_argument("--report", default=None, help="Write failed rows (row, user_id, error) to this CSV")
+    return parser.parse_args()
+
+
+def _read_manifest(path: str, images_dir: str) -> Iterator[Tuple[object, str]]:
+    """Yield (candidate, image path) per manifest row (row numbers count the header as 1)."""
+    from use_cases.bulk_register_users import EnrollmentCandidate
+
+    with open(path, newline="", encoding="utf-8-sig") as manifest:
+        reader = csv.DictReader(manifest)
+        missing = [column for column in REQUIRED_COLUMNS if column not in (reader.fieldnames or [])]
+        if missing:
+            sys.exit(f"Manifest is missing columns: {', '.join(missing)}")
+        for row_number, row in enumerate(reader, start=2):
+            values = {key: (value or "").strip() for key, value in row.items() if key}
+            candidate = EnrollmentCandidate(
+                row=row_number,
+                user_id=values["user_id"],
+                user_name=values["user_name"] or values["user_id"],
+                first_name=values.get("first_name") or None,
+                last_name=values.get("last_name") or None,
+                email=values.get("email") or None
+            )
+            if not values["image"]:
+                candidate.error = "No image given"
+            yield candidate, os.path.join(images_dir, values["image"])
+
+
+def _init_worker() -> None:
+    """Load the face detector and quality assessor once per worker process."""
+    global _registration_service
+    from api import dependencies
+    from domain.services.recognition import UserRegistrationService
+
+    _registration_service = UserRegistrationService(
+        face_detector=dependencies.get_face_detector(),
+        embedding_extractor=None,  # Embeddings are extracted in batches by the parent
+        quality_assessor=dependencies.get_quality_assessor()
+    )
+
+
+def _detect(task):
+    """Decode one image and detect its face (runs in a worker process)."""
+    import cv2
+    from use_cases.bulk_register_users import detect_enrollment_face
+
+    candidate, path = task
+    if candidate.error is not None:
+        return candidate
+    return detect_enrollment_face(candidate, cv2.imread(path), _registration_service)
+
+
+def main() -> None:
+    args = _parse_args()
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    from api import dependencies
+    from infrastructure.utils import map_in_processes
+    from use_cases.bulk_register_users import BulkRegisterUsersRequest
+
+    images_dir = args.images_dir or os.path.dirname(os.path.abspath(args.manifest))
+    tasks = list(_read_manifest(args.manifest, images_dir))
+    print(f"{len(tasks)} rows in {args.manifest}")
+    started = time.time()
+
+    def progress(candidates):
+        for done, candidate in enumerate(candidates, start=1):
+            if done % 50 == 0 or done == len(tasks):
+                print(f"\r{done}/{len(tasks)} faces detected ({done / (time.time() - started):.1f}/s)",
+                      end="", flush=True)
+            yield candidate
+
+    # Load the embedding model before the workers start competing for CPU
+    use_case = dependencies.get_bulk_register_users_use_case()
+    response = use_case.execute(BulkRegisterUsersRequest(
+        candidates=progress(map_in_processes(_detect, tasks, args.workers, initializer=_init_worker)),
+        embedding_batch_size=args.batch_size
+    ))
+    print()
+
+    for failure in response.failures:
+        print(f"  row {failure.row} ({failure.user_id}): {failure.error}")
+    if args.report and response.failures:
+        with open(args.report, "w", newline="", encoding="utf-8") as report:
+            writer = csv.writer(report)
+            writer.writerow(["row", "user_id", "error"])
+            writer.writerows((failure.row, failure.user_id, failure.error) for failure in response.failures)
+    if not response.success:
+        sys.exit(f"Enrollment failed, nobody was registered: {response.error}")
+    print(f"Done in {time.time() - started:.0f}s: {len(response.registered)} registered, "
+          f"{len(response.failures)} failed")
+
+
+if __name__ == "__main__":
+    main()
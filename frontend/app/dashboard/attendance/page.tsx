@@ -35,6 +35,7 @@ interface RecognizedUser {
   userName: string;
   confidence: number;
   faceImage: string; // Base64 frame from Phase 1
+  sessionId?: string; // Server-side session from Phase 1
 }
 
 export default function AttendancePage() {
@@ -90,6 +91,7 @@ export default function AttendancePage() {
           userName: response.userName,
           confidence: response.confidence,
           faceImage: capturedFrame, // Store frame from Phase 1 for Phase 2
+          sessionId: response.sessionId,
         });
         
         toast({
@@ -300,6 +302,7 @@ export default function AttendancePage() {
                 userName: recognizedUser.userName,
                 confidence: recognizedUser.confidence,
                 faceImage: recognizedUser.faceImage,
+                sessionId: recognizedUser.sessionId,
               }}
               onComplete={handlePhase2Complete}
               onError={handlePhase2Error}
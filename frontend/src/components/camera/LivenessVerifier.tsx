@@ -24,6 +24,7 @@ export interface LivenessVerifierProps {
     userName: string;
     confidence: number;
     faceImage: string; // Base64 encoded frame from Phase 1
+    sessionId?: string; // Server-side session from Phase 1
   };
   /** Callback when attendance is successfully marked */
   onComplete: () => void;
@@ -338,6 +339,9 @@ export function LivenessVerifier({
             landmarks: landmarksToSend.length > 0 ? landmarksToSend : undefined,
             userId: user.userId,
             userName: user.userName,
+            // With a session the server reuses its decoded Phase 1 face; the
+            // face image is only decoded if another API worker holds the session
+            sessionId: user.sessionId,
             faceImage: user.faceImage,
             confidence: user.confidence,
             blinkCount: currentBlinkCount, // Send frontend blink count to backend
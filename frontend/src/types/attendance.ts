@@ -31,9 +31,10 @@ export interface AttendanceFilters {
 export interface MarkAttendanceRequest {
   frames: string[]; // Base64 encoded frames for liveness verification (minimum 3)
   landmarks?: number[][][]; // Optional landmarks: [[[x, y], ...], ...] - one per frame
+  sessionId?: string; // Session from Phase 1; faceImage is still sent in case another worker holds it
   userId: string; // REQUIRED - from Phase 1 recognition
   userName: string; // REQUIRED - from Phase 1 recognition
-  faceImage: string; // REQUIRED - Base64 encoded single frame from Phase 1
+  faceImage?: string; // REQUIRED without sessionId - Base64 encoded single frame from Phase 1
   confidence: number; // REQUIRED - Recognition confidence from Phase 1 (0-1)
   faceQualityScore?: number; // Optional - Quality score from Phase 1 (0-1), will be recalculated if not provided
   location?: string; // Optional - Location where attendance is being marked
@@ -68,6 +69,7 @@ export interface RecognizeFaceResponse {
   confidence?: number; // Present when success is true, between 0 and 1
   message: string; // Success or error message
   dailyLimitReached: boolean; // True if user has reached daily attendance limit
+  sessionId?: string; // Present when success is true; pass to Phase 2 along with the face image
 }
 
 /**
@@ -5,7 +5,14 @@ Provides camera management for the application.
 """
 
 from infrastructure.camera.camera_manager import CameraManager
+from infrastructure.camera.frame_buffer import BufferedFrame, CaptureStats, FrameRingBuffer
+from infrastructure.camera.frame_source import CameraFrameSource, VideoFileSource
 
 __all__ = [
     "CameraManager",
+    "FrameRingBuffer",
+    "BufferedFrame",
+    "CaptureStats",
+    "CameraFrameSource",
+    "VideoFileSource",
 ]
@@ -3,17 +3,35 @@ Camera Manager for EyeD AI Attendance System
 
 This module provides abstracted camera operations (initialize, capture frame, release)
 for the application layer. This component follows SRP by handling ONLY camera I/O operations.
+Optionally a background grabber thread keeps reading frames into a ring buffer,
+so callers always get the newest frame instead of one queued in the driver.
 
 No domain dependencies - pure infrastructure component.
 """
 
 import cv2
 import logging
+import threading
 import numpy as np
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+from core.shared.metrics import metrics_registry
+from infrastructure.camera.frame_buffer import BufferedFrame, CaptureStats, FrameRingBuffer
 
 logger = logging.getLogger(__name__)
 
+_CAMERA_FRAMES_TOTAL = metrics_registry.counter(
+    "eyed_camera_frames_total",
+    "Camera frames by outcome (captured, failed)",
+    ("result",)
+)
+
+DEFAULT_BUFFER_SIZE = 4
+"""Frames kept by the background grabber's ring buffer."""
+
+FIRST_FRAME_TIMEOUT_SECONDS = 2.0
+"""How long capture_frame waits for the grabber's first frame."""
+
 
 class CameraManager:
     """
@@ -22,6 +40,11 @@ class CameraManager:
     This class handles ONLY camera I/O operations following the Single
     Responsibility Principle. No face detection, image processing, or
     business logic is performed here.
+    
+    By default frames are read on the caller's thread. After
+    start_capture() a daemon thread reads continuously into a
+    FrameRingBuffer; capture_frame() then returns the newest frame, and
+    get_latest_frame()/get_next_frames() give zero-copy access.
     """
     
     def __init__(self, camera_id: int = 0, settings: Optional[Dict[str, Any]] = None):
@@ -47,6 +70,11 @@ class CameraManager:
         self._camera: Optional[cv2.VideoCapture] = None
         self._is_initialized = False
         
+        # Background capture (started on start_capture() call)
+        self._buffer: Optional[FrameRingBuffer] = None
+        self._grabber: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        
         logger.debug(f"CameraManager initialized for camera_id={camera_id}, "
                     f"settings={self.settings}")
     
@@ -140,6 +168,14 @@ class CameraManager:
             logger.warning("Cannot capture frame: camera not initialized")
             return None
         
+        if self.is_capturing():
+            # Newest frame from the grabber (a copy, so it stays valid)
+            buffered = self._buffer.wait_latest(timeout=FIRST_FRAME_TIMEOUT_SECONDS, copy=True)
+            if buffered is None:
+                logger.warning("No frame from background capture")
+                return None
+            return buffered.image
+        
         try:
             ret, frame = self._camera.read()
             
@@ -153,12 +189,157 @@ class CameraManager:
             logger.error(f"Error capturing frame: {e}")
             return None
     
+    def start_capture(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> bool:
+        """
+        Start reading frames continuously on a background thread.
+        
+        Args:
+            buffer_size: Number of frames kept in the ring buffer.
+        
+        Returns:
+            True if capture is running, False if the camera is not initialized.
+        """
+        if not self.is_initialized():
+            logger.warning("Cannot start capture: camera not initialized")
+            return False
+        if self.is_capturing():
+            return True
+        
+        self._buffer = FrameRingBuffer(capacity=buffer_size)
+        self._stop_event.clear()
+        self._grabber = threading.Thread(
+            target=self._grab_loop,
+            name=f"camera-{self.camera_id}-grabber",
+            daemon=True
+        )
+        self._grabber.start()
+        logger.info(f"Camera {self.camera_id} background capture started (buffer={self._buffer.capacity})")
+        return True
+    
+    def stop_capture(self) -> None:
+        """Stop the background grabber thread (the camera stays open)."""
+        grabber = self._grabber
+        if grabber is None:
+            return
+        self._stop_event.set()
+        if grabber is not threading.current_thread():
+            grabber.join(timeout=2.0)
+        self._grabber = None
+        logger.info(f"Camera {self.camera_id} background capture stopped")
+    
+    def is_capturing(self) -> bool:
+        """Return whether the background grabber thread is running."""
+        return self._grabber is not None and self._grabber.is_alive()
+    
+    def get_latest_frame(self, copy: bool = False) -> Optional[BufferedFrame]:
+        """
+        Return the newest captured frame without waiting.
+        
+        Args:
+            copy: Return a copy instead of a view into the ring buffer. A view
+                 stays valid until buffer_size - 1 newer frames are captured.
+        
+        Returns:
+            BufferedFrame with the frame, its sequence number and capture time,
+            or None if background capture is not running or has no frame yet.
+        """
+        if self._buffer is None:
+            return None
+        return self._buffer.latest(copy=copy)
+    
+    def wait_for_frame(
+        self,
+        after: int = -1,
+        timeout: Optional[float] = None,
+        copy: bool = True
+    ) -> Optional[BufferedFrame]:
+        """
+        Wait for the newest frame captured after sequence number `after`.
+        
+        Args:
+            after: Sequence number the caller has already seen (-1: any frame).
+            timeout: Maximum seconds to wait (None waits indefinitely).
+            copy: Return a copy (default) instead of a view into the ring buffer.
+        
+        Returns:
+            BufferedFrame, or None on timeout or if background capture is not running.
+        """
+        if not self.is_capturing():
+            return None
+        return self._buffer.wait_latest(after=after, timeout=timeout, copy=copy)
+    
+    def get_next_frames(
+        self,
+        count: int,
+        timeout: Optional[float] = None,
+        copy: bool = True
+    ) -> List[BufferedFrame]:
+        """
+        Wait for the next `count` frames captured after this call.
+        
+        Args:
+            count: Number of frames to collect.
+            timeout: Maximum seconds to wait (None waits indefinitely).
+            copy: Return copies (default) instead of views into the ring buffer.
+        
+        Returns:
+            Frames in capture order; fewer than `count` on timeout, empty if
+            background capture is not running.
+        """
+        if not self.is_capturing():
+            return []
+        return self._buffer.next_frames(count, timeout=timeout, copy=copy)
+    
+    def get_capture_stats(self) -> Optional[CaptureStats]:
+        """
+        Return background capture statistics.
+        
+        Returns:
+            CaptureStats (frames captured and dropped, read failures, capture
+            rate, age of the newest frame), or None if capture never started.
+        """
+        if self._buffer is None:
+            return None
+        return self._buffer.stats()
+    
+    def _grab_loop(self) -> None:
+        """Read frames into the ring buffer until stopped."""
+        buffer = self._buffer
+        shape, dtype = None, None
+        while not self._stop_event.is_set():
+            camera = self._camera
+            if camera is None:
+                break
+            try:
+                slot = buffer.write_slot(shape, dtype) if shape is not None else None
+                ret, frame = camera.read(slot) if slot is not None else camera.read()
+                if not ret or frame is None:
+                    buffer.record_failure()
+                    _CAMERA_FRAMES_TOTAL.inc(result="failed")
+                    # Avoid spinning on a disconnected camera
+                    self._stop_event.wait(0.01)
+                    continue
+                if frame is not slot:
+                    # First frame, or the driver returned a new array (e.g. new size)
+                    shape, dtype = frame.shape, frame.dtype
+                    slot = buffer.write_slot(shape, dtype)
+                    np.copyto(slot, frame)
+                buffer.commit()
+                _CAMERA_FRAMES_TOTAL.inc(result="captured")
+            except Exception as e:
+                logger.error(f"Error in background capture: {e}")
+                buffer.record_failure()
+                _CAMERA_FRAMES_TOTAL.inc(result="failed")
+                self._stop_event.wait(0.01)
+    
     def release(self) -> None:
         """
         Release camera resources.
         
-        Cleans up OpenCV VideoCapture and resets initialization state.
+        Stops background capture, cleans up OpenCV VideoCapture and resets
+        initialization state.
         """
+        self.stop_capture()
         if self._camera is not None:
             try:
                 self._camera.release()
@@ -242,6 +423,7 @@ class CameraManager:
             'height': self._height,
             'fps': self._fps,
             'is_initialized': self.is_initialized(),
+            'is_capturing': self.is_capturing(),
         }
         
         if self.is_initialized() and self._camera:
@@ -0,0 +1,247 @@
+"""
+Frame ring buffer for EyeD AI Attendance System
+
+This module provides a small preallocated ring buffer that a camera grabber
+thread writes into and processing threads read from. Frames are stored in
+one contiguous (capacity, height, width, channels) array, so capturing does
+not allocate per frame and readers can take views instead of copies.
+
+No domain dependencies - pure infrastructure component.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class BufferedFrame:
+    """
+    A frame read from the ring buffer.
+
+    Attributes:
+        image: Frame pixels. A view into the buffer unless copied; a view stays
+              valid until capacity - 1 newer frames have been captured.
+        sequence: Capture sequence number (0 for the first frame).
+        timestamp: time.monotonic() when the frame was captured.
+    """
+    image: np.ndarray
+    sequence: int
+    timestamp: float
+
+    @property
+    def age_seconds(self) -> float:
+        """Return the seconds elapsed since the frame was captured."""
+        return time.monotonic() - self.timestamp
+
+
+@dataclass(frozen=True)
+class CaptureStats:
+    """
+    Capture statistics of a frame ring buffer.
+
+    Attributes:
+        frames_captured: Frames written to the buffer.
+        frames_dropped: Frames overwritten before any reader took them.
+        read_failures: Failed camera reads reported by the grabber.
+        capture_fps: Capture rate over the frames currently in the buffer.
+        latest_age_seconds: Age of the newest frame (None before the first frame).
+    """
+    frames_captured: int
+    frames_dropped: int
+    read_failures: int
+    capture_fps: float
+    latest_age_seconds: Optional[float]
+
+
+class FrameRingBuffer:
+    """
+    Single-writer, multi-reader ring buffer of camera frames.
+
+    This class is responsible ONLY for:
+    - Holding the last `capacity` frames in a preallocated array
+    - Handing the writer the slot to capture the next frame into
+    - Returning the latest frame or waiting for the next N frames
+    - Counting captured, dropped and failed frames
+
+    It does NOT handle:
+    - Camera I/O (see CameraManager)
+    - Frame processing
+    """
+
+    def __init__(self, capacity: int = 4):
+        """
+        Initialize the ring buffer.
+
+        Args:
+            capacity: Number of frames kept (at least 2). Storage is
+                     allocated when the first frame's shape is known.
+        """
+        self.capacity = max(2, int(capacity))
+        self._frames: Optional[np.ndarray] = None
+        self._sequences = np.full(self.capacity, -1, dtype=np.int64)
+        self._timestamps = np.zeros(self.capacity, dtype=np.float64)
+        self._taken = np.zeros(self.capacity, dtype=bool)
+        self._next_sequence = 0
+        # Frames before this one are in a previous (different shape) storage
+        self._first_sequence = 0
+        self._frames_dropped = 0
+        self._read_failures = 0
+        self._condition = threading.Condition()
+
+    def write_slot(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """
+        Return the array the next frame should be captured into.
+
+        (Re)allocates storage when the frame shape or dtype changes; frames
+        of the old storage are no longer returned. Only the writer thread may
+        call this; the frame becomes visible to readers on commit().
+
+        Args:
+            shape: Frame shape, e.g. (height, width, 3).
+            dtype: Frame dtype.
+
+        Returns:
+            Writable view of the slot for the next frame.
+        """
+        with self._condition:
+            if self._frames is None or self._frames.shape[1:] != tuple(shape) or self._frames.dtype != dtype:
+                self._frames = np.empty((self.capacity,) + tuple(shape), dtype=dtype)
+                self._sequences[:] = -1
+                self._taken[:] = False
+                self._first_sequence = self._next_sequence
+            return self._frames[self._next_sequence % self.capacity]
+
+    def commit(self, timestamp: Optional[float] = None) -> int:
+        """
+        Publish the frame written into the current write slot.
+
+        Args:
+            timestamp: Capture time (default: time.monotonic()).
+
+        Returns:
+            Sequence number of the published frame.
+        """
+        with self._condition:
+            sequence = self._next_sequence
+            slot = sequence % self.capacity
+            if self._sequences[slot] >= 0 and not self._taken[slot]:
+                self._frames_dropped += 1
+            self._sequences[slot] = sequence
+            self._timestamps[slot] = time.monotonic() if timestamp is None else timestamp
+            self._taken[slot] = False
+            self._next_sequence = sequence + 1
+            self._condition.notify_all()
+            return sequence
+
+    def record_failure(self) -> None:
+        """Count a failed camera read."""
+        with self._condition:
+            self._read_failures += 1
+
+    def latest(self, copy: bool = False) -> Optional[BufferedFrame]:
+        """
+        Return the newest frame without waiting.
+
+        Args:
+            copy: Return a copy instead of a view into the buffer.
+
+        Returns:
+            BufferedFrame, or None if no frame has been captured yet.
+        """
+        with self._condition:
+            if self._next_sequence <= self._first_sequence:
+                return None
+            return self._take(self._next_sequence - 1, copy)
+
+    def wait_latest(self, after: int = -1, timeout: Optional[float] = None, copy: bool = False) -> Optional[BufferedFrame]:
+        """
+        Return the newest frame with a sequence number greater than `after`.
+
+        Args:
+            after: Sequence number the caller has already seen (-1: any frame).
+            timeout: Maximum seconds to wait (None waits indefinitely).
+            copy: Return a copy instead of a view into the buffer.
+
+        Returns:
+            BufferedFrame, or None on timeout.
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._next_sequence - 1 > max(after, self._first_sequence - 1), timeout
+            ):
+                return None
+            return self._take(self._next_sequence - 1, copy)
+
+    def next_frames(self, count: int, timeout: Optional[float] = None, copy: bool = True) -> List[BufferedFrame]:
+        """
+        Wait for the next `count` frames captured after this call.
+
+        Frames are returned in capture order. If the caller falls behind by
+        capacity - 1 frames or more, frames that are overwritten or being
+        overwritten are skipped and counted as dropped. Views (copy=False) are only safe while fewer than
+        capacity - 1 newer frames have been captured, so use them when count
+        is small relative to capacity and frames are processed promptly.
+
+        Args:
+            count: Number of frames to collect.
+            timeout: Maximum total seconds to wait (None waits indefinitely).
+            copy: Return copies instead of views into the buffer.
+
+        Returns:
+            Up to `count` frames (fewer on timeout).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        frames: List[BufferedFrame] = []
+        with self._condition:
+            wanted = self._next_sequence
+            while len(frames) < count:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                if not self._condition.wait_for(
+                    lambda: self._next_sequence > max(wanted, self._first_sequence), remaining
+                ):
+                    break
+                # The slot of _next_sequence is being written outside the lock
+                oldest = max(self._next_sequence - self.capacity + 1, self._first_sequence)
+                if wanted < oldest:
+                    # Overwritten before this reader got to them
+                    wanted = oldest
+                frames.append(self._take(wanted, copy))
+                wanted += 1
+        return frames
+
+    def stats(self) -> CaptureStats:
+        """Return capture statistics."""
+        with self._condition:
+            captured = self._next_sequence
+            valid = self._sequences >= 0
+            timestamps = np.sort(self._timestamps[valid])
+            capture_fps = 0.0
+            if len(timestamps) > 1 and timestamps[-1] > timestamps[0]:
+                capture_fps = (len(timestamps) - 1) / float(timestamps[-1] - timestamps[0])
+            latest_age = None
+            if captured:
+                latest_age = time.monotonic() - float(self._timestamps[(captured - 1) % self.capacity])
+            return CaptureStats(
+                frames_captured=captured,
+                frames_dropped=self._frames_dropped,
+                read_failures=self._read_failures,
+                capture_fps=capture_fps,
+                latest_age_seconds=latest_age
+            )
+
+    def _take(self, sequence: int, copy: bool) -> BufferedFrame:
+        """Mark a buffered frame as taken and return it (caller holds the lock)."""
+        slot = sequence % self.capacity
+        self._taken[slot] = True
+        image = self._frames[slot]
+        return BufferedFrame(
+            image=image.copy() if copy else image,
+            sequence=sequence,
+            timestamp=float(self._timestamps[slot])
+        )
@@ -0,0 +1,176 @@
+"""
+Frame sources for EyeD AI Attendance System
+
+This module provides iterable frame sources for long-running consumers such
+as the kiosk pipeline: a live camera read through CameraManager's background
+grabber, or a recorded video file that stands in for the camera (for tests,
+benchmarks and replaying a recorded session).
+
+No domain dependencies - pure infrastructure component.
+"""
+
+import cv2
+import logging
+import threading
+import time
+import numpy as np
+from typing import Iterator, Optional
+
+from infrastructure.camera.camera_manager import CameraManager, DEFAULT_BUFFER_SIZE
+
+logger = logging.getLogger(__name__)
+
+FRAME_WAIT_TIMEOUT_SECONDS = 1.0
+"""How long a camera source waits for a new frame before checking for stop."""
+
+
+class CameraFrameSource:
+    """
+    Frame source reading a live camera.
+
+    This class is responsible ONLY for:
+    - Starting CameraManager's background grabber
+    - Yielding each new frame once, newest first (stale frames are skipped)
+
+    It does NOT handle:
+    - Camera configuration (see CameraManager)
+    - Frame processing
+    """
+
+    live = True
+    """Frames arrive in real time; consumers should drop rather than block."""
+
+    def __init__(self, camera_manager: CameraManager, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        Initialize the camera source.
+
+        Args:
+            camera_manager: Camera manager (initialized on first use if needed).
+            buffer_size: Frames kept by the grabber's ring buffer.
+        """
+        self.camera_manager = camera_manager
+        self.buffer_size = buffer_size
+        self._stop_event = threading.Event()
+
+    def frames(self) -> Iterator[np.ndarray]:
+        """
+        Yield frames until close() is called or the camera stops.
+
+        Each frame is a copy, so it stays valid after newer frames are captured.
+        """
+        camera = self.camera_manager
+        if not camera.is_initialized() and not camera.initialize():
+            raise RuntimeError(f"Failed to open camera {camera.camera_id}")
+        camera.start_capture(buffer_size=self.buffer_size)
+
+        sequence = -1
+        while not self._stop_event.is_set() and camera.is_capturing():
+            buffered = camera.wait_for_frame(
+                after=sequence, timeout=FRAME_WAIT_TIMEOUT_SECONDS, copy=True
+            )
+            if buffered is None:
+                continue
+            sequence = buffered.sequence
+            yield buffered.image
+
+    def close(self) -> None:
+        """Stop yielding frames and release the camera."""
+        self._stop_event.set()
+        self.camera_manager.release()
+
+
+class VideoFileSource:
+    """
+    Frame source reading a recorded video file.
+
+    This class is responsible ONLY for:
+    - Decoding the frames of a video file in order
+    - Optionally sampling them at a lower frame rate
+    - Optionally pacing them at the file's frame rate
+
+    It does NOT handle:
+    - Frame processing
+
+    Without pacing, every frame is yielded as fast as consumers take it, so a
+    run over the same file is deterministic. Frames skipped by sampling are
+    only grabbed, not converted to BGR images.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        realtime: bool = False,
+        loop: bool = False,
+        sample_fps: Optional[float] = None
+    ):
+        """
+        Initialize the video file source.
+
+        Args:
+            path: Path to the video file.
+            realtime: Pace frames at the file's frame rate and let consumers
+                     drop frames they cannot keep up with, like a camera.
+            loop: Restart from the first frame at the end of the file.
+            sample_fps: Yield about this many frames per second of video
+                       (None yields every frame).
+        """
+        self.path = str(path)
+        self.realtime = realtime
+        self.loop = loop
+        self.sample_fps = sample_fps
+        self._stop_event = threading.Event()
+
+    @property
+    def live(self) -> bool:
+        """Return whether frames arrive in real time (paced playback)."""
+        return self.realtime
+
+    def frames(self) -> Iterator[np.ndarray]:
+        """Yield the file's frames until it ends (unless looping) or close() is called."""
+        capture = cv2.VideoCapture(self.path)
+        if not capture.isOpened():
+            raise FileNotFoundError(f"Cannot open video file: {self.path}")
+
+        try:
+            fps = capture.get(cv2.CAP_PROP_FPS)
+            step = self.frame_step(fps)
+            interval = step / fps if self.realtime and fps > 0 else 0.0
+            next_time = time.monotonic()
+            while not self._stop_event.is_set():
+                for _ in range(step - 1):
+                    if not capture.grab():
+                        break
+                ret, frame = capture.read()
+                if not ret or frame is None:
+                    if not self.loop:
+                        break
+                    capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    ret, frame = capture.read()
+                    if not ret or frame is None:
+                        break
+                if interval:
+                    next_time += interval
+                    delay = next_time - time.monotonic()
+                    if delay > 0:
+                        self._stop_event.wait(delay)
+                yield frame
+        finally:
+            capture.release()
+
+    def frame_step(self, fps: float) -> int:
+        """
+        Return how many source frames each yielded frame stands for.
+
+        Args:
+            fps: Frame rate of the video (0 if unknown).
+
+        Returns:
+            1 without sampling or for an unknown frame rate, else round(fps / sample_fps).
+        """
+        if not self.sample_fps or fps <= 0:
+            return 1
+        return max(1, int(round(fps / self.sample_fps)))
+
+    def close(self) -> None:
+        """Stop yielding frames."""
+        self._stop_event.set()
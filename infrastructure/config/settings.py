@@ -71,6 +71,40 @@ class Settings:
             'fps': 30,
             'confidence_threshold': 0.45,
             'liveness_threshold': 0.2,
+            'liveness_ear_hysteresis': 0.0,
+            'liveness_streaming': True,
+            'liveness_sparse_stride': 1,
+            'liveness_dip_margin': 0.05,
+            'liveness_roi_input_size': 192,
+            'liveness_roi_margin': 0.25,
+            'kiosk_queue_size': 4,
+            'kiosk_lost_face_frames': 15,
+            'kiosk_track_timeout_seconds': 20.0,
+            'kiosk_cooldown_seconds': 60.0,
+            'warmup_on_startup': True,
+            'warmup_workers': 4,
+            'gallery_migration_on_startup': True,
+            'detector_pool_size': 2,
+            'embedding_skip_detection': False,
+            'recognition_batch_size': 8,
+            'recognition_batch_wait_ms': 5.0,
+            'inference_workers': 4,
+            'inference_interactive_concurrency': 0,
+            'inference_bulk_concurrency': 0,
+            'inference_aging_seconds': 2.0,
+            'recognition_cascade_model': '',
+            'gallery_precision': 'float32',
+            'cascade_accept_score': 0.6,
+            'cascade_min_margin': 0.15,
+            'embedding_backend': 'deepface',
+            'onnx_model_path': str(self._project_root / "models" / "arcface.onnx"),
+            'onnx_int8_model_path': '',
+            'onnx_use_int8': False,
+            'onnx_intra_op_threads': 0,
+            'onnx_input_mean': 0.0,
+            'onnx_input_std': 255.0,
+            'recognition_session_ttl_seconds': 120.0,
+            'recognition_session_max': 1000,
         }
     
     def _load_from_file(self, config_file: str) -> None:
@@ -124,6 +158,40 @@ class Settings:
             'EYED_FPS': 'fps',
             'EYED_CONFIDENCE_THRESHOLD': 'confidence_threshold',
             'EYED_LIVENESS_THRESHOLD': 'liveness_threshold',
+            'EYED_LIVENESS_EAR_HYSTERESIS': 'liveness_ear_hysteresis',
+            'EYED_LIVENESS_STREAMING': 'liveness_streaming',
+            'EYED_LIVENESS_SPARSE_STRIDE': 'liveness_sparse_stride',
+            'EYED_LIVENESS_DIP_MARGIN': 'liveness_dip_margin',
+            'EYED_LIVENESS_ROI_INPUT_SIZE': 'liveness_roi_input_size',
+            'EYED_LIVENESS_ROI_MARGIN': 'liveness_roi_margin',
+            'EYED_KIOSK_QUEUE_SIZE': 'kiosk_queue_size',
+            'EYED_KIOSK_LOST_FACE_FRAMES': 'kiosk_lost_face_frames',
+            'EYED_KIOSK_TRACK_TIMEOUT_SECONDS': 'kiosk_track_timeout_seconds',
+            'EYED_KIOSK_COOLDOWN_SECONDS': 'kiosk_cooldown_seconds',
+            'EYED_WARMUP_ON_STARTUP': 'warmup_on_startup',
+            'EYED_WARMUP_WORKERS': 'warmup_workers',
+            'EYED_GALLERY_MIGRATION_ON_STARTUP': 'gallery_migration_on_startup',
+            'EYED_DETECTOR_POOL_SIZE': 'detector_pool_size',
+            'EYED_EMBEDDING_SKIP_DETECTION': 'embedding_skip_detection',
+            'EYED_RECOGNITION_BATCH_SIZE': 'recognition_batch_size',
+            'EYED_RECOGNITION_BATCH_WAIT_MS': 'recognition_batch_wait_ms',
+            'EYED_INFERENCE_WORKERS': 'inference_workers',
+            'EYED_INFERENCE_INTERACTIVE_CONCURRENCY': 'inference_interactive_concurrency',
+            'EYED_INFERENCE_BULK_CONCURRENCY': 'inference_bulk_concurrency',
+            'EYED_INFERENCE_AGING_SECONDS': 'inference_aging_seconds',
+            'EYED_RECOGNITION_CASCADE_MODEL': 'recognition_cascade_model',
+            'EYED_GALLERY_PRECISION': 'gallery_precision',
+            'EYED_CASCADE_ACCEPT_SCORE': 'cascade_accept_score',
+            'EYED_CASCADE_MIN_MARGIN': 'cascade_min_margin',
+            'EYED_EMBEDDING_BACKEND': 'embedding_backend',
+            'EYED_ONNX_MODEL_PATH': 'onnx_model_path',
+            'EYED_ONNX_INT8_MODEL_PATH': 'onnx_int8_model_path',
+            'EYED_ONNX_USE_INT8': 'onnx_use_int8',
+            'EYED_ONNX_INTRA_OP_THREADS': 'onnx_intra_op_threads',
+            'EYED_ONNX_INPUT_MEAN': 'onnx_input_mean',
+            'EYED_ONNX_INPUT_STD': 'onnx_input_std',
+            'EYED_RECOGNITION_SESSION_TTL_SECONDS': 'recognition_session_ttl_seconds',
+            'EYED_RECOGNITION_SESSION_MAX': 'recognition_session_max',
         }
         
         for env_var, config_key in env_mappings.items():
@@ -276,9 +344,174 @@ class Settings:
     def liveness_threshold(self) -> float:
         """Return liveness threshold."""
         return self.get_float('liveness_threshold', 0.2)
+    
+    @property
+    def warmup_on_startup(self) -> bool:
+        """Return whether models are warmed up when the API starts."""
+        return self.get_bool('warmup_on_startup', True)
+    
+    @property
+    def warmup_workers(self) -> int:
+        """Return number of threads used to warm up models in parallel."""
+        return self.get_int('warmup_workers', 4)
+    
+    @property
+    def gallery_migration_on_startup(self) -> bool:
+        """Return whether the gallery is re-embedded at startup when its model is not the current one."""
+        return self.get_bool('gallery_migration_on_startup', True)
+    
+    @property
+    def detector_pool_size(self) -> int:
+        """Return maximum number of face detector instances per detector pool."""
+        return max(1, self.get_int('detector_pool_size', 2))
+    
+    @property
+    def embedding_skip_detection(self) -> bool:
+        """Return whether embeddings skip DeepFace's detector backend (aligned extraction)."""
+        return self.get_bool('embedding_skip_detection', False)
+    
+    @property
+    def recognition_batch_size(self) -> int:
+        """Return maximum number of concurrent /recognize faces batched together (1 disables; aligned extraction only)."""
+        return max(1, self.get_int('recognition_batch_size', 8))
+    
+    @property
+    def recognition_batch_wait_ms(self) -> float:
+        """Return maximum time in milliseconds a face waits for its recognition batch to fill."""
+        return max(0.0, self.get_float('recognition_batch_wait_ms', 5.0))
+    
+    @property
+    def inference_workers(self) -> int:
+        """Return number of worker threads shared by interactive and bulk inference."""
+        return max(1, self.get_int('inference_workers', 4))
+    
+    @property
+    def inference_interactive_concurrency(self) -> int:
+        """Return maximum workers used by interactive inference (0 means all workers)."""
+        return max(0, self.get_int('inference_interactive_concurrency', 0))
+    
+    @property
+    def inference_bulk_concurrency(self) -> int:
+        """Return maximum workers used by bulk inference (0 means all workers but one)."""
+        return max(0, self.get_int('inference_bulk_concurrency', 0))
+    
+    @property
+    def inference_aging_seconds(self) -> float:
+        """Return waiting time after which a queued task gains one priority rank (0 disables aging)."""
+        return max(0.0, self.get_float('inference_aging_seconds', 2.0))
+    
+    @property
+    def recognition_cascade_model(self) -> str:
+        """Return the fast model for cascade recognition, e.g. "SFace" (empty disables the cascade)."""
+        return str(self.get('recognition_cascade_model', '') or '').strip()
+    
+    @property
+    def gallery_precision(self) -> str:
+        """Return the precision of the cached recognition gallery ("float32", "float16" or "int8")."""
+        return str(self.get('gallery_precision', 'float32') or 'float32').strip().lower()
+    
+    @property
+    def cascade_accept_score(self) -> float:
+        """Return the minimum fast-model similarity accepted without escalating to the full model."""
+        return self.get_float('cascade_accept_score', 0.6)
+    
+    @property
+    def cascade_min_margin(self) -> float:
+        """Return the minimum top-1 over top-2 margin accepted without escalating to the full model."""
+        return self.get_float('cascade_min_margin', 0.15)
+    
+    @property
+    def embedding_backend(self) -> str:
+        """Return the embedding inference backend ("deepface" or "onnxruntime")."""
+        return str(self.get('embedding_backend', 'deepface') or 'deepface').strip().lower()
+    
+    @property
+    def onnx_model_path(self) -> str:
+        """Return the path of the exported float32 ONNX embedding model."""
+        return str(self.get('onnx_model_path', '') or '')
+    
+    @property
+    def onnx_int8_model_path(self) -> str:
+        """Return the path of the int8-quantized ONNX model (empty means "<model>.int8.onnx")."""
+        return str(self.get('onnx_int8_model_path', '') or '')
+    
+    @property
+    def onnx_use_int8(self) -> bool:
+        """Return whether the ONNX backend loads the int8-quantized model."""
+        return self.get_bool('onnx_use_int8', False)
+    
+    @property
+    def onnx_intra_op_threads(self) -> int:
+        """Return ONNX Runtime threads per operator (0 lets ONNX Runtime decide)."""
+        return max(0, self.get_int('onnx_intra_op_threads', 0))
+    
+    @property
+    def onnx_input_mean(self) -> float:
+        """Return the value subtracted from pixels before the ONNX model."""
+        return self.get_float('onnx_input_mean', 0.0)
+    
+    @property
+    def onnx_input_std(self) -> float:
+        """Return the value pixels are divided by before the ONNX model."""
+        return self.get_float('onnx_input_std', 255.0)
+    
+    @property
+    def recognition_session_ttl_seconds(self) -> float:
+        """Return how long a Phase 1 recognition session stays usable by /mark."""
+        return max(1.0, self.get_float('recognition_session_ttl_seconds', 120.0))
+    
+    @property
+    def recognition_session_max(self) -> int:
+        """Return the maximum number of recognition sessions held in memory."""
+        return max(1, self.get_int('recognition_session_max', 1000))
+    
+    @property
+    def liveness_ear_hysteresis(self) -> float:
+        """Return the EAR margin above the liveness threshold needed to count eyes as reopened."""
+        return max(0.0, self.get_float('liveness_ear_hysteresis', 0.0))
+    
+    @property
+    def liveness_streaming(self) -> bool:
+        """Return whether liveness frames are processed lazily with early exit."""
+        return self.get_bool('liveness_streaming', True)
+    
+    @property
+    def liveness_sparse_stride(self) -> int:
+        """Return the frame step of streaming liveness while the eyes are open (above 1 may miss one-frame blinks)."""
+        return max(1, self.get_int('liveness_sparse_stride', 1))
+    
+    @property
+    def liveness_dip_margin(self) -> float:
+        """Return the EAR margin above the blink threshold that switches to every-frame sampling."""
+        return max(0.0, self.get_float('liveness_dip_margin', 0.05))
+    
+    @property
+    def liveness_roi_input_size(self) -> int:
+        """Return the longest side face ROI crops are downscaled to for landmark extraction."""
+        return max(32, self.get_int('liveness_roi_input_size', 192))
+    
+    @property
+    def liveness_roi_margin(self) -> float:
+        """Return the fraction of the face ROI size added on each side of liveness crops."""
+        return max(0.0, self.get_float('liveness_roi_margin', 0.25))
 
-
-
-
-
-
+    
+    @property
+    def kiosk_queue_size(self) -> int:
+        """Return the capacity of the frame queues between kiosk pipeline stages."""
+        return max(1, self.get_int('kiosk_queue_size', 4))
+    
+    @property
+    def kiosk_lost_face_frames(self) -> int:
+        """Return the consecutive frames without landmarks after which the kiosk drops a face."""
+        return max(1, self.get_int('kiosk_lost_face_frames', 15))
+    
+    @property
+    def kiosk_track_timeout_seconds(self) -> float:
+        """Return the seconds a kiosk face may take to complete its blinks."""
+        return max(1.0, self.get_float('kiosk_track_timeout_seconds', 20.0))
+    
+    @property
+    def kiosk_cooldown_seconds(self) -> float:
+        """Return the seconds after marking during which the kiosk ignores the same user."""
+        return max(0.0, self.get_float('kiosk_cooldown_seconds', 60.0))
\ No newline at end of file
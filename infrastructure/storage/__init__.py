@@ -7,10 +7,12 @@ Provides file and CSV storage handlers for the application.
 from infrastructure.storage.file_storage import FileStorage
 from infrastructure.storage.csv_handler import CSVHandler
 from infrastructure.storage.export_formatter import ExportFormatter
+from infrastructure.storage.checkpoint_file import CheckpointFile
 
 __all__ = [
     "FileStorage",
     "CSVHandler",
     "ExportFormatter",
+    "CheckpointFile",
 ]
 
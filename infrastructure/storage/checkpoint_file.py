@@ -0,0 +1,79 @@
+"""
+Checkpoint file for resumable batch jobs.
+
+Records the keys of completed work items (e.g. photo paths) one per line,
+so an interrupted job can skip them when it is started again.
+
+No domain dependencies - pure infrastructure component.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable, Set
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointFile:
+    """
+    Append-only record of completed work item keys.
+
+    This class is responsible ONLY for:
+    - Loading the keys completed by earlier runs
+    - Durably appending newly completed keys
+
+    It does NOT handle:
+    - Deciding when a work item is complete
+    - Running or ordering the work
+
+    A line is only written after the item's results were saved, so a crash
+    can at worst redo the items since the last checkpoint. A partially
+    written last line (crash mid-write) is ignored on load.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initialize the checkpoint file.
+
+        Args:
+            file_path: Path of the checkpoint file (created on first add).
+        """
+        self.file_path = Path(file_path)
+
+    def load(self) -> Set[str]:
+        """
+        Return the keys completed so far.
+
+        Returns:
+            Set of completed keys (empty if the file does not exist).
+        """
+        if not self.file_path.exists():
+            return set()
+        with open(self.file_path, "r", encoding="utf-8") as checkpoint:
+            content = checkpoint.read()
+        lines = content.split("\n")
+        # Only newline-terminated lines were completely written
+        return {line for line in lines[:-1] if line}
+
+    def add(self, keys: Iterable[str]) -> None:
+        """
+        Append completed keys and flush them to disk.
+
+        Args:
+            keys: Keys of the completed work items (must not contain newlines).
+        """
+        lines = "".join(f"{key}\n" for key in keys)
+        if not lines:
+            return
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.file_path, "a", encoding="utf-8") as checkpoint:
+            checkpoint.write(lines)
+            checkpoint.flush()
+            os.fsync(checkpoint.fileno())
+
+    def clear(self) -> None:
+        """Delete the checkpoint so the next run starts from scratch."""
+        if self.file_path.exists():
+            self.file_path.unlink()
+            logger.info(f"Checkpoint cleared: {self.file_path}")
@@ -11,12 +11,21 @@ No domain dependencies - pure infrastructure component.
 import io
 from typing import Any, Dict, List, Optional
 import logging
-import pandas as pd
 
 from .file_storage import FileStorage
+from core.shared.metrics import metrics_registry
 
 logger = logging.getLogger(__name__)
 
+# pandas is imported inside the methods that need it: it adds ~0.4s to the
+# import of every API module that (indirectly) depends on this handler.
+
+_OPERATION_SECONDS = metrics_registry.histogram(
+    "eyed_csv_operation_seconds",
+    "Latency of CSV file operations in seconds",
+    ("operation",)
+)
+
 
 class CSVHandler:
     """
@@ -41,6 +50,7 @@ class CSVHandler:
         self.file_storage = file_storage
         logger.debug("CSVHandler initialized")
     
+    @_OPERATION_SECONDS.time(operation="read_csv")
     def read_csv(self, file_path: str) -> List[Dict[str, Any]]:
         """
         Read CSV file and return list of dictionaries.
@@ -58,6 +68,8 @@ class CSVHandler:
             logger.debug(f"CSV file does not exist: {file_path}, returning empty list")
             return []
         
+        import pandas as pd
+        
         try:
             # Read file content using FileStorage
             csv_content = self.file_storage.read_text_file(file_path, encoding="utf-8")
@@ -85,6 +97,7 @@ class CSVHandler:
             logger.error(f"Unexpected error reading CSV file: {file_path} - {e}")
             return []
     
+    @_OPERATION_SECONDS.time(operation="write_csv")
     def write_csv(
         self,
         file_path: str,
@@ -105,6 +118,8 @@ class CSVHandler:
         Returns:
             True on success, False on failure
         """
+        import pandas as pd
+        
         try:
             # Determine headers
             if headers is None:
@@ -143,6 +158,7 @@ class CSVHandler:
             logger.error(f"Unexpected error writing CSV file: {file_path} - {e}")
             return False
     
+    @_OPERATION_SECONDS.time(operation="append_csv")
     def append_csv(
         self,
         file_path: str,
@@ -160,23 +176,53 @@ class CSVHandler:
         Returns:
             True on success, False on failure
         """
+        return self._append_rows(file_path, [row])
+    
+    @_OPERATION_SECONDS.time(operation="append_rows")
+    def append_rows(
+        self,
+        file_path: str,
+        rows: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Append several rows to CSV file with one read and one write.
+        
+        Creates file with headers (from the first row) if it doesn't exist.
+        
+        Args:
+            file_path: Path to the CSV file
+            rows: Dictionaries representing the rows to append
+            
+        Returns:
+            True on success (or nothing to append), False on failure
+        """
+        if not rows:
+            return True
+        return self._append_rows(file_path, rows)
+    
+    def _append_rows(
+        self,
+        file_path: str,
+        rows: List[Dict[str, Any]]
+    ) -> bool:
+        """Append rows by rewriting the file once (see append_csv)."""
         try:
             # Check if file exists
             if not self.csv_exists(file_path):
-                # Create new file with headers from the row
+                # Create new file with headers from the first row
                 logger.debug(f"CSV file does not exist, creating new file: {file_path}")
-                return self.write_csv(file_path, [row], headers=list(row.keys()))
+                return self.write_csv(file_path, rows, headers=list(rows[0].keys()))
             
             # Read existing data
             existing_data = self.read_csv(file_path)
             
-            # Append new row
-            existing_data.append(row)
+            # Append new rows
+            existing_data.extend(rows)
             
-            # Get headers (from existing file or from new row)
+            # Get headers (from existing file or from the first new row)
             headers = self.get_headers(file_path)
             if not headers:
-                headers = list(row.keys())
+                headers = list(rows[0].keys())
             
             # Write all data back
             return self.write_csv(file_path, existing_data, headers=headers)
@@ -185,6 +231,7 @@ class CSVHandler:
             logger.error(f"Unexpected error appending to CSV file: {file_path} - {e}")
             return False
     
+    @_OPERATION_SECONDS.time(operation="filter_csv")
     def filter_csv(
         self,
         file_path: str,
@@ -257,6 +304,8 @@ class CSVHandler:
             logger.debug(f"CSV file does not exist: {file_path}")
             return []
         
+        import pandas as pd
+        
         try:
             # Read file content using FileStorage
             csv_content = self.file_storage.read_text_file(file_path, encoding="utf-8")
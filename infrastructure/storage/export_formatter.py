@@ -12,8 +12,6 @@ import logging
 from datetime import datetime
 from typing import List, Tuple, Union
 
-import pandas as pd
-
 from domain.entities.attendance_record import AttendanceRecord
 
 logger = logging.getLogger(__name__)
@@ -68,6 +66,8 @@ class ExportFormatter:
         Returns:
             Tuple of (CSV string, filename).
         """
+        import pandas as pd
+
         # Convert records to list of dictionaries
         data = self._records_to_dict_list(records)
         
@@ -119,6 +119,8 @@ class ExportFormatter:
         Returns:
             Tuple of (Excel bytes, filename).
         """
+        import pandas as pd
+
         # Convert records to list of dictionaries
         data = self._records_to_dict_list(records)
         
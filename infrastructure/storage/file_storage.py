@@ -8,12 +8,45 @@ No domain dependencies - pure infrastructure component.
 """
 
 import os
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, Iterator, List, Optional, Tuple
 import logging
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 logger = logging.getLogger(__name__)
 
+# Poll interval of blocking locks on Windows (msvcrt cannot wait indefinitely)
+_LOCK_POLL_SECONDS = 0.05
+
+
+def _try_lock(handle: IO[bytes]) -> bool:
+    """Try to take an exclusive lock on an open file without waiting."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(handle: IO[bytes]) -> None:
+    """Release a lock taken with _try_lock."""
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    else:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
 
 class FileStorage:
     """
@@ -91,13 +124,15 @@ class FileStorage:
             logger.error(error_msg)
             raise IOError(error_msg) from e
     
-    def write_file(self, file_path: str, content: bytes) -> bool:
+    def write_file(self, file_path: str, content: bytes, atomic: bool = False) -> bool:
         """
         Write content to file.
         
         Args:
             file_path: Path to the file to write
             content: Content to write as bytes
+            atomic: Write to a temporary file and rename it over the target, so
+                readers (and crashes) see either the old or the new content
             
         Returns:
             True on success, False on failure
@@ -108,8 +143,16 @@ class FileStorage:
             # Create parent directories if needed
             resolved_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(resolved_path, 'wb') as f:
-                f.write(content)
+            if atomic:
+                temp_path = resolved_path.with_name(f".{resolved_path.name}.tmp")
+                with open(temp_path, 'wb') as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, resolved_path)
+            else:
+                with open(resolved_path, 'wb') as f:
+                    f.write(content)
             
             logger.debug(f"Wrote {len(content)} bytes to {resolved_path}")
             return True
@@ -170,7 +213,13 @@ class FileStorage:
             logger.error(error_msg)
             raise IOError(error_msg) from e
     
-    def write_text_file(self, file_path: str, content: str, encoding: str = "utf-8") -> bool:
+    def write_text_file(
+        self,
+        file_path: str,
+        content: str,
+        encoding: str = "utf-8",
+        atomic: bool = False
+    ) -> bool:
         """
         Write text content to file.
         
@@ -178,6 +227,8 @@ class FileStorage:
             file_path: Path to the file to write
             content: Content to write as string
             encoding: Text encoding (default: utf-8)
+            atomic: Write to a temporary file and rename it over the target, so
+                readers (and crashes) see either the old or the new content
             
         Returns:
             True on success, False on failure
@@ -188,8 +239,16 @@ class FileStorage:
             # Create parent directories if needed
             resolved_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(resolved_path, 'w', encoding=encoding) as f:
-                f.write(content)
+            if atomic:
+                temp_path = resolved_path.with_name(f".{resolved_path.name}.tmp")
+                with open(temp_path, 'w', encoding=encoding) as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, resolved_path)
+            else:
+                with open(resolved_path, 'w', encoding=encoding) as f:
+                    f.write(content)
             
             logger.debug(f"Wrote text file: {resolved_path} ({len(content)} characters)")
             return True
@@ -206,6 +265,39 @@ class FileStorage:
             logger.error(f"Unexpected error writing file: {resolved_path} - {e}")
             return False
     
+    def append_text_file(self, file_path: str, content: str, encoding: str = "utf-8") -> bool:
+        """
+        Append text content to file and flush it to disk.
+        
+        Args:
+            file_path: Path to the file to append to (created if missing)
+            content: Content to append as string
+            encoding: Text encoding (default: utf-8)
+            
+        Returns:
+            True on success, False on failure
+        """
+        resolved_path = self._resolve_path(file_path)
+        
+        try:
+            resolved_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(resolved_path, 'a', encoding=encoding) as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            
+            logger.debug(f"Appended to text file: {resolved_path} ({len(content)} characters)")
+            return True
+        except PermissionError as e:
+            logger.error(f"Permission denied appending to file: {resolved_path} - {e}")
+            return False
+        except IOError as e:
+            logger.error(f"I/O error appending to file: {resolved_path} - {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error appending to file: {resolved_path} - {e}")
+            return False
+    
     def file_exists(self, file_path: str) -> bool:
         """
         Check if file exists.
@@ -221,6 +313,57 @@ class FileStorage:
         logger.debug(f"File exists check: {resolved_path} -> {exists}")
         return exists
     
+    def get_file_version(self, file_path: str) -> Optional[Tuple[int, int, int]]:
+        """
+        Get a token that changes whenever the file is written or replaced.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            (modification time in ns, size, inode), or None if the file does not exist
+        """
+        try:
+            stat = self._resolve_path(file_path).stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    
+    @contextmanager
+    def lock(self, lock_path: str, blocking: bool = True) -> Iterator[bool]:
+        """
+        Hold an exclusive lock on a lock file while the context is active.
+        
+        The lock is advisory and works across processes (e.g. uvicorn
+        workers and CLI scripts) as well as threads, since each holder opens
+        the lock file itself. It is released when the holder exits, even if
+        the process dies. Locks are not reentrant.
+        
+        Args:
+            lock_path: Path to the lock file (created if missing)
+            blocking: Wait for the lock; if False, give up immediately
+            
+        Yields:
+            True if the lock is held, False if blocking is False and another
+            holder has it
+        """
+        resolved_path = self._resolve_path(lock_path)
+        resolved_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(resolved_path, 'a+b') as handle:
+            acquired = _try_lock(handle)
+            if not acquired and blocking:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                else:
+                    while not _try_lock(handle):
+                        time.sleep(_LOCK_POLL_SECONDS)
+                acquired = True
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    _unlock(handle)
+    
     def delete_file(self, file_path: str) -> bool:
         """
         Delete file.
@@ -6,9 +6,11 @@ format handling, and other cross-cutting infrastructure operations.
 """
 
 from infrastructure.utils.image_converter import ImageConverter
+from infrastructure.utils.process_pool import map_in_processes
 
 __all__ = [
     "ImageConverter",
+    "map_in_processes",
 ]
 
 
@@ -0,0 +1,57 @@
+"""
+Process Pool Utility - EyeD AI Attendance System
+
+This module runs CPU-bound per-item work (image decoding, face detection)
+in worker processes for the bulk command-line tools.
+
+No business logic, no domain dependencies.
+"""
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_in_processes(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    workers: int,
+    initializer: Optional[Callable[[], None]] = None,
+    max_in_flight: Optional[int] = None
+) -> Iterator[R]:
+    """
+    Apply func to every item in worker processes and yield the results in order.
+
+    Unlike Executor.map, items are submitted lazily: at most max_in_flight
+    results wait in memory, so a slow consumer (e.g. batched embedding)
+    does not make the workers decode the whole input ahead of it.
+
+    Workers are started with "spawn": the caller usually holds model
+    runtimes with their own threads, which must not be forked.
+
+    Args:
+        func: Picklable top-level function run in the workers.
+        items: Picklable work items.
+        workers: Number of worker processes.
+        initializer: Optional picklable function run once per worker (e.g. to
+                     load a model into a module-level variable).
+        max_in_flight: Items submitted but not yet yielded (default: 4 per worker).
+
+    Yields:
+        func(item) for each item, in input order.
+    """
+    workers = max(1, int(workers))
+    max_in_flight = max_in_flight or workers * 4
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=initializer) as executor:
+        in_flight = deque()
+        for item in items:
+            in_flight.append(executor.submit(func, item))
+            if len(in_flight) >= max_in_flight:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
@@ -0,0 +1,15 @@
+"""
+Kiosk package.
+
+On-device attendance runtime that drives a camera (or a recorded video)
+through the domain services without the HTTP API.
+"""
+
+from kiosk.pipeline import KioskConfig, KioskPipeline, KioskReport, StageStats
+
+__all__ = [
+    "KioskPipeline",
+    "KioskConfig",
+    "KioskReport",
+    "StageStats",
+]
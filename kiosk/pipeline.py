@@ -0,0 +1,571 @@
+"""
+Kiosk pipeline.
+
+Runs attendance on a kiosk PC without the HTTP API: frames from a camera (or
+a recorded video standing in for it) flow through overlapping stages on
+their own threads, connected by bounded queues:
+
+    capture -> detect (+ quality gate) -> recognize (embed + match)
+                     \\-> liveness (landmarks + blink counting) -> mark
+
+Detection only runs while nobody is being tracked. Once a face passes the
+quality gate a track starts: recognition runs once for it while liveness
+follows the face in every frame and counts blinks, so embedding and blink
+verification overlap. When the track has an identity and enough blinks, it
+ends and attendance is written through MarkAttendanceUseCase and the
+existing repositories while detection looks for the next face.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Tuple
+import logging
+import queue
+import threading
+import time
+
+import numpy as np
+
+from core.shared.metrics import metrics_registry
+from domain.shared.constants import MIN_BLINKS_REQUIRED
+from domain.shared.exceptions import FaceDetectionFailedError, InsufficientQualityError
+from use_cases.mark_attendance import MarkAttendanceRequest, MarkAttendanceResponse
+from use_cases.recognize_face import RecognizeFaceResponse
+
+logger = logging.getLogger(__name__)
+
+_STAGE_SECONDS = metrics_registry.histogram(
+    "eyed_kiosk_stage_seconds",
+    "Kiosk pipeline time per processed item by stage",
+    ("stage",)
+)
+
+STAGES = ("capture", "detect", "recognize", "liveness", "mark")
+
+_END = object()
+"""Queue sentinel marking the end of the frame stream."""
+
+FaceRoi = Tuple[int, int, int, int]
+
+
+class FrameSourceProtocol(Protocol):
+    """Protocol for frame sources (see infrastructure.camera.frame_source)."""
+
+    live: bool
+    """Whether frames arrive in real time (stale frames are dropped, not queued)."""
+
+    def frames(self) -> Iterator[np.ndarray]:
+        """Yield BGR frames until the source ends or is closed."""
+        ...
+
+    def close(self) -> None:
+        """Stop yielding frames."""
+        ...
+
+
+class FaceRecognitionServiceProtocol(Protocol):
+    """Protocol for the detection and quality gate stage."""
+
+    def detect_and_assess_face_with_location(self, image: np.ndarray) -> Tuple[np.ndarray, Any, Any]:
+        """Return (face crop, QualityResult, FaceLocation) or raise detection/quality errors."""
+        ...
+
+
+class RecognizeFaceUseCaseProtocol(Protocol):
+    """Protocol for the recognition stage."""
+
+    def execute_for_face(
+        self,
+        face_image: np.ndarray,
+        face_quality_score: float,
+        location: Optional[str] = None,
+        face_roi: Optional[FaceRoi] = None
+    ) -> RecognizeFaceResponse:
+        """Recognize an already detected face."""
+        ...
+
+
+class MarkAttendanceUseCaseProtocol(Protocol):
+    """Protocol for the marking stage."""
+
+    def execute(self, request: MarkAttendanceRequest) -> MarkAttendanceResponse:
+        """Verify liveness and write the attendance record."""
+        ...
+
+
+class LandmarkExtractorProtocol(Protocol):
+    """Protocol for the liveness stage's landmark extractor."""
+
+    def extract_eye_points(
+        self,
+        face_image: np.ndarray,
+        roi: Optional[FaceRoi] = None,
+        full_frame_fallback: bool = True
+    ) -> Optional[np.ndarray]:
+        """Return the 12 EAR eye points (normalized) or None if no face."""
+        ...
+
+    def face_roi_from_eye_points(self, eye_points: np.ndarray, image_shape: Tuple[int, ...]) -> FaceRoi:
+        """Return a face box around the eye points, in pixels."""
+        ...
+
+
+class BlinkDetectorProtocol(Protocol):
+    """Protocol for the liveness stage's blink detector."""
+
+    def detect_eye_points(self, eye_points: np.ndarray) -> Any:
+        """Advance the blink counter by one frame."""
+        ...
+
+    def get_blink_count(self) -> int:
+        """Return the blinks counted since the last reset."""
+        ...
+
+    def reset_counter(self) -> None:
+        """Reset the blink counter."""
+        ...
+
+
+@dataclass
+class KioskConfig:
+    """Kiosk pipeline configuration."""
+    location: str = "kiosk"  # Location written to attendance records (selects the roster)
+    device_info: str = "kiosk"
+    queue_size: int = 4  # Capacity of the frame queues between stages
+    min_blinks: int = MIN_BLINKS_REQUIRED
+    lost_face_frames: int = 15  # Consecutive frames without landmarks that end a track
+    track_timeout_seconds: float = 20.0  # A track without enough blinks ends after this
+    redetect_interval: int = 5  # Frames skipped by detection after a rejected track
+    cooldown_seconds: float = 60.0  # A user marked recently is not marked again
+
+
+@dataclass
+class StageStats:
+    """Throughput counters of one pipeline stage."""
+    processed: int = 0
+    dropped: int = 0
+    busy_seconds: float = 0.0
+
+    def throughput(self, elapsed_seconds: float) -> float:
+        """Return items processed per second of wall time."""
+        return self.processed / elapsed_seconds if elapsed_seconds > 0 else 0.0
+
+    def capacity(self) -> float:
+        """Return items per second the stage could sustain (1 / mean busy time)."""
+        return self.processed / self.busy_seconds if self.busy_seconds > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class KioskReport:
+    """
+    Summary of a kiosk pipeline run.
+
+    Attributes:
+        elapsed_seconds: Wall time of the run.
+        stages: StageStats per stage name (see STAGES).
+        tracks_started: Faces that passed detection and the quality gate.
+        marked: Attendance records written, as (user_id, user_name).
+        rejected: Tracks that ended without attendance, by reason.
+    """
+    elapsed_seconds: float
+    stages: Dict[str, StageStats]
+    tracks_started: int
+    marked: List[Tuple[str, str]]
+    rejected: Dict[str, int]
+
+    @property
+    def fps(self) -> float:
+        """Return frames captured per second."""
+        return self.stages["capture"].throughput(self.elapsed_seconds)
+
+    def summary(self) -> str:
+        """Return a human-readable multi-line summary."""
+        lines = [
+            f"Kiosk run: {self.elapsed_seconds:.1f}s, {self.fps:.1f} fps captured, "
+            f"{self.tracks_started} tracks, {len(self.marked)} marked"
+        ]
+        for name in STAGES:
+            stats = self.stages[name]
+            lines.append(
+                f"  {name:<10} processed {stats.processed:>6}  dropped {stats.dropped:>5}  "
+                f"{stats.throughput(self.elapsed_seconds):7.1f}/s  capacity {stats.capacity():7.1f}/s"
+            )
+        if self.rejected:
+            reasons = ", ".join(f"{reason}={count}" for reason, count in sorted(self.rejected.items()))
+            lines.append(f"  rejected tracks: {reasons}")
+        return "\n".join(lines)
+
+
+@dataclass
+class _Track:
+    """A face followed from detection until it is marked or lost."""
+    track_id: int
+    face_roi: Optional[FaceRoi]
+    face_image: np.ndarray
+    face_quality_score: float
+    started_at: float
+    recognition: Optional[RecognizeFaceResponse] = None
+    blink_count: int = 0  # Published by the liveness stage
+    missed_frames: int = 0
+    closed: bool = False  # Rejected, lost or handed to the mark stage
+
+
+class KioskPipeline:
+    """
+    Pipelined on-device attendance runtime.
+
+    This class is responsible ONLY for:
+    - Running capture, detection, recognition, liveness and marking as
+      concurrent stages connected by bounded queues
+    - Following one face at a time from detection to marking
+    - Reporting per-stage throughput
+
+    It does NOT handle:
+    - Detection, recognition or blink logic (delegated to domain services
+      and use cases)
+    - Persistence (delegated to MarkAttendanceUseCase and its repositories)
+
+    Live sources drop the oldest queued frame when detection falls behind, so
+    the pipeline always works on fresh frames; file sources block instead, so
+    every frame is processed.
+    """
+
+    def __init__(
+        self,
+        face_recognition_service: FaceRecognitionServiceProtocol,
+        recognize_face_use_case: RecognizeFaceUseCaseProtocol,
+        mark_attendance_use_case: MarkAttendanceUseCaseProtocol,
+        landmark_extractor: LandmarkExtractorProtocol,
+        blink_detector: BlinkDetectorProtocol,
+        config: Optional[KioskConfig] = None,
+        on_marked: Optional[Callable[[MarkAttendanceResponse], None]] = None
+    ):
+        """
+        Initialize the kiosk pipeline.
+
+        Args:
+            face_recognition_service: Service used for detection and the quality gate.
+            recognize_face_use_case: Use case matching detected faces.
+            mark_attendance_use_case: Use case writing attendance records.
+            landmark_extractor: Extractor of eye points for liveness.
+            blink_detector: Blink detector (reset for every track; used only
+                           by the liveness thread).
+            config: Pipeline configuration.
+            on_marked: Optional callback for every successful attendance.
+        """
+        self.face_recognition_service = face_recognition_service
+        self.recognize_face_use_case = recognize_face_use_case
+        self.mark_attendance_use_case = mark_attendance_use_case
+        self.landmark_extractor = landmark_extractor
+        self.blink_detector = blink_detector
+        self.config = config or KioskConfig()
+        self.on_marked = on_marked
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._stats: Dict[str, StageStats] = {}
+        self._track: Optional[_Track] = None
+        self._track_count = 0
+        self._frame_index = 0
+        self._next_detection_frame = 0
+        self._last_marked: Dict[str, float] = {}
+        self._marked: List[Tuple[str, str]] = []
+        self._rejected: Dict[str, int] = {}
+        self._mark_queue: Optional["queue.Queue"] = None
+
+    def run(self, source: FrameSourceProtocol, max_frames: Optional[int] = None) -> KioskReport:
+        """
+        Run the pipeline until the source ends, max_frames is reached or stop() is called.
+
+        Args:
+            source: Frame source (camera or video file).
+            max_frames: Optional number of frames after which capture stops.
+
+        Returns:
+            KioskReport with per-stage throughput and marked users.
+        """
+        size = max(1, self.config.queue_size)
+        frames_queue: "queue.Queue" = queue.Queue(maxsize=size)
+        faces_queue: "queue.Queue" = queue.Queue(maxsize=1)
+        liveness_queue: "queue.Queue" = queue.Queue(maxsize=size)
+        mark_queue: "queue.Queue" = queue.Queue(maxsize=1)
+        self._stop_event.clear()
+        self._stats = {name: StageStats() for name in STAGES}
+        self._mark_queue = mark_queue
+
+        threads = {
+            "capture": threading.Thread(
+                target=self._capture_loop, args=(source, frames_queue, max_frames), daemon=True
+            ),
+            "detect": threading.Thread(
+                target=self._detect_loop, args=(frames_queue, faces_queue, liveness_queue), daemon=True
+            ),
+            "recognize": threading.Thread(target=self._recognize_loop, args=(faces_queue,), daemon=True),
+            "liveness": threading.Thread(target=self._liveness_loop, args=(liveness_queue,), daemon=True),
+            "mark": threading.Thread(target=self._mark_loop, args=(mark_queue,), daemon=True),
+        }
+        for name, thread in threads.items():
+            thread.name = f"kiosk-{name}"
+
+        start = time.perf_counter()
+        for thread in threads.values():
+            thread.start()
+        try:
+            for name in ("capture", "detect", "recognize", "liveness"):
+                threads[name].join()
+        except KeyboardInterrupt:
+            logger.info("Kiosk interrupted; draining pipeline")
+            self.stop()
+            source.close()
+            for name in ("capture", "detect", "recognize", "liveness"):
+                threads[name].join()
+        # Recognition and liveness can both hand a track to the mark stage
+        mark_queue.put(_END)
+        threads["mark"].join()
+        elapsed = time.perf_counter() - start
+
+        report = KioskReport(
+            elapsed_seconds=elapsed,
+            stages=self._stats,
+            tracks_started=self._track_count,
+            marked=list(self._marked),
+            rejected=dict(self._rejected)
+        )
+        logger.info(report.summary())
+        return report
+
+    def stop(self) -> None:
+        """Ask the capture stage to stop; queued frames are still processed."""
+        self._stop_event.set()
+
+    def _capture_loop(self, source: FrameSourceProtocol, frames_queue: "queue.Queue", max_frames: Optional[int]) -> None:
+        """Read frames from the source into the frame queue."""
+        stats = self._stats["capture"]
+        try:
+            for frame in source.frames():
+                if self._stop_event.is_set():
+                    break
+                stats.processed += 1
+                if not source.live:
+                    frames_queue.put(frame)
+                else:
+                    while True:
+                        try:
+                            frames_queue.put_nowait(frame)
+                            break
+                        except queue.Full:
+                            # Detection is behind; keep the freshest frames
+                            try:
+                                frames_queue.get_nowait()
+                                stats.dropped += 1
+                            except queue.Empty:
+                                pass
+                if max_frames is not None and stats.processed >= max_frames:
+                    break
+        except Exception as e:
+            logger.error(f"Kiosk capture failed: {e}", exc_info=True)
+        finally:
+            source.close()
+            frames_queue.put(_END)
+
+    def _detect_loop(self, frames_queue: "queue.Queue", faces_queue: "queue.Queue", liveness_queue: "queue.Queue") -> None:
+        """Start a track on the first good face; route frames of a track to liveness."""
+        stats = self._stats["detect"]
+        while True:
+            frame = frames_queue.get()
+            if frame is _END:
+                break
+            with self._lock:
+                self._frame_index += 1
+                frame_index = self._frame_index
+                track = self._track
+            if track is not None:
+                liveness_queue.put((track, frame))
+                continue
+            if frame_index < self._next_detection_frame:
+                stats.dropped += 1
+                continue
+
+            started = time.perf_counter()
+            try:
+                face_image, quality_result, location = (
+                    self.face_recognition_service.detect_and_assess_face_with_location(frame)
+                )
+            except (FaceDetectionFailedError, InsufficientQualityError):
+                continue
+            except Exception as e:
+                logger.warning(f"Kiosk detection failed: {e}")
+                continue
+            finally:
+                self._record("detect", started)
+
+            with self._lock:
+                self._track_count += 1
+                track = _Track(
+                    track_id=self._track_count,
+                    face_roi=(location.x, location.y, location.width, location.height),
+                    face_image=face_image,
+                    face_quality_score=quality_result.overall_score,
+                    started_at=time.monotonic()
+                )
+                self._track = track
+            faces_queue.put(track)
+            liveness_queue.put((track, frame))
+
+        faces_queue.put(_END)
+        liveness_queue.put(_END)
+
+    def _recognize_loop(self, faces_queue: "queue.Queue") -> None:
+        """Recognize the face of each new track."""
+        while True:
+            track = faces_queue.get()
+            if track is _END:
+                break
+            started = time.perf_counter()
+            response = self.recognize_face_use_case.execute_for_face(
+                track.face_image,
+                track.face_quality_score,
+                location=self.config.location,
+                face_roi=track.face_roi
+            )
+            self._record("recognize", started)
+
+            with self._lock:
+                track.recognition = response
+                if not response.success:
+                    reason = "daily_limit" if response.daily_limit_reached else "not_recognized"
+                    self._close_track(track, reason)
+                    continue
+                marked_at = self._last_marked.get(response.user_id)
+                if marked_at is not None and time.monotonic() - marked_at < self.config.cooldown_seconds:
+                    self._close_track(track, "cooldown")
+                    continue
+            self._maybe_mark(track)
+
+    def _liveness_loop(self, liveness_queue: "queue.Queue") -> None:
+        """Follow the tracked face and count its blinks."""
+        config = self.config
+        current_track_id = None
+        while True:
+            item = liveness_queue.get()
+            if item is _END:
+                break
+            track, frame = item
+            if track.closed:
+                self._stats["liveness"].dropped += 1
+                continue
+            if track.track_id != current_track_id:
+                current_track_id = track.track_id
+                self.blink_detector.reset_counter()
+
+            started = time.perf_counter()
+            # Only the tracked face counts: another face elsewhere in the frame must not keep the track alive
+            eye_points = self.landmark_extractor.extract_eye_points(
+                frame, roi=track.face_roi, full_frame_fallback=False
+            )
+            if eye_points is None:
+                track.missed_frames += 1
+                self._record("liveness", started)
+                if track.missed_frames >= config.lost_face_frames:
+                    with self._lock:
+                        self._close_track(track, "lost")
+                continue
+
+            track.missed_frames = 0
+            track.face_roi = self.landmark_extractor.face_roi_from_eye_points(eye_points, frame.shape)
+            self.blink_detector.detect_eye_points(eye_points)
+            self._record("liveness", started)
+
+            if time.monotonic() - track.started_at > config.track_timeout_seconds:
+                with self._lock:
+                    self._close_track(track, "timeout")
+                continue
+            self._maybe_mark(track, self.blink_detector.get_blink_count())
+
+    def _mark_loop(self, mark_queue: "queue.Queue") -> None:
+        """Write attendance for tracks whose blinks the liveness stage verified."""
+        while True:
+            item = mark_queue.get()
+            if item is _END:
+                break
+            track, blink_count = item
+            recognition = track.recognition
+            started = time.perf_counter()
+            response = self.mark_attendance_use_case.execute(MarkAttendanceRequest(
+                frames_sequence=[],
+                user_id=recognition.user_id or "",
+                user_name=recognition.user_name or "",
+                face_image=track.face_image,
+                face_quality_score=track.face_quality_score,
+                confidence=recognition.confidence or 0.0,
+                device_info=self.config.device_info,
+                location=self.config.location,
+                session_id=recognition.session_id,
+                face_roi=track.face_roi,
+                liveness_verified=True
+            ))
+            self._record("mark", started)
+
+            with self._lock:
+                if response.success:
+                    self._marked.append((recognition.user_id, recognition.user_name))
+                    logger.info(f"Kiosk marked attendance for {recognition.user_name} "
+                                f"({recognition.user_id}, {blink_count} blinks)")
+                else:
+                    logger.warning(f"Kiosk could not mark {recognition.user_id}: {response.error}")
+                    self._last_marked.pop(recognition.user_id, None)
+                    self._rejected["mark_failed"] = self._rejected.get("mark_failed", 0) + 1
+            if response.success and self.on_marked is not None:
+                self.on_marked(response)
+
+    def _maybe_mark(self, track: _Track, blink_count: Optional[int] = None) -> None:
+        """
+        Hand a track to the mark stage once it is recognized and has enough blinks.
+
+        Called by the recognition stage (identity known) and the liveness
+        stage (blink counted), whichever completes the track last. The track
+        ends here, so detection can start on the next face while the record
+        is written; the cooldown keeps the same face from being marked again.
+
+        Args:
+            track: Track to check.
+            blink_count: Blinks counted so far; None to use the count the
+                        liveness stage last published.
+        """
+        with self._lock:
+            if blink_count is not None:
+                track.blink_count = blink_count
+            blinks = track.blink_count
+            recognition = track.recognition
+            if (track.closed or recognition is None or not recognition.success
+                    or blinks < self.config.min_blinks):
+                return
+            self._close_track(track, None)
+            # Start the cooldown now so a returning face cannot race the write
+            self._last_marked[recognition.user_id] = time.monotonic()
+        self._mark_queue.put((track, blinks))
+
+    def _close_track(self, track: _Track, reason: Optional[str]) -> None:
+        """
+        End a track (caller holds the lock) and let detection look for a new face.
+
+        Args:
+            track: Track to end.
+            reason: Rejection reason to count, or None for a completed track.
+        """
+        if track.closed:
+            return
+        track.closed = True
+        if reason is not None:
+            self._rejected[reason] = self._rejected.get(reason, 0) + 1
+            # Give a rejected face a moment before detecting it again
+            self._next_detection_frame = self._frame_index + self.config.redetect_interval
+        if self._track is track:
+            self._track = None
+
+    def _record(self, stage: str, started: float) -> None:
+        """Count one processed item of a stage and its busy time."""
+        seconds = time.perf_counter() - started
+        stats = self._stats[stage]
+        stats.processed += 1
+        stats.busy_seconds += seconds
+        _STAGE_SECONDS.observe(seconds, stage=stage)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Re-embed the face gallery with the current embedding model.
+
+Run this after changing DEFAULT_EMBEDDING_MODEL, the inference backend or
+the ONNX model file (or to upgrade a gallery from before the model was
+recorded whose embeddings have another dimension). Stored face images are
+decoded in worker processes and embedded in batches. Embeddings are staged
+next to the live gallery, which keeps serving (the API embeds probes with the
+gallery's model meanwhile) until every user is staged and the new gallery is
+swapped in with one atomic write. An interrupted run continues with the users
+not staged yet.
+
+With --no-swap the embeddings are only staged, e.g. ahead of deploying the
+new model; the API then swaps them in at startup without re-embedding.
+
+Usage:
+    python reembed_gallery.py
+    python reembed_gallery.py --no-swap --workers 4
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+# Per-process face repository (set by _init_worker)
+_face_repository = None
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Re-embed the face gallery with the current model")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) - 1),
+                        help="Image decoding processes (default: CPU count - 1)")
+    parser.add_argument("--batch-size", type=int, default=32, help="Faces embedded per batch (default: 32)")
+    parser.add_argument("--no-swap", action="store_true", help="Only stage the new embeddings")
+    parser.add_argument("--allow-missing", action="store_true",
+                        help="Swap even if some users could not be re-embedded (they keep their old embedding)")
+    parser.add_argument("--restart", action="store_true", help="Discard embeddings staged by an earlier run")
+    return parser.parse_args()
+
+
+def _init_worker() -> None:
+    """Open the face repository once per worker process."""
+    global _face_repository
+    from api import dependencies
+
+    _face_repository = dependencies.get_face_repository()
+
+
+def _load(face):
+    """Decode one stored face image (runs in a worker process)."""
+    if face.image_path is not None:
+        face.face_image = _face_repository.get_face_image(face.user_id, face.image_path)
+    return face
+
+
+def main() -> None:
+    args = _parse_args()
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    from api import dependencies
+    from infrastructure.utils import map_in_processes
+    from use_cases.reembed_gallery import ReembedGalleryRequest
+
+    # Load the embedding model before the workers start competing for CPU
+    use_case = dependencies.get_reembed_gallery_use_case()
+    if args.restart:
+        dependencies.get_face_repository().clear_staged_gallery(use_case.model_name)
+    print(f"Gallery model: {use_case.gallery_model() or 'unrecorded'}, current model: {use_case.model_name}")
+    if use_case.is_current():
+        print("Gallery already uses the current model; nothing to migrate")
+        return
+
+    pending = use_case.pending_faces()
+    print(f"{use_case.staged_count()} users already staged, {len(pending)} to embed")
+    started = time.time()
+
+    def report(progress) -> None:
+        elapsed = time.time() - started
+        rate = progress.embedded / elapsed if elapsed > 0 else 0.0
+        print(f"\r{progress.embedded + progress.failed}/{len(pending)} users ({rate:.1f}/s), "
+              f"{progress.failed} failed", end="", flush=True)
+
+    response = use_case.execute(ReembedGalleryRequest(
+        faces=map_in_processes(_load, pending, args.workers, initializer=_init_worker) if pending else [],
+        embedding_batch_size=args.batch_size,
+        swap=not args.no_swap,
+        allow_missing=args.allow_missing,
+        progress_callback=report
+    ))
+    print()
+
+    for user_id in response.failed_users:
+        print(f"  failed: {user_id}")
+    if not response.success:
+        sys.exit(f"Gallery not swapped: {response.error}")
+    state = f"swapped to {response.model_name}" if response.swapped else "staged (not swapped)"
+    print(f"Done in {time.time() - started:.0f}s: {response.embedded} embedded, "
+          f"{len(response.failed_users)} failed, gallery {state}")
+
+
+if __name__ == "__main__":
+    main()
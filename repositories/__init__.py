@@ -7,9 +7,13 @@ Provides data access implementations for the application.
 from repositories.user_repository import UserRepository
 from repositories.attendance_repository import AttendanceRepository
 from repositories.face_repository import FaceRepository
+from repositories.roster_repository import RosterRepository
+from repositories.session_repository import SessionRepository
 
 __all__ = [
     "UserRepository",
     "AttendanceRepository",
     "FaceRepository",
+    "RosterRepository",
+    "SessionRepository",
 ]
@@ -9,15 +9,24 @@ domain/entities/attendance_record.py and delegates CSV operations to CSVHandler.
 """
 
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import date, time, datetime
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Set, Tuple
 
 from domain.entities.attendance_record import AttendanceRecord
 from domain.shared.exceptions import DomainException
 from infrastructure.storage.csv_handler import CSVHandler
+from core.shared.metrics import metrics_registry
 
 logger = logging.getLogger(__name__)
 
+_OPERATION_SECONDS = metrics_registry.histogram(
+    "eyed_repository_operation_seconds",
+    "Latency of repository operations in seconds",
+    ("repository", "operation")
+)
+
 
 class AttendanceRepository:
     """
@@ -26,6 +35,14 @@ class AttendanceRepository:
     This class handles ONLY attendance data persistence (CRUD operations).
     It follows SRP by delegating CSV operations to CSVHandler and working
     with AttendanceRecord domain entities.
+    
+    It also maintains an in-memory (date, user_id) -> count index so daily
+    limit checks do not parse the whole CSV. Today's counts are loaded at
+    construction, other days on first query; the index is updated together
+    with every write made through this repository. The index is keyed on
+    the CSV's file version: once another process (e.g. a CLI script or
+    another uvicorn worker) has written the CSV, it is dropped and each day
+    is re-indexed on its next query.
     """
     
     # CSV column names
@@ -48,13 +65,37 @@ class AttendanceRepository:
         
         self.csv_handler = csv_handler
         self.data_file = data_file
+        # Held by every read-modify-write of the CSV, also by other processes
+        # (uvicorn workers, the kiosk and the CLI scripts)
+        self.lock_file = f"{data_file}.lock"
+        
+        # Guards CSV writes together with the per-day count index
+        self._lock = threading.RLock()
+        self._day_counts: Dict[Tuple[date, str], int] = {}
+        self._indexed_days: Set[date] = set()
+        self._indexed_version: Any = None  # CSV file version the index reflects
         
         # Initialize CSV file with headers if it doesn't exist
-        if not self.csv_handler.csv_exists(self.data_file):
-            self._initialize_csv_file()
+        with self._writing():
+            if not self.csv_handler.csv_exists(self.data_file):
+                self._initialize_csv_file()
+        
+        self._reset_index()
+        self._index_day(date.today())
         
         logger.info(f"AttendanceRepository initialized with file: {self.data_file}")
     
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """
+        Hold the in-process lock and the CSV's file lock.
+        
+        Appends rewrite the whole file, so a writer in another process that
+        does not wait for this one would drop its rows.
+        """
+        with self._lock, self.csv_handler.file_storage.lock(self.lock_file):
+            yield
+    
     def _initialize_csv_file(self) -> None:
         """Initialize CSV file with headers if it doesn't exist."""
         try:
@@ -72,6 +113,7 @@ class AttendanceRepository:
         except Exception as e:
             logger.error(f"Error initializing CSV file: {e}")
     
+    @_OPERATION_SECONDS.time(repository="attendance", operation="add_attendance")
     def add_attendance(self, record: AttendanceRecord) -> bool:
         """
         Persist new attendance record.
@@ -87,7 +129,12 @@ class AttendanceRepository:
             csv_row = self._entity_to_csv_row(record)
             
             # Append to CSV file
-            success = self.csv_handler.append_csv(self.data_file, csv_row)
+            with self._writing():
+                stale = self._index_is_stale()
+                success = self.csv_handler.append_csv(self.data_file, csv_row)
+                if success:
+                    self._adjust_day_count(record.date, record.user_id, 1)
+                    self._index_written(stale)
             
             if success:
                 logger.info(f"Attendance record added: {record.record_id} for user {record.user_id}")
@@ -100,6 +147,44 @@ class AttendanceRepository:
             logger.error(f"Error adding attendance record: {e}")
             return False
     
+    @_OPERATION_SECONDS.time(repository="attendance", operation="add_attendance_batch")
+    def add_attendance_batch(self, records: List[AttendanceRecord]) -> bool:
+        """
+        Persist several new attendance records with a single CSV write.
+        
+        Either all records are written or none.
+        
+        Args:
+            records: AttendanceRecord domain entities to persist
+            
+        Returns:
+            True on success (or if there is nothing to add), False on failure
+        """
+        if not records:
+            return True
+        try:
+            csv_rows = [self._entity_to_csv_row(record) for record in records]
+            
+            with self._writing():
+                stale = self._index_is_stale()
+                success = self.csv_handler.append_rows(self.data_file, csv_rows)
+                if success:
+                    for record in records:
+                        self._adjust_day_count(record.date, record.user_id, 1)
+                    self._index_written(stale)
+            
+            if success:
+                logger.info(f"Added {len(records)} attendance records in one write")
+            else:
+                logger.error(f"Failed to add {len(records)} attendance records")
+            
+            return success
+            
+        except Exception as e:
+            logger.error(f"Error adding attendance records: {e}")
+            return False
+    
+    @_OPERATION_SECONDS.time(repository="attendance", operation="get_attendance_history")
     def get_attendance_history(
         self,
         user_id: Optional[str] = None,
@@ -159,6 +244,7 @@ class AttendanceRepository:
             logger.error(f"Error retrieving attendance history: {e}")
             return []
     
+    @_OPERATION_SECONDS.time(repository="attendance", operation="get_attendance_by_id")
     def get_attendance_by_id(self, record_id: str) -> Optional[AttendanceRecord]:
         """
         Retrieve single attendance record by ID.
@@ -194,6 +280,7 @@ class AttendanceRepository:
             logger.error(f"Error retrieving attendance record by ID: {e}")
             return None
     
+    @_OPERATION_SECONDS.time(repository="attendance", operation="update_attendance")
     def update_attendance(self, record_id: str, record: AttendanceRecord) -> bool:
         """
         Update existing attendance record.
@@ -206,33 +293,38 @@ class AttendanceRepository:
             True on success, False on failure
         """
         try:
-            # Read all data from CSV
-            csv_data = self.csv_handler.read_csv(self.data_file)
-            
-            if not csv_data:
-                logger.warning(f"Cannot update: no data in CSV file")
-                return False
-            
-            # Find and update the record
-            updated = False
-            for i, row in enumerate(csv_data):
-                if row.get('Session_ID') == record_id:
-                    # Convert entity to CSV row and update
-                    updated_row = self._entity_to_csv_row(record)
-                    csv_data[i] = updated_row
-                    updated = True
-                    break
-            
-            if not updated:
-                logger.warning(f"Attendance record not found for update: {record_id}")
-                return False
-            
-            # Write updated data back to CSV
-            headers = self.csv_handler.get_headers(self.data_file)
-            if not headers:
-                headers = self.CSV_COLUMNS
-            
-            success = self.csv_handler.write_csv(self.data_file, csv_data, headers=headers)
+            with self._writing():
+                stale = self._index_is_stale()
+                # Read all data from CSV
+                csv_data = self.csv_handler.read_csv(self.data_file)
+                
+                if not csv_data:
+                    logger.warning(f"Cannot update: no data in CSV file")
+                    return False
+                
+                # Find and update the record
+                replaced_row = None
+                for i, row in enumerate(csv_data):
+                    if row.get('Session_ID') == record_id:
+                        # Convert entity to CSV row and update
+                        replaced_row = row
+                        csv_data[i] = self._entity_to_csv_row(record)
+                        break
+                
+                if replaced_row is None:
+                    logger.warning(f"Attendance record not found for update: {record_id}")
+                    return False
+                
+                # Write updated data back to CSV
+                headers = self.csv_handler.get_headers(self.data_file)
+                if not headers:
+                    headers = self.CSV_COLUMNS
+                
+                success = self.csv_handler.write_csv(self.data_file, csv_data, headers=headers)
+                if success:
+                    self._adjust_row_count(replaced_row, -1)
+                    self._adjust_day_count(record.date, record.user_id, 1)
+                    self._index_written(stale)
             
             if success:
                 logger.info(f"Attendance record updated: {record_id}")
@@ -245,6 +337,7 @@ class AttendanceRepository:
             logger.error(f"Error updating attendance record: {e}")
             return False
     
+    @_OPERATION_SECONDS.time(repository="attendance", operation="delete_attendance")
     def delete_attendance(self, record_id: str) -> bool:
         """
         Delete attendance record by ID.
@@ -256,27 +349,33 @@ class AttendanceRepository:
             True on success, False on failure
         """
         try:
-            # Read all data from CSV
-            csv_data = self.csv_handler.read_csv(self.data_file)
-            
-            if not csv_data:
-                logger.warning(f"Cannot delete: no data in CSV file")
-                return False
-            
-            # Find and remove the record
-            original_count = len(csv_data)
-            csv_data = [row for row in csv_data if row.get('Session_ID') != record_id]
-            
-            if len(csv_data) == original_count:
-                logger.warning(f"Attendance record not found for deletion: {record_id}")
-                return False
-            
-            # Write updated data back to CSV
-            headers = self.csv_handler.get_headers(self.data_file)
-            if not headers:
-                headers = self.CSV_COLUMNS
-            
-            success = self.csv_handler.write_csv(self.data_file, csv_data, headers=headers)
+            with self._writing():
+                stale = self._index_is_stale()
+                # Read all data from CSV
+                csv_data = self.csv_handler.read_csv(self.data_file)
+                
+                if not csv_data:
+                    logger.warning(f"Cannot delete: no data in CSV file")
+                    return False
+                
+                # Find and remove the record
+                removed_rows = [row for row in csv_data if row.get('Session_ID') == record_id]
+                csv_data = [row for row in csv_data if row.get('Session_ID') != record_id]
+                
+                if not removed_rows:
+                    logger.warning(f"Attendance record not found for deletion: {record_id}")
+                    return False
+                
+                # Write updated data back to CSV
+                headers = self.csv_handler.get_headers(self.data_file)
+                if not headers:
+                    headers = self.CSV_COLUMNS
+                
+                success = self.csv_handler.write_csv(self.data_file, csv_data, headers=headers)
+                if success:
+                    for row in removed_rows:
+                        self._adjust_row_count(row, -1)
+                    self._index_written(stale)
             
             if success:
                 logger.info(f"Attendance record deleted: {record_id}")
@@ -289,6 +388,101 @@ class AttendanceRepository:
             logger.error(f"Error deleting attendance record: {e}")
             return False
     
+    def count_for_day(self, user_id: str, day: date) -> int:
+        """
+        Count a user's attendance records on a given day.
+        
+        Served from the in-memory index; the first query for a day other
+        than today, and the first query after another process wrote the
+        CSV, loads that day's counts from the CSV.
+        
+        Args:
+            user_id: User ID to count records for
+            day: Day to count records on
+            
+        Returns:
+            Number of attendance records of the user on that day
+        """
+        with self._lock:
+            if self._index_is_stale():
+                self._reset_index()
+            if day not in self._indexed_days:
+                self._index_day(day)
+            return self._day_counts.get((day, str(user_id)), 0)
+    
+    def _csv_version(self) -> Any:
+        """Return the CSV's current file version (see FileStorage.get_file_version)."""
+        return self.csv_handler.file_storage.get_file_version(self.data_file)
+    
+    def _index_is_stale(self) -> bool:
+        """Return True if the CSV was written since the index was last synced with it."""
+        return self._csv_version() != self._indexed_version
+    
+    def _reset_index(self) -> None:
+        """Drop all indexed days; they are re-indexed from the current CSV on query."""
+        self._day_counts.clear()
+        self._indexed_days.clear()
+        self._indexed_version = self._csv_version()
+    
+    def _index_written(self, stale: bool) -> None:
+        """
+        Sync the index version after a write made through this repository.
+        
+        Args:
+            stale: Whether the CSV had changed before the write; the write
+                    then also saved another process's rows the index lacks
+        """
+        if stale:
+            self._reset_index()
+        else:
+            self._indexed_version = self._csv_version()
+    
+    def _index_day(self, day: date) -> None:
+        """
+        Load the per-user record counts of one day into the index.
+        
+        Args:
+            day: Day to index
+        """
+        with self._lock:
+            counts: Dict[Tuple[date, str], int] = {}
+            try:
+                for row in self.csv_handler.read_csv(self.data_file):
+                    try:
+                        row_date = self._parse_date_from_csv(row.get('Date'))
+                    except ValueError:
+                        continue
+                    if row_date == day:
+                        key = (day, str(row.get('ID', '')))
+                        counts[key] = counts.get(key, 0) + 1
+            except Exception as e:
+                # Leave the day unindexed so the next query retries
+                logger.error(f"Error indexing attendance for {day}: {e}")
+                return
+            
+            self._day_counts.update(counts)
+            self._indexed_days.add(day)
+            logger.debug(f"Indexed {sum(counts.values())} attendance records for {day}")
+    
+    def _adjust_day_count(self, day: date, user_id: str, delta: int) -> None:
+        """Apply a count change to an indexed day (unindexed days are loaded on query)."""
+        if day not in self._indexed_days:
+            return
+        key = (day, str(user_id))
+        count = self._day_counts.get(key, 0) + delta
+        if count > 0:
+            self._day_counts[key] = count
+        else:
+            self._day_counts.pop(key, None)
+    
+    def _adjust_row_count(self, row: Dict[str, Any], delta: int) -> None:
+        """Apply a count change for a raw CSV row, ignoring rows with invalid dates."""
+        try:
+            row_date = self._parse_date_from_csv(row.get('Date'))
+        except ValueError:
+            return
+        self._adjust_day_count(row_date, row.get('ID', ''), delta)
+    
     def _entity_to_csv_row(self, record: AttendanceRecord) -> Dict[str, Any]:
         """
         Convert AttendanceRecord domain entity to CSV row format.
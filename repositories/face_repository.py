@@ -8,11 +8,12 @@ This repository works with the FaceEmbedding domain entity and uses
 FileStorage for all file operations.
 """
 
+import functools
 import pickle
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, ContextManager, Dict, List, Optional, Any, Tuple, TypeVar
 from pathlib import Path
 
 import numpy as np
@@ -21,9 +22,32 @@ import cv2
 from domain.entities.face_embedding import FaceEmbedding
 from domain.shared.exceptions import DomainException
 from infrastructure.storage.file_storage import FileStorage
+from core.shared.metrics import metrics_registry
 
 logger = logging.getLogger(__name__)
 
+_OPERATION_SECONDS = metrics_registry.histogram(
+    "eyed_repository_operation_seconds",
+    "Latency of repository operations in seconds",
+    ("repository", "operation")
+)
+_CACHE_REQUESTS_TOTAL = metrics_registry.counter(
+    "eyed_cache_requests_total",
+    "Cache lookups, by cache and result (hit or miss)",
+    ("cache", "result")
+)
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def _holding_gallery_lock(method: _Method) -> _Method:
+    """Run a read-modify-write of faces.json or the pickle cache under the gallery lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.file_storage.lock(self.gallery_lock_file):
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class FaceRepository:
     """
@@ -39,7 +63,8 @@ class FaceRepository:
         file_storage: FileStorage,
         faces_dir: str = "data/faces",
         embeddings_file: str = "data/faces/embeddings_cache.pkl",
-        faces_json_file: str = "data/faces/faces.json"
+        faces_json_file: str = "data/faces/faces.json",
+        embedding_model: Optional[str] = None
     ):
         """
         Initialize face repository.
@@ -49,6 +74,9 @@ class FaceRepository:
             faces_dir: Directory for face images
             embeddings_file: Path to embeddings cache (pickle format) - for backward compatibility
             faces_json_file: Path to faces.json file (contains legacy format embeddings)
+            embedding_model: ID of the model (and inference backend, see
+                embedding_model_id) that produces the primary embeddings
+                written through this repository (recorded in the gallery metadata)
         """
         if file_storage is None:
             raise ValueError("file_storage cannot be None")
@@ -57,6 +85,9 @@ class FaceRepository:
         self.faces_dir = faces_dir
         self.embeddings_file = embeddings_file
         self.faces_json_file = faces_json_file
+        self.embedding_model = embedding_model
+        # Shared with UserRepository: every writer of faces.json holds it
+        self.gallery_lock_file = f"{faces_json_file}.lock"
         
         # Ensure directories exist
         if not self.file_storage.directory_exists(self.faces_dir):
@@ -109,6 +140,39 @@ class FaceRepository:
             }
         return cache
     
+    def _record_embedding_model(
+        self,
+        metadata: Dict[str, Any],
+        embedded_user_ids: List[str],
+        written_user_ids: List[str]
+    ) -> None:
+        """
+        Record the embedding model in a gallery's metadata on a primary write.
+        
+        The model is recorded only while the gallery has no embeddings of
+        another model: once recorded it is changed only by swap_gallery, and a
+        gallery with older unrecorded embeddings stays unrecorded.
+        
+        Args:
+            metadata: Metadata dictionary of faces.json or the pickle cache
+            embedded_user_ids: Users with a primary embedding after the write
+            written_user_ids: Users whose primary embedding this write stores
+        """
+        if self.embedding_model is None or metadata.get("embedding_model"):
+            return
+        if set(embedded_user_ids) <= set(written_user_ids):
+            metadata["embedding_model"] = self.embedding_model
+    
+    @staticmethod
+    def _json_embedded_user_ids(data: Dict[str, Any]) -> List[str]:
+        """Return the users with a primary embedding in faces.json data."""
+        return [
+            user_id for user_id, user_data in data.items()
+            if user_id not in ("users", "metadata") and isinstance(user_data, dict)
+            and "embedding" in user_data
+        ]
+    
+    @_OPERATION_SECONDS.time(repository="face", operation="store_face_image")
     def store_face_image(
         self,
         user_id: str,
@@ -166,6 +230,7 @@ class FaceRepository:
             logger.error(error_msg)
             raise DomainException(error_msg, "IMAGE_STORAGE_ERROR") from e
     
+    @_OPERATION_SECONDS.time(repository="face", operation="get_face_image")
     def get_face_image(self, user_id: str, image_path: str) -> Optional[np.ndarray]:
         """
         Retrieve face image by path.
@@ -211,6 +276,8 @@ class FaceRepository:
             logger.error(f"Error retrieving face image {image_path}: {e}")
             return None
     
+    @_OPERATION_SECONDS.time(repository="face", operation="store_face_embeddings")
+    @_holding_gallery_lock
     def store_face_embeddings(
         self,
         user_id: str,
@@ -298,6 +365,7 @@ class FaceRepository:
             if "metadata" not in data:
                 data["metadata"] = {}
             data["metadata"]["last_updated"] = datetime.now().isoformat()
+            self._record_embedding_model(data["metadata"], self._json_embedded_user_ids(data), [user_id])
             
             # Save to faces.json
             json_content = json.dumps(data, indent=2, default=str)
@@ -319,6 +387,105 @@ class FaceRepository:
                 "error": f"Failed to store face embeddings: {str(e)}"
             }
     
+    @_OPERATION_SECONDS.time(repository="face", operation="store_enrollments")
+    @_holding_gallery_lock
+    def store_enrollments(self, enrollments: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Store the face images and faces.json entries of many new users at once.
+        
+        faces.json is read once and replaced atomically once: either every
+        accepted user is registered or none is. Images of a failed write are
+        deleted again.
+        
+        Args:
+            enrollments: One dictionary per user with keys:
+                - 'user_id': str
+                - 'name': str (full name for legacy format)
+                - 'embedding': np.ndarray
+                - 'face_image': np.ndarray
+                - 'registration_date': str or datetime
+                - 'face_bbox': list [x, y, width, height] or None
+                - 'model_embeddings': optional dict of model name -> np.ndarray
+        
+        Returns:
+            Dictionary with 'success' (bool), 'stored' (list of user IDs) and
+            'errors' (user_id -> message for rejected users) keys, and 'error'
+            (str) if the write failed
+        """
+        stored_images: List[str] = []
+        try:
+            if self.file_storage.file_exists(self.faces_json_file):
+                data = json.loads(self.file_storage.read_text_file(self.faces_json_file))
+            else:
+                data = {"metadata": {}}
+            users = data.get("users", {})
+            
+            stored: List[str] = []
+            errors: Dict[str, str] = {}
+            for enrollment in enrollments:
+                user_id = enrollment.get("user_id")
+                if not user_id or not str(user_id).strip():
+                    errors[str(user_id)] = "user_id cannot be None or empty"
+                    continue
+                if user_id in ("users", "metadata") or user_id in data or user_id in users:
+                    errors[user_id] = f"User {user_id} already exists"
+                    continue
+                try:
+                    image_path = self.store_face_image(user_id, enrollment["face_image"])
+                except Exception as e:
+                    errors[user_id] = str(e)
+                    continue
+                stored_images.append(image_path)
+                
+                registration_date = enrollment.get("registration_date") or datetime.now()
+                entry = {
+                    "name": enrollment.get("name") or user_id,
+                    "registration_date": (
+                        registration_date.isoformat() if isinstance(registration_date, datetime)
+                        else str(registration_date)
+                    ),
+                    "embedding": np.asarray(enrollment["embedding"]).tolist(),
+                    "image_path": Path(image_path).name
+                }
+                if enrollment.get("face_bbox") is not None:
+                    entry["face_bbox"] = enrollment["face_bbox"]
+                if enrollment.get("model_embeddings"):
+                    entry["model_embeddings"] = {
+                        model_name: np.asarray(embedding).tolist()
+                        for model_name, embedding in enrollment["model_embeddings"].items()
+                    }
+                data[user_id] = entry
+                stored.append(user_id)
+            
+            if stored:
+                metadata = data.setdefault("metadata", {})
+                metadata["last_updated"] = datetime.now().isoformat()
+                metadata["total_users"] = len(users) + sum(
+                    1 for key, value in data.items()
+                    if key not in ("users", "metadata") and isinstance(value, dict)
+                    and "name" in value and "embedding" in value
+                )
+                self._record_embedding_model(metadata, self._json_embedded_user_ids(data), stored)
+                json_content = json.dumps(data, indent=2, default=str)
+                if not self.file_storage.write_text_file(self.faces_json_file, json_content, atomic=True):
+                    raise IOError(f"Failed to write {self.faces_json_file}")
+            
+            logger.info(f"Enrolled {len(stored)} users in one write ({len(errors)} rejected)")
+            return {"success": True, "stored": stored, "errors": errors}
+            
+        except Exception as e:
+            logger.error(f"Error storing enrollments: {e}")
+            for image_path in stored_images:
+                self.file_storage.delete_file(image_path)
+            return {
+                "success": False,
+                "stored": [],
+                "errors": {},
+                "error": f"Failed to store enrollments: {str(e)}"
+            }
+    
+    @_OPERATION_SECONDS.time(repository="face", operation="store_face_embedding")
+    @_holding_gallery_lock
     def store_face_embedding(
         self,
         user_id: str,
@@ -370,6 +537,7 @@ class FaceRepository:
             # Update metadata
             cache["metadata"]["total_embeddings"] = len(cache["embeddings"])
             cache["metadata"]["last_updated"] = datetime.now().isoformat()
+            self._record_embedding_model(cache["metadata"], list(cache["embeddings"]), [user_id])
             
             # Save back using FileStorage
             updated_cache_bytes = pickle.dumps(cache)
@@ -384,6 +552,7 @@ class FaceRepository:
             logger.error(f"Error storing face embedding for user {user_id}: {e}")
             return False
     
+    @_OPERATION_SECONDS.time(repository="face", operation="get_face_embedding")
     def get_face_embedding(self, user_id: str) -> Optional[FaceEmbedding]:
         """
         Retrieve face embedding for user from legacy format or pickle cache.
@@ -439,6 +608,7 @@ class FaceRepository:
                 cache = pickle.loads(cache_bytes)
                 
                 if user_id in cache.get("embeddings", {}):
+                    _CACHE_REQUESTS_TOTAL.inc(cache="embeddings_pickle", result="hit")
                     embedding_data = cache["embeddings"][user_id]
                     
                     embedding = FaceEmbedding(
@@ -451,6 +621,7 @@ class FaceRepository:
                     logger.debug(f"Face embedding retrieved for user {user_id} from pickle cache")
                     return embedding
             
+            _CACHE_REQUESTS_TOTAL.inc(cache="embeddings_pickle", result="miss")
             logger.debug(f"No embeddings found for user {user_id}")
             return None
             
@@ -526,6 +697,7 @@ class FaceRepository:
             logger.error(f"Error loading legacy embeddings from JSON: {e}")
             return {}
     
+    @_OPERATION_SECONDS.time(repository="face", operation="get_all_face_embeddings")
     def get_all_face_embeddings(self) -> Dict[str, FaceEmbedding]:
         """
         Retrieve all face embeddings from legacy format (faces.json) and pickle cache.
@@ -582,6 +754,343 @@ class FaceRepository:
         logger.info(f"Retrieved {len(embeddings)} face embeddings (legacy + cache)")
         return embeddings
     
+    def get_gallery_version(self) -> Tuple[Any, Any]:
+        """
+        Get a token that changes whenever the stored embeddings may have changed.
+        
+        Callers keep derived data (e.g. a matching gallery) until the token
+        changes. Writes by other processes change it too.
+        
+        Returns:
+            Versions of faces.json and the pickle cache
+        """
+        return (
+            self.file_storage.get_file_version(self.faces_json_file),
+            self.file_storage.get_file_version(self.embeddings_file)
+        )
+    
+    def store_model_embedding(
+        self,
+        user_id: str,
+        model_name: str,
+        embedding: np.ndarray
+    ) -> Dict[str, Any]:
+        """
+        Store an embedding from an additional model (e.g. the cascade's fast model).
+        
+        Stored in the user's faces.json entry under "model_embeddings", next to
+        the primary "embedding", so both galleries share the user's lifecycle.
+        
+        Args:
+            user_id: ID of the user (must already have a faces.json entry)
+            model_name: Name of the model that produced the embedding
+            embedding: Face embedding as numpy array
+        
+        Returns:
+            Dictionary with 'success' (bool) key, and optionally 'error' (str) key
+        """
+        if embedding is None or not isinstance(embedding, np.ndarray):
+            return {"success": False, "error": "embedding must be a numpy array"}
+        
+        result = self.store_model_embeddings(model_name, {user_id: embedding})
+        if result["success"] and user_id not in result["stored"]:
+            return {"success": False, "error": f"No face data for user {user_id}"}
+        return {key: value for key, value in result.items() if key in ("success", "error")}
+    
+    @_OPERATION_SECONDS.time(repository="face", operation="store_model_embeddings")
+    @_holding_gallery_lock
+    def store_model_embeddings(self, model_name: str, embeddings: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """
+        Store many users' embeddings from an additional model in one write.
+        
+        faces.json is read once and replaced atomically once. Users without a
+        faces.json entry are skipped.
+        
+        Args:
+            model_name: Name of the model that produced the embeddings
+            embeddings: Dictionary mapping user_id to embedding
+        
+        Returns:
+            Dictionary with 'success' (bool) and 'stored' (list of user IDs)
+            keys, and optionally 'error' (str) key
+        """
+        try:
+            if not self.file_storage.file_exists(self.faces_json_file):
+                return {"success": True, "stored": []}
+            data = json.loads(self.file_storage.read_text_file(self.faces_json_file))
+            
+            stored = []
+            for user_id, embedding in embeddings.items():
+                if user_id in ("users", "metadata") or not isinstance(data.get(user_id), dict):
+                    logger.warning(f"No face data for user {user_id}; skipping {model_name} embedding")
+                    continue
+                data[user_id].setdefault("model_embeddings", {})[model_name] = np.asarray(embedding).tolist()
+                stored.append(user_id)
+            if not stored:
+                return {"success": True, "stored": []}
+            data.setdefault("metadata", {})["last_updated"] = datetime.now().isoformat()
+            
+            json_content = json.dumps(data, indent=2, default=str)
+            if self.file_storage.write_text_file(self.faces_json_file, json_content, atomic=True):
+                logger.info(f"{model_name} embeddings stored for {len(stored)} users")
+                return {"success": True, "stored": stored}
+            return {"success": False, "stored": [], "error": "Failed to save model embeddings to faces.json"}
+        except Exception as e:
+            logger.error(f"Error storing {model_name} embeddings: {e}")
+            return {"success": False, "stored": [], "error": f"Failed to store model embeddings: {str(e)}"}
+    
+    @_OPERATION_SECONDS.time(repository="face", operation="get_model_embeddings")
+    def get_model_embeddings(self, model_name: str) -> Dict[str, np.ndarray]:
+        """
+        Retrieve all users' embeddings from an additional model.
+        
+        Args:
+            model_name: Name of the model
+        
+        Returns:
+            Dictionary mapping user_id to embedding (users without one are omitted)
+        """
+        try:
+            if not self.file_storage.file_exists(self.faces_json_file):
+                return {}
+            data = json.loads(self.file_storage.read_text_file(self.faces_json_file))
+        except Exception as e:
+            logger.error(f"Error loading {model_name} embeddings from JSON: {e}")
+            return {}
+        
+        embeddings = {}
+        for user_id, user_data in data.items():
+            if user_id in ["users", "metadata"] or not isinstance(user_data, dict):
+                continue
+            embedding_list = user_data.get("model_embeddings", {}).get(model_name)
+            if isinstance(embedding_list, list):
+                embeddings[user_id] = np.array(embedding_list, dtype=np.float32)
+        return embeddings
+    
+    def get_gallery_model(self) -> Optional[str]:
+        """
+        Get the ID of the model that produced the gallery's primary embeddings.
+        
+        Returns:
+            Model ID recorded in faces.json metadata (or in the pickle
+            cache's, if faces.json holds no embeddings), or None for galleries
+            written before the model was recorded
+        """
+        try:
+            if self.file_storage.file_exists(self.faces_json_file):
+                data = json.loads(self.file_storage.read_text_file(self.faces_json_file))
+                model_name = data.get("metadata", {}).get("embedding_model")
+                if model_name or self._json_embedded_user_ids(data):
+                    return model_name
+            if not self.file_storage.file_exists(self.embeddings_file):
+                return None
+            cache = pickle.loads(self.file_storage.read_file(self.embeddings_file))
+            return cache.get("metadata", {}).get("embedding_model")
+        except Exception as e:
+            logger.error(f"Error reading gallery model: {e}")
+            return None
+    
+    def get_user_names(self) -> Dict[str, str]:
+        """
+        Get the display name of every user with a name in faces.json.
+        
+        FaceEmbedding entities carry no name, so callers that label matches
+        look names up here.
+        
+        Returns:
+            Dictionary mapping user_id to name (users without one are omitted)
+        """
+        try:
+            if not self.file_storage.file_exists(self.faces_json_file):
+                return {}
+            data = json.loads(self.file_storage.read_text_file(self.faces_json_file))
+        except Exception as e:
+            logger.error(f"Error loading user names from JSON: {e}")
+            return {}
+        
+        return {
+            user_id: user_data["name"]
+            for user_id, user_data in data.items()
+            if user_id not in ["users", "metadata"]
+            and isinstance(user_data, dict) and user_data.get("name")
+        }
+    
+    def gallery_job_lock(self, job_name: str) -> ContextManager[bool]:
+        """
+        Claim a long-running gallery job (e.g. a sync or migration) for this process.
+        
+        Every uvicorn worker starts the same background jobs; only the one
+        that gets the lock should run a job. The lock is released when the
+        context exits or the process dies.
+        
+        Args:
+            job_name: Name of the job
+        
+        Returns:
+            Context manager yielding True if this process holds the job,
+            False if another process is running it
+        """
+        return self.file_storage.lock(str(Path(self.faces_dir) / f".{job_name}.lock"), blocking=False)
+    
+    def _gallery_staging_file(self, model_name: str) -> str:
+        """Return the path of the staging file for a gallery migration to model_name."""
+        return str(Path(self.faces_dir) / f"gallery_{model_name}.staging.jsonl")
+    
+    @_OPERATION_SECONDS.time(repository="face", operation="stage_gallery_embeddings")
+    def stage_gallery_embeddings(self, model_name: str, embeddings: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """
+        Durably record re-extracted embeddings for a gallery migration.
+        
+        Staged embeddings are appended to a per-model staging file and are not
+        used for recognition until swap_gallery replaces the primary ones.
+        The staging file doubles as the migration's checkpoint.
+        
+        Args:
+            model_name: Model the embeddings were extracted with
+            embeddings: Dictionary mapping user_id to embedding
+        
+        Returns:
+            Dictionary with 'success' (bool) key, and optionally 'error' (str) key
+        """
+        lines = "".join(
+            json.dumps({"user_id": user_id, "embedding": np.asarray(embedding).tolist()}) + "\n"
+            for user_id, embedding in embeddings.items()
+        )
+        if not lines:
+            return {"success": True}
+        if self.file_storage.append_text_file(self._gallery_staging_file(model_name), lines):
+            return {"success": True}
+        return {"success": False, "error": f"Failed to stage {model_name} embeddings"}
+    
+    @_OPERATION_SECONDS.time(repository="face", operation="get_staged_gallery_embeddings")
+    def get_staged_gallery_embeddings(self, model_name: str) -> Dict[str, np.ndarray]:
+        """
+        Retrieve the embeddings staged for a gallery migration.
+        
+        Args:
+            model_name: Model of the migration
+        
+        Returns:
+            Dictionary mapping user_id to staged embedding
+        """
+        staging_file = self._gallery_staging_file(model_name)
+        try:
+            if not self.file_storage.file_exists(staging_file):
+                return {}
+            lines = self.file_storage.read_text_file(staging_file).split("\n")
+        except Exception as e:
+            logger.error(f"Error loading staged {model_name} embeddings: {e}")
+            return {}
+        
+        embeddings = {}
+        # Only newline-terminated lines were completely written
+        for line in lines[:-1]:
+            try:
+                record = json.loads(line)
+                embeddings[record["user_id"]] = np.array(record["embedding"], dtype=np.float32)
+            except (ValueError, KeyError, TypeError):
+                logger.warning(f"Skipping malformed line in {staging_file}")
+        return embeddings
+    
+    def clear_staged_gallery(self, model_name: str) -> None:
+        """
+        Discard the embeddings staged for a gallery migration.
+        
+        Args:
+            model_name: Model of the migration
+        """
+        staging_file = self._gallery_staging_file(model_name)
+        if self.file_storage.file_exists(staging_file):
+            self.file_storage.delete_file(staging_file)
+            logger.info(f"Discarded staged {model_name} gallery")
+    
+    @_OPERATION_SECONDS.time(repository="face", operation="swap_gallery")
+    @_holding_gallery_lock
+    def swap_gallery(self, model_name: str, allow_missing: bool = False) -> Dict[str, Any]:
+        """
+        Replace the primary embeddings with the staged ones of a migration.
+        
+        The pickle cache is replaced first and faces.json, which records the
+        gallery's model, last; both are written atomically, so readers see
+        either the old or the new gallery of each file. Users missing a staged
+        embedding keep their old one (only with allow_missing).
+        
+        Args:
+            model_name: Model of the migration
+            allow_missing: Swap even if some users have no staged embedding
+        
+        Returns:
+            Dictionary with 'success' (bool), 'swapped' (int) and 'missing'
+            (list of user IDs without a staged embedding) keys, and optionally
+            'error' (str) key
+        """
+        try:
+            staged = self.get_staged_gallery_embeddings(model_name)
+            if self.file_storage.file_exists(self.faces_json_file):
+                data = json.loads(self.file_storage.read_text_file(self.faces_json_file))
+            else:
+                data = {"metadata": {}}
+            cache = None
+            if self.file_storage.file_exists(self.embeddings_file):
+                cache = self._normalize_cache_structure(
+                    pickle.loads(self.file_storage.read_file(self.embeddings_file))
+                )
+            
+            json_users = self._json_embedded_user_ids(data)
+            cache_users = list(cache["embeddings"]) if cache is not None else []
+            missing = sorted({
+                user_id for user_id in json_users + cache_users if user_id not in staged
+            })
+            if missing and not allow_missing:
+                return {
+                    "success": False,
+                    "swapped": 0,
+                    "missing": missing,
+                    "error": f"{len(missing)} users have no {model_name} embedding"
+                }
+            
+            swapped = set()
+            if cache is not None and any(user_id in staged for user_id in cache_users):
+                for user_id in cache_users:
+                    if user_id not in staged:
+                        continue
+                    entry = cache["embeddings"][user_id]
+                    if isinstance(entry, dict):
+                        entry["embedding"] = staged[user_id]
+                    else:
+                        cache["embeddings"][user_id] = staged[user_id]
+                    swapped.add(user_id)
+                cache["metadata"]["embedding_model"] = model_name
+                if not self.file_storage.write_file(self.embeddings_file, pickle.dumps(cache), atomic=True):
+                    raise IOError(f"Failed to write {self.embeddings_file}")
+            
+            for user_id in json_users:
+                if user_id in staged:
+                    data[user_id]["embedding"] = staged[user_id].tolist()
+                    swapped.add(user_id)
+            metadata = data.setdefault("metadata", {})
+            metadata["embedding_model"] = model_name
+            metadata["last_updated"] = datetime.now().isoformat()
+            json_content = json.dumps(data, indent=2, default=str)
+            if not self.file_storage.write_text_file(self.faces_json_file, json_content, atomic=True):
+                raise IOError(f"Failed to write {self.faces_json_file}")
+            
+            self.clear_staged_gallery(model_name)
+            logger.info(f"Gallery swapped to {model_name}: {len(swapped)} users "
+                        f"({len(missing)} kept their old embedding)")
+            return {"success": True, "swapped": len(swapped), "missing": missing}
+            
+        except Exception as e:
+            logger.error(f"Error swapping gallery to {model_name}: {e}")
+            return {
+                "success": False,
+                "swapped": 0,
+                "missing": [],
+                "error": f"Failed to swap gallery: {str(e)}"
+            }
+    
+    @_OPERATION_SECONDS.time(repository="face", operation="delete_face_data")
+    @_holding_gallery_lock
     def delete_face_data(self, user_id: str) -> bool:
         """
         Delete all face data for a user (images and embeddings).
@@ -0,0 +1,159 @@
+"""
+Roster Repository for EyeD AI Attendance System.
+
+This module handles data persistence for class rosters: the set of user IDs
+expected at a location or session. Recognition searches a roster's users
+before falling back to the whole gallery.
+"""
+
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+from infrastructure.storage.file_storage import FileStorage
+from core.shared.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+_OPERATION_SECONDS = metrics_registry.histogram(
+    "eyed_repository_operation_seconds",
+    "Latency of repository operations in seconds",
+    ("repository", "operation")
+)
+
+
+class RosterRepository:
+    """
+    Repository for class roster persistence.
+
+    This class handles ONLY roster persistence (location -> user IDs).
+    Rosters are kept in memory and written through to a JSON file on
+    every change, so lookups on the recognition path never touch disk.
+    """
+
+    def __init__(self, storage_handler: FileStorage, data_file: str = "data/rosters.json"):
+        """
+        Initialize roster repository.
+
+        Args:
+            storage_handler: Injected file storage handler for file operations
+            data_file: Path to roster data file (JSON format)
+        """
+        if storage_handler is None:
+            raise ValueError("storage_handler cannot be None")
+
+        self.storage_handler = storage_handler
+        self.data_file = data_file
+        self._lock = threading.RLock()
+        self._rosters: Dict[str, FrozenSet[str]] = self._load_rosters()
+
+        logger.info(f"RosterRepository initialized with {len(self._rosters)} roster(s) from {self.data_file}")
+
+    def get_roster(self, location: str) -> Optional[FrozenSet[str]]:
+        """
+        Get the user IDs registered for a location.
+
+        Args:
+            location: Location or session name
+
+        Returns:
+            Frozen set of user IDs, or None if no roster is registered
+        """
+        with self._lock:
+            return self._rosters.get(location)
+
+    def get_all_rosters(self) -> Dict[str, List[str]]:
+        """
+        Get all rosters.
+
+        Returns:
+            Dictionary mapping location to sorted list of user IDs
+        """
+        with self._lock:
+            return {location: sorted(user_ids) for location, user_ids in self._rosters.items()}
+
+    @_OPERATION_SECONDS.time(repository="roster", operation="set_roster")
+    def set_roster(self, location: str, user_ids: Iterable[str]) -> bool:
+        """
+        Register (or replace) the roster of a location.
+
+        Args:
+            location: Location or session name
+            user_ids: User IDs expected at the location
+
+        Returns:
+            True on success, False on failure
+        """
+        with self._lock:
+            rosters = dict(self._rosters)
+            rosters[location] = frozenset(str(user_id) for user_id in user_ids)
+            if not self._save_rosters(rosters):
+                return False
+            self._rosters = rosters
+        logger.info(f"Roster for '{location}' set to {len(rosters[location])} user(s)")
+        return True
+
+    @_OPERATION_SECONDS.time(repository="roster", operation="delete_roster")
+    def delete_roster(self, location: str) -> bool:
+        """
+        Delete the roster of a location.
+
+        Args:
+            location: Location or session name
+
+        Returns:
+            True if the roster existed and was deleted, False otherwise
+        """
+        with self._lock:
+            if location not in self._rosters:
+                return False
+            rosters = {k: v for k, v in self._rosters.items() if k != location}
+            if not self._save_rosters(rosters):
+                return False
+            self._rosters = rosters
+        logger.info(f"Roster for '{location}' deleted")
+        return True
+
+    def _load_rosters(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Load rosters from file.
+
+        Returns:
+            Dictionary mapping location to user IDs (empty if the file is missing or invalid)
+        """
+        if not self.storage_handler.file_exists(self.data_file):
+            return {}
+        try:
+            data = json.loads(self.storage_handler.read_text_file(self.data_file))
+            return {
+                location: frozenset(str(user_id) for user_id in user_ids)
+                for location, user_ids in data.get("rosters", {}).items()
+            }
+        except Exception as e:
+            logger.error(f"Failed to load rosters from {self.data_file}: {e}")
+            return {}
+
+    def _save_rosters(self, rosters: Dict[str, FrozenSet[str]]) -> bool:
+        """
+        Save rosters to file.
+
+        Args:
+            rosters: Dictionary mapping location to user IDs
+
+        Returns:
+            True on success, False on failure
+        """
+        data = {
+            "rosters": {location: sorted(user_ids) for location, user_ids in rosters.items()},
+            "metadata": {
+                "last_updated": datetime.now().isoformat(),
+                "total_rosters": len(rosters)
+            }
+        }
+        try:
+            return self.storage_handler.write_text_file(self.data_file, json.dumps(data, indent=2))
+        except Exception as e:
+            logger.error(f"Failed to save rosters to {self.data_file}: {e}")
+            return False
@@ -0,0 +1,192 @@
+"""
+Session Repository for EyeD AI Attendance System.
+
+This module keeps Phase 1 recognition sessions in memory so that Phase 2
+(/api/attendance/mark) can reference them by ID instead of re-uploading
+the face image. Sessions expire after a short TTL and the store is bounded.
+Sessions are per process: with several uvicorn workers, a /mark request
+may reach a worker that does not hold its session, so clients also send
+the Phase 1 fields as a fallback.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Set, Tuple
+
+from domain.entities.recognition_session import RecognitionSession
+from core.shared.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+_SESSIONS_TOTAL = metrics_registry.counter(
+    "eyed_recognition_sessions_total",
+    "Recognition session events, by result (created, consumed, expired, evicted, missing, in_use)",
+    ("result",)
+)
+_ACTIVE_SESSIONS = metrics_registry.gauge(
+    "eyed_recognition_sessions_active",
+    "Recognition sessions currently held in memory"
+)
+
+DEFAULT_SESSION_TTL_SECONDS = 120.0
+DEFAULT_MAX_SESSIONS = 1000
+
+
+class SessionRepository:
+    """
+    In-memory, TTL-bounded repository for recognition sessions.
+    
+    This class handles ONLY recognition session storage. Sessions are not
+    persisted: they live for ttl_seconds, and when max_sessions is reached
+    the oldest session is evicted. A restart simply sends kiosks back to
+    Phase 1.
+    """
+    
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_SESSION_TTL_SECONDS,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize session repository.
+        
+        Args:
+            ttl_seconds: Lifetime of a session in seconds
+            max_sessions: Maximum number of sessions held at once
+            clock: Monotonic clock (injectable for tests)
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Insertion order is expiry order, since every session has the same TTL
+        self._sessions: "OrderedDict[str, Tuple[float, RecognitionSession]]" = OrderedDict()
+        # Sessions a /mark request is using; nobody else can claim them meanwhile
+        self._claimed: Set[str] = set()
+    
+    def add_session(self, session: RecognitionSession) -> None:
+        """
+        Store a session, evicting expired and, if full, the oldest sessions.
+        
+        Args:
+            session: Recognition session to store
+        """
+        with self._lock:
+            now = self._clock()
+            self._purge_expired(now)
+            while len(self._sessions) >= self.max_sessions:
+                evicted_id, _ = self._sessions.popitem(last=False)
+                self._claimed.discard(evicted_id)
+                _SESSIONS_TOTAL.inc(result="evicted")
+            self._sessions[session.session_id] = (now + self.ttl_seconds, session)
+            _ACTIVE_SESSIONS.set(len(self._sessions))
+        _SESSIONS_TOTAL.inc(result="created")
+    
+    def get_session(self, session_id: str) -> Optional[RecognitionSession]:
+        """
+        Get a live session.
+        
+        Args:
+            session_id: Session ID returned by Phase 1
+        
+        Returns:
+            RecognitionSession, or None if it does not exist or has expired
+        """
+        with self._lock:
+            self._purge_expired(self._clock())
+            entry = self._sessions.get(session_id)
+        if entry is None:
+            _SESSIONS_TOTAL.inc(result="missing")
+            return None
+        return entry[1]
+    
+    def claim_session(self, session_id: str) -> Tuple[Optional[RecognitionSession], bool]:
+        """
+        Claim a live session for marking attendance.
+        
+        Checking and claiming happen under one lock, so of several concurrent
+        requests with the same session only one gets it. The claim ends with
+        delete_session (attendance marked) or release_session (retry allowed).
+        
+        Args:
+            session_id: Session ID returned by Phase 1
+        
+        Returns:
+            (session, known): the session if this caller claimed it, else
+            None; known is True if the session is held by this process, even
+            when another request has claimed it
+        """
+        with self._lock:
+            self._purge_expired(self._clock())
+            entry = self._sessions.get(session_id)
+            in_use = entry is not None and session_id in self._claimed
+            if entry is not None and not in_use:
+                self._claimed.add(session_id)
+        if entry is None:
+            _SESSIONS_TOTAL.inc(result="missing")
+            return None, False
+        if in_use:
+            _SESSIONS_TOTAL.inc(result="in_use")
+            return None, True
+        return entry[1], True
+    
+    def release_session(self, session_id: str) -> None:
+        """
+        Release a claimed session without consuming it (e.g. liveness failed).
+        
+        Args:
+            session_id: Session ID
+        """
+        with self._lock:
+            self._claimed.discard(session_id)
+    
+    def delete_session(self, session_id: str) -> bool:
+        """
+        Delete a session once it has been used.
+        
+        Args:
+            session_id: Session ID
+        
+        Returns:
+            True if the session existed, False otherwise
+        """
+        with self._lock:
+            removed = self._sessions.pop(session_id, None) is not None
+            self._claimed.discard(session_id)
+            _ACTIVE_SESSIONS.set(len(self._sessions))
+        if removed:
+            _SESSIONS_TOTAL.inc(result="consumed")
+        return removed
+    
+    def count(self) -> int:
+        """
+        Count live sessions.
+        
+        Returns:
+            Number of sessions that have not expired
+        """
+        with self._lock:
+            self._purge_expired(self._clock())
+            return len(self._sessions)
+    
+    def _purge_expired(self, now: float) -> None:
+        """Drop expired sessions from the front of the store (lock must be held)."""
+        expired = 0
+        while self._sessions:
+            expires_at, _ = next(iter(self._sessions.values()))
+            if expires_at > now:
+                break
+            expired_id, _ = self._sessions.popitem(last=False)
+            self._claimed.discard(expired_id)
+            expired += 1
+        if expired:
+            _SESSIONS_TOTAL.inc(expired, result="expired")
+            _ACTIVE_SESSIONS.set(len(self._sessions))
@@ -8,16 +8,35 @@ The repository implements the UserRepositoryProtocol and works with
 the User domain entity from domain/entities/user.py.
 """
 
+import functools
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, TypeVar
 
 from domain.entities.user import User
 from infrastructure.storage.file_storage import FileStorage
+from core.shared.metrics import metrics_registry
 
 logger = logging.getLogger(__name__)
 
+_OPERATION_SECONDS = metrics_registry.histogram(
+    "eyed_repository_operation_seconds",
+    "Latency of repository operations in seconds",
+    ("repository", "operation")
+)
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def _holding_data_lock(method: _Method) -> _Method:
+    """Run a read-modify-write of the data file under its lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.storage_handler.lock(self.lock_file):
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class UserRepository:
     """
@@ -41,6 +60,8 @@ class UserRepository:
         
         self.storage_handler = storage_handler
         self.data_file = data_file
+        # Shared with FaceRepository, which writes the same faces.json
+        self.lock_file = f"{data_file}.lock"
         
         # Initialize file if it doesn't exist
         if not self.storage_handler.file_exists(self.data_file):
@@ -287,6 +308,8 @@ class UserRepository:
             status=user_dict.get("status", "active")
         )
     
+    @_OPERATION_SECONDS.time(repository="user", operation="add_user")
+    @_holding_data_lock
     def add_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Persist new user data in legacy format (top-level key).
@@ -349,6 +372,7 @@ class UserRepository:
                 "error": f"Failed to add user: {str(e)}"
             }
     
+    @_OPERATION_SECONDS.time(repository="user", operation="get_user")
     def get_user(self, user_id: str) -> Dict[str, Any]:
         """
         Retrieve user by ID from legacy format (top-level key) or new format ("users" section).
@@ -396,6 +420,8 @@ class UserRepository:
                 "data": None
             }
     
+    @_OPERATION_SECONDS.time(repository="user", operation="update_user")
+    @_holding_data_lock
     def update_user(self, user_id: str, user: User) -> bool:
         """
         Update existing user in legacy format.
@@ -455,6 +481,8 @@ class UserRepository:
             logger.error(f"Failed to update user {user_id}: {e}")
             return False
     
+    @_OPERATION_SECONDS.time(repository="user", operation="delete_user")
+    @_holding_data_lock
     def delete_user(self, user_id: str) -> bool:
         """
         Delete user by ID from legacy format or new format.
@@ -497,6 +525,7 @@ class UserRepository:
             logger.error(f"Failed to delete user {user_id}: {e}")
             return False
     
+    @_OPERATION_SECONDS.time(repository="user", operation="get_all_users")
     def get_all_users(self, include_inactive: bool = True) -> Dict[str, Any]:
         """
         Retrieve all users from legacy format (top-level keys) and new format ("users" section).
@@ -590,6 +619,7 @@ class UserRepository:
                 'error': str(e)
             }
     
+    @_OPERATION_SECONDS.time(repository="user", operation="search_users")
     def search_users(self, search_term: str, search_fields: List[str] = None) -> List[User]:
         """
         Search users by various criteria.
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Start the EyeD kiosk.
+
+Runs attendance on this machine's camera without the API server: capture,
+detection, recognition and blink verification run as a pipeline of
+concurrent stages, and attendance is written to the same data files the
+API uses. A recorded video can stand in for the camera with --video.
+
+Usage:
+    python start_kiosk.py --location "Main Hall"
+    python start_kiosk.py --video session.mp4 --realtime
+"""
+
+import argparse
+import logging
+
+from api import dependencies
+from api.startup import warm_up_models
+from infrastructure.camera import CameraFrameSource, CameraManager, VideoFileSource
+from kiosk import KioskConfig, KioskPipeline
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the EyeD attendance kiosk")
+    parser.add_argument("--camera-id", type=int, default=0, help="Camera device ID (default: 0)")
+    parser.add_argument("--video", help="Read frames from a video file instead of the camera")
+    parser.add_argument("--realtime", action="store_true",
+                        help="Pace --video at its frame rate and drop frames like a camera")
+    parser.add_argument("--location", default="kiosk", help="Location recorded with attendance")
+    parser.add_argument("--max-frames", type=int, default=None, help="Stop after this many frames")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    settings = dependencies.get_settings()
+
+    if settings.warmup_on_startup:
+        warm_up_models(max_workers=settings.warmup_workers)
+
+    if args.video:
+        source = VideoFileSource(args.video, realtime=args.realtime)
+    else:
+        source = CameraFrameSource(CameraManager(camera_id=args.camera_id))
+
+    pipeline = KioskPipeline(
+        face_recognition_service=dependencies.get_face_recognition_service(),
+        recognize_face_use_case=dependencies.get_recognize_face_use_case(),
+        mark_attendance_use_case=dependencies.get_mark_attendance_use_case(),
+        landmark_extractor=dependencies.get_landmark_extractor(),
+        blink_detector=dependencies.get_blink_detector(),
+        config=KioskConfig(
+            location=args.location,
+            queue_size=settings.kiosk_queue_size,
+            lost_face_frames=settings.kiosk_lost_face_frames,
+            track_timeout_seconds=settings.kiosk_track_timeout_seconds,
+            cooldown_seconds=settings.kiosk_cooldown_seconds
+        )
+    )
+    report = pipeline.run(source, max_frames=args.max_frames)
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Unit tests for the attendance marking route.
+
+Calls the route function directly with a mocked use case and a scheduler
+that runs the use case inline.
+"""
+
+import asyncio
+import base64
+import io
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+from PIL import Image
+
+from api.routes.attendance import MarkAttendanceRequestDTO, mark_attendance
+from use_cases.mark_attendance import MarkAttendanceResponse
+
+
+class _InlineScheduler:
+    """Scheduler stand-in that runs work on the calling thread."""
+
+    async def run(self, priority, function, *args):
+        return function(*args)
+
+
+def _jpeg(truncated: bool = False) -> str:
+    buffer = io.BytesIO()
+    Image.fromarray(np.full((32, 32, 3), 128, dtype=np.uint8)).save(buffer, format="JPEG")
+    data = buffer.getvalue()
+    return base64.b64encode(data[:len(data) // 2] if truncated else data).decode()
+
+
+def test_a_frame_that_fails_to_decode_during_liveness_returns_400() -> None:
+    """Test that lazy decode errors are reported as a 400, not a generic failure."""
+    use_case = Mock()
+
+    def execute(request) -> MarkAttendanceResponse:
+        try:
+            [request.frames_sequence[i] for i in range(len(request.frames_sequence))]
+        except Exception as e:  # The use case reports unexpected errors itself
+            return MarkAttendanceResponse(success=False, error=str(e))
+        return MarkAttendanceResponse(success=False, error="liveness failed")
+
+    use_case.execute.side_effect = execute
+    dto = MarkAttendanceRequestDTO(
+        frames=[_jpeg(), _jpeg(truncated=True), _jpeg()],
+        userId="u1",
+        userName="User One",
+        faceImage=_jpeg(),
+        confidence=0.9
+    )
+
+    with pytest.raises(HTTPException) as raised:
+        asyncio.run(mark_attendance(dto, use_case=use_case, scheduler=_InlineScheduler()))
+
+    assert raised.value.status_code == 400
@@ -0,0 +1,68 @@
+"""
+Unit tests for ComponentRegistry.
+"""
+
+import threading
+import time
+
+import pytest
+
+from api.registry import ComponentRegistry
+
+
+class TestComponentRegistry:
+    """Test suite for ComponentRegistry class."""
+
+    def test_concurrent_first_calls_construct_once(self) -> None:
+        """Test that concurrent first requests share a single instance."""
+        registry = ComponentRegistry()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            time.sleep(0.05)  # Widen the race window
+            return object()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get_or_create("model", factory)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len({id(result) for result in results}) == 1
+
+    def test_failed_construction_is_retried(self) -> None:
+        """Test that a factory error registers nothing and the next call retries."""
+        registry = ComponentRegistry()
+        attempts = []
+
+        def factory():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ImportError("missing dependency")
+            return "ready"
+
+        with pytest.raises(ImportError):
+            registry.get_or_create("model", factory)
+        assert not registry.is_initialized("model")
+        assert registry.get_or_create("model", factory) == "ready"
+
+    def test_singleton_decorator_and_reset(self) -> None:
+        """Test that decorated factories return shared instances until reset."""
+        registry = ComponentRegistry()
+
+        @registry.singleton
+        def get_component():
+            return object()
+
+        first = get_component()
+        assert get_component() is first
+        assert registry.is_initialized("get_component")
+
+        registry.reset()
+        assert get_component() is not first
@@ -0,0 +1,49 @@
+"""
+Unit tests for import-light API startup.
+
+Imports the API in a fresh interpreter and checks that heavy ML libraries
+are not loaded until a strategy or extractor is constructed.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+HEAVY_MODULES = ("tensorflow", "tf_keras", "keras", "deepface", "mediapipe", "ultralytics", "torch")
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _modules_loaded_after_import(module: str) -> list:
+    """Import a module in a subprocess and return the heavy modules it loaded."""
+    code = (
+        "import json, sys\n"
+        f"import {module}\n"
+        f"print(json.dumps(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(PROJECT_ROOT),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+class TestStartupImports:
+    """Test suite for lazy loading of heavy ML dependencies."""
+
+    def test_api_import_does_not_load_ml_libraries(self) -> None:
+        """Test that importing the API app loads no heavy ML library."""
+        assert _modules_loaded_after_import("api.main") == []
+
+    def test_core_modules_do_not_load_ml_libraries(self) -> None:
+        """Test that detector, extractor and landmark modules import lazily."""
+        for module in (
+            "core.recognition.strategies",
+            "core.recognition.embedding_extractor",
+            "core.liveness.landmark_extractor",
+        ):
+            assert _modules_loaded_after_import(module) == [], module
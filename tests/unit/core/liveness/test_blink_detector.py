@@ -8,6 +8,7 @@ All tests are unit tests only - no integration tests.
 from typing import List, Tuple
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
 from core.liveness.blink_detector import BlinkDetector
@@ -222,6 +223,79 @@ class TestBlinkDetector:
         
         assert detector.ear_threshold == 0.2
 
+    def test_detect_sequence_matches_per_frame_detect(self) -> None:
+        """Test detect_sequence gives the same EARs and blinks as detect on every frame."""
+        open_landmarks = self._create_open_eyes_landmarks()
+        closed_landmarks = self._create_closed_eyes_landmarks()
+        medium_landmarks = self._create_medium_ear_landmarks()
+        sequence = [open_landmarks, closed_landmarks, closed_landmarks, open_landmarks,
+                    medium_landmarks, closed_landmarks, open_landmarks]
+        
+        scalar_detector = BlinkDetector(ear_threshold=0.3)
+        scalar_results = [scalar_detector.detect(landmarks) for landmarks in sequence]
+        
+        result = BlinkDetector(ear_threshold=0.3).detect_sequence(np.array(sequence))
+        
+        np.testing.assert_allclose(result.ear_values, [r.ear_value for r in scalar_results])
+        assert result.closed.tolist() == [r.is_blinking for r in scalar_results]
+        assert result.blink_count == scalar_results[-1].blink_count == 2
+        assert result.blink_frames.tolist() == [3, 6]
+
+    def test_detect_sequence_accepts_eye_points_only(self) -> None:
+        """Test detect_sequence gives the same result for (T, 12, 2) eye points."""
+        detector = BlinkDetector(ear_threshold=0.2)
+        sequence = np.array([self._create_open_eyes_landmarks(),
+                             self._create_closed_eyes_landmarks(),
+                             self._create_open_eyes_landmarks()])
+        
+        full = detector.detect_sequence(sequence)
+        eyes_only = detector.detect_sequence(sequence[:, BlinkDetector.EYE_INDICES])
+        
+        np.testing.assert_allclose(full.ear_values, eyes_only.ear_values)
+        assert eyes_only.blink_count == 1
+        with pytest.raises(ValueError, match="Invalid landmarks"):
+            detector.detect_sequence(np.zeros((3, 100, 2)))
+
+    def test_detect_eye_points_matches_detect(self) -> None:
+        """Test detect_eye_points on the 12 EAR points matches detect on full landmarks."""
+        full_detector = BlinkDetector()
+        eye_detector = BlinkDetector()
+        for landmarks in (self._create_open_eyes_landmarks(),
+                          self._create_closed_eyes_landmarks(),
+                          self._create_open_eyes_landmarks()):
+            expected = full_detector.detect(landmarks)
+            result = eye_detector.detect_eye_points(np.array(landmarks)[BlinkDetector.EYE_INDICES])
+            assert result.left_ear == pytest.approx(expected.left_ear)
+            assert result.right_ear == pytest.approx(expected.right_ear)
+            assert result.blink_count == expected.blink_count
+        assert eye_detector.get_blink_count() == 1
+        assert eye_detector.is_closed is False
+
+    def test_detect_sequence_hysteresis_and_invalid_frames(self) -> None:
+        """Test EAR jitter inside the hysteresis band and invalid frames do not end a blink."""
+        ears = [0.35, 0.1, 0.25, 0.1, 0.35]
+        sequence = np.stack([self._create_eye_points(ear) for ear in ears])
+        
+        # Without hysteresis the 0.25 frame reopens the eyes: two blinks
+        result = BlinkDetector(ear_threshold=0.2).detect_sequence(sequence)
+        np.testing.assert_allclose(result.ear_values, ears)
+        assert result.blink_count == 2
+        
+        # With hysteresis it stays inside the band: one blink
+        result = BlinkDetector(ear_threshold=0.2, hysteresis=0.1).detect_sequence(sequence)
+        assert result.blink_count == 1
+        assert result.closed.tolist() == [False, True, True, True, False]
+        
+        # An invalid frame keeps the previous state
+        valid = np.array([True, True, False, True, True])
+        assert BlinkDetector(ear_threshold=0.2).detect_sequence(sequence, valid).blink_count == 1
+
+    def _create_eye_points(self, ear: float) -> np.ndarray:
+        """Create (12, 2) eye points where both eyes have the given EAR."""
+        eye = np.array([(0.0, 0.0), (0.3, -ear / 2), (0.6, -ear / 2),
+                        (1.0, 0.0), (0.6, ear / 2), (0.3, ear / 2)])
+        return np.concatenate([eye, eye])
+
     def _create_open_eyes_landmarks(self) -> List[Tuple[float, float]]:
         """Create mock landmarks with eyes open (high EAR)."""
         landmarks = [(0.0, 0.0)] * 468
@@ -0,0 +1,106 @@
+"""
+Unit tests for LandmarkExtractor face ROI helpers.
+
+These helpers are pure geometry and do not need MediaPipe; eye point
+extraction is tested with FaceMesh replaced by a stand-in.
+"""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+
+from core.liveness.blink_detector import BlinkDetector
+from core.liveness.landmark_extractor import LandmarkExtractor
+
+
+class TestLandmarkExtractorRoi:
+    """Test suite for the face ROI helpers of LandmarkExtractor."""
+
+    def test_crop_bounds_adds_margin_and_clips(self) -> None:
+        """Test crop bounds grow by the margin and stay inside the image."""
+        shape = (480, 640, 3)
+        
+        assert LandmarkExtractor.crop_bounds(shape, (200, 100, 100, 120), margin=0.25) == (175, 70, 325, 250)
+        assert LandmarkExtractor.crop_bounds(shape, (-50, 400, 200, 200), margin=0.25) == (0, 350, 200, 480)
+        assert LandmarkExtractor.crop_bounds(shape, (700, 500, 50, 50), margin=0.0) is None
+
+    def test_face_roi_from_eye_points_covers_eyes(self) -> None:
+        """Test the estimated face ROI contains the eyes with room for the rest of the face."""
+        shape = (480, 640, 3)
+        eye_points = np.zeros((len(BlinkDetector.EYE_INDICES), 2))
+        # Left eye around x=0.55, right eye around x=0.45 (normalized), eye line at y=0.4
+        eye_points[:6] = [(0.58, 0.4), (0.57, 0.39), (0.53, 0.39), (0.52, 0.4), (0.53, 0.41), (0.57, 0.41)]
+        eye_points[6:] = [(0.42, 0.4), (0.43, 0.39), (0.47, 0.39), (0.48, 0.4), (0.47, 0.41), (0.43, 0.41)]
+        
+        x, y, width, height = LandmarkExtractor.face_roi_from_eye_points(eye_points, shape)
+        xs, ys = eye_points[:, 0] * 640, eye_points[:, 1] * 480
+        
+        assert x < xs.min() and x + width > xs.max()
+        assert y < ys.min() and y + height > ys.max() + (xs.max() - xs.min())
+
+
+def _extractor(landmarks) -> LandmarkExtractor:
+    """Create an extractor whose FaceMesh returns the given landmarks (without MediaPipe)."""
+    extractor = LandmarkExtractor.__new__(LandmarkExtractor)
+    extractor.roi_input_size = 192
+    extractor.roi_margin = 0.25
+    extractor._face_landmarks = Mock(return_value=landmarks)
+    return extractor
+
+
+class TestLandmarkExtractorEyePoints:
+    """Test suite for eye point extraction from a face ROI crop."""
+
+    def test_roi_crop_landmarks_map_back_to_the_full_frame(self) -> None:
+        """Test crop-normalized landmarks are returned normalized to the full frame."""
+        # Every landmark at (0.5, 0.25) of the crop
+        extractor = _extractor([SimpleNamespace(x=0.5, y=0.25)] * 478)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        eye_points = extractor.extract_eye_points(frame, roi=(200, 100, 200, 240))
+
+        # Crop (150, 40)-(450, 400), downscaled to fit 192 pixels
+        crop = extractor._face_landmarks.call_args.args[0]
+        assert crop.shape == (192, 160, 3)
+        assert np.allclose(eye_points, [((150 + 0.5 * 300) / 640, (40 + 0.25 * 360) / 480)] * 12)
+
+    def test_without_fallback_facemesh_runs_once_when_the_crop_has_no_face(self) -> None:
+        """Test a missed crop is not followed by a full-frame FaceMesh run."""
+        extractor = _extractor(None)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        assert extractor.extract_eye_points(frame, roi=(200, 100, 100, 120), full_frame_fallback=False) is None
+        assert extractor._face_landmarks.call_count == 1
+        assert extractor.extract_eye_points(frame, roi=(200, 100, 100, 120)) is None
+        assert extractor._face_landmarks.call_count == 3
+
+    def test_facemesh_is_built_once_per_thread(self) -> None:
+        """Test that FaceMesh graphs are reused across calls and not shared between threads."""
+        built = []
+
+        def face_mesh(**options):
+            graph = Mock(options=options)
+            graph.process.return_value = SimpleNamespace(multi_face_landmarks=None)
+            built.append(graph)
+            return graph
+
+        extractor = LandmarkExtractor.__new__(LandmarkExtractor)
+        extractor.min_detection_confidence = 0.3
+        extractor._mp_face_mesh = SimpleNamespace(FaceMesh=face_mesh)
+        extractor._thread_state = threading.local()
+        crop = np.zeros((96, 96, 3), dtype=np.uint8)
+
+        def run() -> None:
+            for _ in range(3):
+                extractor._face_landmarks(crop)
+
+        run()
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+
+        assert len(built) == 2
+        assert [graph.process.call_count for graph in built] == [3, 3]
+        assert all(graph.options["static_image_mode"] for graph in built)
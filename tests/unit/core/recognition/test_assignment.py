@@ -0,0 +1,39 @@
+"""
+Unit tests for one-to-one face assignment.
+"""
+
+import numpy as np
+import pytest
+
+from core.recognition.assignment import assign_greedy, assign_one_to_one
+
+
+class TestAssignment:
+    """Test suite for assign_one_to_one and its strategies."""
+
+    def test_greedy_assigns_distinct_users_above_threshold(self) -> None:
+        """Test that greedy assignment takes the best pairs and respects the threshold."""
+        scores = np.array([
+            [0.9, 0.8, 0.1],
+            [0.85, 0.2, 0.1],
+            [0.3, 0.2, 0.4],
+        ])
+
+        assert assign_greedy(scores, threshold=0.5) == [0, None, None]
+        assert assign_one_to_one(scores, threshold=0.5, method="greedy") == [0, None, None]
+
+    def test_hungarian_maximizes_total_similarity(self) -> None:
+        """Test that Hungarian assignment finds the better global pairing."""
+        pytest.importorskip("scipy")
+        scores = np.array([
+            [0.9, 0.8],
+            [0.85, 0.2],
+        ])
+
+        assert assign_one_to_one(scores, threshold=0.5, method="hungarian") == [1, 0]
+
+    def test_unknown_method_and_empty_scores(self) -> None:
+        """Test that unknown methods raise and empty inputs assign nothing."""
+        with pytest.raises(ValueError):
+            assign_one_to_one(np.ones((1, 1)), threshold=0.5, method="random")
+        assert assign_one_to_one(np.zeros((2, 0)), threshold=0.5) == [None, None]
@@ -0,0 +1,31 @@
+"""
+Unit tests for the cascade accept-or-escalate policy.
+"""
+
+import numpy as np
+
+from core.recognition.cascade import CascadePolicy
+
+
+class TestCascadePolicy:
+    """Test suite for CascadePolicy.decide."""
+
+    def test_accepts_only_strong_well_separated_matches(self) -> None:
+        """Test that low scores and small margins are escalated."""
+        scores = np.array([
+            [0.9, 0.2, 0.1],   # strong and clear
+            [0.5, 0.1, 0.0],   # below accept score
+            [0.9, 0.85, 0.1],  # ambiguous runner-up
+        ])
+
+        best, best_scores, accepted = CascadePolicy(accept_score=0.6, min_margin=0.15).decide(scores)
+
+        assert best.tolist() == [0, 0, 0]
+        assert np.allclose(best_scores, [0.9, 0.5, 0.9])
+        assert accepted.tolist() == [True, False, False]
+
+    def test_empty_gallery_never_accepts(self) -> None:
+        """Test that an empty gallery escalates every probe."""
+        _, _, accepted = CascadePolicy().decide(np.zeros((2, 0)))
+
+        assert accepted.tolist() == [False, False]
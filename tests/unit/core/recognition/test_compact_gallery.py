@@ -0,0 +1,68 @@
+"""
+Unit tests for CompactEmbeddingGallery.
+"""
+
+import numpy as np
+import pytest
+
+from core.recognition.compact_gallery import CompactEmbeddingGallery, compare_to_float32
+from core.recognition.gallery import EmbeddingGallery
+
+
+def _known_and_probes(users: int = 200, dimension: int = 64):
+    """Return a random unit-norm gallery and noisy probes of its first users."""
+    rng = np.random.default_rng(0)
+    matrix = rng.normal(size=(users, dimension)).astype(np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    known = {f"user_{i}": row for i, row in enumerate(matrix)}
+    probes = matrix[:20] + 0.05 * rng.normal(size=(20, dimension)).astype(np.float32)
+    return known, probes
+
+
+class TestCompactEmbeddingGallery:
+    """Test suite for CompactEmbeddingGallery class."""
+
+    @pytest.mark.parametrize("precision", ["float16", "int8"])
+    def test_matches_float32_gallery_with_exact_top_scores(self, precision) -> None:
+        """Test that compact matching agrees with float32 and re-ranked scores are exact."""
+        known, probes = _known_and_probes()
+        baseline = EmbeddingGallery.from_known_embeddings(known)
+        compact = CompactEmbeddingGallery.from_known_embeddings(known, precision=precision, rerank_k=4)
+
+        expected = baseline.match(probes, threshold=0.5)
+        matches = compact.match(probes, threshold=0.5)
+
+        assert [m[0] for m in matches] == [e[0] for e in expected]
+        assert np.allclose([m[1] for m in matches], [e[1] for e in expected], atol=1e-6)
+
+    def test_report_and_memory_mapped_round_trip(self, tmp_path) -> None:
+        """Test the float32 comparison report and save/load with memory-mapped rows."""
+        known, probes = _known_and_probes()
+        compact = CompactEmbeddingGallery.from_known_embeddings(known, precision="int8")
+        compact.save(str(tmp_path))
+
+        loaded = CompactEmbeddingGallery.load(str(tmp_path))
+        report = compare_to_float32(EmbeddingGallery.from_known_embeddings(known), loaded, probes, 0.5)
+
+        assert loaded.size == len(known)
+        # Only the int8 codes and scales stay resident
+        assert loaded.memory_bytes < report.float32_memory_bytes / 3
+        assert report.top1_agreement == 1.0
+        assert report.decision_agreement == 1.0
+        assert report.max_abs_score_delta < 1e-6
+
+    def test_subset_keeps_the_compact_rows_of_the_given_users(self, tmp_path) -> None:
+        """Test that a roster subset of a compact (also memory-mapped) gallery matches like float32."""
+        known, probes = _known_and_probes()
+        roster = {f"user_{i}" for i in range(0, 40, 2)}
+        baseline = EmbeddingGallery.from_known_embeddings(known).subset(roster)
+        CompactEmbeddingGallery.from_known_embeddings(known, precision="int8").save(str(tmp_path))
+
+        for compact in (CompactEmbeddingGallery.from_known_embeddings(known, precision="float16"),
+                        CompactEmbeddingGallery.load(str(tmp_path))):
+            subset = compact.subset(roster)
+
+            assert subset.size == len(roster) and set(subset.user_ids) == roster
+            matches, expected = subset.match(probes, threshold=0.5), baseline.match(probes, threshold=0.5)
+            assert [m and m[0] for m in matches] == [e and e[0] for e in expected]
+            assert np.allclose([m[1] for m in matches if m], [e[1] for e in expected if e], atol=1e-6)
@@ -0,0 +1,58 @@
+"""
+Unit tests for FaceAligner.
+"""
+
+import numpy as np
+import pytest
+
+from core.recognition.face_aligner import (
+    ARCFACE_TEMPLATE_112,
+    FaceAligner,
+    estimate_similarity_transform
+)
+from core.recognition.value_objects import FaceLocation
+
+
+class TestFaceAligner:
+    """Test suite for FaceAligner class."""
+
+    def test_estimate_similarity_transform_recovers_known_transform(self) -> None:
+        """Test that a rotated, scaled and shifted template maps back onto itself."""
+        angle = np.deg2rad(20.0)
+        scale = 2.5
+        rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+        source = scale * ARCFACE_TEMPLATE_112 @ rotation.T + np.array([300.0, 120.0])
+
+        matrix = estimate_similarity_transform(source, ARCFACE_TEMPLATE_112)
+        mapped = source @ matrix[:, :2].T + matrix[:, 2]
+
+        np.testing.assert_allclose(mapped, ARCFACE_TEMPLATE_112, atol=1e-6)
+
+    def test_align_with_landmarks_places_eyes_on_template(self) -> None:
+        """Test that marked eye pixels end up at the template eye positions."""
+        image = np.zeros((400, 400, 3), dtype=np.uint8)
+        landmarks = [(100 + 2 * x, 50 + 2 * y) for x, y in ARCFACE_TEMPLATE_112]
+        for x, y in landmarks[:2]:
+            image[int(round(y)) - 2:int(round(y)) + 3, int(round(x)) - 2:int(round(x)) + 3] = 255
+
+        aligned = FaceAligner().align(image, FaceLocation(x=100, y=50, width=224, height=224), landmarks)
+
+        assert aligned.shape == (112, 112, 3)
+        for x, y in ARCFACE_TEMPLATE_112[:2]:
+            assert aligned[int(round(y)), int(round(x))].max() > 128
+
+    def test_align_without_landmarks_crops_square_box(self) -> None:
+        """Test that a box-only alignment crops the box region at the output size."""
+        image = np.zeros((200, 300, 3), dtype=np.uint8)
+        image[50:150, 100:200] = 200
+
+        aligned = FaceAligner(output_size=64).align(image, FaceLocation(x=100, y=50, width=100, height=100))
+
+        assert aligned.shape == (64, 64, 3)
+        assert aligned[2:-2, 2:-2].min() == 200
+
+    def test_align_rejects_unsupported_landmark_count(self) -> None:
+        """Test that landmark sets other than 5 or 2 points are rejected."""
+        image = np.zeros((100, 100, 3), dtype=np.uint8)
+        with pytest.raises(ValueError):
+            FaceAligner().align(image, FaceLocation(x=0, y=0, width=50, height=50), [(1, 1)] * 3)
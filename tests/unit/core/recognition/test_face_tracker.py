@@ -0,0 +1,71 @@
+"""
+Unit tests for FaceTracker and per-track identity voting.
+"""
+
+import numpy as np
+
+from core.recognition.face_tracker import FaceTracker, vote_identity
+from core.recognition.value_objects import FaceLocation, RecognitionResult
+
+
+def _crop(value: int) -> np.ndarray:
+    return np.full((4, 4, 3), value, dtype=np.uint8)
+
+
+def _result(user_id: str, confidence: float) -> RecognitionResult:
+    return RecognitionResult(user_id=user_id, user_name=user_id.title(), confidence=confidence, match_score=confidence)
+
+
+class TestFaceTracker:
+    """Test suite for FaceTracker class."""
+
+    def test_links_moving_faces_and_keeps_best_crops(self) -> None:
+        """Test that overlapping boxes form one track per face with its best-quality crops."""
+        tracker = FaceTracker(keep_best=2)
+        for frame in range(5):
+            tracker.update(
+                frame,
+                [FaceLocation(10 + 2 * frame, 10, 40, 40), FaceLocation(200, 20 + frame, 40, 40)],
+                [_crop(frame), _crop(100 + frame)],
+                [0.5 + 0.1 * (frame % 3), 0.9 - 0.1 * frame]
+            )
+
+        first, second = tracker.finish()
+
+        assert (first.hits, second.hits) == (5, 5)
+        assert [face.frame_index for face in first.best_faces] == [2, 1]
+        assert [face.frame_index for face in second.best_faces] == [0, 1]
+        assert int(second.best_faces[0].face_image[0, 0, 0]) == 100
+
+    def test_ends_tracks_after_max_missed_frames(self) -> None:
+        """Test that a face gone for more than max_missed frames starts a new track on return."""
+        tracker = FaceTracker(max_missed=1)
+        box = FaceLocation(10, 10, 40, 40)
+        tracker.update(0, [box], [_crop(0)], [0.8])
+        tracker.update(1, [], [], [])
+        tracker.update(2, [box], [_crop(2)], [0.8])  # Missed once: same track
+        tracker.update(3, [], [], [])
+        tracker.update(4, [], [], [])
+        tracker.update(5, [box], [_crop(5)], [0.8])  # Missed twice: new track
+
+        tracks = tracker.finish()
+
+        assert [(track.first_frame, track.last_frame, track.hits) for track in tracks] == [(0, 2, 2), (5, 5, 1)]
+
+
+class TestVoteIdentity:
+    """Test suite for vote_identity."""
+
+    def test_majority_wins_with_mean_confidence(self) -> None:
+        """Test that a strict plurality with enough of all crops wins."""
+        identity = vote_identity([_result("ada", 0.8), None, _result("ada", 0.6), _result("bob", 0.9)])
+
+        assert identity.user_id == "ada"
+        assert identity.votes == 2
+        assert identity.samples == 4
+        assert abs(identity.confidence - 0.7) < 1e-9
+
+        assert vote_identity([_result("ada", 0.8), None]).user_id == "ada"
+        assert vote_identity([_result("ada", 0.8), None, None]) is None
+        assert vote_identity([_result("ada", 0.8), _result("bob", 0.9)]) is None
+        assert vote_identity([None, None]) is None
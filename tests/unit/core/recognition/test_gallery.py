@@ -0,0 +1,81 @@
+"""
+Unit tests for EmbeddingGallery.
+"""
+
+import numpy as np
+
+from core.recognition.gallery import EmbeddingGallery
+from core.recognition.recognizer import FaceRecognizer
+
+
+def _unit(vector: np.ndarray) -> np.ndarray:
+    """Normalize a vector to unit length."""
+    return vector / np.linalg.norm(vector)
+
+
+class TestEmbeddingGallery:
+    """Test suite for EmbeddingGallery class."""
+
+    def test_batch_match_agrees_with_face_recognizer(self) -> None:
+        """Test that batched matching returns FaceRecognizer's best matches."""
+        rng = np.random.default_rng(0)
+        known = {f"user_{i}": _unit(rng.normal(size=32)) for i in range(20)}
+        probes = np.stack([
+            _unit(known["user_3"] + 0.1 * rng.normal(size=32)),
+            _unit(known["user_17"] + 0.1 * rng.normal(size=32)),
+            _unit(rng.normal(size=32)),
+        ])
+
+        matches = EmbeddingGallery.from_known_embeddings(known).match(probes, threshold=0.5)
+        expected = [FaceRecognizer().find_best_match(probe, known, 0.5) for probe in probes]
+
+        assert [m[0] if m else None for m in matches] == [e[0] if e else None for e in expected]
+        for match, exp in zip(matches, expected):
+            if match:
+                assert abs(match[1] - exp[1]) < 1e-5
+
+    def test_multiple_embeddings_per_user_and_dimension_mismatch(self) -> None:
+        """Test that users with several embeddings match on their best one."""
+        a, b = np.eye(4)[0], np.eye(4)[1]
+        gallery = EmbeddingGallery.from_known_embeddings({
+            "alice": [a, _unit(a + b)],
+            "bob": np.stack([b]),
+            "stale": np.ones(8),  # Different dimension, skipped
+        })
+
+        assert gallery.size == 3
+        assert gallery.match(a, threshold=0.9) == [("alice", 1.0)]
+        assert gallery.match(np.ones(8), threshold=0.1) == [None]
+
+    def test_empty_gallery_matches_nothing(self) -> None:
+        """Test that an empty gallery returns no matches."""
+        gallery = EmbeddingGallery.from_known_embeddings({})
+        assert gallery.match(np.ones((2, 4)), threshold=0.1) == [None, None]
+
+    def test_match_unique_never_assigns_a_user_twice(self) -> None:
+        """Test that two faces close to the same user are not both assigned to them."""
+        a, b = np.eye(4)[0], np.eye(4)[1]
+        gallery = EmbeddingGallery.from_known_embeddings({"alice": a, "bob": b})
+        probes = np.stack([_unit(a + 0.2 * b), _unit(a + 0.6 * b)])
+
+        assert [m[0] for m in gallery.match(probes, threshold=0.5)] == ["alice", "alice"]
+        unique = gallery.match_unique(probes, threshold=0.5)
+        assert [m[0] for m in unique] == ["alice", "bob"]
+
+    def test_subset_and_exclude_select_users_rows(self) -> None:
+        """Test that subset keeps every row of the given users and exclude masks them."""
+        basis = np.eye(4)
+        gallery = EmbeddingGallery.from_known_embeddings(
+            {"a": np.stack([basis[0], basis[1]]), "b": basis[2], "c": basis[3]}
+        )
+
+        roster = gallery.subset({"a", "c", "unknown"})
+
+        assert list(roster.row_user_ids) == ["a", "a", "c"]
+        assert roster.match(basis[1], threshold=0.5)[0][0] == "a"
+        assert gallery.match(basis[0], threshold=0.5, exclude={"a"}) == [None]
+        assert gallery.match(basis[2], threshold=0.5, exclude={"a"})[0][0] == "b"
+        assert gallery.match_unique(np.stack([basis[0], basis[3]]), 0.5, exclude={"a", "unknown"}) == [
+            None, ("c", 1.0)
+        ]
+        assert gallery.size == 4  # Excluding does not modify the gallery
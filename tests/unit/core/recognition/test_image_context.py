@@ -0,0 +1,80 @@
+"""
+Unit tests for ImageContext and its use by FaceDetector and QualityAssessor.
+"""
+
+from typing import List
+
+import cv2
+import numpy as np
+
+from core.recognition.detector import FaceDetector
+from core.recognition.image_context import ImageContext
+from core.recognition.quality_assessor import QualityAssessor
+from core.recognition.value_objects import FaceLocation
+
+FACE = FaceLocation(10, 20, 30, 40)
+
+
+def _image() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 255, size=(120, 160, 3), dtype=np.uint8)
+
+
+class _CountingStrategy:
+    """Detection strategy recording the grayscale images it was given."""
+
+    def __init__(self):
+        self.calls: List[np.ndarray] = []
+
+    def detect(self, image):
+        self.calls.append(ImageContext.of(image).gray)
+        return [(FACE, 0.9)]
+
+
+def test_conversions_are_computed_once_and_crops_share_them() -> None:
+    """Test memoized conversions and that crops are views of the parent's."""
+    image = _image()
+    context = ImageContext(image)
+
+    assert context.gray is context.gray
+    assert np.array_equal(context.rgb, cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+
+    crop = context.crop(FACE)
+    assert crop is context.crop(FACE)
+    assert np.shares_memory(crop.image, image)
+    assert np.shares_memory(crop.gray, context.gray)
+    assert np.array_equal(crop.gray, cv2.cvtColor(image[20:60, 10:40], cv2.COLOR_BGR2GRAY))
+
+
+def test_crop_converts_only_its_region_before_the_parent() -> None:
+    """Test that a crop converts itself when the parent has not been converted."""
+    image = _image()
+    context = ImageContext(image)
+
+    gray = context.crop(FaceLocation(150, 100, 30, 40)).gray  # Clipped to the image
+
+    assert gray.shape == (20, 10)
+    assert context._gray is None
+
+
+def test_detector_and_quality_results_are_memoized_per_context() -> None:
+    """Test that repeated detection and assessment of a context reuse the first result."""
+    strategy = _CountingStrategy()
+    detector = FaceDetector(detection_strategy=strategy)
+    assessor = QualityAssessor()
+    image = _image()
+    context = ImageContext(image)
+
+    first = detector.detect(context)
+    assert detector.detect(context) is first
+    assert len(strategy.calls) == 1
+    assert strategy.calls[0] is context.gray
+
+    face = context.crop(first.faces[0])
+    quality = assessor.assess(face)
+    assert assessor.assess(context.crop(first.faces[0])) is quality
+    assert quality == assessor.assess(image[20:60, 10:40].copy())
+
+    detector.detect(image)  # Plain arrays are not memoized
+    detector.detect(image)
+    assert len(strategy.calls) == 3
@@ -0,0 +1,101 @@
+"""
+Unit tests for the ONNX Runtime inference backend.
+
+A tiny linear "recognition model" is generated locally with the onnx
+package, so no exported face model is needed.
+"""
+
+import numpy as np
+import pytest
+
+onnx = pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+
+from onnx import TensorProto, helper, numpy_helper
+
+from core.recognition.embedding_extractor import EmbeddingExtractor
+from core.recognition.inference_backend import OnnxRuntimeBackend, quantize_onnx_model
+
+SIZE = 8
+DIM = 16
+
+
+def _write_model(path, weights: np.ndarray, channels_first: bool = False, batch="N") -> str:
+    """Write a model that flattens the input and multiplies it by weights."""
+    input_shape = [batch, 3, SIZE, SIZE] if channels_first else [batch, SIZE, SIZE, 3]
+    graph = helper.make_graph(
+        [
+            helper.make_node("Reshape", ["input", "shape"], ["flat"]),
+            helper.make_node("MatMul", ["flat", "weights"], ["embedding"]),
+        ],
+        "tiny_embedder",
+        [helper.make_tensor_value_info("input", TensorProto.FLOAT, input_shape)],
+        [helper.make_tensor_value_info("embedding", TensorProto.FLOAT, [batch, DIM])],
+        initializer=[
+            numpy_helper.from_array(np.array([-1, SIZE * SIZE * 3], dtype=np.int64), "shape"),
+            numpy_helper.from_array(weights, "weights"),
+        ]
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    model.ir_version = 8
+    onnx.save(model, str(path))
+    return str(path)
+
+
+@pytest.fixture
+def weights() -> np.ndarray:
+    return np.random.default_rng(0).standard_normal((SIZE * SIZE * 3, DIM)).astype(np.float32)
+
+
+@pytest.fixture
+def faces() -> np.ndarray:
+    return np.random.default_rng(1).integers(0, 256, (5, SIZE, SIZE, 3), dtype=np.uint8)
+
+
+class TestOnnxRuntimeBackend:
+    """Test suite for OnnxRuntimeBackend."""
+
+    def test_batched_forward_matches_reference(self, tmp_path, weights, faces) -> None:
+        """Test that one batched call reproduces the model's math."""
+        backend = OnnxRuntimeBackend(_write_model(tmp_path / "tiny.onnx", weights), intra_op_threads=1)
+
+        output = backend.forward(faces)
+
+        expected = (faces.astype(np.float32) / 255.0).reshape(len(faces), -1) @ weights
+        assert backend.input_size == SIZE
+        assert np.allclose(output, expected, atol=1e-4)
+
+    def test_channels_first_fixed_batch_model(self, tmp_path, weights, faces) -> None:
+        """Test NCHW inputs and a model exported with batch size 1."""
+        path = _write_model(tmp_path / "nchw.onnx", weights, channels_first=True, batch=1)
+        backend = OnnxRuntimeBackend(path, input_mean=127.5, input_std=127.5)
+
+        output = backend.forward(faces)
+
+        scaled = (faces.astype(np.float32) - 127.5) / 127.5
+        expected = scaled.transpose(0, 3, 1, 2).reshape(len(faces), -1) @ weights
+        assert np.allclose(output, expected, atol=1e-4)
+
+    def test_int8_variant_stays_close(self, tmp_path, weights, faces) -> None:
+        """Test that the int8-quantized model gives nearly the same embeddings."""
+        path = _write_model(tmp_path / "tiny.onnx", weights)
+        quantize_onnx_model(path)
+        full = OnnxRuntimeBackend(path).forward(faces)
+
+        quantized = OnnxRuntimeBackend(path, use_int8=True).forward(faces)
+
+        cosine = np.sum(full * quantized, axis=1) / (
+            np.linalg.norm(full, axis=1) * np.linalg.norm(quantized, axis=1)
+        )
+        assert np.all(cosine > 0.99)
+
+    def test_extractor_runs_on_backend_without_deepface(self, tmp_path, weights, faces) -> None:
+        """Test that EmbeddingExtractor embeds batches through the ONNX backend and names it in its model ID."""
+        extractor = EmbeddingExtractor(backend=OnnxRuntimeBackend(_write_model(tmp_path / "tiny.onnx", weights)))
+
+        results = extractor.extract_batch(list(faces))
+
+        assert len(results) == len(faces)
+        assert all(result.dimension == DIM for result in results)
+        assert np.allclose([np.linalg.norm(result.embedding) for result in results], 1.0)
+        assert extractor.model_id == "ArcFace@onnxruntime-tiny"
@@ -0,0 +1,63 @@
+"""
+Unit tests for PooledFaceDetector.
+
+The pooled detectors are mocks; no detection model is loaded.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from core.recognition.detector import PooledFaceDetector
+
+
+class TestPooledFaceDetector:
+    """Test suite for PooledFaceDetector class."""
+
+    def test_detectors_are_never_used_concurrently(self) -> None:
+        """Test that each detector serves one caller at a time and the pool stays bounded."""
+        active = set()
+        overlaps = []
+        lock = threading.Lock()
+
+        def make_detector():
+            detector = Mock()
+
+            def detect(image):
+                with lock:
+                    if id(detector) in active:
+                        overlaps.append(id(detector))
+                    active.add(id(detector))
+                time.sleep(0.02)
+                with lock:
+                    active.discard(id(detector))
+                return "result"
+
+            detector.detect.side_effect = detect
+            return detector
+
+        pool = PooledFaceDetector(make_detector, pool_size=2)
+        image = np.zeros((10, 10, 3), dtype=np.uint8)
+        threads = [threading.Thread(target=pool.detect, args=(image,)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert overlaps == []
+        assert pool.created == 2
+
+    def test_first_detector_is_created_eagerly(self) -> None:
+        """Test that construction errors surface when the pool is created."""
+        factory = Mock(side_effect=ImportError("MediaPipe is not available"))
+
+        with pytest.raises(ImportError):
+            PooledFaceDetector(factory, pool_size=2)
+
+    def test_invalid_pool_size(self) -> None:
+        """Test that a pool size below 1 is rejected."""
+        with pytest.raises(ValueError):
+            PooledFaceDetector(Mock(), pool_size=0)
@@ -0,0 +1,106 @@
+"""
+Unit tests for the priority-aware inference scheduler.
+
+This module tests priority ordering, per-class concurrency limits, aging
+and error delivery.
+"""
+
+import threading
+import time
+
+import pytest
+
+from core.shared.inference_scheduler import (
+    InferenceScheduler,
+    PriorityClass,
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+)
+
+
+def _blocked_scheduler(scheduler: InferenceScheduler, priority: str) -> threading.Event:
+    """Occupy the scheduler's single worker until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def block() -> None:
+        started.set()
+        release.wait(5)
+
+    scheduler.submit(priority, block)
+    assert started.wait(5)
+    return release
+
+
+class TestInferenceScheduler:
+    """Test suite for InferenceScheduler."""
+
+    def test_interactive_runs_before_earlier_bulk(self) -> None:
+        """Test that queued interactive tasks are picked before older bulk tasks."""
+        scheduler = InferenceScheduler.interactive_and_bulk(
+            max_workers=1, bulk_max_concurrency=1, aging_seconds=0
+        )
+        order = []
+        release = _blocked_scheduler(scheduler, PRIORITY_BULK)
+
+        futures = [
+            scheduler.submit(PRIORITY_BULK, order.append, "bulk-1"),
+            scheduler.submit(PRIORITY_BULK, order.append, "bulk-2"),
+            scheduler.submit(PRIORITY_INTERACTIVE, order.append, "interactive"),
+        ]
+        assert scheduler.stats()[PRIORITY_BULK]["queued"] == 2
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+        scheduler.close()
+
+        assert order == ["interactive", "bulk-1", "bulk-2"]
+
+    def test_class_concurrency_limit_is_enforced(self) -> None:
+        """Test that a class never occupies more workers than its limit."""
+        scheduler = InferenceScheduler(
+            [PriorityClass(PRIORITY_BULK, 1, max_concurrency=2)], max_workers=4
+        )
+        lock = threading.Lock()
+        running = [0, 0]  # current, peak
+
+        def task() -> None:
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+
+        futures = [scheduler.submit(PRIORITY_BULK, task) for _ in range(8)]
+        for future in futures:
+            future.result(timeout=5)
+        scheduler.close()
+
+        assert running[1] == 2
+
+    def test_aging_promotes_waiting_bulk_task(self) -> None:
+        """Test that a bulk task waiting longer than aging_seconds beats new interactive work."""
+        scheduler = InferenceScheduler.interactive_and_bulk(max_workers=1, aging_seconds=0.01)
+        order = []
+        release = _blocked_scheduler(scheduler, PRIORITY_INTERACTIVE)
+
+        bulk = scheduler.submit(PRIORITY_BULK, order.append, "bulk")
+        time.sleep(0.05)
+        interactive = scheduler.submit(PRIORITY_INTERACTIVE, order.append, "interactive")
+        release.set()
+        bulk.result(timeout=5)
+        interactive.result(timeout=5)
+        scheduler.close()
+
+        assert order == ["bulk", "interactive"]
+
+    def test_errors_are_delivered_and_unknown_classes_rejected(self) -> None:
+        """Test that task exceptions reach the caller and bad priorities raise ValueError."""
+        scheduler = InferenceScheduler.interactive_and_bulk(max_workers=1)
+
+        with pytest.raises(ZeroDivisionError):
+            scheduler.submit(PRIORITY_INTERACTIVE, lambda: 1 / 0).result(timeout=5)
+        with pytest.raises(ValueError):
+            scheduler.submit("urgent", print)
+        scheduler.close()
@@ -0,0 +1,97 @@
+"""
+Unit tests for the in-process metrics registry.
+
+This module tests counters, histograms and the text exposition output.
+"""
+
+import pytest
+
+from core.shared.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Test suite for MetricsRegistry, Counter and Histogram."""
+
+    def test_counter_increments_per_label_set(self) -> None:
+        """Test that counters track values independently per label set."""
+        registry = MetricsRegistry()
+        counter = registry.counter("eyed_test_total", "Test counter", ("strategy",))
+
+        counter.inc(strategy="opencv")
+        counter.inc(2, strategy="opencv")
+        counter.inc(strategy="mediapipe")
+
+        assert counter.get(strategy="opencv") == 3
+        assert counter.get(strategy="mediapipe") == 1
+        assert counter.get(strategy="yolo") == 0
+
+    def test_counter_rejects_wrong_labels(self) -> None:
+        """Test that label mismatches raise ValueError."""
+        registry = MetricsRegistry()
+        counter = registry.counter("eyed_test_total", "Test counter", ("strategy",))
+
+        with pytest.raises(ValueError):
+            counter.inc(stage="detection")
+
+    def test_gauge_goes_up_and_down(self) -> None:
+        """Test that gauges can be set, incremented and decremented."""
+        registry = MetricsRegistry()
+        gauge = registry.gauge("eyed_test_depth", "Test gauge", ("priority",))
+
+        gauge.set(5, priority="bulk")
+        gauge.inc(priority="bulk")
+        gauge.dec(3, priority="bulk")
+
+        assert gauge.get(priority="bulk") == 3
+        assert 'eyed_test_depth{priority="bulk"} 3' in registry.render()
+
+    def test_registry_returns_same_metric_by_name(self) -> None:
+        """Test that metrics are shared by name and type conflicts are rejected."""
+        registry = MetricsRegistry()
+        first = registry.histogram("eyed_test_seconds", "Test", ("stage",))
+        second = registry.histogram("eyed_test_seconds", "Test", ("stage",))
+
+        assert first is second
+        with pytest.raises(ValueError):
+            registry.counter("eyed_test_seconds", "Test", ("stage",))
+
+    def test_histogram_time_records_observation(self) -> None:
+        """Test that Histogram.time works as context manager and decorator."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("eyed_test_seconds", "Test", ("stage",))
+
+        with histogram.time(stage="detection"):
+            pass
+
+        @histogram.time(stage="matching")
+        def match() -> int:
+            return 42
+
+        assert match() == 42
+        assert match() == 42
+        assert histogram.get_count(stage="detection") == 1
+        assert histogram.get_count(stage="matching") == 2
+
+    def test_render_text_exposition_format(self) -> None:
+        """Test cumulative buckets, sum/count lines and label escaping."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram(
+            "eyed_test_seconds", "Test histogram", ("stage",), buckets=(0.1, 1.0)
+        )
+        counter = registry.counter("eyed_test_total", "Test counter", ("path",))
+
+        histogram.observe(0.05, stage="detection")
+        histogram.observe(0.5, stage="detection")
+        histogram.observe(5.0, stage="detection")
+        counter.inc(path='a"b')
+
+        text = registry.render()
+
+        assert "# TYPE eyed_test_seconds histogram" in text
+        assert 'eyed_test_seconds_bucket{stage="detection",le="0.1"} 1' in text
+        assert 'eyed_test_seconds_bucket{stage="detection",le="1"} 2' in text
+        assert 'eyed_test_seconds_bucket{stage="detection",le="+Inf"} 3' in text
+        assert 'eyed_test_seconds_sum{stage="detection"} 5.55' in text
+        assert 'eyed_test_seconds_count{stage="detection"} 3' in text
+        assert 'eyed_test_total{path="a\\"b"} 1' in text
+        assert text.endswith("\n")
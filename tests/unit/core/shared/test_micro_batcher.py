@@ -0,0 +1,64 @@
+"""
+Unit tests for MicroBatcher.
+"""
+
+import threading
+
+import pytest
+
+from core.shared.micro_batcher import MicroBatcher
+
+
+class TestMicroBatcher:
+    """Test suite for MicroBatcher class."""
+
+    def test_concurrent_submissions_are_batched(self) -> None:
+        """Test that items submitted together are processed in one batch."""
+        batches = []
+        release = threading.Event()
+
+        def process(items):
+            release.wait(timeout=5)
+            batches.append(list(items))
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(process, max_batch_size=8, max_wait_ms=200.0, name="test")
+        futures = [batcher.submit(i) for i in range(5)]
+        release.set()
+
+        assert [future.result(timeout=5) for future in futures] == [0, 2, 4, 6, 8]
+        assert batches == [[0, 1, 2, 3, 4]]
+        batcher.close()
+
+    def test_batches_are_limited_to_max_batch_size(self) -> None:
+        """Test that no batch exceeds max_batch_size."""
+        sizes = []
+        batcher = MicroBatcher(lambda items: sizes.append(len(items)) or items,
+                               max_batch_size=3, max_wait_ms=50.0)
+
+        futures = [batcher.submit(i) for i in range(7)]
+
+        assert [future.result(timeout=5) for future in futures] == list(range(7))
+        assert max(sizes) <= 3
+        assert sum(sizes) == 7
+        batcher.close()
+
+    def test_exceptions_are_delivered_per_item_and_per_batch(self) -> None:
+        """Test that exception entries fail only their item and batch errors fail all."""
+        def process(items):
+            if "fail_batch" in items:
+                raise RuntimeError("batch failed")
+            return [ValueError(item) if item == "bad" else item for item in items]
+
+        batcher = MicroBatcher(process, max_batch_size=4, max_wait_ms=50.0)
+        good, bad = batcher.submit("good"), batcher.submit("bad")
+        assert good.result(timeout=5) == "good"
+        with pytest.raises(ValueError):
+            bad.result(timeout=5)
+
+        with pytest.raises(RuntimeError):
+            batcher.process("fail_batch", timeout=5)
+
+        batcher.close()
+        with pytest.raises(RuntimeError):
+            batcher.submit("late")
@@ -0,0 +1,101 @@
+"""
+Unit tests for StreamingLivenessVerifier.
+
+Frames are stand-ins that already hold (12, 2) eye points (or None when no
+face is found), so the extractor is the identity function.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+import pytest
+
+from core.liveness.blink_detector import BlinkDetector
+from domain.services.liveness.streaming_verifier import StreamingLivenessVerifier
+
+OPEN_EAR = 0.3
+CLOSED_EAR = 0.05
+
+
+def _eye_points(ear: float) -> np.ndarray:
+    """Create (12, 2) eye points where both eyes have the given EAR."""
+    eye = np.array([(0.0, 0.0), (0.3, -ear / 2), (0.6, -ear / 2),
+                    (1.0, 0.0), (0.6, ear / 2), (0.3, ear / 2)])
+    return np.concatenate([eye, eye])
+
+
+def _frames(ears: List[Optional[float]]) -> List[Optional[np.ndarray]]:
+    return [None if ear is None else _eye_points(ear) for ear in ears]
+
+
+def _blinking(blinks: int, open_frames: int = 10, closed_frames: int = 2, tail: int = 0) -> List[float]:
+    """EARs with `blinks` blinks separated by open frames, plus a tail of open frames."""
+    ears = [OPEN_EAR] * open_frames
+    for _ in range(blinks):
+        ears += [0.22] + [CLOSED_EAR] * closed_frames + [0.22] + [OPEN_EAR] * open_frames
+    return ears + [OPEN_EAR] * tail
+
+
+class TestStreamingLivenessVerifier:
+    """Test suite for StreamingLivenessVerifier class."""
+
+    def test_stops_once_min_blinks_reached(self) -> None:
+        """Test verification stops at the third blink and skips the rest."""
+        frames = _frames(_blinking(3, tail=100))
+        verifier = StreamingLivenessVerifier(BlinkDetector(), min_blinks=3, sparse_stride=1)
+        
+        report = verifier.verify(frames, lambda frame: frame)
+        
+        assert report.is_verified is True
+        assert report.blink_count == 3
+        assert report.early_exit is True
+        assert report.frames_received == len(frames)
+        assert report.frames_processed < len(frames) - 100
+
+    def test_stops_once_min_blinks_unreachable(self) -> None:
+        """Test verification fails as soon as too few frames remain for the missing blinks."""
+        frames = _frames([OPEN_EAR] * 20)
+        verifier = StreamingLivenessVerifier(BlinkDetector(), min_blinks=3, sparse_stride=1)
+        
+        report = verifier.verify(frames, lambda frame: frame)
+        
+        assert report.is_verified is False
+        assert report.early_exit is True
+        # With 5 frames left at most 2 more blinks fit, so it stops there
+        assert report.frames_processed == 15
+
+    def test_adaptive_sampling_counts_same_blinks_with_fewer_frames(self) -> None:
+        """Test sparse sampling backfills around EAR dips and keeps the blink count."""
+        ears = _blinking(2, open_frames=15) + [None, OPEN_EAR]
+        frames = _frames(ears)
+        dense = BlinkDetector().detect_sequence(
+            np.stack([f if f is not None else np.zeros((12, 2)) for f in frames]),
+            valid=np.array([f is not None for f in frames])
+        )
+        verifier = StreamingLivenessVerifier(BlinkDetector(), min_blinks=3, sparse_stride=3)
+        
+        report = verifier.verify(frames, lambda frame: frame)
+        
+        assert report.blink_count == dense.blink_count == 2
+        assert report.is_verified is False
+        assert report.frames_processed < report.frames_received
+        assert report.frames_skipped == report.frames_received - report.frames_processed
+
+    def test_find_face_stops_at_first_face(self) -> None:
+        """Test the trusted-frontend check stops at the first frame with a face."""
+        verifier = StreamingLivenessVerifier(BlinkDetector())
+        
+        report = verifier.find_face(_frames([None, None, OPEN_EAR, OPEN_EAR]), lambda frame: frame)
+        assert report.is_verified is True
+        assert report.frames_processed == 3
+        
+        report = verifier.find_face(_frames([None, None]), lambda frame: frame)
+        assert report.is_verified is False
+        assert report.frames_processed == 2
+
+    def test_invalid_parameters_raise(self) -> None:
+        """Test min_blinks and sparse_stride must be at least 1."""
+        with pytest.raises(ValueError):
+            StreamingLivenessVerifier(BlinkDetector(), min_blinks=0)
+        with pytest.raises(ValueError):
+            StreamingLivenessVerifier(BlinkDetector(), sparse_stride=0)
@@ -0,0 +1,121 @@
+"""
+Unit tests for FaceRecognitionService.
+
+This module tests batch recognition with roster scoping, using mocked
+detection, embedding and quality components.
+"""
+
+from unittest.mock import Mock
+
+import numpy as np
+
+from core.recognition.detector import FaceDetector
+from core.recognition.embedding_extractor import EmbeddingExtractor
+from core.recognition.quality_assessor import QualityAssessor
+from core.recognition.recognizer import FaceRecognizer
+from core.recognition.value_objects import DetectionResult, EmbeddingResult, FaceLocation, QualityResult
+from domain.services.recognition import FaceRecognitionService
+
+
+def _service(probes: np.ndarray) -> FaceRecognitionService:
+    """Create a service whose extractor returns the given probe embeddings."""
+    extractor = Mock(spec=EmbeddingExtractor)
+    extractor.extract_batch.return_value = [
+        EmbeddingResult(embedding=probe, dimension=len(probe), extraction_time_ms=0.0)
+        for probe in probes
+    ]
+    return FaceRecognitionService(
+        face_detector=Mock(spec=FaceDetector),
+        embedding_extractor=extractor,
+        face_recognizer=FaceRecognizer(),
+        quality_assessor=Mock(spec=QualityAssessor),
+        confidence_threshold=0.5
+    )
+
+
+class TestFaceRecognitionServiceRosters:
+    """Test suite for roster-scoped recognition."""
+
+    def test_roster_is_searched_first_with_global_fallback(self) -> None:
+        """Test that roster users win inside the roster and others still match globally."""
+        basis = np.eye(4)
+        known = {"alice": basis[0], "alice_twin": basis[0] * 0.99 + basis[3] * 0.01, "bob": basis[1]}
+        probes = np.stack([basis[0] * 0.98 + basis[3] * 0.2, basis[1], basis[2]])
+        service = _service(probes)
+        faces = [np.zeros((8, 8, 3), dtype=np.uint8)] * 3
+
+        results = service.recognize_faces(
+            faces, known, {}, rosters=[frozenset({"alice"})] * 3
+        )
+
+        # alice_twin scores higher globally, but alice is on the roster
+        assert [r.user_id if r else None for r in results] == ["alice", "bob", None]
+        unscoped = service.recognize_faces(faces, known, {})
+        assert unscoped[0].user_id == "alice_twin"
+
+
+class TestFaceRecognitionServiceCascade:
+    """Test suite for two-stage cascade recognition."""
+
+    def test_fast_accepts_and_ambiguous_faces_escalate(self) -> None:
+        """Test that clear fast matches skip the full model and ambiguous ones do not."""
+        basis = np.eye(4)
+        known = {"alice": basis[0], "bob": basis[1]}
+        fast_known = {"alice": basis[0], "bob": basis[1]}
+        fast_probes = [basis[0], basis[0] + basis[1]]  # clear, ambiguous
+        service = _service(np.stack([basis[1]]))
+        fast_extractor = Mock(spec=EmbeddingExtractor)
+        fast_extractor.extract_batch.return_value = [
+            EmbeddingResult(embedding=probe, dimension=4, extraction_time_ms=0.0)
+            for probe in fast_probes
+        ]
+        service.fast_embedding_extractor = fast_extractor
+        faces = [np.zeros((8, 8, 3), dtype=np.uint8)] * 2
+
+        results = service.recognize_faces_cascade(faces, known, fast_known, {})
+
+        assert [r.user_id for r in results] == ["alice", "bob"]
+        # Only the ambiguous face reached the full model
+        assert len(service.embedding_extractor.extract_batch.call_args[0][0]) == 1
+
+    def test_missing_fast_embedding_escalates(self) -> None:
+        """Test that an incomplete fast gallery escalates instead of accepting."""
+        basis = np.eye(4)
+        known = {"alice": basis[0], "bob": basis[1]}
+        service = _service(np.stack([basis[1]]))
+        fast_extractor = Mock(spec=EmbeddingExtractor)
+        fast_extractor.extract_batch.return_value = [
+            EmbeddingResult(embedding=basis[0], dimension=4, extraction_time_ms=0.0)
+        ]
+        service.fast_embedding_extractor = fast_extractor
+
+        results = service.recognize_faces_cascade(
+            [np.zeros((8, 8, 3), dtype=np.uint8)], known, {"alice": basis[0]}, {}
+        )
+
+        # bob has no fast embedding, so the full model decides
+        assert results[0].user_id == "bob"
+
+
+class TestFaceRecognitionServiceMultipleFaces:
+    """Test suite for class photo recognition."""
+
+    def test_suitable_faces_are_embedded_in_one_batch(self) -> None:
+        """Test that faces passing the quality check are embedded with one call, in photo order."""
+        basis = np.eye(4)
+        service = _service(np.stack([basis[1], basis[0]]))
+        faces = [FaceLocation(0, 0, 8, 8), FaceLocation(10, 0, 8, 8), FaceLocation(20, 0, 8, 8)]
+        service.face_detector.detect.return_value = DetectionResult(True, 3, faces, [0.9] * 3)
+        service.quality_assessor.assess.side_effect = [
+            QualityResult(score, score, score, score, score, score >= 0.5)
+            for score in (0.9, 0.1, 0.9)
+        ]
+
+        results = service.recognize_multiple_faces(
+            np.zeros((8, 32, 3), dtype=np.uint8), {"alice": basis[0], "bob": basis[1]}, {}
+        )
+
+        assert [r.user_id if r else None for r in results] == ["bob", None, "alice"]
+        assert service.embedding_extractor.extract_batch.call_count == 1
+        assert len(service.embedding_extractor.extract_batch.call_args[0][0]) == 2
+        service.embedding_extractor.extract.assert_not_called()
@@ -0,0 +1,108 @@
+"""
+Unit tests for FrameRingBuffer.
+"""
+
+import threading
+import time
+
+from infrastructure.camera.frame_buffer import FrameRingBuffer
+
+SHAPE = (4, 6, 3)
+
+
+def _write(buffer: FrameRingBuffer, value: int, timestamp: float = None) -> int:
+    slot = buffer.write_slot(SHAPE)
+    slot[:] = value
+    return buffer.commit(timestamp)
+
+
+class TestFrameRingBuffer:
+    """Test suite for FrameRingBuffer class."""
+
+    def test_latest_returns_view_of_newest_frame(self) -> None:
+        """Test latest() returns the newest frame as a zero-copy view unless copied."""
+        buffer = FrameRingBuffer(capacity=3)
+        assert buffer.latest() is None
+        
+        for value in range(5):
+            _write(buffer, value)
+        
+        latest = buffer.latest()
+        assert latest.sequence == 4
+        assert int(latest.image[0, 0, 0]) == 4
+        assert latest.image.base is not None
+        
+        copied = buffer.latest(copy=True)
+        _write(buffer, 5)
+        _write(buffer, 6)
+        _write(buffer, 7)  # Overwrites the slot of frame 4
+        assert int(copied.image[0, 0, 0]) == 4
+        assert int(latest.image[0, 0, 0]) == 7
+
+    def test_counts_frames_overwritten_before_being_taken(self) -> None:
+        """Test frames_dropped counts frames no reader took before they were overwritten."""
+        buffer = FrameRingBuffer(capacity=2)
+        for value in range(3):
+            _write(buffer, value, timestamp=float(value) / 10)
+        assert buffer.stats().frames_dropped == 1
+        
+        buffer.latest()  # Takes frame 2
+        _write(buffer, 3, timestamp=0.3)  # Overwrites untaken frame 1
+        _write(buffer, 4, timestamp=0.4)  # Overwrites taken frame 2
+        
+        stats = buffer.stats()
+        assert stats.frames_captured == 5
+        assert stats.frames_dropped == 2
+        assert abs(stats.capture_fps - 10.0) < 1e-6
+
+    def test_next_frames_waits_for_new_frames_in_order(self) -> None:
+        """Test next_frames returns frames captured after the call, in order."""
+        buffer = FrameRingBuffer(capacity=4)
+        _write(buffer, 0)
+        started = threading.Event()
+        
+        def writer() -> None:
+            started.wait()
+            for value in range(1, 4):
+                _write(buffer, value)
+        
+        thread = threading.Thread(target=writer)
+        thread.start()
+        started.set()
+        frames = buffer.next_frames(3, timeout=2.0)
+        thread.join()
+        
+        assert [frame.sequence for frame in frames] == [1, 2, 3]
+        assert [int(frame.image[0, 0, 0]) for frame in frames] == [1, 2, 3]
+        assert buffer.next_frames(1, timeout=0.01) == []
+
+    def test_lagging_reader_skips_the_slot_being_written(self) -> None:
+        """Test a reader that fell behind never gets the frame the grabber is writing."""
+        buffer = FrameRingBuffer(capacity=3)
+        _write(buffer, 0)
+        frames = []
+        reader = threading.Thread(target=lambda: frames.extend(buffer.next_frames(2, timeout=2.0)))
+        reader.start()
+        while not buffer._condition._waiters:  # The reader is waiting for frame 1
+            time.sleep(0.001)
+        
+        with buffer._condition:  # The reader wakes up only after all of this
+            for value in range(1, 5):
+                _write(buffer, value)
+            buffer.write_slot(SHAPE)[:] = 99  # Frame 5 being captured, not committed
+        reader.join()
+        
+        assert [frame.sequence for frame in frames] == [3, 4]
+        assert [int(frame.image[0, 0, 0]) for frame in frames] == [3, 4]
+
+    def test_write_slot_reallocates_on_shape_change(self) -> None:
+        """Test a new frame shape reallocates storage."""
+        buffer = FrameRingBuffer(capacity=2)
+        _write(buffer, 1)
+        slot = buffer.write_slot((2, 2, 3))
+        assert buffer.latest() is None  # Not the uninitialized new storage
+        slot[:] = 9
+        buffer.commit()
+        
+        assert buffer.latest().image.shape == (2, 2, 3)
+        assert buffer.latest().sequence == 1
@@ -0,0 +1,187 @@
+"""
+Unit tests for KioskPipeline.
+
+A recorded MJPG video stands in for the webcam. Frame brightness encodes the
+scene: dark frames have no face, bright frames a face with open eyes and
+mid-gray frames a face with closed eyes. Detection and recognition are
+simple stand-ins; liveness verification and attendance persistence use the
+real use case, services and repository on a temporary CSV file.
+"""
+
+from typing import List, Optional
+
+import cv2
+import numpy as np
+import pytest
+
+from core.attendance.attendance_logger import AttendanceLogger
+from core.attendance.attendance_validator import AttendanceValidator
+from core.liveness.blink_detector import BlinkDetector
+from core.liveness.landmark_extractor import LandmarkExtractor
+from core.recognition.value_objects import FaceLocation
+from domain.services.attendance import AttendanceService
+from domain.services.liveness import LivenessService
+from domain.services.liveness.liveness_verifier import LivenessVerifier
+from domain.shared.exceptions import FaceDetectionFailedError
+from infrastructure.camera.frame_source import VideoFileSource
+from infrastructure.storage.csv_handler import CSVHandler
+from infrastructure.storage.file_storage import FileStorage
+from kiosk.pipeline import KioskConfig, KioskPipeline
+from repositories.attendance_repository import AttendanceRepository
+from use_cases.mark_attendance import MarkAttendanceUseCase
+from use_cases.recognize_face import RecognizeFaceResponse
+
+NO_FACE, EYES_OPEN, EYES_CLOSED = 0, 220, 110
+OTHER_EYES_OPEN, OTHER_EYES_CLOSED = 190, 80  # A second person
+SIZE = (96, 128)  # (height, width)
+
+
+def _write_video(path: str, levels: List[int]) -> None:
+    """Write one uniform frame per brightness level as an MJPG video."""
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 30.0, (SIZE[1], SIZE[0]))
+    assert writer.isOpened()
+    for level in levels:
+        writer.write(np.full(SIZE + (3,), level, dtype=np.uint8))
+    writer.release()
+
+
+def _blinks(count: int, eyes_open: int = EYES_OPEN, eyes_closed: int = EYES_CLOSED) -> List[int]:
+    return [eyes_open] * 4 + ([eyes_closed] * 2 + [eyes_open] * 4) * count
+
+
+def _eye_points(ear: float) -> np.ndarray:
+    """Create normalized (12, 2) eye points where both eyes have the given EAR."""
+    eye = np.array([(0.0, 0.0), (0.3, -ear / 2), (0.6, -ear / 2),
+                    (1.0, 0.0), (0.6, ear / 2), (0.3, ear / 2)])
+    return np.concatenate([eye, eye]) * 0.2 + 0.4
+
+
+class _BrightnessFaces:
+    """Detection and landmark stand-in reading the scene from frame brightness."""
+
+    face_roi_from_eye_points = staticmethod(LandmarkExtractor.face_roi_from_eye_points)
+
+    def detect_and_assess_face_with_location(self, image: np.ndarray):
+        if image.mean() < 50:
+            raise FaceDetectionFailedError()
+        quality = type("Quality", (), {"overall_score": 0.9})()
+        return image[16:80, 32:96], quality, FaceLocation(32, 16, 64, 64)
+
+    def extract_eye_points(self, face_image: np.ndarray, roi=None, full_frame_fallback=True) -> Optional[np.ndarray]:
+        brightness = face_image.mean()
+        if brightness < 50:
+            return None
+        return _eye_points(0.3 if brightness > 165 else 0.05)
+
+
+class _KnownUser:
+    """Recognition stand-in that recognizes every face as one user."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def execute_for_face(self, face_image, face_quality_score, location=None, face_roi=None):
+        self.calls += 1
+        return RecognizeFaceResponse(success=True, user_id="user_1", user_name="Ada", confidence=0.92)
+
+
+class _TwoUsers:
+    """Recognition stand-in telling the two people apart by brightness."""
+
+    def execute_for_face(self, face_image, face_quality_score, location=None, face_roi=None):
+        level = float(face_image.mean())
+        if min(abs(level - EYES_OPEN), abs(level - EYES_CLOSED)) <= min(
+                abs(level - OTHER_EYES_OPEN), abs(level - OTHER_EYES_CLOSED)):
+            return RecognizeFaceResponse(success=True, user_id="user_1", user_name="Ada", confidence=0.92)
+        return RecognizeFaceResponse(success=True, user_id="user_2", user_name="Grace", confidence=0.9)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Attendance repository on a temporary CSV file."""
+    csv_handler = CSVHandler(file_storage=FileStorage(base_path=tmp_path))
+    return AttendanceRepository(csv_handler=csv_handler, data_file="attendance.csv")
+
+
+def _pipeline(repository, recognizer, **config) -> KioskPipeline:
+    faces = _BrightnessFaces()
+    mark_use_case = MarkAttendanceUseCase(
+        liveness_service=LivenessService(
+            landmark_extractor=faces,
+            liveness_verifier=LivenessVerifier(blink_detector=BlinkDetector())
+        ),
+        attendance_service=AttendanceService(
+            attendance_logger=AttendanceLogger(),
+            attendance_validator=AttendanceValidator()
+        ),
+        attendance_repository=repository
+    )
+    return KioskPipeline(
+        face_recognition_service=faces,
+        recognize_face_use_case=recognizer,
+        mark_attendance_use_case=mark_use_case,
+        landmark_extractor=faces,
+        blink_detector=BlinkDetector(),
+        config=KioskConfig(location="hall", lost_face_frames=3, **config)
+    )
+
+
+class TestKioskPipeline:
+    """Test suite for KioskPipeline driven by a recorded video."""
+
+    def test_marks_attendance_once_after_enough_blinks(self, tmp_path, repository) -> None:
+        """Test a recognized face that blinks three times is marked once and written to the repository."""
+        video = str(tmp_path / "kiosk.avi")
+        face = _blinks(3)[:-3]  # Leaves right after the third blink
+        _write_video(video, [NO_FACE] * 5 + face + [NO_FACE] * 5)
+        recognizer = _KnownUser()
+        
+        report = _pipeline(repository, recognizer).run(VideoFileSource(video))
+        
+        assert report.marked == [("user_1", "Ada")]
+        assert report.tracks_started == 1
+        assert recognizer.calls == 1
+        assert report.stages["capture"].processed == 5 + len(face) + 5
+        assert report.stages["capture"].dropped == 0
+        assert report.stages["liveness"].processed == len(face)  # The track ends once marked
+        records = repository.get_attendance_history(user_id="user_1")
+        assert len(records) == 1
+        assert records[0].location == "hall"
+        assert records[0].liveness_verified
+
+    def test_face_lost_before_enough_blinks_is_not_marked(self, tmp_path, repository) -> None:
+        """Test a face that leaves after two blinks ends its track without attendance."""
+        video = str(tmp_path / "kiosk.avi")
+        _write_video(video, _blinks(2) + [NO_FACE] * 5)
+        
+        report = _pipeline(repository, _KnownUser()).run(VideoFileSource(video))
+        
+        assert report.marked == []
+        assert report.rejected == {"lost": 1}
+        assert repository.get_attendance_history(user_id="user_1") == []
+
+    def test_cooldown_prevents_marking_the_same_user_twice(self, tmp_path, repository) -> None:
+        """Test a user who returns within the cooldown is recognized but not marked again."""
+        video = str(tmp_path / "kiosk.avi")
+        _write_video(video, _blinks(3) + [NO_FACE] * 4 + _blinks(3) + [NO_FACE] * 4)
+        
+        report = _pipeline(repository, _KnownUser()).run(VideoFileSource(video))
+        
+        assert report.marked == [("user_1", "Ada")]
+        assert report.tracks_started >= 2
+        assert "cooldown" in report.rejected
+        assert len(repository.get_attendance_history(user_id="user_1")) == 1
+
+    def test_next_person_is_marked_after_the_previous_one(self, tmp_path, repository) -> None:
+        """Test the track ends once marked, so a second person stepping in right after is marked too."""
+        video = str(tmp_path / "kiosk.avi")
+        _write_video(
+            video,
+            [NO_FACE] * 3 + _blinks(3) + [OTHER_EYES_OPEN] * 12
+            + _blinks(3, OTHER_EYES_OPEN, OTHER_EYES_CLOSED) + [NO_FACE] * 4
+        )
+        
+        report = _pipeline(repository, _TwoUsers()).run(VideoFileSource(video))
+        
+        assert report.marked == [("user_1", "Ada"), ("user_2", "Grace")]
+        assert len(repository.get_attendance_history(user_id="user_2")) == 1
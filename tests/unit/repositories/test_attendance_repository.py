@@ -0,0 +1,114 @@
+"""
+Unit tests for AttendanceRepository.
+
+Uses a real CSVHandler on a temporary directory.
+"""
+
+import threading
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from domain.entities.attendance_record import AttendanceRecord
+from infrastructure.storage.csv_handler import CSVHandler
+from infrastructure.storage.file_storage import FileStorage
+from repositories.attendance_repository import AttendanceRepository
+
+
+def _record(record_id: str, user_id: str, day: date) -> AttendanceRecord:
+    """Create an attendance record for a user on a given day."""
+    return AttendanceRecord.create(
+        record_id=record_id,
+        user_id=user_id,
+        user_name=f"User {user_id}",
+        date=day,
+        time=datetime.now().time().replace(microsecond=0),
+        confidence=0.9,
+        liveness_verified=True,
+        face_quality_score=0.8,
+        processing_time_ms=10.0,
+        verification_stage="test",
+        session_id=record_id,
+        device_info="test",
+        location="test"
+    )
+
+
+@pytest.fixture
+def repository_factory(tmp_path):
+    """Return a factory creating repositories on the same temporary CSV file."""
+    csv_handler = CSVHandler(file_storage=FileStorage(base_path=tmp_path))
+    return lambda: AttendanceRepository(csv_handler=csv_handler, data_file="attendance.csv")
+
+
+class TestAttendanceRepositoryDayIndex:
+    """Test suite for the per-day attendance count index."""
+
+    def test_counts_follow_add_update_and_delete(self, repository_factory) -> None:
+        """Test that add, update and delete keep the index in sync."""
+        repository = repository_factory()
+        today = date.today()
+        yesterday = today - timedelta(days=1)
+
+        assert repository.add_attendance(_record("r1", "u1", today))
+        assert repository.add_attendance(_record("r2", "u1", today))
+        assert repository.add_attendance(_record("r3", "u2", today))
+        assert repository.count_for_day("u1", today) == 2
+        assert repository.count_for_day("u2", today) == 1
+
+        assert repository.update_attendance("r2", _record("r2", "u1", yesterday))
+        assert repository.count_for_day("u1", today) == 1
+        assert repository.count_for_day("u1", yesterday) == 1
+
+        assert repository.delete_attendance("r1")
+        assert repository.count_for_day("u1", today) == 0
+        assert repository.count_for_day("u3", today) == 0
+
+    def test_index_is_built_from_existing_records(self, repository_factory) -> None:
+        """Test that a new repository counts records already in the CSV."""
+        today = date.today()
+        earlier = today - timedelta(days=3)
+        writer = repository_factory()
+        writer.add_attendance(_record("r1", "u1", today))
+        writer.add_attendance(_record("r2", "u1", earlier))
+        writer.add_attendance(_record("r3", "u1", earlier))
+
+        repository = repository_factory()
+
+        assert repository.count_for_day("u1", today) == 1
+        assert repository.count_for_day("u1", earlier) == 2
+
+    def test_writes_by_another_repository_are_counted(self, repository_factory) -> None:
+        """Test that the index follows writes made to the CSV by another process."""
+        today = date.today()
+        repository = repository_factory()
+        other_process = repository_factory()
+        assert repository.count_for_day("u1", today) == 0
+
+        other_process.add_attendance(_record("r1", "u1", today))
+        assert repository.count_for_day("u1", today) == 1
+
+        repository.add_attendance(_record("r2", "u1", today))
+        other_process.add_attendance(_record("r3", "u1", today))
+        assert repository.count_for_day("u1", today) == 3
+        assert other_process.count_for_day("u1", today) == 3
+
+    def test_concurrent_writers_in_other_processes_keep_each_others_rows(self, repository_factory) -> None:
+        """Test that appends through separate repositories (like separate processes) are not lost."""
+        today = date.today()
+        writers = [repository_factory() for _ in range(4)]
+
+        def add(index: int, writer: AttendanceRepository) -> None:
+            for batch in range(5):
+                writer.add_attendance_batch([
+                    _record(f"r{index}-{batch}-{row}", f"u{index}", today) for row in range(3)
+                ])
+
+        threads = [threading.Thread(target=add, args=(index, writer)) for index, writer in enumerate(writers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(writers[0].get_attendance_history()) == 4 * 5 * 3
+        assert [writers[0].count_for_day(f"u{index}", today) for index in range(4)] == [15] * 4
@@ -0,0 +1,64 @@
+"""
+Unit tests for FaceRepository writes shared between threads and processes.
+
+Uses a real FileStorage in a temporary folder.
+"""
+
+import threading
+
+import numpy as np
+
+from infrastructure.storage.file_storage import FileStorage
+from repositories.face_repository import FaceRepository
+from repositories.user_repository import UserRepository
+
+DIMENSION = 4
+
+
+def _enroll(face_repository: FaceRepository, user_ids) -> None:
+    face_repository.store_enrollments([
+        {
+            'user_id': user_id,
+            'name': user_id,
+            'embedding': np.ones(DIMENSION, dtype=np.float32),
+            'face_image': np.zeros((8, 8, 3), dtype=np.uint8),
+            'registration_date': None,
+            'face_bbox': None
+        }
+        for user_id in user_ids
+    ])
+
+
+def test_concurrent_faces_json_writes_are_not_lost(tmp_path) -> None:
+    """Test that writers of faces.json from several threads keep each other's updates."""
+    storage = FileStorage(tmp_path)
+    face_repository = FaceRepository(file_storage=storage)
+    user_repository = UserRepository(storage_handler=storage)
+    user_ids = [f"u{index}" for index in range(12)]
+    _enroll(face_repository, user_ids)
+
+    def store_fast_embedding(user_id: str) -> None:
+        face_repository.store_model_embedding(user_id, "fast", np.full(DIMENSION, 0.5, dtype=np.float32))
+
+    threads = [threading.Thread(target=store_fast_embedding, args=(user_id,)) for user_id in user_ids]
+    threads.append(threading.Thread(target=user_repository.add_user, args=({'user_id': "new", 'first_name': "New"},)))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(face_repository.get_model_embeddings("fast")) == sorted(user_ids)
+    assert user_repository._load_data()["new"]["name"] == "New"
+
+
+def test_gallery_job_is_claimed_by_one_holder(tmp_path) -> None:
+    """Test that a gallery job lock is not granted twice until released."""
+    face_repository = FaceRepository(file_storage=FileStorage(tmp_path))
+
+    with face_repository.gallery_job_lock("sync_fast") as first:
+        with face_repository.gallery_job_lock("sync_fast") as second:
+            assert first and not second
+        with face_repository.gallery_job_lock("migration") as other:
+            assert other
+    with face_repository.gallery_job_lock("sync_fast") as again:
+        assert again
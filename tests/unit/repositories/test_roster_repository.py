@@ -0,0 +1,27 @@
+"""
+Unit tests for RosterRepository.
+
+Uses a real FileStorage on a temporary directory.
+"""
+
+from infrastructure.storage.file_storage import FileStorage
+from repositories.roster_repository import RosterRepository
+
+
+class TestRosterRepository:
+    """Test suite for RosterRepository."""
+
+    def test_rosters_persist_across_instances(self, tmp_path) -> None:
+        """Test that set and delete are written through to the JSON file."""
+        storage = FileStorage(base_path=tmp_path)
+        repository = RosterRepository(storage_handler=storage, data_file="rosters.json")
+
+        assert repository.get_roster("CS101") is None
+        assert repository.set_roster("CS101", ["u2", "u1", "u1"])
+        assert repository.set_roster("CS102", ["u3"])
+        assert repository.delete_roster("CS102")
+        assert not repository.delete_roster("CS102")
+
+        reloaded = RosterRepository(storage_handler=storage, data_file="rosters.json")
+        assert reloaded.get_roster("CS101") == frozenset({"u1", "u2"})
+        assert reloaded.get_all_rosters() == {"CS101": ["u1", "u2"]}
@@ -0,0 +1,71 @@
+"""
+Unit tests for SessionRepository.
+
+Uses a fake clock to expire sessions deterministically.
+"""
+
+from datetime import datetime
+
+import numpy as np
+
+from domain.entities.attendance_session import AttendanceSession
+from domain.entities.recognition_session import RecognitionSession
+from repositories.session_repository import SessionRepository
+
+
+def _session(session_id: str) -> RecognitionSession:
+    """Create a recognition session for a test user."""
+    return RecognitionSession(
+        session=AttendanceSession(
+            session_id=session_id,
+            user_id="u1",
+            user_name="User One",
+            start_time=datetime.now(),
+            end_time=None,
+            status="active",
+            confidence=0.9,
+            liveness_verified=False
+        ),
+        face_image=np.zeros((4, 4, 3), dtype=np.uint8),
+        face_quality_score=0.8
+    )
+
+
+class TestSessionRepository:
+    """Test suite for SessionRepository."""
+
+    def test_sessions_expire_and_are_bounded(self) -> None:
+        """Test TTL expiry, oldest-first eviction and deletion."""
+        now = [0.0]
+        repository = SessionRepository(ttl_seconds=10.0, max_sessions=2, clock=lambda: now[0])
+
+        repository.add_session(_session("a"))
+        now[0] = 5.0
+        repository.add_session(_session("b"))
+        now[0] = 8.0
+        repository.add_session(_session("c"))  # evicts "a"
+
+        assert repository.get_session("a") is None
+        assert repository.get_session("b").face_quality_score == 0.8
+        now[0] = 12.0  # "b" expires at 15, "c" at 18
+        assert repository.count() == 2
+        now[0] = 15.0
+        assert repository.get_session("b") is None
+        assert repository.delete_session("c")
+        assert not repository.delete_session("c")
+        assert repository.count() == 0
+
+    def test_a_session_is_claimed_by_one_request_at_a_time(self) -> None:
+        """Test that a claimed session cannot be claimed again until released or deleted."""
+        repository = SessionRepository(ttl_seconds=10.0, clock=lambda: 0.0)
+        repository.add_session(_session("a"))
+
+        session, known = repository.claim_session("a")
+        assert session is not None and known
+        assert repository.claim_session("a") == (None, True)
+
+        repository.release_session("a")  # e.g. liveness failed: the user may retry
+        session, _ = repository.claim_session("a")
+        assert session is not None
+        assert repository.delete_session("a")
+        assert repository.claim_session("a") == (None, False)
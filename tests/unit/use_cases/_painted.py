@@ -0,0 +1,55 @@
+"""
+Painted-face stand-ins shared by the batch use case tests.
+
+Images are synthetic: each face box is painted with its owner's index in the
+red channel and its quality in the green channel. PaintedFaces plays the face
+detector, quality assessor and embedding extractor by reading those values, so
+the tests exercise the real matching and persistence code around them.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from core.recognition.value_objects import DetectionResult, EmbeddingResult, FaceLocation, QualityResult
+
+DIMENSION = 8
+
+
+def paint(shape: Tuple[int, int], boxes: Dict[int, FaceLocation], quality: float) -> np.ndarray:
+    """Return an RGB image of the given (height, width) with each box painted as (index, quality, 0)."""
+    image = np.zeros((*shape, 3), dtype=np.uint8)
+    for index, box in boxes.items():
+        image[box.y:box.y + box.height, box.x:box.x + box.width] = (index, int(quality * 255), 0)
+    return image
+
+
+class PaintedFaces:
+    """Detector, quality assessor and extractor stand-in reading the painted boxes."""
+
+    model_name = "painted"
+
+    def __init__(self, boxes: List[FaceLocation], min_quality: float = 0.0):
+        self.boxes = boxes
+        self.min_quality = min_quality
+        self.batches = []
+
+    @property
+    def embedded(self) -> int:
+        """Number of face crops embedded so far."""
+        return sum(self.batches)
+
+    def detect(self, image: np.ndarray) -> DetectionResult:
+        faces = [box for box in self.boxes if image[box.y, box.x, 0]]
+        return DetectionResult(bool(faces), len(faces), faces, [0.9] * len(faces))
+
+    def assess(self, face_image: np.ndarray) -> QualityResult:
+        score = float(face_image[0, 0, 1]) / 255.0
+        return QualityResult(score, score, score, score, score, score >= self.min_quality)
+
+    def extract_batch(self, face_images: List[np.ndarray]) -> List[EmbeddingResult]:
+        self.batches.append(len(face_images))
+        return [
+            EmbeddingResult(np.eye(DIMENSION, dtype=np.float32)[int(face[0, 0, 0])], DIMENSION, 1.0)
+            for face in face_images
+        ]
@@ -0,0 +1,93 @@
+"""
+Unit tests for BackfillClassAttendanceUseCase.
+
+Photos are painted by tests.unit.use_cases._painted, whose stand-ins detect,
+assess and embed the faces; matching, daily limits and attendance persistence
+are real, on a temporary CSV file.
+"""
+
+from datetime import date, datetime
+from typing import List
+
+import numpy as np
+
+from core.attendance.attendance_logger import AttendanceLogger
+from core.attendance.attendance_validator import AttendanceValidator
+from core.recognition.recognizer import FaceRecognizer
+from core.recognition.value_objects import FaceLocation
+from domain.services.attendance import AttendanceService
+from domain.services.recognition import FaceRecognitionService
+from infrastructure.storage import CheckpointFile
+from infrastructure.storage.csv_handler import CSVHandler
+from infrastructure.storage.file_storage import FileStorage
+from repositories.attendance_repository import AttendanceRepository
+from tests.unit.use_cases._painted import DIMENSION, PaintedFaces, paint
+from use_cases.backfill_class_attendance import (
+    BackfillClassAttendanceRequest,
+    BackfillClassAttendanceUseCase,
+    detect_class_photo
+)
+
+SEATS = {1: FaceLocation(10, 10, 40, 40), 2: FaceLocation(100, 10, 40, 40), 3: FaceLocation(190, 10, 40, 40)}
+
+
+def _photo(students: List[int], quality: float = 0.8) -> np.ndarray:
+    return paint((80, 240), {student: SEATS[student] for student in students}, quality)
+
+
+def test_backfills_photos_in_chunks_on_their_own_dates(tmp_path) -> None:
+    """Test cross-photo embedding batches, per-date daily limits, bulk saves and checkpointed progress."""
+    faces = PaintedFaces(list(SEATS.values()))
+    repository = AttendanceRepository(
+        csv_handler=CSVHandler(file_storage=FileStorage(base_path=tmp_path)),
+        data_file="attendance.csv"
+    )
+    gallery = {f"user_{i}": np.eye(DIMENSION, dtype=np.float32)[i] for i in SEATS}
+    use_case = BackfillClassAttendanceUseCase(
+        face_recognition_service=FaceRecognitionService(
+            face_detector=faces,
+            embedding_extractor=faces,
+            face_recognizer=FaceRecognizer(),
+            quality_assessor=faces,
+            min_quality_threshold=0.3
+        ),
+        attendance_service=AttendanceService(
+            attendance_logger=AttendanceLogger(),
+            attendance_validator=AttendanceValidator()
+        ),
+        attendance_repository=repository,
+        face_repository=type("Faces", (), {"get_all_face_embeddings": lambda self: gallery, "get_user_names": lambda self: {}})(),
+        max_daily_entries=1
+    )
+    monday, tuesday = datetime(2024, 3, 4, 9, 0), datetime(2024, 3, 5, 9, 0)
+    photos = [
+        detect_class_photo("mon_a.jpg", _photo([1, 2]), monday, faces, faces),
+        detect_class_photo("mon_b.jpg", _photo([2, 3]), monday, faces, faces),  # user_2 again on Monday
+        detect_class_photo("broken.jpg", None, monday, faces, faces),
+        detect_class_photo("tue_a.jpg", _photo([1, 2, 3]), tuesday, faces, faces),
+        detect_class_photo("tue_b.jpg", _photo([1], quality=0.1), tuesday, faces, faces),  # too blurry
+    ]
+    checkpoint = CheckpointFile(str(tmp_path / "checkpoint"))
+
+    response = use_case.execute(BackfillClassAttendanceRequest(
+        photos=iter(photos),
+        location="Room 101",
+        embedding_batch_size=4,
+        progress_callback=lambda progress: checkpoint.add(progress.committed_photo_ids)
+    ))
+
+    assert response.success, response.error
+    assert response.photos_processed == 5
+    assert response.failed_photos == {"broken.jpg": "Could not read image"}
+    assert response.faces_detected == 8
+    assert response.faces_recognized == 7
+    assert faces.batches == [4, 3]
+    assert response.total_marked == 6
+    assert [r.user_id for r in response.results if not r.success] == ["user_2"]
+    assert checkpoint.load() == {"mon_a.jpg", "mon_b.jpg", "tue_a.jpg", "tue_b.jpg"}
+
+    records = repository.get_attendance_history()
+    assert sorted((record.date, record.user_id) for record in records) == [
+        (date(2024, 3, 4), "user_1"), (date(2024, 3, 4), "user_2"), (date(2024, 3, 4), "user_3"),
+        (date(2024, 3, 5), "user_1"), (date(2024, 3, 5), "user_2"), (date(2024, 3, 5), "user_3"),
+    ]
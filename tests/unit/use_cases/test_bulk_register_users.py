@@ -0,0 +1,87 @@
+"""
+Unit tests for BulkRegisterUsersUseCase.
+
+Images are painted by tests.unit.use_cases._painted, whose stand-ins detect,
+assess and embed the face; validation and persistence run on real
+repositories in a temporary folder.
+"""
+
+import numpy as np
+
+from core.recognition.value_objects import FaceLocation
+from domain.services.recognition import UserRegistrationService
+from infrastructure.storage.file_storage import FileStorage
+from repositories.face_repository import FaceRepository
+from repositories.user_repository import UserRepository
+from tests.unit.use_cases._painted import DIMENSION, PaintedFaces, paint
+from use_cases.bulk_register_users import (
+    BulkRegisterUsersRequest,
+    BulkRegisterUsersUseCase,
+    EnrollmentCandidate,
+    detect_enrollment_face
+)
+
+FACE = FaceLocation(20, 20, 40, 40)
+
+
+def _image(index: int, quality: float = 0.9) -> np.ndarray:
+    return paint((80, 80), {index: FACE}, quality)
+
+
+class _CountingStorage(FileStorage):
+    """File storage counting text file writes."""
+
+    def __init__(self, base_path):
+        super().__init__(base_path=base_path)
+        self.text_writes = 0
+
+    def write_text_file(self, *args, **kwargs) -> bool:
+        self.text_writes += 1
+        return super().write_text_file(*args, **kwargs)
+
+
+def test_enrolls_valid_rows_with_one_write_and_reports_failures(tmp_path) -> None:
+    """Test batched embedding, one faces.json write and per-row failures."""
+    faces = PaintedFaces([FACE], min_quality=0.5)
+    storage = _CountingStorage(tmp_path)
+    user_repository = UserRepository(storage_handler=storage)
+    face_repository = FaceRepository(file_storage=storage)
+    face_repository.store_face_embeddings("u1", np.eye(DIMENSION, dtype=np.float32)[1], {"name": "Existing User"})
+    service = UserRegistrationService(face_detector=faces, embedding_extractor=faces, quality_assessor=faces)
+    use_case = BulkRegisterUsersUseCase(
+        registration_service=service,
+        user_repository=user_repository,
+        face_repository=face_repository
+    )
+
+    def candidate(row: int, user_id: str, image) -> EnrollmentCandidate:
+        return detect_enrollment_face(EnrollmentCandidate(row, user_id, f"Student {user_id}"), image, service)
+
+    candidates = [
+        candidate(2, "u1", _image(1)),  # already registered
+        candidate(3, "u2", _image(2)),
+        candidate(4, "u3", _image(3, quality=0.2)),  # blurry
+        candidate(5, "u4", _image(4)),
+        candidate(6, "u2", _image(5)),  # repeated user_id
+        candidate(7, "u6", None),  # unreadable image
+        candidate(8, "u7", np.zeros((80, 80, 3), dtype=np.uint8)),  # no face
+        candidate(9, "u8", _image(6)),
+    ]
+    writes_before = storage.text_writes
+
+    response = use_case.execute(BulkRegisterUsersRequest(candidates=iter(candidates), embedding_batch_size=2))
+
+    assert response.success, response.error
+    assert response.rows_processed == 8
+    assert sorted(response.registered) == ["u2", "u4", "u8"]
+    assert [failure.row for failure in response.failures] == [2, 4, 6, 7, 8]
+    assert "already exists" in response.failures[0].error
+    assert "row 3" in response.failures[2].error
+    assert faces.batches == [2, 1]
+    assert storage.text_writes - writes_before == 1
+
+    embeddings = face_repository.get_all_face_embeddings()
+    assert sorted(embeddings) == ["u1", "u2", "u4", "u8"]
+    assert np.argmax(embeddings["u4"].embedding) == 4
+    assert user_repository.get_user("u8")["data"] is not None
+    assert len(list((tmp_path / "data" / "faces").glob("user_*.jpg"))) == 3
@@ -0,0 +1,78 @@
+"""
+Unit tests for IngestLectureVideoUseCase.
+
+Frames are painted by tests.unit.use_cases._painted, whose stand-ins detect,
+assess and embed the faces; tracking, matching, voting and attendance
+persistence are real, on a temporary CSV file.
+"""
+
+from datetime import date, datetime
+from typing import List
+
+import numpy as np
+
+from core.attendance.attendance_logger import AttendanceLogger
+from core.attendance.attendance_validator import AttendanceValidator
+from core.recognition.recognizer import FaceRecognizer
+from core.recognition.value_objects import FaceLocation
+from domain.services.attendance import AttendanceService
+from domain.services.recognition import FaceRecognitionService
+from infrastructure.storage.csv_handler import CSVHandler
+from infrastructure.storage.file_storage import FileStorage
+from repositories.attendance_repository import AttendanceRepository
+from tests.unit.use_cases._painted import DIMENSION, PaintedFaces, paint
+from use_cases.ingest_lecture_video import IngestLectureVideoRequest, IngestLectureVideoUseCase
+
+SEATS = {1: FaceLocation(10, 10, 40, 40), 2: FaceLocation(200, 10, 40, 40)}
+
+
+def _frame(students: List[int], quality: float) -> np.ndarray:
+    return paint((80, 320), {student: SEATS[student] for student in students}, quality)
+
+
+def test_embeds_best_crops_per_track_and_marks_each_student_once(tmp_path) -> None:
+    """Test that only the best crops of each track are embedded and records are bulk-inserted once per student."""
+    faces = PaintedFaces(list(SEATS.values()))
+    repository = AttendanceRepository(
+        csv_handler=CSVHandler(file_storage=FileStorage(base_path=tmp_path)),
+        data_file="attendance.csv"
+    )
+    gallery = {f"user_{i}": np.eye(DIMENSION, dtype=np.float32)[i] for i in SEATS}
+    use_case = IngestLectureVideoUseCase(
+        face_recognition_service=FaceRecognitionService(
+            face_detector=faces,
+            embedding_extractor=faces,
+            face_recognizer=FaceRecognizer(),
+            quality_assessor=faces,
+            min_quality_threshold=0.3
+        ),
+        attendance_service=AttendanceService(
+            attendance_logger=AttendanceLogger(),
+            attendance_validator=AttendanceValidator()
+        ),
+        attendance_repository=repository,
+        face_repository=type("Faces", (), {
+            "get_all_face_embeddings": lambda self: gallery,
+            "get_user_names": lambda self: {"user_1": "Ada Lovelace"}
+        })()
+    )
+    # Student 2 leaves after frame 5 and comes back at frame 12 (a second track)
+    frames = [_frame([1, 2] if frame < 6 or frame >= 12 else [1], 0.4 + 0.03 * frame) for frame in range(16)]
+
+    response = use_case.execute(IngestLectureVideoRequest(
+        frames=iter(frames), location="Room 101", recorded_at=datetime(2024, 3, 4, 9, 0)
+    ))
+
+    assert response.success, response.error
+    assert response.frames_processed == 16
+    assert response.faces_detected == 16 + 6 + 4
+    assert response.tracks == 3
+    assert response.faces_embedded == 9
+    assert faces.embedded == 9
+    assert sorted(result.user_id for result in response.results if result.success) == ["user_1", "user_2"]
+    records = repository.get_attendance_history()
+    assert sorted(record.user_id for record in records) == ["user_1", "user_2"]
+    assert {record.verification_stage for record in records} == {"lecture_video"}
+    assert {record.location for record in records} == {"Room 101"}
+    assert {record.date for record in records} == {date(2024, 3, 4)}
+    assert sorted(record.user_name for record in records) == ["Ada Lovelace", "user_2"]
@@ -0,0 +1,90 @@
+"""
+Unit tests for MarkAttendanceUseCase with recognition sessions.
+
+Sessions live in a real SessionRepository; liveness and record creation
+are mocked.
+"""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import numpy as np
+
+from domain.entities.attendance_session import AttendanceSession
+from domain.entities.recognition_session import RecognitionSession
+from repositories.session_repository import SessionRepository
+from use_cases.mark_attendance import MarkAttendanceRequest, MarkAttendanceUseCase
+
+FRAMES = [np.zeros((4, 4, 3), dtype=np.uint8)] * 3
+
+
+def _use_case(session_repository: SessionRepository) -> MarkAttendanceUseCase:
+    attendance_service = Mock()
+    attendance_service.create_and_validate_record.side_effect = lambda **fields: fields
+    attendance_repository = Mock()
+    attendance_repository.add_attendance.return_value = True
+    return MarkAttendanceUseCase(
+        liveness_service=Mock(),
+        attendance_service=attendance_service,
+        attendance_repository=attendance_repository,
+        session_repository=session_repository
+    )
+
+
+def _open_session(session_repository: SessionRepository) -> None:
+    session_repository.add_session(RecognitionSession(
+        session=AttendanceSession(
+            session_id="s1",
+            user_id="u1",
+            user_name="User One",
+            start_time=datetime.now(),
+            end_time=None,
+            status="active",
+            confidence=0.9,
+            liveness_verified=False
+        ),
+        face_image=np.zeros((4, 4, 3), dtype=np.uint8),
+        face_quality_score=0.8
+    ))
+
+
+def test_phase1_fields_are_used_when_another_worker_holds_the_session() -> None:
+    """Test the fallback request for a session this process does not hold."""
+    use_case = _use_case(SessionRepository())
+    fallback = MarkAttendanceRequest(
+        frames_sequence=FRAMES,
+        user_id="u1",
+        user_name="User One",
+        face_image=np.zeros((4, 4, 3), dtype=np.uint8),
+        confidence=0.9
+    )
+
+    response = use_case.execute(MarkAttendanceRequest(
+        frames_sequence=FRAMES, session_id="s1", fallback_request=lambda: fallback
+    ))
+    assert response.success and response.attendance_record["user_id"] == "u1"
+
+    response = use_case.execute(MarkAttendanceRequest(frames_sequence=FRAMES, session_id="s1"))
+    assert not response.success and "expired" in response.error
+
+
+def test_concurrent_requests_with_one_session_mark_once() -> None:
+    """Test that a second request arriving while the first is marking is rejected."""
+    session_repository = SessionRepository()
+    _open_session(session_repository)
+    use_case = _use_case(session_repository)
+    request = MarkAttendanceRequest(frames_sequence=FRAMES, session_id="s1")
+    concurrent = []
+
+    def verify_liveness(frames, **kwargs) -> bool:
+        concurrent.append(use_case.execute(request))
+        return True
+
+    use_case.liveness_service.verify_liveness.side_effect = verify_liveness
+
+    response = use_case.execute(request)
+
+    assert response.success
+    assert not concurrent[0].success and "already being marked" in concurrent[0].error
+    assert use_case.attendance_repository.add_attendance.call_count == 1
+    assert session_repository.count() == 0
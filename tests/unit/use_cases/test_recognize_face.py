@@ -0,0 +1,156 @@
+"""
+Unit tests for RecognizeFaceUseCase.
+
+The gallery lives in a real FaceRepository in a temporary folder. Face crops
+are uniform grey levels; the stand-in extractor maps each level to a one-hot
+embedding, so the crop of level i matches user u{i}.
+"""
+
+from typing import List
+from unittest.mock import Mock
+
+import numpy as np
+
+from core.recognition.compact_gallery import CompactEmbeddingGallery
+from core.recognition.detector import FaceDetector
+from core.recognition.embedding_extractor import EmbeddingExtractor
+from core.recognition.quality_assessor import QualityAssessor
+from core.recognition.recognizer import FaceRecognizer
+from core.recognition.value_objects import EmbeddingResult
+from core.shared.inference_scheduler import PRIORITY_INTERACTIVE, InferenceScheduler
+from domain.services.recognition import FaceRecognitionService
+from infrastructure.storage.file_storage import FileStorage
+from repositories.face_repository import FaceRepository
+from use_cases.recognize_face import RecognizeFaceUseCase
+
+DIMENSION = 8
+LEVEL = 20  # Grey level step between users' crops
+
+
+def _extract_batch(face_images: List[np.ndarray]) -> List[EmbeddingResult]:
+    return [
+        EmbeddingResult(np.eye(DIMENSION, dtype=np.float32)[int(round(float(face.mean()) / LEVEL))], DIMENSION, 0.0)
+        for face in face_images
+    ]
+
+
+def _face(index: int) -> np.ndarray:
+    return np.full((32, 32, 3), index * LEVEL, dtype=np.uint8)
+
+
+def _enroll(face_repository: FaceRepository, indices: List[int]) -> None:
+    face_repository.store_enrollments([
+        {
+            'user_id': f"u{index}",
+            'name': f"Student {index}",
+            'embedding': np.eye(DIMENSION, dtype=np.float32)[index],
+            'face_image': _face(index),
+            'registration_date': None,
+            'face_bbox': None
+        }
+        for index in indices
+    ])
+
+
+def _use_case(face_repository: FaceRepository, **kwargs) -> RecognizeFaceUseCase:
+    extractor = Mock(spec=EmbeddingExtractor)
+    extractor.extract_batch.side_effect = _extract_batch
+    attendance_repository = Mock()
+    attendance_repository.count_for_day.return_value = 0
+    user_repository = Mock()
+    user_repository.get_user.return_value = {'success': False}
+    return RecognizeFaceUseCase(
+        face_recognition_service=FaceRecognitionService(
+            face_detector=Mock(spec=FaceDetector),
+            embedding_extractor=extractor,
+            face_recognizer=FaceRecognizer(),
+            quality_assessor=Mock(spec=QualityAssessor),
+            confidence_threshold=0.5
+        ),
+        attendance_repository=attendance_repository,
+        face_repository=face_repository,
+        user_repository=user_repository,
+        **kwargs
+    )
+
+
+def test_gallery_is_cached_until_the_stored_embeddings_change(tmp_path) -> None:
+    """Test that the gallery is built once and rebuilt after a registration."""
+    face_repository = FaceRepository(file_storage=FileStorage(tmp_path))
+    _enroll(face_repository, [1, 2])
+    use_case = _use_case(face_repository)
+
+    assert use_case.execute_for_face(_face(1), 0.9).user_id == "u1"
+    gallery = use_case._gallery_cache[1]
+    assert use_case.execute_for_face(_face(2), 0.9).user_id == "u2"
+    assert use_case._gallery_cache[1] is gallery
+
+    _enroll(face_repository, [3])
+
+    assert use_case.execute_for_face(_face(3), 0.9).user_id == "u3"
+    assert use_case._gallery_cache[1] is not gallery
+
+
+def test_full_batch_forms_with_more_requests_than_inference_workers(tmp_path) -> None:
+    """Test that interactive workers do not cap the micro-batch below its size."""
+    face_repository = FaceRepository(file_storage=FileStorage(tmp_path))
+    _enroll(face_repository, [1, 2, 3, 4, 5, 6])
+    # A long wait: the batch only runs early once it is full
+    use_case = _use_case(face_repository, batch_max_size=6, batch_max_wait_ms=5000)
+    scheduler = InferenceScheduler.interactive_and_bulk(max_workers=2, interactive_batch_size=6)
+
+    try:
+        futures = [
+            scheduler.submit(PRIORITY_INTERACTIVE, use_case.execute_for_face, _face(index), 0.9)
+            for index in range(1, 7)
+        ]
+        responses = [future.result(timeout=3) for future in futures]
+    finally:
+        scheduler.close()
+
+    assert [response.user_id for response in responses] == ["u1", "u2", "u3", "u4", "u5", "u6"]
+    extract_batch = use_case.face_recognition_service.embedding_extractor.extract_batch
+    assert [len(call.args[0]) for call in extract_batch.call_args_list] == [6]
+
+
+def test_int8_gallery_recognizes_with_and_without_a_roster(tmp_path) -> None:
+    """Test that a compact cached gallery serves full-gallery and roster matching."""
+    face_repository = FaceRepository(file_storage=FileStorage(tmp_path))
+    _enroll(face_repository, [1, 2, 3, 4])
+    roster_repository = Mock()
+    roster_repository.get_roster.side_effect = lambda location: {"u2", "u3"} if location == "Room 101" else None
+    use_case = _use_case(face_repository, gallery_precision="int8", roster_repository=roster_repository)
+
+    anywhere = [use_case.execute_for_face(_face(index), 0.9).user_id for index in (1, 4)]
+    in_room = [use_case.execute_for_face(_face(index), 0.9, location="Room 101").user_id for index in (3, 4)]
+
+    assert anywhere == ["u1", "u4"] and in_room == ["u3", "u4"]
+    assert isinstance(use_case._gallery_cache[1], CompactEmbeddingGallery)
+
+
+def test_probes_use_the_gallery_model_until_a_migration_swaps(tmp_path) -> None:
+    """Test that probes are embedded with the gallery's recorded model, and refused if it cannot be loaded."""
+    face_repository = FaceRepository(file_storage=FileStorage(tmp_path), embedding_model="OldModel")
+    _enroll(face_repository, [1, 2])
+    old_extractor = Mock(spec=EmbeddingExtractor)
+    old_extractor.extract_batch.side_effect = _extract_batch
+    loaded = []
+    use_case = _use_case(face_repository, extractor_for_model=lambda model_id: loaded.append(model_id) or old_extractor)
+    unloadable = _use_case(face_repository)
+    new_extractor = use_case.face_recognition_service.embedding_extractor
+    new_extractor.model_id = unloadable.face_recognition_service.embedding_extractor.model_id = "NewModel"
+
+    assert [use_case.execute_for_face(_face(index), 0.9).user_id for index in (1, 2)] == ["u1", "u2"]
+    refused = unloadable.execute_for_face(_face(1), 0.9)
+    assert not refused.success and "OldModel" in refused.error
+    assert old_extractor.extract_batch.call_count == 2 and not new_extractor.extract_batch.called
+
+    face_repository.stage_gallery_embeddings("NewModel", {
+        f"u{index}": np.eye(DIMENSION, dtype=np.float32)[index] for index in (1, 2)
+    })
+    assert face_repository.swap_gallery("NewModel")["success"]
+
+    assert use_case.execute_for_face(_face(2), 0.9).user_id == "u2"
+    assert unloadable.execute_for_face(_face(1), 0.9).user_id == "u1"
+    assert old_extractor.extract_batch.call_count == 2 and new_extractor.extract_batch.call_count == 1
+    assert loaded == ["OldModel"]
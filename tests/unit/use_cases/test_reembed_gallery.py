@@ -0,0 +1,151 @@
+"""
+Unit tests for ReembedGalleryUseCase.
+
+The gallery lives in a real FaceRepository in a temporary folder. Stored face
+images are uniform grey levels; the stand-in extractor maps each level to a
+one-hot embedding of a new, larger dimension.
+"""
+
+from typing import List
+
+import numpy as np
+
+from core.recognition.value_objects import EmbeddingResult
+from infrastructure.storage.file_storage import FileStorage
+from repositories.face_repository import FaceRepository
+from use_cases.reembed_gallery import ReembedGalleryRequest, ReembedGalleryUseCase
+
+OLD_DIMENSION = 4
+NEW_DIMENSION = 8
+LEVEL = 40  # Grey level step between users' images
+
+
+class _GreyLevelExtractor:
+    """Embedding extractor stand-in: one-hot of the image's grey level."""
+
+    model_id = "NewModel"
+
+    def __init__(self):
+        self.embedded: List[int] = []
+
+    def extract_batch(self, face_images: List[np.ndarray]) -> List[EmbeddingResult]:
+        results = []
+        for face in face_images:
+            index = int(round(float(face.mean()) / LEVEL))
+            self.embedded.append(index)
+            results.append(EmbeddingResult(np.eye(NEW_DIMENSION, dtype=np.float32)[index], NEW_DIMENSION, 1.0))
+        return results
+
+    def get_embedding_dimension(self) -> int:
+        return NEW_DIMENSION
+
+
+def _enroll(face_repository: FaceRepository, indices: List[int]) -> None:
+    face_repository.store_enrollments([
+        {
+            'user_id': f"u{index}",
+            'name': f"Student {index}",
+            'embedding': np.eye(OLD_DIMENSION, dtype=np.float32)[index % OLD_DIMENSION],
+            'face_image': np.full((64, 64, 3), index * LEVEL, dtype=np.uint8),
+            'registration_date': None,
+            'face_bbox': None
+        }
+        for index in indices
+    ])
+
+
+def _loaded(use_case: ReembedGalleryUseCase):
+    faces = use_case.pending_faces()
+    for face in faces:
+        face.face_image = use_case.face_repository.get_face_image(face.user_id, face.image_path)
+    return faces
+
+
+def test_resumes_from_staged_users_and_swaps_atomically(tmp_path) -> None:
+    """Test that an interrupted migration resumes and the old gallery serves until the swap."""
+    face_repository = FaceRepository(file_storage=FileStorage(tmp_path))
+    _enroll(face_repository, [1, 2, 3, 4])
+    extractor = _GreyLevelExtractor()
+    use_case = ReembedGalleryUseCase(face_repository=face_repository, embedding_extractor=extractor)
+    assert not use_case.is_current()
+
+    # First run stages two users, then "crashes" before the swap
+    first = use_case.execute(ReembedGalleryRequest(
+        faces=_loaded(use_case)[:2],
+        swap=False
+    ))
+    assert first.success and first.embedded == 2 and not first.swapped
+    assert {e.embedding.shape[0] for e in face_repository.get_all_face_embeddings().values()} == {OLD_DIMENSION}
+
+    second = use_case.execute(ReembedGalleryRequest(embedding_batch_size=1))
+
+    assert second.success, second.error
+    assert second.already_staged == 2 and second.embedded == 2 and second.swapped
+    assert sorted(extractor.embedded) == [1, 2, 3, 4]  # Nobody embedded twice
+    embeddings = face_repository.get_all_face_embeddings()
+    assert {user_id: int(np.argmax(e.embedding)) for user_id, e in embeddings.items()} == {
+        "u1": 1, "u2": 2, "u3": 3, "u4": 4
+    }
+    assert use_case.is_current()
+    assert use_case.staged_count() == 0
+
+
+def test_does_not_swap_while_users_cannot_be_reembedded(tmp_path) -> None:
+    """Test that a user without a readable image blocks the swap unless allowed."""
+    face_repository = FaceRepository(file_storage=FileStorage(tmp_path))
+    _enroll(face_repository, [1, 2])
+    for image_path in face_repository.get_face_images("u2"):
+        face_repository.file_storage.delete_file(image_path)
+    use_case = ReembedGalleryUseCase(face_repository=face_repository, embedding_extractor=_GreyLevelExtractor())
+
+    blocked = use_case.execute(ReembedGalleryRequest())
+
+    assert not blocked.success and not blocked.swapped
+    assert blocked.failed_users == ["u2"]
+    assert face_repository.get_gallery_model() is None
+    assert face_repository.get_all_face_embeddings()["u1"].embedding.shape[0] == OLD_DIMENSION
+
+    forced = use_case.execute(ReembedGalleryRequest(allow_missing=True))
+
+    assert forced.success and forced.swapped and forced.embedded == 0
+    embeddings = face_repository.get_all_face_embeddings()
+    assert embeddings["u1"].embedding.shape[0] == NEW_DIMENSION
+    assert embeddings["u2"].embedding.shape[0] == OLD_DIMENSION
+    assert face_repository.get_gallery_model() == "NewModel"
+
+
+def test_gallery_model_is_recorded_and_unrecorded_galleries_compare_dimensions(tmp_path) -> None:
+    """Test that new galleries record their model and unrecorded ones of the right dimension are current."""
+    recorded = FaceRepository(file_storage=FileStorage(tmp_path / "recorded"), embedding_model="NewModel")
+    _enroll(recorded, [1])
+    _enroll(recorded, [2])
+    assert recorded.get_gallery_model() == "NewModel"
+
+    unrecorded = FaceRepository(file_storage=FileStorage(tmp_path / "unrecorded"))
+    _enroll(unrecorded, [1])
+    late = FaceRepository(file_storage=unrecorded.file_storage, embedding_model="NewModel")
+    _enroll(late, [2])  # Older embeddings of an unknown model: stays unrecorded
+    assert late.get_gallery_model() is None
+    assert not ReembedGalleryUseCase(face_repository=late, embedding_extractor=_GreyLevelExtractor()).is_current()
+
+    extractor = _GreyLevelExtractor()
+    extractor.get_embedding_dimension = lambda: OLD_DIMENSION
+    use_case = ReembedGalleryUseCase(face_repository=unrecorded, embedding_extractor=extractor)
+    assert use_case.is_current()
+    response = use_case.execute(ReembedGalleryRequest())
+    assert response.success and not response.swapped and extractor.embedded == []
+
+
+def test_only_one_process_migrates(tmp_path) -> None:
+    """Test that a migration is refused while another process holds the migration job."""
+    face_repository = FaceRepository(file_storage=FileStorage(tmp_path))
+    _enroll(face_repository, [1, 2])
+    extractor = _GreyLevelExtractor()
+    use_case = ReembedGalleryUseCase(face_repository=face_repository, embedding_extractor=extractor)
+
+    with face_repository.gallery_job_lock("gallery_migration"):
+        refused = use_case.execute(ReembedGalleryRequest())
+
+    assert not refused.success and "another process" in refused.error
+    assert extractor.embedded == [] and use_case.staged_count() == 0
+    assert use_case.execute(ReembedGalleryRequest()).swapped
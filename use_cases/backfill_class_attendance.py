@@ -0,0 +1,382 @@
+"""
+Backfill class attendance use case.
+
+Marks attendance from an archive of class photos. Faces are detected ahead
+of this use case (usually in worker processes, see detect_class_photo); here
+the crops of several photos are embedded together, matched against a
+gallery loaded once, and each chunk of photos is saved with one bulk insert.
+"""
+
+from dataclasses import dataclass, field
+from typing import AbstractSet, Any, Callable, Dict, Iterable, List, Optional, Protocol, Tuple
+from datetime import date, datetime
+import time
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+from core.attendance.value_objects import IndividualAttendanceResult
+from domain.entities.attendance_record import AttendanceRecord
+from domain.services.attendance import AttendanceService
+from domain.services.recognition import FaceRecognitionService
+from domain.shared.constants import MAX_DAILY_ATTENDANCE_ENTRIES
+from domain.shared.exceptions import InvalidAttendanceRecordError
+from use_cases.known_embeddings import load_known_embeddings
+
+
+@dataclass
+class ClassPhotoFaces:
+    """Faces detected in one class photo."""
+    photo_id: str  # Stable key of the photo (e.g. its path), used for checkpoints
+    recorded_at: datetime  # When the photo was taken (date/time of the attendance)
+    face_images: List[np.ndarray] = field(default_factory=list)
+    quality_scores: List[float] = field(default_factory=list)
+    error: Optional[str] = None  # Set if the photo could not be read or processed
+
+
+@dataclass
+class BackfillProgress:
+    """Progress reported after each committed chunk of photos."""
+    photos_processed: int
+    photos_failed: int
+    faces_detected: int
+    faces_recognized: int
+    total_marked: int
+    committed_photo_ids: List[str]  # Photos whose attendance is now saved
+
+
+@dataclass
+class BackfillClassAttendanceRequest:
+    """Request for marking class attendance from a photo archive."""
+    photos: Iterable[ClassPhotoFaces]
+    location: str
+    device_info: str = "photo_backfill"
+    embedding_batch_size: int = 64  # Crops embedded together (a chunk ends once reached)
+    progress_callback: Optional[Callable[[BackfillProgress], None]] = None
+
+
+@dataclass
+class BackfillClassAttendanceResponse:
+    """Response from backfilling class attendance."""
+    success: bool
+    results: List[IndividualAttendanceResult]
+    photos_processed: int = 0
+    photos_failed: int = 0
+    faces_detected: int = 0
+    faces_recognized: int = 0
+    total_marked: int = 0
+    failed_photos: Dict[str, str] = field(default_factory=dict)  # photo_id -> error
+    error: Optional[str] = None
+
+
+class AttendanceRepositoryProtocol(Protocol):
+    """Protocol for attendance repository operations."""
+
+    def add_attendance_batch(self, records: List[AttendanceRecord]) -> bool:
+        """Add several attendance entries with one write. Returns True if successful."""
+        ...
+
+    def count_for_day(self, user_id: str, day: date) -> int:
+        """Count a user's attendance entries on a given day."""
+        ...
+
+
+class FaceRepositoryProtocol(Protocol):
+    """Protocol for face repository operations."""
+
+    def get_all_face_embeddings(self) -> Dict[str, Any]:
+        """Get all face embeddings. Returns dict with 'success' and 'embeddings' keys."""
+        ...
+
+    def get_user_names(self) -> Dict[str, str]:
+        """Get the display name of every user that has one."""
+        ...
+
+
+class RosterRepositoryProtocol(Protocol):
+    """Protocol for roster repository operations."""
+
+    def get_roster(self, location: str) -> Optional[AbstractSet[str]]:
+        """Get the user IDs registered for a location (None if no roster)."""
+        ...
+
+
+def detect_class_photo(
+    photo_id: str,
+    image: Optional[np.ndarray],
+    recorded_at: datetime,
+    face_detector: Any,
+    quality_assessor: Any
+) -> ClassPhotoFaces:
+    """
+    Detect and assess the faces of one class photo.
+
+    Runs in detection workers: only the crops and their quality scores are
+    sent back, not the full photo.
+
+    Args:
+        photo_id: Stable key of the photo.
+        image: Decoded photo (None if it could not be read).
+        recorded_at: When the photo was taken.
+        face_detector: Detector with detect(image) -> DetectionResult.
+        quality_assessor: Assessor with assess(face_image) -> QualityResult.
+
+    Returns:
+        ClassPhotoFaces with one crop and quality score per detected face.
+    """
+    if image is None:
+        return ClassPhotoFaces(photo_id, recorded_at, error="Could not read image")
+    try:
+        detection_result = face_detector.detect(image)
+        photo = ClassPhotoFaces(photo_id, recorded_at)
+        if not detection_result.faces_detected:
+            return photo
+
+        height, width = image.shape[:2]
+        for location in detection_result.faces:
+            x, y = max(0, location.x), max(0, location.y)
+            # Copy: a view would pickle (and keep alive) the whole photo
+            face_image = image[y:min(height, y + location.height), x:min(width, x + location.width)].copy()
+            photo.face_images.append(face_image)
+            photo.quality_scores.append(
+                quality_assessor.assess(face_image).overall_score if face_image.size else 0.0
+            )
+        return photo
+    except Exception as e:
+        logger.warning(f"Face detection failed for {photo_id}: {e}")
+        return ClassPhotoFaces(photo_id, recorded_at, error=f"Face detection failed: {str(e)}")
+
+
+class BackfillClassAttendanceUseCase:
+    """
+    Orchestrates class attendance marking for a photo archive.
+
+    This use case handles:
+    - Loading the known embeddings (and the location's roster) once per run
+    - Embedding the crops of several photos per batch
+    - Checking daily limits on each photo's own date
+    - Saving each chunk of photos with one bulk insert and reporting progress
+
+    It does NOT handle:
+    - Reading photos or detecting faces (see detect_class_photo)
+    - Checkpoint storage (the progress callback receives the committed photos)
+    """
+
+    def __init__(
+        self,
+        face_recognition_service: FaceRecognitionService,
+        attendance_service: AttendanceService,
+        attendance_repository: AttendanceRepositoryProtocol,
+        face_repository: FaceRepositoryProtocol,
+        max_daily_entries: int = None,
+        roster_repository: Optional[RosterRepositoryProtocol] = None
+    ):
+        """
+        Initialize BackfillClassAttendanceUseCase.
+
+        Args:
+            face_recognition_service: Composite service for face recognition operations.
+            attendance_service: Composite service for attendance operations.
+            attendance_repository: Attendance data persistence repository.
+            face_repository: Face embedding persistence repository.
+            max_daily_entries: Maximum attendance entries allowed per day.
+            roster_repository: Optional roster repository; the roster of the
+                              request's location is searched before the full gallery.
+        """
+        self.face_recognition_service = face_recognition_service
+        self.attendance_service = attendance_service
+        self.attendance_repository = attendance_repository
+        self.face_repository = face_repository
+        self.roster_repository = roster_repository
+        self.max_daily_entries = (
+            max_daily_entries if max_daily_entries is not None
+            else MAX_DAILY_ATTENDANCE_ENTRIES
+        )
+
+    def execute(self, request: BackfillClassAttendanceRequest) -> BackfillClassAttendanceResponse:
+        """
+        Execute the backfill.
+
+        Workflow:
+        1. Get known embeddings (and the location's roster) once
+        2. Collect photos until a batch of crops is reached
+        3. Embed and match the chunk's crops together
+        4. Create records on each photo's date and save them with one bulk insert
+        5. Report progress (committed photos) and continue with the next chunk
+
+        Args:
+            request: Backfill request with the detected photos and metadata.
+
+        Returns:
+            BackfillClassAttendanceResponse with one result per recognized face.
+        """
+        response = BackfillClassAttendanceResponse(success=False, results=[])
+
+        try:
+            # Step 1: Load the gallery once for the whole run
+            known_embeddings, user_names = load_known_embeddings(self.face_repository)
+            if not known_embeddings:
+                response.error = "No known faces in database"
+                return response
+            roster = (
+                self.roster_repository.get_roster(request.location)
+                if self.roster_repository is not None and request.location else None
+            )
+            # (user_id, day) -> entries, so limits see records of earlier chunks
+            day_counts: Dict[Tuple[str, date], int] = {}
+
+            # Step 2: Chunk photos by embedding batch size
+            chunk: List[ClassPhotoFaces] = []
+            pending_crops = 0
+            for photo in request.photos:
+                response.photos_processed += 1
+                if photo.error is not None:
+                    response.photos_failed += 1
+                    response.failed_photos[photo.photo_id] = photo.error
+                    continue
+                response.faces_detected += len(photo.face_images)
+                chunk.append(photo)
+                pending_crops += len(photo.face_images)
+                if pending_crops >= request.embedding_batch_size:
+                    self._commit_chunk(chunk, request, known_embeddings, user_names, roster, day_counts, response)
+                    chunk, pending_crops = [], 0
+            if chunk:
+                self._commit_chunk(chunk, request, known_embeddings, user_names, roster, day_counts, response)
+
+            response.success = True
+            logger.info(f"Class photo backfill: {response.photos_processed} photos "
+                        f"({response.photos_failed} failed), {response.faces_detected} faces, "
+                        f"{response.faces_recognized} recognized, {response.total_marked} marked")
+            return response
+
+        except Exception as e:
+            logger.exception(f"Unexpected error during class photo backfill: {e}")
+            response.success = False
+            response.error = f"Unexpected error during class photo backfill: {str(e)}"
+            return response
+
+    def _commit_chunk(
+        self,
+        chunk: List[ClassPhotoFaces],
+        request: BackfillClassAttendanceRequest,
+        known_embeddings: Dict[str, np.ndarray],
+        user_names: Dict[str, str],
+        roster: Optional[AbstractSet[str]],
+        day_counts: Dict[Tuple[str, date], int],
+        response: BackfillClassAttendanceResponse
+    ) -> None:
+        """
+        Recognize, save and report one chunk of photos.
+
+        Args:
+            chunk: Photos of the chunk (without read errors).
+            request: Backfill request with device info, location and callback.
+            known_embeddings: Dictionary mapping user_id to embedding arrays.
+            user_names: Dictionary mapping user_id to user names.
+            roster: Optional user IDs searched before the full gallery.
+            day_counts: Attendance entries per (user_id, day) seen so far.
+            response: Response whose totals and results are updated.
+        """
+        start_time = time.time()
+        service = self.face_recognition_service
+
+        # Step 3: Embed the chunk's usable crops together
+        face_groups, kept = [], []
+        for photo in chunk:
+            indices = [i for i, score in enumerate(photo.quality_scores) if score >= service.min_quality_threshold]
+            face_groups.append([photo.face_images[i] for i in indices])
+            kept.append(indices)
+        recognitions = service.recognize_face_groups(face_groups, known_embeddings, user_names, roster)
+
+        # Step 4: One record per recognized face, on the photo's date
+        records: List[AttendanceRecord] = []
+        marked: List[Tuple[str, str, float, Optional[str]]] = []
+        for photo, indices, results in zip(chunk, kept, recognitions):
+            for face_index, result in zip(indices, results):
+                if result is None:
+                    continue
+                response.faces_recognized += 1
+                confidence = float(result.confidence)
+                error = self._create_record(
+                    photo, face_index, result.user_id, result.user_name, confidence,
+                    request, day_counts, records, start_time
+                )
+                marked.append((result.user_id, result.user_name, confidence, error))
+
+        committed = [photo.photo_id for photo in chunk]
+        if records and not self.attendance_repository.add_attendance_batch(records):
+            # Nothing of the chunk was written: report it so a resume retries it
+            for record in records:
+                day_counts[(record.user_id, record.date)] -= 1
+            marked = [(u, n, c, error or "Failed to save attendance records") for u, n, c, error in marked]
+            for photo_id in committed:
+                response.photos_failed += 1
+                response.failed_photos[photo_id] = "Failed to save attendance records"
+            committed = []
+
+        for user_id, user_name, confidence, error in marked:
+            response.results.append(IndividualAttendanceResult(
+                user_id=user_id,
+                user_name=user_name,
+                confidence=confidence,
+                success=error is None,
+                error_message=error
+            ))
+        response.total_marked += sum(1 for *_, error in marked if error is None)
+
+        # Step 5: Report progress (the caller checkpoints the committed photos)
+        if request.progress_callback is not None:
+            request.progress_callback(BackfillProgress(
+                photos_processed=response.photos_processed,
+                photos_failed=response.photos_failed,
+                faces_detected=response.faces_detected,
+                faces_recognized=response.faces_recognized,
+                total_marked=response.total_marked,
+                committed_photo_ids=committed
+            ))
+
+    def _create_record(
+        self,
+        photo: ClassPhotoFaces,
+        face_index: int,
+        user_id: str,
+        user_name: str,
+        confidence: float,
+        request: BackfillClassAttendanceRequest,
+        day_counts: Dict[Tuple[str, date], int],
+        records: List[AttendanceRecord],
+        start_time: float
+    ) -> Optional[str]:
+        """
+        Create the attendance record of one recognized face.
+
+        Returns:
+            None if a record was added to records, otherwise the error message.
+        """
+        day = photo.recorded_at.date()
+        key = (user_id, day)
+        if key not in day_counts:
+            day_counts[key] = self.attendance_repository.count_for_day(user_id, day)
+        if day_counts[key] >= self.max_daily_entries:
+            return f"Daily attendance limit reached ({self.max_daily_entries} entries)"
+
+        try:
+            records.append(self.attendance_service.create_and_validate_record(
+                user_id=user_id,
+                user_name=user_name,
+                face_image=photo.face_images[face_index],
+                confidence=confidence,
+                liveness_verified=True,  # Skip liveness for photo-based attendance
+                face_quality_score=photo.quality_scores[face_index],
+                device_info=request.device_info,
+                location=request.location,
+                verification_stage="class_attendance",
+                session_id=None,  # Will be generated by logger
+                start_time=start_time,
+                recorded_at=photo.recorded_at
+            ))
+        except InvalidAttendanceRecordError as e:
+            return str(e.message) if hasattr(e, 'message') else str(e)
+        day_counts[key] += 1
+        return None
@@ -0,0 +1,319 @@
+"""
+Bulk register users use case.
+
+Enrolls a whole intake of users from a manifest. Faces are detected and
+assessed ahead of this use case (usually in worker processes, see
+detect_enrollment_face); here the accepted faces are embedded in batches and
+all profiles and embeddings are committed with one faces.json write.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Protocol
+from datetime import datetime
+import logging
+import numpy as np
+
+from domain.entities.user import User
+from domain.services.recognition import UserRegistrationService
+from domain.shared.exceptions import DomainException
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EnrollmentCandidate:
+    """One manifest row with its detected face."""
+    row: int  # Manifest row number (for failure reports)
+    user_id: str
+    user_name: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[str] = None
+    face_image: Optional[np.ndarray] = None
+    quality_score: Optional[float] = None
+    face_bbox: Optional[List[int]] = None
+    error: Optional[str] = None  # Set if the row was rejected before embedding
+
+
+@dataclass
+class EnrollmentFailure:
+    """A manifest row that was not enrolled."""
+    row: int
+    user_id: str
+    error: str
+
+
+@dataclass
+class BulkRegisterUsersRequest:
+    """Request for enrolling many users at once."""
+    candidates: Iterable[EnrollmentCandidate]
+    embedding_batch_size: int = 32
+
+
+@dataclass
+class BulkRegisterUsersResponse:
+    """Response from bulk enrollment."""
+    success: bool
+    registered: List[str] = field(default_factory=list)
+    failures: List[EnrollmentFailure] = field(default_factory=list)
+    rows_processed: int = 0
+    error: Optional[str] = None
+
+
+class UserRepositoryProtocol(Protocol):
+    """Protocol for user repository operations."""
+
+    def get_all_users(self) -> Dict[str, Any]:
+        """Get all users. Returns dict with 'success' and 'data' (list of user dicts) keys."""
+        ...
+
+
+class FaceRepositoryProtocol(Protocol):
+    """Protocol for face repository operations."""
+
+    def store_enrollments(self, enrollments: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Store many new users with one write. Returns dict with 'success', 'stored' and 'errors' keys."""
+        ...
+
+
+class EmbeddingExtractorProtocol(Protocol):
+    """Protocol for an additional embedding extractor (e.g. the cascade's fast model)."""
+
+    model_name: str
+
+    def extract_batch(self, face_images: List[np.ndarray]) -> List[Any]:
+        """Extract embeddings for several faces. Returns EmbeddingResult or None per face."""
+        ...
+
+
+def detect_enrollment_face(
+    candidate: EnrollmentCandidate,
+    image: Optional[np.ndarray],
+    registration_service: UserRegistrationService
+) -> EnrollmentCandidate:
+    """
+    Detect and assess the face of one manifest row.
+
+    Runs in detection workers: only the face crop is sent back, not the
+    full image. Failures are recorded on the candidate instead of raised.
+
+    Args:
+        candidate: Manifest row (without face).
+        image: Decoded image (None if it could not be read).
+        registration_service: Service with the face detector and quality
+            assessor (its embedding extractor is not used).
+
+    Returns:
+        The candidate with face_image, quality_score and face_bbox, or error.
+    """
+    if image is None:
+        candidate.error = "Could not read image"
+        return candidate
+    try:
+        face_image, quality_result, location = registration_service.detect_registration_face(image)
+        # Copy: a view would pickle (and keep alive) the whole image
+        candidate.face_image = face_image.copy()
+        candidate.quality_score = float(quality_result.overall_score)
+        candidate.face_bbox = [int(location.x), int(location.y), int(location.width), int(location.height)]
+    except DomainException as e:
+        candidate.error = e.message
+    except Exception as e:
+        logger.warning(f"Face detection failed for row {candidate.row} ({candidate.user_id}): {e}")
+        candidate.error = f"Face detection failed: {str(e)}"
+    return candidate
+
+
+class BulkRegisterUsersUseCase:
+    """
+    Orchestrates bulk user enrollment.
+
+    This use case handles:
+    - Rejecting rows that failed detection, duplicate IDs and existing users
+    - Extracting embeddings (and the cascade's fast-model embeddings) in batches
+    - Committing all profiles and embeddings with one faces.json write
+
+    It does NOT handle:
+    - Reading the manifest or images, or detecting faces (see detect_enrollment_face)
+    """
+
+    def __init__(
+        self,
+        registration_service: UserRegistrationService,
+        user_repository: UserRepositoryProtocol,
+        face_repository: FaceRepositoryProtocol,
+        fast_embedding_extractor: Optional[EmbeddingExtractorProtocol] = None
+    ):
+        """
+        Initialize BulkRegisterUsersUseCase.
+
+        Args:
+            registration_service: Composite service for user registration operations.
+            user_repository: User data persistence repository.
+            face_repository: Face embedding persistence repository.
+            fast_embedding_extractor: Optional cascade fast-model extractor; when set,
+                                      its embeddings are stored alongside the primary ones.
+        """
+        self.registration_service = registration_service
+        self.user_repository = user_repository
+        self.face_repository = face_repository
+        self.fast_embedding_extractor = fast_embedding_extractor
+
+    def execute(self, request: BulkRegisterUsersRequest) -> BulkRegisterUsersResponse:
+        """
+        Execute bulk enrollment.
+
+        Workflow:
+        1. Reject failed rows, repeated user IDs and existing users
+        2. Extract embeddings batch by batch
+        3. Store all images and faces.json entries with one write
+
+        Args:
+            request: Bulk enrollment request with the detected candidates.
+
+        Returns:
+            BulkRegisterUsersResponse with the registered users and per-row failures.
+        """
+        response = BulkRegisterUsersResponse(success=False)
+        try:
+            # One faces.json read instead of one per row
+            users_result = self.user_repository.get_all_users()
+            if not users_result.get('success', False):
+                response.error = users_result.get('error') or "Failed to load existing users"
+                return response
+            existing = {user['user_id'] for user in users_result.get('data', [])}
+
+            enrollments: List[Dict[str, Any]] = []
+            rows: Dict[str, int] = {}
+            batch: List[EnrollmentCandidate] = []
+            batch_size = max(1, request.embedding_batch_size)
+
+            # Step 1: Validate rows as they arrive
+            for candidate in request.candidates:
+                response.rows_processed += 1
+                error = candidate.error
+                if error is None and not candidate.user_id:
+                    error = "user_id is required"
+                elif error is None and candidate.user_id in rows:
+                    error = f"Duplicate user_id (also on row {rows[candidate.user_id]})"
+                elif error is None and candidate.user_id in existing:
+                    error = f"User {candidate.user_id} already exists"
+                if error is not None:
+                    response.failures.append(EnrollmentFailure(candidate.row, candidate.user_id, error))
+                    continue
+
+                rows[candidate.user_id] = candidate.row
+                batch.append(candidate)
+                # Step 2: Embed each full batch
+                if len(batch) >= batch_size:
+                    enrollments.extend(self._embed_batch(batch, response))
+                    batch = []
+            if batch:
+                enrollments.extend(self._embed_batch(batch, response))
+
+            # Step 3: One transactional write for everyone
+            if enrollments:
+                result = self.face_repository.store_enrollments(enrollments)
+                if not result.get('success', False):
+                    error = result.get('error', 'Failed to store enrollments')
+                    response.failures.extend(
+                        EnrollmentFailure(rows[e['user_id']], e['user_id'], error) for e in enrollments
+                    )
+                    response.error = error
+                    return response
+                response.registered = list(result.get('stored', []))
+                for user_id, error in result.get('errors', {}).items():
+                    response.failures.append(EnrollmentFailure(rows.get(user_id, 0), user_id, error))
+
+            response.failures.sort(key=lambda failure: failure.row)
+            response.success = True
+            logger.info(f"Bulk enrollment: {response.rows_processed} rows, "
+                        f"{len(response.registered)} registered, {len(response.failures)} failed")
+            return response
+
+        except Exception as e:
+            logger.exception(f"Unexpected error during bulk enrollment: {e}")
+            response.error = f"Unexpected error during bulk enrollment: {str(e)}"
+            return response
+
+    def _embed_batch(
+        self,
+        batch: List[EnrollmentCandidate],
+        response: BulkRegisterUsersResponse
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract the embeddings of a batch and build its enrollments.
+
+        Rows whose embedding fails are added to the response's failures.
+
+        Args:
+            batch: Candidates with face images.
+            response: Response collecting failures.
+
+        Returns:
+            One enrollment dictionary (see FaceRepository.store_enrollments)
+            per candidate with an embedding.
+        """
+        face_images = [candidate.face_image for candidate in batch]
+        embeddings = self._extract_batch(self.registration_service.embedding_extractor, face_images)
+        fast_embeddings: List[Any] = [None] * len(batch)
+        if self.fast_embedding_extractor is not None:
+            # Users without a fast embedding are still recognized (the cascade escalates)
+            fast_embeddings = self._extract_batch(self.fast_embedding_extractor, face_images)
+
+        enrollments = []
+        created_at = datetime.now()
+        for candidate, embedding, fast_embedding in zip(batch, embeddings, fast_embeddings):
+            if embedding is None:
+                response.failures.append(EnrollmentFailure(
+                    candidate.row, candidate.user_id, "Face embedding extraction failed"
+                ))
+                continue
+            user = User(
+                user_id=candidate.user_id,
+                username=candidate.user_name,
+                first_name=candidate.first_name,
+                last_name=candidate.last_name,
+                email=candidate.email,
+                registration_date=created_at,
+                status='active'
+            )
+            enrollments.append({
+                'user_id': user.user_id,
+                'name': user.get_full_name(),
+                'embedding': embedding.embedding,
+                'face_image': candidate.face_image,
+                'registration_date': created_at,
+                'face_bbox': candidate.face_bbox,
+                'model_embeddings': (
+                    {self.fast_embedding_extractor.model_name: fast_embedding.embedding}
+                    if fast_embedding is not None else None
+                )
+            })
+        return enrollments
+
+    @staticmethod
+    def _extract_batch(extractor: Any, face_images: List[np.ndarray]) -> List[Any]:
+        """
+        Extract embeddings for a batch, falling back to one face at a time on error.
+
+        Args:
+            extractor: Embedding extractor to use.
+            face_images: Cropped face images.
+
+        Returns:
+            One EmbeddingResult (or None on failure) per face image.
+        """
+        try:
+            return extractor.extract_batch(face_images)
+        except Exception as e:
+            # One bad crop must not fail the whole batch: retry face by face
+            logger.warning(f"Batched embedding extraction failed, retrying per face: {e}")
+
+        embedding_results = []
+        for face_image in face_images:
+            try:
+                embedding_results.append(extractor.extract(face_image))
+            except Exception as face_error:
+                logger.warning(f"Embedding extraction failed for face: {face_error}")
+                embedding_results.append(None)
+        return embedding_results
@@ -0,0 +1,369 @@
+"""
+Ingest lecture video use case.
+
+Marks attendance from a recorded classroom video. Faces are detected in
+sampled frames and tracked across them; each track is embedded only at its
+few best-quality frames, its identity is decided by voting, and all
+attendance records are written with one bulk insert.
+"""
+
+from dataclasses import dataclass
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Protocol, Tuple
+from datetime import date, datetime
+import time
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+from core.attendance.value_objects import IndividualAttendanceResult
+from core.recognition.face_tracker import (
+    DEFAULT_TRACK_IOU_THRESHOLD,
+    DEFAULT_TRACK_KEEP_BEST,
+    DEFAULT_TRACK_MAX_MISSED,
+    FaceTrack,
+    FaceTracker,
+    TrackIdentity,
+    vote_identity
+)
+from domain.entities.attendance_record import AttendanceRecord
+from domain.services.attendance import AttendanceService
+from domain.services.recognition import FaceRecognitionService
+from domain.shared.constants import MAX_DAILY_ATTENDANCE_ENTRIES
+from domain.shared.exceptions import InvalidAttendanceRecordError
+from use_cases.known_embeddings import load_known_embeddings
+
+
+@dataclass
+class IngestLectureVideoRequest:
+    """Request for marking attendance from a recorded lecture video."""
+    frames: Iterable[np.ndarray]  # Sampled frames in order, e.g. VideoFileSource(path, sample_fps=2).frames()
+    location: str
+    device_info: str = "lecture_video"
+    embeddings_per_track: int = DEFAULT_TRACK_KEEP_BEST  # Best-quality crops embedded per track
+    min_track_detections: int = 2  # Shorter tracks (e.g. false detections) are ignored
+    max_missed_frames: int = DEFAULT_TRACK_MAX_MISSED  # Sampled frames a face may be missed before its track ends
+    iou_threshold: float = DEFAULT_TRACK_IOU_THRESHOLD
+    embedding_batch_size: int = 32
+    recorded_at: Optional[datetime] = None  # When the lecture took place (default: now)
+
+
+@dataclass
+class IngestLectureVideoResponse:
+    """Response from ingesting a lecture video."""
+    success: bool
+    results: List[IndividualAttendanceResult]
+    frames_processed: int = 0
+    faces_detected: int = 0
+    tracks: int = 0
+    tracks_identified: int = 0
+    faces_embedded: int = 0
+    total_marked: int = 0
+    error: Optional[str] = None
+
+
+class AttendanceRepositoryProtocol(Protocol):
+    """Protocol for attendance repository operations."""
+
+    def add_attendance_batch(self, records: List[AttendanceRecord]) -> bool:
+        """Add several attendance entries with one write. Returns True if successful."""
+        ...
+
+    def count_for_day(self, user_id: str, day: date) -> int:
+        """Count a user's attendance entries on a given day."""
+        ...
+
+
+class FaceRepositoryProtocol(Protocol):
+    """Protocol for face repository operations."""
+
+    def get_all_face_embeddings(self) -> Dict[str, Any]:
+        """Get all face embeddings. Returns dict with 'success' and 'embeddings' keys."""
+        ...
+
+    def get_user_names(self) -> Dict[str, str]:
+        """Get the display name of every user that has one."""
+        ...
+
+
+class RosterRepositoryProtocol(Protocol):
+    """Protocol for roster repository operations."""
+
+    def get_roster(self, location: str) -> Optional[AbstractSet[str]]:
+        """Get the user IDs registered for a location (None if no roster)."""
+        ...
+
+
+class IngestLectureVideoUseCase:
+    """
+    Orchestrates attendance marking from a recorded lecture video.
+
+    This use case handles:
+    - Detecting faces in sampled frames and tracking them across frames
+    - Embedding each track's best-quality crops in batches
+    - Voting on each track's identity
+    - Checking daily limits and bulk-inserting one record per recognized student
+
+    Embedding dominates per-face cost, so embedding a few crops per track
+    instead of every detection is what lets an hour of video be processed
+    much faster than real time.
+    """
+
+    def __init__(
+        self,
+        face_recognition_service: FaceRecognitionService,
+        attendance_service: AttendanceService,
+        attendance_repository: AttendanceRepositoryProtocol,
+        face_repository: FaceRepositoryProtocol,
+        max_daily_entries: int = None,
+        roster_repository: Optional[RosterRepositoryProtocol] = None
+    ):
+        """
+        Initialize IngestLectureVideoUseCase.
+
+        Args:
+            face_recognition_service: Composite service for face recognition operations.
+            attendance_service: Composite service for attendance operations.
+            attendance_repository: Attendance data persistence repository.
+            face_repository: Face embedding persistence repository.
+            max_daily_entries: Maximum attendance entries allowed per day.
+            roster_repository: Optional roster repository; the roster of the
+                              request's location is searched before the full gallery.
+        """
+        self.face_recognition_service = face_recognition_service
+        self.attendance_service = attendance_service
+        self.attendance_repository = attendance_repository
+        self.face_repository = face_repository
+        self.roster_repository = roster_repository
+        self.max_daily_entries = (
+            max_daily_entries if max_daily_entries is not None
+            else MAX_DAILY_ATTENDANCE_ENTRIES
+        )
+
+    def execute(self, request: IngestLectureVideoRequest) -> IngestLectureVideoResponse:
+        """
+        Execute lecture video ingestion.
+
+        Workflow:
+        1. Get known embeddings (and the location's roster)
+        2. Detect and track faces in every sampled frame
+        3. Embed each track's best crops and vote on its identity
+        4. Keep one track per student (the most confident)
+        5. Create records and save them with one bulk insert
+
+        Args:
+            request: Ingest request with the sampled frames and metadata.
+
+        Returns:
+            IngestLectureVideoResponse with one result per recognized student.
+        """
+        start_time = time.time()
+
+        try:
+            # Step 1: Get known embeddings
+            known_embeddings, user_names = load_known_embeddings(self.face_repository)
+            if not known_embeddings:
+                return IngestLectureVideoResponse(
+                    success=False,
+                    results=[],
+                    error="No known faces in database"
+                )
+            roster = (
+                self.roster_repository.get_roster(request.location)
+                if self.roster_repository is not None and request.location else None
+            )
+
+            # Step 2: Track faces across the sampled frames
+            tracker = FaceTracker(
+                iou_threshold=request.iou_threshold,
+                max_missed=request.max_missed_frames,
+                keep_best=request.embeddings_per_track
+            )
+            frames_processed, faces_detected = 0, 0
+            for frame_index, frame in enumerate(request.frames):
+                faces_detected += self._track_frame(tracker, frame_index, frame)
+                frames_processed += 1
+            tracks = [
+                track for track in tracker.finish()
+                if track.hits >= request.min_track_detections
+            ]
+
+            # Step 3: Embed the best crops and vote per track
+            identities, faces_embedded = self._identify_tracks(
+                tracks, known_embeddings, user_names, roster, request.embedding_batch_size
+            )
+
+            # Step 4: One record per student (a student may leave and come back)
+            best_by_user: Dict[str, Tuple[FaceTrack, TrackIdentity]] = {}
+            for track, identity in zip(tracks, identities):
+                if identity is None:
+                    continue
+                current = best_by_user.get(identity.user_id)
+                if current is None or identity.confidence > current[1].confidence:
+                    best_by_user[identity.user_id] = (track, identity)
+
+            # Step 5: Create records and bulk insert
+            results = self._save_attendance(list(best_by_user.values()), request, start_time)
+
+            response = IngestLectureVideoResponse(
+                success=True,
+                results=results,
+                frames_processed=frames_processed,
+                faces_detected=faces_detected,
+                tracks=len(tracks),
+                tracks_identified=sum(1 for identity in identities if identity is not None),
+                faces_embedded=faces_embedded,
+                total_marked=sum(1 for result in results if result.success)
+            )
+            logger.info(f"Lecture video ingested: {frames_processed} frames, {faces_detected} faces, "
+                        f"{len(tracks)} tracks, {faces_embedded} embedded, "
+                        f"{response.total_marked} marked in {time.time() - start_time:.1f}s")
+            return response
+
+        except Exception as e:
+            logger.exception(f"Unexpected error during lecture video ingestion: {e}")
+            return IngestLectureVideoResponse(
+                success=False,
+                results=[],
+                error=f"Unexpected error during lecture video ingestion: {str(e)}"
+            )
+
+    def _track_frame(self, tracker: FaceTracker, frame_index: int, frame: np.ndarray) -> int:
+        """
+        Detect the faces of one frame and feed them to the tracker.
+
+        Args:
+            tracker: Tracker of the video.
+            frame_index: Index of the sampled frame.
+            frame: Frame image.
+
+        Returns:
+            Number of faces detected.
+        """
+        service = self.face_recognition_service
+        detection_result = service.face_detector.detect(frame)
+        locations = detection_result.faces if detection_result.faces_detected else []
+
+        height, width = frame.shape[:2]
+        face_images, quality_scores = [], []
+        for location in locations:
+            x, y = max(0, location.x), max(0, location.y)
+            face_image = frame[y:min(height, y + location.height), x:min(width, x + location.width)]
+            face_images.append(face_image)
+            quality_scores.append(
+                service.quality_assessor.assess(face_image).overall_score if face_image.size else 0.0
+            )
+
+        # Frames without faces still age the tracks
+        tracker.update(frame_index, locations, face_images, quality_scores)
+        return len(locations)
+
+    def _identify_tracks(
+        self,
+        tracks: List[FaceTrack],
+        known_embeddings: Dict[str, np.ndarray],
+        user_names: Dict[str, str],
+        roster: Optional[AbstractSet[str]],
+        batch_size: int
+    ) -> Tuple[List[Optional[TrackIdentity]], int]:
+        """
+        Embed the best crops of all tracks in batches and vote per track.
+
+        Crops below the service's quality threshold are not embedded.
+
+        Args:
+            tracks: Tracks to identify.
+            known_embeddings: Dictionary mapping user_id to embedding arrays.
+            user_names: Dictionary mapping user_id to user names.
+            roster: Optional user IDs searched before the full gallery.
+            batch_size: Crops embedded per batch.
+
+        Returns:
+            Tuple of (identity per track or None, number of crops embedded).
+        """
+        service = self.face_recognition_service
+        crops: List[np.ndarray] = []
+        owners: List[int] = []
+        for track_index, track in enumerate(tracks):
+            for face in track.best_faces:
+                if face.quality_score >= service.min_quality_threshold:
+                    crops.append(face.face_image)
+                    owners.append(track_index)
+
+        results = []
+        batch_size = max(1, batch_size)
+        for start in range(0, len(crops), batch_size):
+            batch = crops[start:start + batch_size]
+            results.extend(service.recognize_faces(
+                face_images=batch,
+                known_embeddings=known_embeddings,
+                user_names=user_names,
+                rosters=[roster] * len(batch) if roster else None
+            ))
+
+        per_track: List[List[Any]] = [[] for _ in tracks]
+        for owner, result in zip(owners, results):
+            per_track[owner].append(result)
+        identities = [vote_identity(track_results) if track_results else None for track_results in per_track]
+        return identities, len(crops)
+
+    def _save_attendance(
+        self,
+        identified: List[Tuple[FaceTrack, TrackIdentity]],
+        request: IngestLectureVideoRequest,
+        start_time: float
+    ) -> List[IndividualAttendanceResult]:
+        """
+        Create one record per identified student and save them in one write.
+
+        Args:
+            identified: (track, identity) per student.
+            request: Ingest request with device info, location and lecture time.
+            start_time: Start time for processing time calculation.
+
+        Returns:
+            IndividualAttendanceResult per student.
+        """
+        records: List[AttendanceRecord] = []
+        errors: List[Optional[str]] = []
+        day = request.recorded_at.date() if request.recorded_at else date.today()
+
+        for track, identity in identified:
+            if self.attendance_repository.count_for_day(identity.user_id, day) >= self.max_daily_entries:
+                errors.append(f"Daily attendance limit reached ({self.max_daily_entries} entries)")
+                continue
+
+            best_face = track.best_faces[0]
+            try:
+                records.append(self.attendance_service.create_and_validate_record(
+                    user_id=identity.user_id,
+                    user_name=identity.user_name,
+                    face_image=best_face.face_image,
+                    confidence=identity.confidence,
+                    liveness_verified=True,  # Skip liveness for recorded-video attendance
+                    face_quality_score=best_face.quality_score,
+                    device_info=request.device_info,
+                    location=request.location,
+                    verification_stage="lecture_video",
+                    session_id=None,  # Will be generated by logger
+                    start_time=start_time,
+                    recorded_at=request.recorded_at
+                ))
+                errors.append(None)
+            except InvalidAttendanceRecordError as e:
+                errors.append(str(e.message) if hasattr(e, 'message') else str(e))
+
+        # All records are written with one CSV rewrite instead of one per student
+        if records and not self.attendance_repository.add_attendance_batch(records):
+            errors = [error or "Failed to save attendance records" for error in errors]
+
+        return [
+            IndividualAttendanceResult(
+                user_id=identity.user_id,
+                user_name=identity.user_name,
+                confidence=identity.confidence,
+                success=error is None,
+                error_message=error
+            )
+            for (_, identity), error in zip(identified, errors)
+        ]
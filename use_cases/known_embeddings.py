@@ -0,0 +1,80 @@
+"""
+Known embeddings shared by the recognition use cases.
+
+Loads the gallery's primary embeddings and the user names used to label
+matches, in the format FaceRecognitionService expects.
+"""
+
+from typing import Any, Dict, Protocol, Tuple
+import numpy as np
+
+from domain.entities.face_embedding import FaceEmbedding
+
+
+class KnownEmbeddingsRepositoryProtocol(Protocol):
+    """Protocol for the face repository operations used to load known embeddings."""
+
+    def get_all_face_embeddings(self) -> Dict[str, Any]:
+        """Get all face embeddings. Returns dict with 'success' and 'embeddings' keys."""
+        ...
+
+    def get_user_names(self) -> Dict[str, str]:
+        """Get the display name of every user that has one."""
+        ...
+
+
+def load_known_embeddings(
+    face_repository: KnownEmbeddingsRepositoryProtocol
+) -> Tuple[Dict[str, np.ndarray], Dict[str, str]]:
+    """
+    Get known embeddings and user names from the face repository.
+
+    Handles both formats:
+    - Dict[str, FaceEmbedding] (actual repository format)
+    - Dict with 'success' and 'embeddings' keys (protocol format), whose
+      values may be FaceEmbedding entities, dicts with an 'embeddings' or
+      'embedding' key, or numpy arrays
+
+    Names come from the entry itself when it has a 'user_name', otherwise
+    from face_repository.get_user_names(); users without a name are labelled
+    with their user_id.
+
+    Args:
+        face_repository: Repository holding the gallery.
+
+    Returns:
+        Tuple of (known_embeddings, user_names) dictionaries; both are empty
+        if the repository reports a failure or has no embeddings.
+    """
+    embeddings_result = face_repository.get_all_face_embeddings()
+
+    if isinstance(embeddings_result, dict) and 'success' in embeddings_result:
+        if not embeddings_result.get('success', False):
+            return {}, {}
+        embeddings_data = embeddings_result.get('embeddings', {})
+    else:
+        embeddings_data = embeddings_result
+
+    if not embeddings_data:
+        return {}, {}
+
+    stored_names = face_repository.get_user_names()
+    known_embeddings = {}
+    user_names = {}
+    for user_id, embedding_info in embeddings_data.items():
+        name = None
+        if isinstance(embedding_info, FaceEmbedding):
+            known_embeddings[user_id] = embedding_info.embedding
+        elif isinstance(embedding_info, dict) and 'embeddings' in embedding_info:
+            known_embeddings[user_id] = embedding_info['embeddings']
+            name = embedding_info.get('user_name')
+        elif isinstance(embedding_info, dict) and 'embedding' in embedding_info:
+            known_embeddings[user_id] = embedding_info['embedding']
+            name = embedding_info.get('user_name')
+        elif isinstance(embedding_info, np.ndarray):
+            known_embeddings[user_id] = embedding_info
+        else:
+            continue
+        user_names[user_id] = name or stored_names.get(user_id) or user_id
+
+    return known_embeddings, user_names
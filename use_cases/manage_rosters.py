@@ -0,0 +1,138 @@
+"""
+Manage rosters use cases.
+
+Orchestrates registration and retrieval of class rosters (location or
+session -> expected user IDs) used to scope recognition.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Protocol
+
+
+@dataclass
+class RegisterRosterRequest:
+    """Request for registering (or replacing) a roster."""
+    location: str
+    user_ids: List[str]
+
+
+@dataclass
+class RegisterRosterResponse:
+    """Response from registering a roster."""
+    success: bool
+    location: str
+    user_ids: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+@dataclass
+class GetRostersRequest:
+    """Request for getting all rosters."""
+    pass
+
+
+@dataclass
+class GetRostersResponse:
+    """Response from getting all rosters."""
+    success: bool
+    rosters: Dict[str, List[str]] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+class RosterRepositoryProtocol(Protocol):
+    """Protocol for roster repository operations."""
+
+    def set_roster(self, location: str, user_ids: Iterable[str]) -> bool:
+        """Register or replace a roster. Returns True on success."""
+        ...
+
+    def get_all_rosters(self) -> Dict[str, List[str]]:
+        """Get all rosters as location -> sorted user IDs."""
+        ...
+
+
+class RegisterRosterUseCase:
+    """
+    Orchestrates roster registration workflow.
+
+    This use case validates the roster and stores it in the repository.
+    Users do not need to be enrolled yet; unknown user IDs simply never
+    match until they are.
+    """
+
+    def __init__(self, roster_repository: RosterRepositoryProtocol):
+        """
+        Initialize RegisterRosterUseCase.
+
+        Args:
+            roster_repository: Roster data persistence repository.
+        """
+        self.roster_repository = roster_repository
+
+    def execute(self, request: RegisterRosterRequest) -> RegisterRosterResponse:
+        """
+        Execute roster registration workflow.
+
+        Args:
+            request: Register roster request with location and user IDs.
+
+        Returns:
+            RegisterRosterResponse with the stored user IDs.
+        """
+        location = (request.location or "").strip()
+        if not location:
+            return RegisterRosterResponse(
+                success=False,
+                location=request.location,
+                error="Roster location cannot be empty"
+            )
+
+        user_ids = sorted({str(user_id).strip() for user_id in request.user_ids if str(user_id).strip()})
+
+        try:
+            if not self.roster_repository.set_roster(location, user_ids):
+                return RegisterRosterResponse(
+                    success=False,
+                    location=location,
+                    error="Failed to save roster"
+                )
+            return RegisterRosterResponse(success=True, location=location, user_ids=user_ids)
+        except Exception as e:
+            return RegisterRosterResponse(
+                success=False,
+                location=location,
+                error=f"Unexpected error during roster registration: {str(e)}"
+            )
+
+
+class GetRostersUseCase:
+    """
+    Orchestrates roster retrieval workflow.
+    """
+
+    def __init__(self, roster_repository: RosterRepositoryProtocol):
+        """
+        Initialize GetRostersUseCase.
+
+        Args:
+            roster_repository: Roster data persistence repository.
+        """
+        self.roster_repository = roster_repository
+
+    def execute(self, request: GetRostersRequest) -> GetRostersResponse:
+        """
+        Execute roster retrieval workflow.
+
+        Args:
+            request: Get rosters request.
+
+        Returns:
+            GetRostersResponse with all rosters.
+        """
+        try:
+            return GetRostersResponse(success=True, rosters=self.roster_repository.get_all_rosters())
+        except Exception as e:
+            return GetRostersResponse(
+                success=False,
+                error=f"Unexpected error during roster retrieval: {str(e)}"
+            )
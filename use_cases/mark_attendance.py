@@ -5,8 +5,8 @@ Orchestrates attendance marking workflow with liveness verification.
 Face recognition is handled in Phase 1 (RecognizeFaceUseCase).
 """
 
-from dataclasses import dataclass
-from typing import Optional, List, Protocol
+from dataclasses import dataclass, replace
+from typing import Callable, Optional, List, Protocol, Sequence, Tuple
 from datetime import date
 import time
 import logging
@@ -15,6 +15,7 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 from domain.entities.attendance_record import AttendanceRecord
+from domain.entities.recognition_session import RecognitionSession
 from domain.services.liveness import LivenessService
 from domain.services.attendance import AttendanceService
 from domain.shared.exceptions import (
@@ -25,16 +26,28 @@ from domain.shared.exceptions import (
 
 @dataclass
 class MarkAttendanceRequest:
-    """Request for marking attendance with liveness verification."""
-    frames_sequence: List[np.ndarray]  # Frames for liveness verification
-    user_id: str  # From Phase 1
-    user_name: str  # From Phase 1
-    face_image: np.ndarray  # Single frame from Phase 1 for attendance record
-    face_quality_score: float  # Quality score from Phase 1
-    confidence: float  # Recognition confidence from Phase 1
-    device_info: str
-    location: str
+    """
+    Request for marking attendance with liveness verification.
+    
+    Phase 1 results come either from session_id (a session opened by
+    RecognizeFaceUseCase) or, for clients without sessions, from the
+    user_id ... confidence fields. Sessions live in the process that opened
+    them; if another process opened the session, fallback_request builds
+    the request from the Phase 1 fields the client sent along.
+    """
+    frames_sequence: Sequence[np.ndarray]  # Frames for liveness verification (may be decoded lazily)
+    user_id: str = ""  # From Phase 1
+    user_name: str = ""  # From Phase 1
+    face_image: Optional[np.ndarray] = None  # Face from Phase 1 for attendance record
+    face_quality_score: float = 0.0  # Quality score from Phase 1
+    confidence: float = 0.0  # Recognition confidence from Phase 1
+    device_info: str = "web"
+    location: str = "unknown"
     frontend_blink_count: Optional[int] = None  # Optional blink count from frontend
+    session_id: Optional[str] = None  # Recognition session from Phase 1
+    face_roi: Optional[Tuple[int, int, int, int]] = None  # Phase 1 face box (x, y, w, h), from the session
+    liveness_verified: bool = False  # Blinks already counted by an in-process caller (kiosk); never set from HTTP
+    fallback_request: Optional[Callable[[], "MarkAttendanceRequest"]] = None  # Used if the session is not in this process
 
 
 @dataclass
@@ -64,6 +77,20 @@ class AttendanceRepositoryProtocol(Protocol):
         ...
 
 
+class SessionRepositoryProtocol(Protocol):
+    """Protocol for recognition session repository operations."""
+    
+    def claim_session(self, session_id: str) -> Tuple[Optional[RecognitionSession], bool]:
+        """Claim a live recognition session. Returns (session or None, whether the session is known)."""
+        ...
+    
+    def release_session(self, session_id: str) -> None:
+        """Release a claimed session so it can be used again."""
+        ...
+    
+    def delete_session(self, session_id: str) -> bool:
+        """Delete a used recognition session."""
+        ...
 
 
 class MarkAttendanceUseCase:
@@ -82,7 +109,8 @@ class MarkAttendanceUseCase:
         self,
         liveness_service: LivenessService,
         attendance_service: AttendanceService,
-        attendance_repository: AttendanceRepositoryProtocol
+        attendance_repository: AttendanceRepositoryProtocol,
+        session_repository: Optional[SessionRepositoryProtocol] = None
     ):
         """
         Initialize MarkAttendanceUseCase.
@@ -91,10 +119,13 @@ class MarkAttendanceUseCase:
             liveness_service: Composite service for liveness verification.
             attendance_service: Composite service for attendance operations.
             attendance_repository: Attendance data persistence repository.
+            session_repository: Optional recognition session repository for
+                               requests that reference a Phase 1 session.
         """
         self.liveness_service = liveness_service
         self.attendance_service = attendance_service
         self.attendance_repository = attendance_repository
+        self.session_repository = session_repository
     
     def execute(self, request: MarkAttendanceRequest) -> MarkAttendanceResponse:
         """
@@ -121,11 +152,34 @@ class MarkAttendanceUseCase:
         """
         start_time = time.time()
         stage = None
+        claimed_session_id = None
         
         try:
             # Step 1: Validate inputs
             stage = "validation"
-            if not request.frames_sequence:
+            if request.session_id:
+                session_request, known = self._claim_session(request)
+                if session_request is not None:
+                    claimed_session_id = request.session_id
+                    request = session_request
+                elif known:
+                    return MarkAttendanceResponse(
+                        success=False,
+                        error="Attendance is already being marked for this recognition session.",
+                        stage=stage
+                    )
+                elif request.fallback_request is not None:
+                    # e.g. Phase 1 was served by another uvicorn worker
+                    logger.info("Recognition session not held by this process; using the Phase 1 fields sent with the request")
+                    request = request.fallback_request()
+                else:
+                    return MarkAttendanceResponse(
+                        success=False,
+                        error="Recognition session expired or not found. Please scan your face again.",
+                        stage=stage
+                    )
+            
+            if not request.frames_sequence and not request.liveness_verified:
                 return MarkAttendanceResponse(
                     success=False,
                     error="Frames sequence cannot be empty",
@@ -139,11 +193,19 @@ class MarkAttendanceUseCase:
                     stage=stage
                 )
             
+            if request.face_image is None:
+                return MarkAttendanceResponse(
+                    success=False,
+                    error="Face image or session ID is required from Phase 1",
+                    stage=stage
+                )
+            
             # Step 2: Call liveness_service.verify_liveness(frames)
             stage = "liveness_verification"
-            liveness_verified = self.liveness_service.verify_liveness(
+            liveness_verified = request.liveness_verified or self.liveness_service.verify_liveness(
                 request.frames_sequence,
-                frontend_blink_count=request.frontend_blink_count
+                frontend_blink_count=request.frontend_blink_count,
+                face_roi=request.face_roi
             )
             
             # Step 3: If True, create attendance record and save
@@ -157,6 +219,11 @@ class MarkAttendanceUseCase:
                 start_time
             )
             
+            if claimed_session_id is not None:
+                # A session marks attendance once
+                self.session_repository.delete_session(claimed_session_id)
+                claimed_session_id = None
+            
             # Success
             return MarkAttendanceResponse(
                 success=True,
@@ -187,6 +254,48 @@ class MarkAttendanceUseCase:
                 error=f"Unexpected error during attendance marking: {str(e)}",
                 stage=stage or "unknown"
             )
+        finally:
+            if claimed_session_id is not None:
+                # Not marked: keep the session for a retry
+                self.session_repository.release_session(claimed_session_id)
+    
+    def _claim_session(self, request: MarkAttendanceRequest) -> Tuple[Optional[MarkAttendanceRequest], bool]:
+        """
+        Claim the request's recognition session and fill its Phase 1 fields.
+        
+        The claim keeps concurrent requests with the same session from both
+        marking attendance. The session is kept until attendance is marked,
+        so a failed liveness check can be retried within its lifetime.
+        
+        Args:
+            request: Request with a session_id.
+        
+        Returns:
+            (request, known): the request with user, face image, quality score
+            and confidence from the session, or None if the session was not
+            claimed; known is True if this process holds the session (another
+            request is using it)
+        """
+        if self.session_repository is None:
+            return None, False
+        recognition_session, known = self.session_repository.claim_session(request.session_id)
+        if recognition_session is None:
+            return None, known
+        session = recognition_session.session
+        location = request.location
+        if (not location or location == "unknown") and recognition_session.location:
+            location = recognition_session.location
+        return replace(
+            request,
+            fallback_request=None,
+            user_id=session.user_id,
+            user_name=session.user_name,
+            face_image=recognition_session.face_image,
+            face_quality_score=recognition_session.face_quality_score,
+            confidence=session.confidence,
+            location=location,
+            face_roi=recognition_session.face_roi
+        ), True
     
     def _create_and_save_record(
         self,
@@ -6,7 +6,7 @@ class is taken and attendance is marked for all recognized students.
 """
 
 from dataclasses import dataclass
-from typing import Optional, List, Protocol, Dict, Any
+from typing import AbstractSet, Optional, List, Protocol, Dict, Any
 from datetime import date
 import time
 import logging
@@ -14,6 +14,7 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+from core.recognition.image_context import ImageContext
 from domain.entities.attendance_record import AttendanceRecord
 from domain.services.recognition import FaceRecognitionService
 from domain.services.attendance import AttendanceService
@@ -23,6 +24,7 @@ from domain.shared.exceptions import (
     FaceNotRecognizedError
 )
 from domain.shared.constants import MAX_DAILY_ATTENDANCE_ENTRIES
+from use_cases.known_embeddings import load_known_embeddings
 
 
 @dataclass
@@ -59,6 +61,10 @@ class AttendanceRepositoryProtocol(Protocol):
     ) -> List:
         """Get attendance history. Returns list of attendance entries."""
         ...
+    
+    def count_for_day(self, user_id: str, day: date) -> int:
+        """Count a user's attendance entries on a given day."""
+        ...
 
 
 class FaceRepositoryProtocol(Protocol):
@@ -68,6 +74,10 @@ class FaceRepositoryProtocol(Protocol):
         """Get all face embeddings. Returns dict with 'success' and 'embeddings' keys."""
         ...
 
+    def get_user_names(self) -> Dict[str, str]:
+        """Get the display name of every user that has one."""
+        ...
+
 
 class UserRepositoryProtocol(Protocol):
     """Protocol for user repository operations."""
@@ -77,6 +87,14 @@ class UserRepositoryProtocol(Protocol):
         ...
 
 
+class RosterRepositoryProtocol(Protocol):
+    """Protocol for roster repository operations."""
+    
+    def get_roster(self, location: str) -> Optional[AbstractSet[str]]:
+        """Get the user IDs registered for a location (None if no roster)."""
+        ...
+
+
 class MarkClassAttendanceUseCase:
     """
     Orchestrates class attendance marking workflow.
@@ -98,7 +116,8 @@ class MarkClassAttendanceUseCase:
         attendance_repository: AttendanceRepositoryProtocol,
         face_repository: FaceRepositoryProtocol,
         user_repository: UserRepositoryProtocol,
-        max_daily_entries: int = None
+        max_daily_entries: int = None,
+        roster_repository: Optional[RosterRepositoryProtocol] = None
     ):
         """
         Initialize MarkClassAttendanceUseCase.
@@ -110,12 +129,15 @@ class MarkClassAttendanceUseCase:
             face_repository: Face embedding persistence repository.
             user_repository: User data persistence repository.
             max_daily_entries: Maximum attendance entries allowed per day.
+            roster_repository: Optional roster repository; the roster of the
+                              request's location is searched before the full gallery.
         """
         self.face_recognition_service = face_recognition_service
         self.attendance_service = attendance_service
         self.attendance_repository = attendance_repository
         self.face_repository = face_repository
         self.user_repository = user_repository
+        self.roster_repository = roster_repository
         self.max_daily_entries = (
             max_daily_entries if max_daily_entries is not None
             else MAX_DAILY_ATTENDANCE_ENTRIES
@@ -142,7 +164,7 @@ class MarkClassAttendanceUseCase:
         
         try:
             # Step 1: Get known embeddings
-            known_embeddings, user_names = self._get_known_embeddings()
+            known_embeddings, user_names = load_known_embeddings(self.face_repository)
             if not known_embeddings:
                 return MarkClassAttendanceResponse(
                     success=False,
@@ -154,34 +176,43 @@ class MarkClassAttendanceUseCase:
                 )
             
             # Step 2: Recognize all faces using recognize_multiple_faces
+            # (restricted to the location's roster first, if one is registered)
+            roster = (
+                self.roster_repository.get_roster(request.location)
+                if self.roster_repository is not None and request.location else None
+            )
+            # One image context for the request: detection, crops and quality
+            # results computed during recognition are reused below
+            context = ImageContext(request.class_image)
             recognition_results = self.face_recognition_service.recognize_multiple_faces(
-                image=request.class_image,
+                image=context,
                 known_embeddings=known_embeddings,
-                user_names=user_names
+                user_names=user_names,
+                roster=roster
             )
             
             total_detected = len(recognition_results)
             total_recognized = sum(1 for r in recognition_results if r is not None)
             
             # Step 3: Get face images and process each recognized face
-            face_images = self._extract_face_images(request.class_image, len(recognition_results))
+            face_images = self._extract_face_images(context, len(recognition_results))
             
             # Step 4: Process each recognized face for attendance
             for idx, recognition_result in enumerate(recognition_results):
                 if recognition_result is None:
                     continue
                 
-                face_image = face_images[idx] if idx < len(face_images) else None
-                if face_image is None:
+                face = face_images[idx] if idx < len(face_images) else None
+                if face is None:
                     continue
                 
-                # Get quality score for this face
-                quality_result = self.face_recognition_service.quality_assessor.assess(face_image)
+                # Get quality score for this face (memoized during recognition)
+                quality_result = self.face_recognition_service.quality_assessor.assess(face)
                 
                 # Process individual face attendance
                 result = self._process_individual_attendance(
                     recognition_result=recognition_result,
-                    face_image=face_image,
+                    face_image=face.image,
                     quality_score=quality_result.overall_score,
                     device_info=request.device_info,
                     location=request.location,
@@ -210,90 +241,33 @@ class MarkClassAttendanceUseCase:
                 error=f"Unexpected error during class attendance marking: {str(e)}"
             )
     
-    def _get_known_embeddings(
-        self
-    ) -> tuple[Dict[str, np.ndarray], Dict[str, str]]:
-        """
-        Get known embeddings and user names from repository.
-        
-        Returns:
-            Tuple of (known_embeddings, user_names) dictionaries.
-        """
-        embeddings_result = self.face_repository.get_all_face_embeddings()
-        
-        # Handle both protocol format (dict with 'success' and 'embeddings')
-        # and actual format (Dict[str, FaceEmbedding])
-        if isinstance(embeddings_result, dict) and 'success' in embeddings_result:
-            if not embeddings_result.get('success', False):
-                return {}, {}
-            embeddings_data = embeddings_result.get('embeddings', {})
-        else:
-            embeddings_data = embeddings_result
-        
-        if not embeddings_data:
-            return {}, {}
-        
-        known_embeddings = {}
-        user_names = {}
-        
-        from domain.entities.face_embedding import FaceEmbedding
-        
-        for user_id, embedding_info in embeddings_data.items():
-            # Handle FaceEmbedding entity format
-            if isinstance(embedding_info, FaceEmbedding):
-                known_embeddings[user_id] = embedding_info.embedding
-                user_names[user_id] = embedding_info.user_id
-            # Handle dict format with 'embeddings' key
-            elif isinstance(embedding_info, dict) and 'embeddings' in embedding_info:
-                known_embeddings[user_id] = embedding_info['embeddings']
-                user_names[user_id] = embedding_info.get('user_name', user_id)
-            # Handle dict format with 'embedding' key
-            elif isinstance(embedding_info, dict) and 'embedding' in embedding_info:
-                known_embeddings[user_id] = embedding_info['embedding']
-                user_names[user_id] = embedding_info.get('user_name', user_id)
-            # Handle direct numpy array
-            elif isinstance(embedding_info, np.ndarray):
-                known_embeddings[user_id] = embedding_info
-                user_names[user_id] = user_id
-        
-        return known_embeddings, user_names
-    
     def _extract_face_images(
         self,
-        image: np.ndarray,
+        context: ImageContext,
         expected_count: int
-    ) -> List[Optional[np.ndarray]]:
+    ) -> List[Optional[ImageContext]]:
         """
         Extract face images from the class image.
         
-        Detects faces and extracts face regions. Results are in the same order
-        as recognition results from recognize_multiple_faces.
+        Results are in the same order as recognition results from
+        recognize_multiple_faces. The detection is the one memoized on the
+        context during recognition, and the crops are views shared with it.
         
         Args:
-            image: Full class image containing multiple faces.
+            context: Image context of the class photo used for recognition.
             expected_count: Expected number of faces (from recognition results).
         
         Returns:
-            List of face images (one per detected face), None for failed extractions.
+            List of face crop contexts (one per detected face), None for failed extractions.
         """
-        detection_result = self.face_recognition_service.face_detector.detect(image)
+        detection_result = self.face_recognition_service.face_detector.detect(context)
         if not detection_result.faces_detected or detection_result.face_count == 0:
             return []
         
         face_images = []
-        height, width = image.shape[:2]
-        
         for face_location in detection_result.faces:
             try:
-                # Ensure coordinates are within image bounds
-                x = max(0, face_location.x)
-                y = max(0, face_location.y)
-                x_end = min(width, x + face_location.width)
-                y_end = min(height, y + face_location.height)
-                
-                # Extract face region
-                face_image = image[y:y_end, x:x_end]
-                face_images.append(face_image)
+                face_images.append(context.crop(face_location))
             except Exception as e:
                 logger.warning(f"Error extracting face region: {str(e)}")
                 face_images.append(None)
@@ -404,16 +378,6 @@ class MarkClassAttendanceUseCase:
         Returns:
             True if daily limit reached, False otherwise.
         """
-        today = date.today()
-        
-        # Get existing attendance records for today
-        existing_records = self.attendance_repository.get_attendance_history(
-            user_id=user_id,
-            start_date=today,
-            end_date=today
-        )
-        
-        # Check daily limit
-        daily_entries_count = len(existing_records)
+        # Served from the repository's per-day index (no CSV scan)
+        daily_entries_count = self.attendance_repository.count_for_day(user_id, date.today())
         return daily_entries_count >= self.max_daily_entries
-
@@ -6,13 +6,21 @@ Handles face detection, quality assessment, recognition, and eligibility validat
 """
 
 from dataclasses import dataclass
-from typing import Optional, Protocol, Dict, Any, Tuple, List
+from typing import AbstractSet, Callable, Optional, Protocol, Dict, Any, Tuple, List
 from datetime import date, datetime
 import logging
+import threading
+import uuid
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+from core.recognition.compact_gallery import COMPACT_PRECISIONS, PRECISION_FLOAT32, CompactEmbeddingGallery
+from core.recognition.embedding_extractor import EmbeddingExtractor
+from core.recognition.gallery import EmbeddingGallery
+from core.shared.micro_batcher import MicroBatcher
+from domain.entities.attendance_session import AttendanceSession
+from domain.entities.recognition_session import RecognitionSession
 from domain.entities.user import User
 from domain.services.recognition import FaceRecognitionService
 from domain.shared.exceptions import (
@@ -25,12 +33,14 @@ from domain.shared.constants import (
     MIN_FACE_QUALITY_SCORE,
     MAX_DAILY_ATTENDANCE_ENTRIES
 )
+from use_cases.known_embeddings import load_known_embeddings
 
 
 @dataclass
 class RecognizeFaceRequest:
     """Request for recognizing a face from a single frame."""
     frame: np.ndarray  # Single frame for recognition
+    location: Optional[str] = None  # Kiosk location; its roster is searched first
 
 
 @dataclass
@@ -43,6 +53,7 @@ class RecognizeFaceResponse:
     confidence: Optional[float] = None
     error: Optional[str] = None
     daily_limit_reached: bool = False
+    session_id: Optional[str] = None  # Phase 2 references this instead of re-sending the face
 
 
 class AttendanceRepositoryProtocol(Protocol):
@@ -56,6 +67,10 @@ class AttendanceRepositoryProtocol(Protocol):
     ) -> List:
         """Get attendance history. Returns list of attendance entries."""
         ...
+    
+    def count_for_day(self, user_id: str, day: date) -> int:
+        """Count a user's attendance entries on a given day."""
+        ...
 
 
 class FaceRepositoryProtocol(Protocol):
@@ -64,6 +79,22 @@ class FaceRepositoryProtocol(Protocol):
     def get_all_face_embeddings(self) -> Dict[str, Any]:
         """Get all face embeddings. Returns dict with 'success' and 'embeddings' keys."""
         ...
+    
+    def get_user_names(self) -> Dict[str, str]:
+        """Get the display name of every user that has one."""
+        ...
+    
+    def get_model_embeddings(self, model_name: str) -> Dict[str, np.ndarray]:
+        """Get all users' embeddings from an additional model (e.g. the cascade's fast model)."""
+        ...
+    
+    def get_gallery_version(self) -> Any:
+        """Get a token that changes whenever the stored embeddings may have changed."""
+        ...
+    
+    def get_gallery_model(self) -> Optional[str]:
+        """Get the model ID the gallery was embedded with (None if unrecorded)."""
+        ...
 
 
 class UserRepositoryProtocol(Protocol):
@@ -74,6 +105,22 @@ class UserRepositoryProtocol(Protocol):
         ...
 
 
+class RosterRepositoryProtocol(Protocol):
+    """Protocol for roster repository operations."""
+    
+    def get_roster(self, location: str) -> Optional[AbstractSet[str]]:
+        """Get the user IDs registered for a location (None if no roster)."""
+        ...
+
+
+class SessionRepositoryProtocol(Protocol):
+    """Protocol for recognition session repository operations."""
+    
+    def add_session(self, session: RecognitionSession) -> None:
+        """Store a recognition session for Phase 2."""
+        ...
+
+
 class RecognizeFaceUseCase:
     """
     Use case for recognizing faces from a single frame.
@@ -94,7 +141,13 @@ class RecognizeFaceUseCase:
         attendance_repository: AttendanceRepositoryProtocol,
         face_repository: FaceRepositoryProtocol,
         user_repository: UserRepositoryProtocol,
-        max_daily_entries: int = None
+        max_daily_entries: int = None,
+        batch_max_size: int = 1,
+        batch_max_wait_ms: float = 5.0,
+        roster_repository: Optional[RosterRepositoryProtocol] = None,
+        session_repository: Optional[SessionRepositoryProtocol] = None,
+        gallery_precision: str = PRECISION_FLOAT32,
+        extractor_for_model: Optional[Callable[[str], Optional[EmbeddingExtractor]]] = None
     ):
         """
         Initialize RecognizeFaceUseCase.
@@ -105,15 +158,61 @@ class RecognizeFaceUseCase:
             face_repository: Face embedding persistence repository.
             user_repository: User data persistence repository.
             max_daily_entries: Maximum attendance entries allowed per day.
+            batch_max_size: Maximum number of concurrent requests whose faces are
+                           embedded and matched together. 1 disables micro-batching.
+            batch_max_wait_ms: Maximum time a face waits for others to join its batch.
+            roster_repository: Optional roster repository; when the request has a
+                              location with a roster, that roster is searched first.
+            session_repository: Optional session repository; when given, a
+                               successful recognition opens a session that
+                               Phase 2 references by ID.
+            gallery_precision: Precision of the cached gallery: "float32", or
+                              "float16" / "int8" to hold it as a
+                              CompactEmbeddingGallery (a half or a quarter of
+                              the memory, approximate similarities).
+            extractor_for_model: Optional factory returning an extractor for a
+                                model ID (None if it cannot be loaded). While
+                                the gallery still holds another model's
+                                embeddings (a migration has not swapped yet),
+                                probes are embedded with that model; without
+                                it, such a gallery is not matched at all.
+        
+        Raises:
+            ValueError: If gallery_precision is not supported.
         """
         self.face_recognition_service = face_recognition_service
         self.attendance_repository = attendance_repository
         self.face_repository = face_repository
         self.user_repository = user_repository
+        self.roster_repository = roster_repository
+        self.session_repository = session_repository
+        if gallery_precision not in (PRECISION_FLOAT32,) + COMPACT_PRECISIONS:
+            raise ValueError(f"Unsupported gallery precision '{gallery_precision}'")
+        self.gallery_precision = gallery_precision
+        self.extractor_for_model = extractor_for_model
         self.max_daily_entries = (
             max_daily_entries if max_daily_entries is not None
             else MAX_DAILY_ATTENDANCE_ENTRIES
         )
+        # (gallery version, gallery, user names, fast-model gallery, extractor
+        # of the gallery's model), rebuilt only when the face repository's
+        # version changes
+        self._gallery_cache: Optional[Tuple[
+            Any, EmbeddingGallery, Dict[str, str], Optional[EmbeddingGallery], EmbeddingExtractor
+        ]] = None
+        # (model ID, extractor) of a gallery not embedded with the service's model
+        self._gallery_model_extractor: Optional[Tuple[str, EmbeddingExtractor]] = None
+        self._gallery_lock = threading.Lock()
+        self._batcher: Optional[MicroBatcher] = None
+        if batch_max_size > 1:
+            # Detection and quality checks stay per request; embedding extraction
+            # and gallery matching of concurrent requests run as one batch
+            self._batcher = MicroBatcher(
+                self._recognize_batch,
+                max_batch_size=batch_max_size,
+                max_wait_ms=batch_max_wait_ms,
+                name="recognize"
+            )
     
     def execute(self, request: RecognizeFaceRequest) -> RecognizeFaceResponse:
         """
@@ -124,6 +223,7 @@ class RecognizeFaceUseCase:
         2. Recognize face from known embeddings
         3. Validate eligibility (check daily limit)
         4. Get user information
+        5. Open a recognition session for Phase 2 (if a session repository is set)
         
         Args:
             request: Recognize face request with single frame.
@@ -133,75 +233,187 @@ class RecognizeFaceUseCase:
         """
         try:
             # Step 1: Detect face and assess quality
-            face_image, quality_result = self.face_recognition_service.detect_and_assess_face(
-                request.frame
+            face_image, quality_result, face_location = (
+                self.face_recognition_service.detect_and_assess_face_with_location(request.frame)
             )
             
-            # Step 2: Recognize face
-            recognition_result = self._recognize_face(face_image)
-            
-            # Step 3: Validate eligibility (check daily limit)
-            daily_limit_reached = self._check_daily_limit(recognition_result.user_id)
-            if daily_limit_reached:
-                return RecognizeFaceResponse(
-                    success=False,
-                    error=f"Daily attendance limit reached ({self.max_daily_entries} entries)",
-                    daily_limit_reached=True,
-                    user_id=recognition_result.user_id,
-                    user_name=recognition_result.user_name,
-                    confidence=recognition_result.confidence
-                )
-            
-            # Step 4: Get user information
-            user = self._get_user(recognition_result)
-            
-            # Success
-            return RecognizeFaceResponse(
-                success=True,
-                user=user,
-                user_id=recognition_result.user_id,
-                user_name=recognition_result.user_name,
-                confidence=recognition_result.confidence,
-                daily_limit_reached=False
+            # Steps 2-5
+            return self._recognize_detected_face(
+                face_image, quality_result.overall_score, request.location,
+                face_roi=(face_location.x, face_location.y, face_location.width, face_location.height)
             )
             
-        except FaceDetectionFailedError as e:
-            return RecognizeFaceResponse(
-                success=False,
-                error=str(e.message) if hasattr(e, 'message') else str(e)
-            )
-        except InsufficientQualityError as e:
+        except Exception as e:
+            return self._error_response(e)
+    
+    def execute_for_face(
+        self,
+        face_image: np.ndarray,
+        face_quality_score: float,
+        location: Optional[str] = None,
+        face_roi: Optional[Tuple[int, int, int, int]] = None
+    ) -> RecognizeFaceResponse:
+        """
+        Execute steps 2-5 of the workflow for an already detected face.
+        
+        For callers that run detection and the quality gate themselves,
+        e.g. the kiosk pipeline, where detection is a separate stage.
+        
+        Args:
+            face_image: Cropped face image that passed the quality gate.
+            face_quality_score: Quality score of the face image.
+            location: Kiosk location; its roster is searched first.
+            face_roi: Face box (x, y, width, height) in the source frame.
+        
+        Returns:
+            RecognizeFaceResponse with user info or error.
+        """
+        try:
+            return self._recognize_detected_face(face_image, face_quality_score, location, face_roi)
+        except Exception as e:
+            return self._error_response(e)
+    
+    def _recognize_detected_face(
+        self,
+        face_image: np.ndarray,
+        face_quality_score: float,
+        location: Optional[str],
+        face_roi: Optional[Tuple[int, int, int, int]]
+    ) -> RecognizeFaceResponse:
+        """
+        Recognize a detected face, check eligibility and open a session.
+        
+        Raises:
+            FaceNotRecognizedError: If recognition fails.
+        """
+        # Step 2: Recognize face
+        recognition_result = self._recognize_face(face_image, self._get_roster(location))
+        
+        # Step 3: Validate eligibility (check daily limit)
+        daily_limit_reached = self._check_daily_limit(recognition_result.user_id)
+        if daily_limit_reached:
             return RecognizeFaceResponse(
                 success=False,
-                error=str(e.message) if hasattr(e, 'message') else str(e)
+                error=f"Daily attendance limit reached ({self.max_daily_entries} entries)",
+                daily_limit_reached=True,
+                user_id=recognition_result.user_id,
+                user_name=recognition_result.user_name,
+                confidence=recognition_result.confidence
             )
-        except FaceNotRecognizedError as e:
+        
+        # Step 4: Get user information
+        user = self._get_user(recognition_result)
+        
+        # Step 5: Keep the decoded face and results for Phase 2
+        session_id = self._open_session(
+            recognition_result, face_image, face_quality_score, location, face_roi=face_roi
+        )
+        
+        # Success
+        return RecognizeFaceResponse(
+            success=True,
+            user=user,
+            user_id=recognition_result.user_id,
+            user_name=recognition_result.user_name,
+            confidence=recognition_result.confidence,
+            daily_limit_reached=False,
+            session_id=session_id
+        )
+    
+    def _error_response(self, error: Exception) -> RecognizeFaceResponse:
+        """
+        Convert an exception raised during recognition into a response.
+        
+        Args:
+            error: Exception raised by a workflow step.
+        
+        Returns:
+            Unsuccessful RecognizeFaceResponse.
+        """
+        if isinstance(error, (FaceDetectionFailedError, InsufficientQualityError, FaceNotRecognizedError)):
             return RecognizeFaceResponse(
                 success=False,
-                error=str(e.message) if hasattr(e, 'message') else str(e)
+                error=str(error.message) if hasattr(error, 'message') else str(error)
             )
-        except DailyLimitExceededError as e:
+        if isinstance(error, DailyLimitExceededError):
             return RecognizeFaceResponse(
                 success=False,
-                error=str(e.message) if hasattr(e, 'message') else str(e),
+                error=str(error.message) if hasattr(error, 'message') else str(error),
                 daily_limit_reached=True
             )
-        except Exception as e:
-            logger.error(f"Unexpected error during face recognition: {e}", exc_info=True)
-            return RecognizeFaceResponse(
-                success=False,
-                error=f"Unexpected error during face recognition: {str(e)}"
-            )
+        logger.error(f"Unexpected error during face recognition: {error}", exc_info=True)
+        return RecognizeFaceResponse(
+            success=False,
+            error=f"Unexpected error during face recognition: {str(error)}"
+        )
+    
+    def _open_session(
+        self,
+        recognition_result: Any,
+        face_image: np.ndarray,
+        face_quality_score: float,
+        location: Optional[str],
+        face_roi: Optional[Tuple[int, int, int, int]] = None
+    ) -> Optional[str]:
+        """
+        Store a recognition session for Phase 2.
+        
+        Args:
+            recognition_result: RecognitionResult of the face.
+            face_image: Cropped face image.
+            face_quality_score: Quality score of the face image.
+            location: Location from the request (may be None).
+            face_roi: Face box (x, y, width, height) in the Phase 1 frame.
+        
+        Returns:
+            Session ID, or None if no session repository is configured.
+        """
+        if self.session_repository is None:
+            return None
+        session = RecognitionSession(
+            session=AttendanceSession(
+                session_id=uuid.uuid4().hex,
+                user_id=recognition_result.user_id,
+                user_name=recognition_result.user_name,
+                start_time=datetime.now(),
+                end_time=None,
+                status="active",
+                confidence=recognition_result.confidence,
+                liveness_verified=False
+            ),
+            face_image=face_image,
+            face_quality_score=face_quality_score,
+            location=location,
+            face_roi=face_roi
+        )
+        self.session_repository.add_session(session)
+        return session.session_id
+    
+    def _get_roster(self, location: Optional[str]) -> Optional[AbstractSet[str]]:
+        """
+        Get the roster registered for a location.
+        
+        Args:
+            location: Location from the request (may be None).
+        
+        Returns:
+            Roster user IDs, or None if there is no location or roster.
+        """
+        if not location or self.roster_repository is None:
+            return None
+        return self.roster_repository.get_roster(location)
     
     def _recognize_face(
         self,
-        face_image: np.ndarray
+        face_image: np.ndarray,
+        roster: Optional[AbstractSet[str]] = None
     ) -> Any:
         """
         Get known embeddings and recognize face.
         
         Args:
             face_image: Cropped face image.
+            roster: Optional user IDs to search before the full gallery.
         
         Returns:
             RecognitionResult with user_id, user_name, and confidence.
@@ -209,88 +421,186 @@ class RecognizeFaceUseCase:
         Raises:
             FaceNotRecognizedError: If recognition fails.
         """
-        # Get known embeddings
-        embeddings_result = self.face_repository.get_all_face_embeddings()
+        if self._batcher is not None:
+            return self._batcher.process((face_image, roster))
+        
+        # Without micro-batching, the face runs through the batch path alone
+        result = self._recognize_batch([(face_image, roster)])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+    
+    def _recognize_batch(
+        self,
+        items: List[Tuple[np.ndarray, Optional[AbstractSet[str]]]]
+    ) -> List[Any]:
+        """
+        Recognize the faces of several concurrent requests in one batch.
         
-        # Handle both protocol format (dict with 'success' and 'embeddings') 
-        # and actual format (Dict[str, FaceEmbedding])
-        if isinstance(embeddings_result, dict) and 'success' in embeddings_result:
-            # Protocol format
-            if not embeddings_result.get('success', False):
-                raise FaceNotRecognizedError(message="Failed to retrieve known face embeddings")
-            embeddings_data = embeddings_result.get('embeddings', {})
+        Probes are embedded with the gallery's model and matched against the
+        cached gallery (see _load_gallery). Called on the
+        micro-batcher's worker thread, or directly with one item when
+        micro-batching is disabled.
+        
+        Args:
+            items: (cropped face image, roster) pairs, one per waiting request.
+        
+        Returns:
+            One entry per face: RecognitionResult, or FaceNotRecognizedError
+            (raised to that request's caller by the batcher).
+        
+        Raises:
+            FaceNotRecognizedError: If known embeddings or their model cannot
+                be loaded (delivered to every request of the batch).
+        """
+        gallery, user_names, fast_gallery, extractor = self._load_gallery()
+        service = self.face_recognition_service
+        if service.cascade_enabled:
+            results = service.recognize_faces_cascade(
+                face_images=[face_image for face_image, _ in items],
+                known_embeddings=gallery,
+                fast_known_embeddings=fast_gallery,
+                user_names=user_names,
+                rosters=[roster for _, roster in items],
+                embedding_extractor=extractor
+            )
         else:
-            # Actual format: Dict[str, FaceEmbedding]
-            embeddings_data = embeddings_result
+            results = service.recognize_faces(
+                face_images=[face_image for face_image, _ in items],
+                known_embeddings=gallery,
+                user_names=user_names,
+                rosters=[roster for _, roster in items],
+                embedding_extractor=extractor
+            )
+        return [
+            result if result is not None else FaceNotRecognizedError(
+                confidence=0.0,
+                threshold=self.face_recognition_service.confidence_threshold
+            )
+            for result in results
+        ]
+    
+    def _load_gallery(self) -> Tuple[EmbeddingGallery, Dict[str, str], Optional[EmbeddingGallery], EmbeddingExtractor]:
+        """
+        Get the gallery of known embeddings, rebuilding it only after they change.
         
-        if not embeddings_data:
-            raise FaceNotRecognizedError(message="No known faces in database")
+        The gallery is cached together with the face repository's version
+        token and the extractor of the model it was embedded with, so
+        registrations, deletions and gallery migrations (also by other
+        processes) invalidate it on the next request; a migration's swap
+        switches gallery and extractor together.
+        
+        Returns:
+            Tuple of (gallery, user_names, fast-model gallery or None if the
+            cascade is disabled, extractor of the gallery's model).
         
-        logger.info(f"Loaded {len(embeddings_data)} known face embeddings for recognition")
+        Raises:
+            FaceNotRecognizedError: If no known embeddings are available, or
+                their model differs from the service's and cannot be loaded.
+        """
+        # Read before loading: a write racing the load leaves a stale version,
+        # so the next request rebuilds again instead of keeping stale data
+        version = self.face_repository.get_gallery_version()
+        with self._gallery_lock:
+            cached = self._gallery_cache
+            if cached is not None and cached[0] == version:
+                return cached[1], cached[2], cached[3], cached[4]
+            
+            extractor = self._gallery_extractor(self.face_repository.get_gallery_model())
+            known_embeddings, user_names = self._load_known_embeddings()
+            gallery = self._build_gallery(known_embeddings, user_names)
+            fast_gallery = None
+            service = self.face_recognition_service
+            if service.cascade_enabled:
+                fast_gallery = self._build_gallery(
+                    self.face_repository.get_model_embeddings(service.fast_embedding_extractor.model_name),
+                    user_names
+                )
+            self._gallery_cache = (version, gallery, user_names, fast_gallery, extractor)
+            logger.info(f"Recognition gallery rebuilt: {gallery.size} {self.gallery_precision} embeddings")
+            return gallery, user_names, fast_gallery, extractor
+    
+    def _gallery_extractor(self, gallery_model: Optional[str]) -> EmbeddingExtractor:
+        """
+        Get the extractor of the model the gallery was embedded with.
         
-        # Prepare known embeddings dictionary for recognition
-        known_embeddings, user_names = self._prepare_known_embeddings(embeddings_data)
+        The service's extractor serves galleries of its model and unrecorded
+        ones. Another model's extractor is created once through
+        extractor_for_model and kept until the gallery changes model.
         
-        logger.info(f"Prepared {len(known_embeddings)} known embeddings for recognition")
-        if len(known_embeddings) > 0:
-            first_user_id = list(known_embeddings.keys())[0]
-            first_embedding = known_embeddings[first_user_id]
-            logger.info(f"Sample embedding ({first_user_id}): shape={np.array(first_embedding).shape}, dtype={np.array(first_embedding).dtype}, norm={np.linalg.norm(np.array(first_embedding)):.6f}")
+        Args:
+            gallery_model: Model ID recorded by the gallery, or None.
         
-        # Recognize face using the composite service
-        recognition_result = self.face_recognition_service.recognize_face(
-            face_image=face_image,
-            known_embeddings=known_embeddings,
-            user_names=user_names
-        )
+        Returns:
+            EmbeddingExtractor whose probes are comparable with the gallery.
         
-        return recognition_result
+        Raises:
+            FaceNotRecognizedError: If the gallery's model cannot be loaded;
+                probes of another model would match at random.
+        """
+        extractor = self.face_recognition_service.embedding_extractor
+        if gallery_model is None or gallery_model == extractor.model_id:
+            self._gallery_model_extractor = None
+            return extractor
+        
+        cached = self._gallery_model_extractor
+        if cached is not None and cached[0] == gallery_model:
+            return cached[1]
+        
+        gallery_extractor = self.extractor_for_model(gallery_model) if self.extractor_for_model else None
+        if gallery_extractor is None:
+            raise FaceNotRecognizedError(
+                message=f"Gallery was embedded with {gallery_model}, which cannot be loaded; "
+                        f"recognition resumes once it is re-embedded with {extractor.model_id}"
+            )
+        logger.info(f"Gallery not yet migrated to {extractor.model_id}; embedding probes with {gallery_model}")
+        self._gallery_model_extractor = (gallery_model, gallery_extractor)
+        return gallery_extractor
     
-    def _prepare_known_embeddings(
+    def _build_gallery(
         self,
-        embeddings_data: Dict[str, Any]
-    ) -> Tuple[Dict[str, np.ndarray], Dict[str, str]]:
+        known_embeddings: Dict[str, np.ndarray],
+        user_names: Dict[str, str]
+    ) -> EmbeddingGallery:
         """
-        Prepare known embeddings and user names from repository data.
+        Build a gallery in the configured precision.
         
-        Handles both formats:
-        - Dict[str, FaceEmbedding] (actual repository format)
-        - Dict[str, dict] with 'embeddings' key (protocol format)
+        Compact galleries drop their float32 rows, so they hold only the
+        compact ones; their similarities are not re-ranked in float32.
         
         Args:
-            embeddings_data: Raw embeddings data from repository.
+            known_embeddings: Mapping of user_id to embedding(s).
+            user_names: Mapping of user_id to user_name.
+        
+        Returns:
+            EmbeddingGallery or CompactEmbeddingGallery.
+        """
+        if self.gallery_precision == PRECISION_FLOAT32:
+            return EmbeddingGallery.from_known_embeddings(known_embeddings, user_names)
+        return CompactEmbeddingGallery.from_known_embeddings(
+            known_embeddings, user_names, precision=self.gallery_precision, keep_float32=False
+        )
+    
+    def _load_known_embeddings(self) -> Tuple[Dict[str, np.ndarray], Dict[str, str]]:
+        """
+        Load known embeddings and user names from the face repository.
         
         Returns:
             Tuple of (known_embeddings, user_names) dictionaries.
         
         Raises:
-            FaceNotRecognizedError: If no valid embeddings found.
-        """
-        from domain.entities.face_embedding import FaceEmbedding
-        
-        known_embeddings = {}
-        user_names = {}
-        
-        for user_id, embedding_info in embeddings_data.items():
-            # Handle FaceEmbedding entity format
-            if isinstance(embedding_info, FaceEmbedding):
-                known_embeddings[user_id] = embedding_info.embedding
-                user_names[user_id] = embedding_info.user_id  # Use user_id as name
-            # Handle dict format with 'embeddings' key (protocol format)
-            elif isinstance(embedding_info, dict) and 'embeddings' in embedding_info:
-                known_embeddings[user_id] = embedding_info['embeddings']
-                user_names[user_id] = embedding_info.get('user_name', user_id)
-            # Handle dict format with 'embedding' key (direct embedding)
-            elif isinstance(embedding_info, dict) and 'embedding' in embedding_info:
-                known_embeddings[user_id] = embedding_info['embedding']
-                user_names[user_id] = embedding_info.get('user_name', user_id)
-            # Handle direct numpy array
-            elif isinstance(embedding_info, np.ndarray):
-                known_embeddings[user_id] = embedding_info
-                user_names[user_id] = user_id
+            FaceNotRecognizedError: If no known embeddings are available.
+        """
+        known_embeddings, user_names = load_known_embeddings(self.face_repository)
         
         if not known_embeddings:
-            raise FaceNotRecognizedError(message="No valid embeddings found in database")
+            raise FaceNotRecognizedError(message="No known faces in database")
+        
+        logger.info(f"Prepared {len(known_embeddings)} known embeddings for recognition")
+        if len(known_embeddings) > 0:
+            first_user_id = list(known_embeddings.keys())[0]
+            first_embedding = known_embeddings[first_user_id]
+            logger.info(f"Sample embedding ({first_user_id}): shape={np.array(first_embedding).shape}, dtype={np.array(first_embedding).dtype}, norm={np.linalg.norm(np.array(first_embedding)):.6f}")
         
         return known_embeddings, user_names
     
@@ -304,17 +614,8 @@ class RecognizeFaceUseCase:
         Returns:
             True if daily limit reached, False otherwise.
         """
-        today = date.today()
-        
-        # Get existing attendance records for today
-        existing_records = self.attendance_repository.get_attendance_history(
-            user_id=user_id,
-            start_date=today,
-            end_date=today
-        )
-        
-        # Check daily limit
-        daily_entries_count = len(existing_records)
+        # Served from the repository's per-day index (no CSV scan)
+        daily_entries_count = self.attendance_repository.count_for_day(user_id, date.today())
         return daily_entries_count >= self.max_daily_entries
     
     def _get_user(self, recognition_result: Any) -> User:
@@ -377,4 +678,3 @@ class RecognizeFaceUseCase:
             registration_date=registration_date,
             status=user_data.get('status', 'active')
         )
-
@@ -0,0 +1,368 @@
+"""
+Re-embed gallery use case.
+
+Migrates the primary gallery to the current embedding model (e.g. after
+DEFAULT_EMBEDDING_MODEL or the inference backend changed, or for galleries
+from before the model was recorded whose embeddings have another
+dimension). The stored face image of every user is re-embedded in batches
+and staged next to the live gallery, which keeps serving recognition with
+its own model (see RecognizeFaceUseCase); once every user is staged the
+primary embeddings are swapped in one atomic write. Only one process
+migrates at a time.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Protocol
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MIGRATION_JOB_NAME = "gallery_migration"
+
+
+@dataclass
+class GalleryFace:
+    """The stored face image of one user to re-embed."""
+    user_id: str
+    image_path: Optional[str]  # None if the user has no stored face image
+    face_image: Optional[np.ndarray] = None  # Decoded image (None if it could not be loaded)
+
+
+@dataclass
+class ReembedGalleryProgress:
+    """Running totals reported after each embedded batch."""
+    model_name: str
+    total_users: int
+    already_staged: int
+    embedded: int
+    failed: int
+
+
+@dataclass
+class ReembedGalleryRequest:
+    """Request for migrating the gallery to the current embedding model."""
+    # Pre-loaded faces of the pending users (e.g. decoded in worker processes,
+    # see pending_faces); loaded through the repository when None
+    faces: Optional[Iterable[GalleryFace]] = None
+    embedding_batch_size: int = 32
+    swap: bool = True  # Swap the staged gallery in once every user is staged
+    allow_missing: bool = False  # Swap even if some users could not be re-embedded
+    restart: bool = False  # Discard embeddings staged by an earlier run
+    progress_callback: Optional[Callable[[ReembedGalleryProgress], None]] = None
+
+
+@dataclass
+class ReembedGalleryResponse:
+    """Response from migrating the gallery."""
+    success: bool
+    model_name: str
+    previous_model: Optional[str] = None
+    total_users: int = 0
+    already_staged: int = 0
+    embedded: int = 0
+    failed_users: List[str] = field(default_factory=list)
+    swapped: bool = False
+    error: Optional[str] = None
+
+
+class FaceRepositoryProtocol(Protocol):
+    """Protocol for face repository operations."""
+
+    def get_all_face_embeddings(self) -> Dict[str, Any]:
+        """Get all primary face embeddings keyed by user_id."""
+        ...
+
+    def get_face_images(self, user_id: str) -> List[str]:
+        """Get the stored face image paths of a user."""
+        ...
+
+    def get_face_image(self, user_id: str, image_path: str) -> Optional[np.ndarray]:
+        """Load a stored face image."""
+        ...
+
+    def get_gallery_model(self) -> Optional[str]:
+        """Get the model of the primary embeddings (None if unrecorded)."""
+        ...
+
+    def stage_gallery_embeddings(self, model_name: str, embeddings: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """Durably stage re-extracted embeddings. Returns dict with 'success' key."""
+        ...
+
+    def get_staged_gallery_embeddings(self, model_name: str) -> Dict[str, np.ndarray]:
+        """Get the staged embeddings of a migration."""
+        ...
+
+    def clear_staged_gallery(self, model_name: str) -> None:
+        """Discard the staged embeddings of a migration."""
+        ...
+
+    def swap_gallery(self, model_name: str, allow_missing: bool = False) -> Dict[str, Any]:
+        """Swap the staged embeddings in. Returns dict with 'success', 'swapped' and 'missing' keys."""
+        ...
+
+    def gallery_job_lock(self, job_name: str) -> ContextManager[bool]:
+        """Claim a gallery job for this process. Yields False if another process holds it."""
+        ...
+
+
+class EmbeddingExtractorProtocol(Protocol):
+    """Protocol for the primary embedding extractor."""
+
+    model_id: str
+
+    def extract_batch(self, face_images: List[np.ndarray]) -> List[Any]:
+        """Extract embeddings for several faces. Returns EmbeddingResult or None per face."""
+        ...
+
+    def get_embedding_dimension(self) -> Optional[int]:
+        """Get the dimension of the model's embeddings (None if unknown)."""
+        ...
+
+
+class ReembedGalleryUseCase:
+    """
+    Orchestrates migration of the gallery to the current embedding model.
+
+    This use case handles:
+    - Finding the users not yet staged for the current model (the checkpoint)
+    - Re-extracting their embeddings from their stored face images in batches
+    - Staging the embeddings and swapping the complete gallery in
+
+    It does NOT handle:
+    - Running in the background or decoding images in worker processes
+      (see api.gallery_migration and reembed_gallery.py)
+    """
+
+    def __init__(
+        self,
+        face_repository: FaceRepositoryProtocol,
+        embedding_extractor: EmbeddingExtractorProtocol
+    ):
+        """
+        Initialize ReembedGalleryUseCase.
+
+        Args:
+            face_repository: Face embedding persistence repository.
+            embedding_extractor: Extractor of the current embedding model.
+        """
+        self.face_repository = face_repository
+        self.embedding_extractor = embedding_extractor
+
+    @property
+    def model_name(self) -> str:
+        """ID of the model (and backend) the gallery is migrated to."""
+        return self.embedding_extractor.model_id
+
+    def gallery_model(self) -> Optional[str]:
+        """Return the gallery's recorded model (None if unrecorded)."""
+        return self.face_repository.get_gallery_model()
+
+    def is_current(self) -> bool:
+        """
+        Return True if the gallery does not need to be migrated.
+
+        A gallery whose model was not recorded is current if every primary
+        embedding already has the current model's dimension, so galleries
+        registered before the model was recorded are not re-embedded for
+        nothing.
+        """
+        gallery_model = self.gallery_model()
+        if gallery_model is not None:
+            return gallery_model == self.model_name
+        dimensions = {
+            embedding.get_embedding_dimension()
+            for embedding in self.face_repository.get_all_face_embeddings().values()
+        }
+        if not dimensions:
+            return True
+        return dimensions == {self.embedding_extractor.get_embedding_dimension()}
+
+    def staged_count(self) -> int:
+        """Return the number of users staged for the current model so far."""
+        return len(self.face_repository.get_staged_gallery_embeddings(self.model_name))
+
+    def pending_faces(self, exclude: Iterable[str] = ()) -> List[GalleryFace]:
+        """
+        List the users still to re-embed, with their most recent face image.
+
+        Args:
+            exclude: User IDs to leave out (e.g. failed earlier in this run).
+
+        Returns:
+            One GalleryFace (without image) per user without a staged embedding.
+        """
+        staged = self.face_repository.get_staged_gallery_embeddings(self.model_name)
+        excluded = set(exclude)
+        faces = []
+        for user_id in self.face_repository.get_all_face_embeddings():
+            if user_id in staged or user_id in excluded:
+                continue
+            image_paths = sorted(self.face_repository.get_face_images(user_id))
+            faces.append(GalleryFace(user_id, image_paths[-1] if image_paths else None))
+        return faces
+
+    def execute(self, request: ReembedGalleryRequest) -> ReembedGalleryResponse:
+        """
+        Execute gallery migration.
+
+        Workflow:
+        1. Claim the migration (other processes' runs return an error)
+        2. Skip users staged by earlier runs
+        3. Re-extract and stage embeddings batch by batch, stopping if the
+           gallery became current in the meantime
+        4. Swap the staged gallery in once every user is staged
+
+        Args:
+            request: Migration request.
+
+        Returns:
+            ReembedGalleryResponse with counts, failed users and whether the
+            gallery was swapped.
+        """
+        response = ReembedGalleryResponse(success=False, model_name=self.model_name)
+        with self.face_repository.gallery_job_lock(MIGRATION_JOB_NAME) as acquired:
+            if not acquired:
+                response.error = "The gallery is already being migrated by another process"
+                logger.info(response.error)
+                return response
+            return self._migrate(request, response)
+
+    def _migrate(self, request: ReembedGalleryRequest, response: ReembedGalleryResponse) -> ReembedGalleryResponse:
+        """Run the migration while holding the migration job lock."""
+        try:
+            response.previous_model = self.face_repository.get_gallery_model()
+            if self.is_current():
+                # e.g. another worker finished the migration before this one got the lock
+                logger.info(f"Gallery already uses {self.model_name}; nothing to migrate")
+                response.success = True
+                return response
+            if request.restart:
+                self.face_repository.clear_staged_gallery(self.model_name)
+            response.total_users = len(self.face_repository.get_all_face_embeddings())
+            response.already_staged = len(self.face_repository.get_staged_gallery_embeddings(self.model_name))
+
+            if request.faces is not None:
+                self._embed_faces(request.faces, request, response)
+            else:
+                # Users registered while a round ran are picked up by the next one
+                pending = self.pending_faces()
+                while pending:
+                    self._embed_faces(self._load_faces(pending), request, response)
+                    if self.is_current():
+                        logger.info(f"Gallery already uses {self.model_name}; stopping")
+                        response.success = True
+                        return response
+                    pending = self.pending_faces(exclude=response.failed_users)
+
+            if request.swap:
+                if response.failed_users and not request.allow_missing:
+                    response.error = (f"{len(response.failed_users)} users could not be re-embedded; "
+                                      f"the gallery still uses {response.previous_model or 'its old model'}")
+                    return response
+                result = self.face_repository.swap_gallery(self.model_name, allow_missing=request.allow_missing)
+                if not result.get('success', False):
+                    response.error = result.get('error', 'Failed to swap gallery')
+                    return response
+                response.swapped = True
+
+            response.success = True
+            logger.info(f"Gallery migration to {self.model_name}: {response.embedded} embedded, "
+                        f"{len(response.failed_users)} failed, {response.already_staged} staged earlier, "
+                        f"swapped={response.swapped}")
+            return response
+
+        except Exception as e:
+            logger.exception(f"Unexpected error during gallery migration to {self.model_name}: {e}")
+            response.error = f"Unexpected error during gallery migration: {str(e)}"
+            return response
+
+    def _load_faces(self, faces: List[GalleryFace]) -> Iterator[GalleryFace]:
+        """Load the face images of pending users through the repository."""
+        for face in faces:
+            if face.image_path is not None:
+                face.face_image = self.face_repository.get_face_image(face.user_id, face.image_path)
+            yield face
+
+    def _embed_faces(
+        self,
+        faces: Iterable[GalleryFace],
+        request: ReembedGalleryRequest,
+        response: ReembedGalleryResponse
+    ) -> None:
+        """
+        Re-embed and stage faces batch by batch.
+
+        Args:
+            faces: Faces with loaded images.
+            request: Migration request (batch size and progress callback).
+            response: Response collecting counts and failed users.
+        """
+        batch_size = max(1, request.embedding_batch_size)
+        batch: List[GalleryFace] = []
+        for face in faces:
+            if face.face_image is None:
+                logger.warning(f"No readable face image for user {face.user_id}; cannot re-embed")
+                response.failed_users.append(face.user_id)
+                continue
+            batch.append(face)
+            if len(batch) >= batch_size:
+                self._embed_batch(batch, request, response)
+                batch = []
+        if batch:
+            self._embed_batch(batch, request, response)
+
+    def _embed_batch(
+        self,
+        batch: List[GalleryFace],
+        request: ReembedGalleryRequest,
+        response: ReembedGalleryResponse
+    ) -> None:
+        """Extract, stage and report one batch."""
+        embeddings = self._extract_batch([face.face_image for face in batch])
+        staged: Dict[str, np.ndarray] = {}
+        for face, embedding in zip(batch, embeddings):
+            if embedding is None:
+                response.failed_users.append(face.user_id)
+            else:
+                staged[face.user_id] = embedding.embedding
+
+        result = self.face_repository.stage_gallery_embeddings(self.model_name, staged)
+        if not result.get('success', False):
+            raise IOError(result.get('error', 'Failed to stage embeddings'))
+        response.embedded += len(staged)
+
+        if request.progress_callback is not None:
+            request.progress_callback(ReembedGalleryProgress(
+                model_name=self.model_name,
+                total_users=response.total_users,
+                already_staged=response.already_staged,
+                embedded=response.embedded,
+                failed=len(response.failed_users)
+            ))
+
+    def _extract_batch(self, face_images: List[np.ndarray]) -> List[Any]:
+        """
+        Extract embeddings for a batch, falling back to one face at a time on error.
+
+        Args:
+            face_images: Stored face images.
+
+        Returns:
+            One EmbeddingResult (or None on failure) per face image.
+        """
+        try:
+            return self.embedding_extractor.extract_batch(face_images)
+        except Exception as e:
+            # One bad image must not fail the whole batch: retry face by face
+            logger.warning(f"Batched embedding extraction failed, retrying per face: {e}")
+
+        embedding_results = []
+        for face_image in face_images:
+            try:
+                embedding_results.append(self.embedding_extractor.extract_batch([face_image])[0])
+            except Exception as face_error:
+                logger.warning(f"Embedding extraction failed for face: {face_error}")
+                embedding_results.append(None)
+        return embedding_results
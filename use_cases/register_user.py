@@ -66,6 +66,20 @@ class FaceRepositoryProtocol(Protocol):
     ) -> dict:
         """Store face embeddings. Returns dict with 'success' key."""
         ...
+    
+    def store_model_embedding(self, user_id: str, model_name: str, embedding: np.ndarray) -> dict:
+        """Store an embedding from an additional model. Returns dict with 'success' key."""
+        ...
+
+
+class EmbeddingExtractorProtocol(Protocol):
+    """Protocol for an additional embedding extractor (e.g. the cascade's fast model)."""
+    
+    model_name: str
+    
+    def extract(self, face_image: np.ndarray):
+        """Extract an embedding. Returns EmbeddingResult or None."""
+        ...
 
 
 class RegisterUserUseCase:
@@ -83,7 +97,8 @@ class RegisterUserUseCase:
         self,
         registration_service: UserRegistrationService,
         user_repository: UserRepositoryProtocol,
-        face_repository: FaceRepositoryProtocol
+        face_repository: FaceRepositoryProtocol,
+        fast_embedding_extractor: Optional[EmbeddingExtractorProtocol] = None
     ):
         """
         Initialize RegisterUserUseCase.
@@ -92,10 +107,13 @@ class RegisterUserUseCase:
             registration_service: Composite service for user registration operations.
             user_repository: User data persistence repository.
             face_repository: Face embedding persistence repository.
+            fast_embedding_extractor: Optional cascade fast-model extractor; when set,
+                                      its embedding is stored alongside the primary one.
         """
         self.registration_service = registration_service
         self.user_repository = user_repository
         self.face_repository = face_repository
+        self.fast_embedding_extractor = fast_embedding_extractor
     
     def execute(self, request: RegisterUserRequest) -> RegisterUserResponse:
         """
@@ -213,6 +231,9 @@ class RegisterUserUseCase:
                     quality_score=quality_result.overall_score
                 )
             
+            # Step 8: Keep the cascade's fast-model gallery in step
+            self._store_fast_embedding(request.user_id, face_image)
+            
             # Success
             return RegisterUserResponse(
                 success=True,
@@ -231,6 +252,31 @@ class RegisterUserUseCase:
                 error=f"Unexpected error during registration: {str(e)}"
             )
     
+    def _store_fast_embedding(self, user_id: str, face_image: np.ndarray) -> None:
+        """
+        Store the fast-model embedding of a newly registered face, if configured.
+        
+        Failures are logged only: users without a fast embedding are still
+        recognized, the cascade just escalates to the full model for them.
+        
+        Args:
+            user_id: ID of the registered user.
+            face_image: Registered face crop.
+        """
+        if self.fast_embedding_extractor is None:
+            return
+        try:
+            result = self.fast_embedding_extractor.extract(face_image)
+            if result is None:
+                logger.warning(f"No {self.fast_embedding_extractor.model_name} embedding for user {user_id}")
+                return
+            self.face_repository.store_model_embedding(
+                user_id, self.fast_embedding_extractor.model_name, result.embedding
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store {self.fast_embedding_extractor.model_name} embedding "
+                           f"for user {user_id}: {e}")
+    
     def _validate_user_id_uniqueness(self, user_id: str) -> None:
         """
         Validate that user_id is unique.
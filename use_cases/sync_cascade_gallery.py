@@ -0,0 +1,200 @@
+"""
+Sync cascade gallery use case.
+
+Keeps the cascade's fast-model gallery in step with the primary gallery by
+embedding the stored face image of every user who has a primary embedding
+but no fast-model embedding yet (e.g. users registered before the cascade
+was enabled).
+"""
+
+from dataclasses import dataclass
+from typing import Any, ContextManager, Dict, List, Optional, Protocol
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Users embedded per faces.json write
+STORE_BATCH_SIZE = 32
+
+
+@dataclass
+class SyncCascadeGalleryRequest:
+    """Request for syncing the fast-model gallery."""
+    limit: Optional[int] = None  # Maximum number of users to embed in this run
+
+
+@dataclass
+class SyncCascadeGalleryResponse:
+    """Response from syncing the fast-model gallery."""
+    success: bool
+    model_name: str
+    total_users: int = 0
+    already_synced: int = 0
+    synced: int = 0
+    failed: int = 0
+    error: Optional[str] = None
+
+
+class FaceRepositoryProtocol(Protocol):
+    """Protocol for face repository operations."""
+
+    def get_all_face_embeddings(self) -> Dict[str, Any]:
+        """Get all primary face embeddings keyed by user_id."""
+        ...
+
+    def get_model_embeddings(self, model_name: str) -> Dict[str, np.ndarray]:
+        """Get all users' embeddings from an additional model."""
+        ...
+
+    def get_face_images(self, user_id: str) -> List[str]:
+        """Get the stored face image paths of a user."""
+        ...
+
+    def get_face_image(self, user_id: str, image_path: str) -> Optional[np.ndarray]:
+        """Load a stored face image."""
+        ...
+
+    def store_model_embeddings(self, model_name: str, embeddings: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """Store many embeddings from an additional model in one write. Returns dict with 'stored' key."""
+        ...
+
+    def gallery_job_lock(self, job_name: str) -> ContextManager[bool]:
+        """Claim a gallery job for this process; yields False if another process runs it."""
+        ...
+
+
+class EmbeddingExtractorProtocol(Protocol):
+    """Protocol for the fast-model embedding extractor."""
+
+    model_name: str
+
+    def extract(self, face_image: np.ndarray):
+        """Extract an embedding. Returns EmbeddingResult or None."""
+        ...
+
+
+class SyncCascadeGalleryUseCase:
+    """
+    Orchestrates fast-model gallery maintenance.
+
+    This use case finds users missing a fast-model embedding, embeds their
+    most recent stored face image and stores the results in batches. Users
+    it cannot embed are skipped; the cascade escalates to the full model for
+    them. Only one process syncs at a time.
+    """
+
+    def __init__(
+        self,
+        face_repository: FaceRepositoryProtocol,
+        fast_embedding_extractor: EmbeddingExtractorProtocol
+    ):
+        """
+        Initialize SyncCascadeGalleryUseCase.
+
+        Args:
+            face_repository: Face embedding persistence repository.
+            fast_embedding_extractor: Extractor of the cascade's fast model.
+        """
+        self.face_repository = face_repository
+        self.fast_embedding_extractor = fast_embedding_extractor
+
+    def execute(self, request: SyncCascadeGalleryRequest) -> SyncCascadeGalleryResponse:
+        """
+        Execute fast-model gallery sync.
+
+        Args:
+            request: Sync request with optional limit.
+
+        Returns:
+            SyncCascadeGalleryResponse with counts of synced and failed users.
+        """
+        model_name = self.fast_embedding_extractor.model_name
+        with self.face_repository.gallery_job_lock(f"sync_{model_name}") as acquired:
+            if not acquired:
+                logger.info(f"{model_name} gallery sync already running in another process")
+                return SyncCascadeGalleryResponse(
+                    success=False,
+                    model_name=model_name,
+                    error="Gallery sync already running in another process"
+                )
+            return self._sync(request, model_name)
+
+    def _sync(self, request: SyncCascadeGalleryRequest, model_name: str) -> SyncCascadeGalleryResponse:
+        """
+        Embed and store the missing users while holding the sync job.
+
+        Args:
+            request: Sync request with optional limit.
+            model_name: Fast model name.
+
+        Returns:
+            SyncCascadeGalleryResponse with counts of synced and failed users.
+        """
+        try:
+            user_ids = list(self.face_repository.get_all_face_embeddings())
+            synced_ids = set(self.face_repository.get_model_embeddings(model_name))
+            missing = [user_id for user_id in user_ids if user_id not in synced_ids]
+            already_synced = len(user_ids) - len(missing)
+            if request.limit is not None:
+                missing = missing[:request.limit]
+
+            synced = 0
+            for start in range(0, len(missing), STORE_BATCH_SIZE):
+                embeddings = {}
+                for user_id in missing[start:start + STORE_BATCH_SIZE]:
+                    embedding = self._embed_user(user_id, model_name)
+                    if embedding is not None:
+                        embeddings[user_id] = embedding
+                if embeddings:
+                    synced += len(self.face_repository.store_model_embeddings(
+                        model_name, embeddings
+                    ).get('stored', []))
+
+            response = SyncCascadeGalleryResponse(
+                success=True,
+                model_name=model_name,
+                total_users=len(user_ids),
+                already_synced=already_synced,
+                synced=synced,
+                failed=len(missing) - synced
+            )
+            logger.info(f"{model_name} gallery sync: {response.synced} embedded, "
+                        f"{response.failed} failed, {response.already_synced} already present")
+            return response
+
+        except Exception as e:
+            logger.error(f"{model_name} gallery sync failed: {e}", exc_info=True)
+            return SyncCascadeGalleryResponse(
+                success=False,
+                model_name=model_name,
+                error=f"Unexpected error during gallery sync: {str(e)}"
+            )
+
+    def _embed_user(self, user_id: str, model_name: str) -> Optional[np.ndarray]:
+        """
+        Embed one user's most recent face image.
+
+        Args:
+            user_id: ID of the user.
+            model_name: Fast model name.
+
+        Returns:
+            The embedding, or None if the user could not be embedded.
+        """
+        image_paths = sorted(self.face_repository.get_face_images(user_id))
+        if not image_paths:
+            logger.warning(f"No stored face image for user {user_id}; skipping {model_name} embedding")
+            return None
+
+        face_image = self.face_repository.get_face_image(user_id, image_paths[-1])
+        if face_image is None:
+            return None
+
+        try:
+            result = self.fast_embedding_extractor.extract(face_image)
+        except Exception as e:
+            logger.warning(f"{model_name} embedding failed for user {user_id}: {e}")
+            return None
+        return result.embedding if result is not None else None